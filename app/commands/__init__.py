@@ -1,8 +1,5 @@
 # File: app/commands/__init__.py
-# Commands package: imports all command subpackages to trigger registration.
+# Commands package. Modules are not imported here: get_command() imports
+# the module registering a command on first use, as listed in
+# manifest.json (see app/kernel/manifest.py; load_all() imports all).
 # All Rights Reserved Arodi Emmanuel
-
-from . import transforms
-from . import objects
-from . import scene
-from . import advanced
@@ -1,7 +1,4 @@
 # File: app/commands/advanced/__init__.py
 # Advanced commands package: modifiers, collections.
+# Modules load on demand through the command manifest.
 # All Rights Reserved Arodi Emmanuel
-
-from . import modifiers
-from . import collections
-from . import rigid_body
@@ -10,6 +10,7 @@ from app.commands.result_helpers import (
     ok, fail_not_found, fail_missing_args, fail_exists
 )
 from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 class _SimpleCollection:
@@ -52,7 +53,7 @@ def link_to_collection(args: Dict[str, Any]):
     if not obj_name or not coll_name:
         return fail_missing_args('link_to_collection')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return fail_not_found(obj_name, 'link_to_collection')
 
@@ -73,7 +74,7 @@ def unlink_from_collection(args: Dict[str, Any]):
     if not obj_name or not coll_name:
         return fail_missing_args('unlink_from_collection')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return fail_not_found(obj_name, 'unlink_from_collection')
 
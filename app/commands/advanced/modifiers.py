@@ -9,7 +9,7 @@ from app.kernel.registry import register_command
 from app.commands.result_helpers import (
     ok, fail_not_found, fail_missing, fail_missing_args
 )
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 class _SimpleModifier:
@@ -48,7 +48,7 @@ def add_modifier(args: Dict[str, Any]):
     if not obj_name:
         return fail_missing('object', 'add_modifier')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return fail_not_found(obj_name, 'add_modifier')
 
@@ -70,7 +70,7 @@ def remove_modifier(args: Dict[str, Any]):
     if not obj_name or not mod_name:
         return fail_missing_args('remove_modifier')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return fail_not_found(obj_name, 'remove_modifier')
 
@@ -93,7 +93,7 @@ def configure_modifier(args: Dict[str, Any]):
     if not all([obj_name, mod_name, prop_name]):
         return fail_missing_args('configure_modifier')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return fail_not_found(obj_name, 'configure_modifier')
 
@@ -7,8 +7,9 @@ from typing import Any, Dict
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import (
-    data, context, ops, is_mock,
+    context, ops, is_mock,
 )
+from app.infra.object_handles import find_object
 
 
 @register_command('add_rigid_body')
@@ -37,7 +38,7 @@ def add_rigid_body(
             {'object': obj_name},
             command='add_rigid_body',
         )
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {obj_name}",
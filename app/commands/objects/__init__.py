@@ -1,12 +1,4 @@
 # File: app/commands/objects/__init__.py
 # Object commands package: spawn, hierarchy, management, locks, visibility.
+# Modules load on demand through the command manifest.
 # All Rights Reserved Arodi Emmanuel
-
-from . import spawn_primitive
-from . import spawn_polygon
-from . import spawn_text
-from . import hierarchy
-from . import object_mgmt
-from . import object_locks
-from . import visibility
-from . import keyframe_visibility
@@ -8,6 +8,7 @@ from typing import Any, Dict
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import data, context
+from app.infra.object_handles import find_object
 
 
 @register_command('delete_object')
@@ -21,7 +22,7 @@ def delete_object(args: Dict[str, Any]) -> DispatchResult:
             command='delete_object'
         )
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Object not found: {obj_name}",
@@ -50,7 +51,7 @@ def parent_object(args: Dict[str, Any]) -> DispatchResult:
             command='parent_object'
         )
 
-    child = data.objects.get(child_name)
+    child = find_object(child_name)
     if not child:
         return DispatchResult.fail(
             f"Child not found: {child_name}",
@@ -64,7 +65,7 @@ def parent_object(args: Dict[str, Any]) -> DispatchResult:
             command='parent_object'
         )
 
-    parent = data.objects.get(parent_name)
+    parent = find_object(parent_name)
     if not parent:
         return DispatchResult.fail(
             f"Parent not found: {parent_name}",
@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 def _keyframe_hide(obj: Any, frame: int) -> None:
@@ -33,7 +33,7 @@ def hide_at_frame(
             "Missing 'name' or 'frame'",
             command='hide_at_frame',
         )
-    obj = data.objects.get(name)
+    obj = find_object(name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {name}",
@@ -61,7 +61,7 @@ def hide_objects_at_frame(
     f = int(frame)
     hidden = []
     for name in names:
-        obj = data.objects.get(name)
+        obj = find_object(name)
         if obj:
             _keyframe_hide(obj, f)
             hidden.append(name)
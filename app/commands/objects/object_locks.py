@@ -7,7 +7,7 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 @register_command('lock_transforms')
@@ -21,7 +21,7 @@ def lock_transforms(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='lock_transforms')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='lock_transforms')
 
@@ -43,7 +43,7 @@ def unlock_transforms(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='unlock_transforms')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='unlock_transforms')
 
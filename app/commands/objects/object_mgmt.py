@@ -8,6 +8,7 @@ from typing import Any, Dict
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import data, context, is_mock
+from app.infra.object_handles import find_object
 
 
 @register_command('clone_object')
@@ -19,7 +20,7 @@ def clone_object(args: Dict[str, Any]) -> DispatchResult:
     if not src_name:
         return DispatchResult.fail("Missing 'name'", command='clone_object')
 
-    src = data.objects.get(src_name)
+    src = find_object(src_name)
     if not src:
         return DispatchResult.fail(f"Not found: {src_name}", command='clone_object')
 
@@ -40,7 +41,7 @@ def rename_object(args: Dict[str, Any]) -> DispatchResult:
     if not old_name or not new_name:
         return DispatchResult.fail("Missing arguments", command='rename_object')
 
-    obj = data.objects.get(old_name)
+    obj = find_object(old_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {old_name}", command='rename_object')
 
@@ -74,7 +75,7 @@ def select_object(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='select_object')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='select_object')
 
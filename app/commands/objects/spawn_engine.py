@@ -0,0 +1,85 @@
+# File: app/commands/objects/spawn_engine.py
+# Spawn engine selection for primitives: 'ops' runs bpy.ops.mesh operators,
+# 'data' builds meshes through the data API from cached buffers. A batch
+# switches engine with set_spawn_engine; spawns may override with 'engine'.
+# Identical spawns share one mesh datablock unless 'share_data' is False.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, Iterable, Tuple
+
+from app.domain.dispatch_result import DispatchResult
+from app.domain.primitive_geometry import (
+    GEOMETRY_DEFAULTS, geometry_key, primitive_buffers,
+)
+from app.kernel.registry import register_command
+from app.infra import mesh_factory
+from app.infra.run_state import on_reset
+
+ENGINES = ('ops', 'data')
+
+# Operator kwargs that only affect the object, never the mesh it gets.
+OBJECT_KWARGS = {'location', 'rotation', 'scale', 'align', 'enter_editmode'}
+
+_state: Dict[str, str] = {'engine': 'ops'}
+
+
+@on_reset
+def _reset_engine() -> None:
+    _state['engine'] = 'ops'
+
+
+def current_engine() -> str:
+    """Engine used by spawns that do not pass 'engine'."""
+    return _state['engine']
+
+
+def shared_mesh_key(
+    primitive_type: str,
+    engine: str,
+    args: Dict[str, Any],
+    mesh_kwargs: Iterable[str],
+) -> Tuple:
+    """Key under which identical spawns share one mesh datablock.
+
+    Covers everything that shapes the mesh: engine (only 'ops' makes
+    UVs), normalized geometry params, the remaining mesh-affecting
+    operator kwargs and shade_smooth, which is written to the mesh.
+    """
+    geometry = GEOMETRY_DEFAULTS[primitive_type]
+    extras = tuple(sorted(
+        (k, args[k]) for k in mesh_kwargs
+        if k in args and k not in geometry and k not in OBJECT_KWARGS
+    ))
+    return (engine, geometry_key(primitive_type, args), extras,
+            bool(args.get('shade_smooth', False)))
+
+
+def spawn_data_primitive(
+    primitive_type: str,
+    location: Tuple[float, float, float],
+    args: Dict[str, Any],
+) -> Any:
+    """Create a primitive object without operators; return it."""
+    name = args.get('name') or primitive_type.title()
+    buffers = primitive_buffers(geometry_key(primitive_type, args))
+    mesh = mesh_factory.build_mesh(name, buffers)
+    return mesh_factory.link_object(
+        name, mesh, location,
+        tuple(args.get('rotation', (0.0, 0.0, 0.0))),
+        tuple(args.get('scale', (1.0, 1.0, 1.0))),
+    )
+
+
+@register_command('set_spawn_engine')
+def set_spawn_engine(args: Dict[str, Any]) -> DispatchResult:
+    """Select the default primitive spawn engine for what follows."""
+    engine = args.get('engine', 'ops')
+    if engine not in ENGINES:
+        return DispatchResult.fail(
+            f"Invalid 'engine': expected one of {ENGINES}",
+            command='set_spawn_engine'
+        )
+    _state['engine'] = engine
+    return DispatchResult.ok(
+        {'engine': engine}, command='set_spawn_engine'
+    )
@@ -0,0 +1,74 @@
+# File: app/commands/objects/spawn_point_cloud.py
+# Spawn a point cloud: one vertex-only mesh with a per-point scale
+# attribute, instanced with a sphere through geometry nodes. Replaces
+# thousands of spawn_primitive + scale_object pairs (starfields).
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, List
+
+from app.domain.dispatch_result import DispatchResult
+from app.kernel.registry import register_command
+from app.commands.result_helpers import (
+    ok, fail_invalid, fail_missing, fail_not_found,
+)
+from app.infra import instance_nodes, mesh_factory
+from app.infra.bridge import data
+
+SCALE_ATTRIBUTE = 'point_scale'
+
+
+def _flat_points(points: Any) -> List[float]:
+    """Accept flat [x, y, z, ...] or [(x, y, z), ...]."""
+    if points and isinstance(points[0], (list, tuple)):
+        return [float(c) for p in points for c in p]
+    return [float(c) for c in points]
+
+
+@register_command('spawn_point_cloud')
+def spawn_point_cloud(args: Dict[str, Any]) -> DispatchResult:
+    """Spawn one object whose points each carry an instanced sphere.
+
+    Args:
+        name (str): Object name
+        points (list): Flat xyz floats or (x, y, z) triples
+        scales (list): Optional per-point scale, one float per point
+        radius (float): Sphere radius before scaling, default 1.0
+        segments / rings (int): Sphere resolution, default 16 / 8
+        material (str): Optional material set on the instances
+        location (tuple): Object location, default origin
+    """
+    cmd = 'spawn_point_cloud'
+    name = args.get('name')
+    if not name:
+        return fail_missing('name', cmd)
+    try:
+        co = _flat_points(args.get('points') or [])
+    except (TypeError, ValueError):
+        return fail_invalid('points', 'expected xyz floats', cmd)
+    count = len(co) // 3
+    if not count or len(co) % 3:
+        return fail_invalid(
+            'points', 'expected a non-empty multiple of 3 floats', cmd)
+    scales = args.get('scales')
+    scales = [1.0] * count if scales is None else [float(s) for s in scales]
+    if len(scales) != count:
+        return fail_invalid('scales', f'expected {count} values', cmd)
+    material = None
+    mat_name = args.get('material')
+    if mat_name:
+        material = data.materials.get(mat_name)
+        if material is None:
+            return fail_not_found(mat_name, cmd, 'Material')
+
+    mesh = mesh_factory.build_point_mesh(
+        name, co, {SCALE_ATTRIBUTE: scales})
+    obj = mesh_factory.link_object(
+        name, mesh, tuple(args.get('location', (0.0, 0.0, 0.0))))
+    instance_nodes.add_sphere_instancer(
+        obj, SCALE_ATTRIBUTE,
+        radius=float(args.get('radius', 1.0)),
+        segments=int(args.get('segments', 16)),
+        rings=int(args.get('rings', 8)),
+        material=material,
+    )
+    return ok({'name': obj.name, 'points': count}, cmd)
@@ -1,6 +1,7 @@
 # File: app/commands/spawn_primitive.py
 # Command to spawn primitive objects (cube, sphere, plane, etc.) at given
-# location. Supports all basic Blender primitives via bpy.ops.mesh calls.
+# location. Supports all basic Blender primitives via bpy.ops.mesh calls,
+# or via the operator-free data engine (see spawn_engine).
 # All Rights Reserved Arodi Emmanuel
 
 from typing import Any, Dict
@@ -8,6 +9,10 @@ from typing import Any, Dict
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import ops, data, context
+from app.infra import creation_registry, datablock_cache, mesh_factory
+from .spawn_engine import (
+    ENGINES, current_engine, shared_mesh_key, spawn_data_primitive,
+)
 
 
 PRIMITIVE_MAP = {
@@ -25,7 +30,7 @@ SUPPORTED_KWARGS = {
     'cube': {'size', 'calc_uvs', 'enter_editmode', 'align', 'rotation', 'scale'},
     'sphere': {'segments', 'ring_count', 'radius', 'calc_uvs', 'enter_editmode', 'align', 'rotation', 'scale'},
     'plane': {'size', 'calc_uvs', 'enter_editmode', 'align', 'rotation', 'scale'},
-    'torus': {'major_segments', 'minor_segments', 'major_segments', 'minor_segments', 'major_radius', 'minor_radius', 'abso_major_rad', 'abso_minor_rad', 'generate_uvs', 'enter_editmode', 'align', 'rotation', 'scale'},
+    'torus': {'major_segments', 'minor_segments', 'mode', 'major_radius', 'minor_radius', 'abso_major_rad', 'abso_minor_rad', 'generate_uvs', 'enter_editmode', 'align', 'rotation', 'scale'},
     'cone': {'vertices', 'radius1', 'radius2', 'depth', 'end_fill_type', 'calc_uvs', 'enter_editmode', 'align', 'rotation', 'scale'},
     'cylinder': {'vertices', 'radius', 'depth', 'end_fill_type', 'calc_uvs', 'enter_editmode', 'align', 'rotation', 'scale'}
 }
@@ -44,60 +49,52 @@ def spawn_primitive(args: Dict[str, Any]) -> DispatchResult:
             command='spawn_primitive'
         )
 
-    # Forward supported kwargs from the args dict to the primitive operator.
-    # We explicitly lookup our whitelist to ensure we never send engine decorators
-    # (like 'shade_smooth' or 'name') to the low-level Blender C-API.
-    allowed_keys = SUPPORTED_KWARGS.get(primitive_type, set())
-    op_kwargs = {k: v for k, v in args.items() if k in allowed_keys}
+    engine = args.get('engine') or current_engine()
+    if engine not in ENGINES:
+        return DispatchResult.fail(
+            f"Invalid 'engine': expected one of {ENGINES}",
+            command='spawn_primitive'
+        )
 
-    # Record object names before creating so we can identify created objects
-    def _object_names():
+    # Identical spawns link a new object to the first spawn's mesh
+    # (a linked duplicate) unless the caller opts out with share_data.
+    key = None
+    if args.get('share_data', True):
         try:
-            return set(data.objects.keys())
-        except Exception:
-            try:
-                return {o.name for o in data.objects}
-            except Exception:
-                return set()
-
-    prev_names = _object_names()
-
-    try:
-        PRIMITIVE_MAP[primitive_type](location=location, **op_kwargs)
-    except Exception as e:
-        # Any error from the operator should be reported so callers
-        # don't accidentally rename or operate on stale active objects.
-        return DispatchResult.fail(str(e), command='spawn_primitive')
-
-    # Determine the created object robustly by name-difference; fallback to context.active_object
-    created_obj = None
-    try:
-        new_names = _object_names()
-        created_names = new_names - prev_names
-        if created_names:
-            # pick one created object (most operators create single object)
-            created_name = next(iter(created_names))
-            try:
-                created_obj = data.objects.get(created_name) if hasattr(data.objects, 'get') else data.objects[created_name]
-            except Exception:
-                created_obj = None
-    except Exception:
-        created_obj = None
-
-    if created_obj is None:
-        created_obj = getattr(context, 'active_object', None)
+            key = shared_mesh_key(primitive_type, engine, args,
+                                  SUPPORTED_KWARGS[primitive_type])
+        except ValueError as e:
+            return DispatchResult.fail(str(e), command='spawn_primitive')
+    shared = datablock_cache.lookup(key, data.meshes) if key else None
+
+    if shared is not None:
+        created_obj = mesh_factory.link_object(
+            name or primitive_type.title(), shared, location,
+            tuple(args.get('rotation', (0.0, 0.0, 0.0))),
+            tuple(args.get('scale', (1.0, 1.0, 1.0))),
+        )
+    elif engine == 'data':
+        try:
+            created_obj = spawn_data_primitive(primitive_type, location, args)
+        except Exception as e:
+            return DispatchResult.fail(str(e), command='spawn_primitive')
+    else:
+        created_obj = _spawn_with_operator(primitive_type, location, args)
+        if isinstance(created_obj, DispatchResult):
+            return created_obj
 
     if name and created_obj:
         try:
             created_obj.name = name
-            if getattr(created_obj, 'data', None):
+            if getattr(created_obj, 'data', None) and shared is None:
                 created_obj.data.name = name
         except Exception:
             pass
 
-        # Optional: apply smooth shading if requested
+        # Optional: apply smooth shading if requested (a shared mesh
+        # already carries it, shade_smooth is part of the share key)
         shade_smooth = args.get('shade_smooth', False)
-        if shade_smooth and getattr(created_obj, 'data', None):
+        if shade_smooth and shared is None and getattr(created_obj, 'data', None):
             try:
                 for poly in created_obj.data.polygons:
                     poly.use_smooth = True
@@ -113,7 +110,36 @@ def spawn_primitive(args: Dict[str, Any]) -> DispatchResult:
             except Exception:
                 pass
 
+    if key and shared is None and created_obj is not None:
+        datablock_cache.store(key, getattr(created_obj, 'data', None))
+
     return DispatchResult.ok(
         data={'type': primitive_type, 'location': location},
         command='spawn_primitive'
     )
+
+
+def _spawn_with_operator(primitive_type, location, args):
+    """Run the bpy.ops primitive operator; return the new object."""
+    # Forward supported kwargs from the args dict to the primitive operator.
+    # We explicitly lookup our whitelist to ensure we never send engine decorators
+    # (like 'shade_smooth' or 'name') to the low-level Blender C-API.
+    allowed_keys = SUPPORTED_KWARGS.get(primitive_type, set())
+    op_kwargs = {k: v for k, v in args.items() if k in allowed_keys}
+
+    before = creation_registry.mark()
+
+    try:
+        PRIMITIVE_MAP[primitive_type](location=location, **op_kwargs)
+    except Exception as e:
+        # Any error from the operator should be reported so callers
+        # don't accidentally rename or operate on stale active objects.
+        return DispatchResult.fail(str(e), command='spawn_primitive')
+
+    # Identify the created object in O(1); fallback to context.active_object
+    created_obj = creation_registry.created_since(before)
+
+    if created_obj is None:
+        created_obj = getattr(context, 'active_object', None)
+
+    return created_obj
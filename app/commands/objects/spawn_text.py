@@ -7,6 +7,7 @@ from typing import Any, Dict
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import ops, data, context
+from app.infra import creation_registry, datablock_cache, mesh_factory
 
 
 @register_command('spawn_text')
@@ -22,6 +23,8 @@ def spawn_text(args: Dict[str, Any]) -> DispatchResult:
         align_y (str): Vertical alignment ('TOP', 'CENTER', 'BOTTOM').
         scale (list): X,Y,Z scale multiplier.
         rotation (list): X,Y,Z rotation (radians).
+        share_data (bool): Reuse the text data of an identical earlier
+            spawn (same text, extrude, alignment). Default True.
     """
     text_content = str(args.get('text', 'Tex'))
     name = args.get('name', 'TextGen')
@@ -34,14 +37,19 @@ def spawn_text(args: Dict[str, Any]) -> DispatchResult:
     align_x = args.get('align_x', 'CENTER')
     align_y = args.get('align_y', 'CENTER')
 
-    # Record object names before creating so we can identify the new text
-    def _object_names():
-        try:
-            return set(data.objects.keys())
-        except Exception:
-            return set()
+    key = None
+    if args.get('share_data', True):
+        key = ('text', text_content, extrude, align_x, align_y)
+        shared = datablock_cache.lookup(key, data.curves)
+        if shared is not None:
+            mesh_factory.link_object(name, shared, location, rotation, scale)
+            return DispatchResult.ok(
+                data={'text': text_content, 'location': location,
+                      'name': name},
+                command='spawn_text'
+            )
 
-    prev_names = _object_names()
+    before = creation_registry.mark()
 
     try:
         ops.object.text_add(
@@ -54,15 +62,7 @@ def spawn_text(args: Dict[str, Any]) -> DispatchResult:
         return DispatchResult.fail(str(e), command='spawn_text')
 
     # Identify created object
-    created_obj = None
-    try:
-        new_names = _object_names()
-        created_names = new_names - prev_names
-        if created_names:
-            created_name = next(iter(created_names))
-            created_obj = data.objects.get(created_name)
-    except Exception:
-        pass
+    created_obj = creation_registry.created_since(before)
 
     if created_obj is None:
         created_obj = getattr(context, 'active_object', None)
@@ -84,7 +84,9 @@ def spawn_text(args: Dict[str, Any]) -> DispatchResult:
             # Try to name it
             created_obj.name = name
             created_obj.data.name = f"{name}_FontData"
-            
+            if key:
+                datablock_cache.store(key, created_obj.data)
+
         except Exception as e:
             return DispatchResult.fail(f"Failed configuring text properties: {str(e)}", command='spawn_text')
 
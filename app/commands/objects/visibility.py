@@ -7,7 +7,7 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 @register_command('hide_object')
@@ -18,7 +18,7 @@ def hide_object(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='hide_object')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='hide_object')
 
@@ -34,7 +34,7 @@ def show_object(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='show_object')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='show_object')
 
@@ -51,7 +51,7 @@ def set_render_visibility(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='set_render_visibility')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='set_render_visibility')
 
@@ -68,7 +68,7 @@ def set_object_color(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='set_object_color')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='set_object_color')
 
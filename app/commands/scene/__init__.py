@@ -1,15 +1,4 @@
 # File: app/commands/scene/__init__.py
 # Scene commands package: keyframes, animation, cameras, lights, materials.
+# Modules load on demand through the command manifest.
 # All Rights Reserved Arodi Emmanuel
-
-from . import set_keyframe
-from . import animation_ext
-from . import cameras
-from . import lights
-from . import materials
-from . import world_settings
-from . import world_animation
-from . import grid_world
-from . import particles
-from . import material_anim
-
@@ -7,7 +7,8 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data, context
+from app.infra.bridge import context
+from app.infra.object_handles import find_object
 
 
 @register_command('delete_keyframe')
@@ -21,7 +22,7 @@ def delete_keyframe(args: Dict[str, Any]) -> DispatchResult:
         return DispatchResult.fail(
             "Missing arguments", command='delete_keyframe')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {obj_name}", command='delete_keyframe')
@@ -46,7 +47,7 @@ def clear_animation(args: Dict[str, Any]) -> DispatchResult:
         return DispatchResult.fail(
             "Missing 'name'", command='clear_animation')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {obj_name}", command='clear_animation')
@@ -7,7 +7,8 @@ from typing import Any, Dict
 
 from app.kernel.registry import register_command
 from app.commands.result_helpers import ok, fail_not_found, fail_missing
-from app.infra.bridge import data, ops, context, is_mock
+from app.infra.bridge import ops, context, is_mock
+from app.infra.object_handles import find_object
 
 
 @register_command('create_camera')
@@ -43,7 +44,7 @@ def set_camera_target(args: Dict[str, Any]):
     if not cam_name:
         return fail_missing('name', 'set_camera_target')
 
-    obj = data.objects.get(cam_name)
+    obj = find_object(cam_name)
     if not obj:
         return fail_not_found(cam_name, 'set_camera_target')
 
@@ -71,7 +72,7 @@ def set_focal_length(args: Dict[str, Any]):
     if not cam_name:
         return fail_missing('name', 'set_focal_length')
 
-    obj = data.objects.get(cam_name)
+    obj = find_object(cam_name)
     if not obj or not hasattr(obj.data, 'lens'):
         return fail_not_found(cam_name, 'set_focal_length', 'Camera')
 
@@ -90,7 +91,7 @@ def set_depth_of_field(args: Dict[str, Any]):
     if not cam_name:
         return fail_missing('name', 'set_depth_of_field')
 
-    obj = data.objects.get(cam_name)
+    obj = find_object(cam_name)
     if not obj or not hasattr(obj.data, 'dof'):
         return fail_not_found(cam_name, 'set_depth_of_field', 'Camera')
 
@@ -0,0 +1,87 @@
+# File: app/commands/scene/constant_rotation.py
+# Constant angular velocity without per-frame keys: one extrapolated
+# LINEAR fcurve (or a non-scripted driver) per spinning axis.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict
+
+from app.domain.dispatch_result import DispatchResult
+from app.kernel.registry import register_command
+from app.infra.bridge import context
+from app.infra.fcurve_writer import drive_constant_rate, write_constant_rate
+from app.infra.object_handles import find_object
+
+AXES = {'X': 0, 'Y': 1, 'Z': 2}
+MODES = ('fcurve', 'driver')
+
+
+@register_command('set_constant_rotation')
+def set_constant_rotation(args: Dict[str, Any]) -> DispatchResult:
+    """Spin an object about one axis at a constant rate, forever.
+
+    Args:
+        name:        Object name
+        rate:        Radians per frame (negative spins backwards)
+        axis:        'X' | 'Y' | 'Z' (default 'Z')
+        start:       Angle at start_frame (default: current angle)
+        start_frame: Frame where the angle equals start (default 1)
+        rotation:    Optional static base rotation set first
+        mode:        'fcurve' (default) | 'driver'
+    """
+    obj_name = args.get('name')
+    rate = args.get('rate')
+    axis = str(args.get('axis', 'Z')).upper()
+    mode = args.get('mode', 'fcurve')
+
+    if not obj_name:
+        return DispatchResult.fail(
+            "Missing 'name' argument",
+            command='set_constant_rotation'
+        )
+    if rate is None:
+        return DispatchResult.fail(
+            "Missing 'rate' argument",
+            command='set_constant_rotation'
+        )
+    if axis not in AXES:
+        return DispatchResult.fail(
+            f"Invalid axis: {axis}. Valid: {tuple(AXES)}",
+            command='set_constant_rotation'
+        )
+    if mode not in MODES:
+        return DispatchResult.fail(
+            f"Invalid mode: {mode}. Valid: {MODES}",
+            command='set_constant_rotation'
+        )
+
+    obj = find_object(obj_name)
+    if not obj:
+        return DispatchResult.fail(
+            f"Object not found: {obj_name}",
+            command='set_constant_rotation'
+        )
+
+    if args.get('rotation') is not None:
+        obj.rotation_euler = tuple(args['rotation'])
+    index = AXES[axis]
+    start = args.get('start')
+    if start is None:
+        start = tuple(obj.rotation_euler)[index]
+    start_frame = int(args.get('start_frame', 1))
+
+    if mode == 'driver':
+        drive_constant_rate(
+            obj, 'rotation_euler', index, start_frame,
+            float(start), float(rate), context.scene,
+        )
+    else:
+        write_constant_rate(
+            obj, 'rotation_euler', index, start_frame,
+            float(start), float(rate),
+        )
+
+    return DispatchResult.ok(
+        data={'name': obj_name, 'axis': axis, 'rate': float(rate),
+              'mode': mode},
+        command='set_constant_rotation'
+    )
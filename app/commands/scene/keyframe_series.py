@@ -0,0 +1,81 @@
+# File: app/commands/scene/keyframe_series.py
+# Bulk keyframe command: keys a whole series of (frame, value) samples on
+# one object property in a single dispatch via the fcurve writer.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict
+
+from app.domain.dispatch_result import DispatchResult
+from app.kernel.registry import register_command
+from app.infra.fcurve_writer import write_keyframe_series
+from app.infra.object_handles import find_object
+from .set_keyframe import VALID_PROPERTIES
+
+INTERPOLATIONS = ('CONSTANT', 'LINEAR', 'BEZIER')
+
+
+@register_command('keyframe_series')
+def keyframe_series(args: Dict[str, Any]) -> DispatchResult:
+    """Insert many keyframes on one object property at once.
+
+    Args:
+        name:      Object name
+        data_path: 'location' | 'rotation_euler' | 'scale'
+        frames:    Sequence of frame numbers
+        values:    Sequence of (x, y, z) values, one per frame, or an
+                   (N, 3) float array (passed to the writer as is)
+        interpolation: Optional 'CONSTANT' | 'LINEAR' | 'BEZIER' for
+                   the written keys (Blender's default when omitted)
+    """
+    obj_name = args.get('name')
+    prop = args.get('data_path', 'location')
+    frames = args.get('frames')
+    values = args.get('values')
+    interpolation = args.get('interpolation')
+
+    if not obj_name:
+        return DispatchResult.fail(
+            "Missing 'name' argument",
+            command='keyframe_series'
+        )
+    if prop not in VALID_PROPERTIES:
+        return DispatchResult.fail(
+            f"Invalid data_path: {prop}. Valid: {VALID_PROPERTIES}",
+            command='keyframe_series'
+        )
+    if frames is None or values is None or len(frames) == 0:
+        return DispatchResult.fail(
+            "Missing 'frames' or 'values' argument",
+            command='keyframe_series'
+        )
+    if len(frames) != len(values):
+        return DispatchResult.fail(
+            f"Length mismatch: {len(frames)} frames, "
+            f"{len(values)} values",
+            command='keyframe_series'
+        )
+
+    if interpolation is not None and interpolation not in INTERPOLATIONS:
+        return DispatchResult.fail(
+            f"Invalid interpolation: {interpolation}. "
+            f"Valid: {INTERPOLATIONS}",
+            command='keyframe_series'
+        )
+
+    obj = find_object(obj_name)
+    if not obj:
+        return DispatchResult.fail(
+            f"Object not found: {obj_name}",
+            command='keyframe_series'
+        )
+
+    if not hasattr(values, 'shape'):
+        frames = [int(f) for f in frames]
+        values = [tuple(v) for v in values]
+    write_keyframe_series(obj, prop, frames, values, interpolation)
+
+    return DispatchResult.ok(
+        data={'name': obj_name, 'data_path': prop,
+              'count': len(frames)},
+        command='keyframe_series'
+    )
@@ -7,7 +7,8 @@ from typing import Any, Dict
 
 from app.kernel.registry import register_command
 from app.commands.result_helpers import ok, fail_not_found, fail_missing
-from app.infra.bridge import data, ops, context, is_mock
+from app.infra.bridge import ops, context, is_mock
+from app.infra.object_handles import find_object
 
 
 @register_command('create_light')
@@ -46,7 +47,7 @@ def set_light_energy(args: Dict[str, Any]):
     if not light_name:
         return fail_missing('name', 'set_light_energy')
 
-    obj = data.objects.get(light_name)
+    obj = find_object(light_name)
     if not obj or not hasattr(obj.data, 'energy'):
         return fail_not_found(light_name, 'set_light_energy', 'Light')
 
@@ -63,7 +64,7 @@ def set_light_color(args: Dict[str, Any]):
     if not light_name:
         return fail_missing('name', 'set_light_color')
 
-    obj = data.objects.get(light_name)
+    obj = find_object(light_name)
     if not obj or not hasattr(obj.data, 'color'):
         return fail_not_found(light_name, 'set_light_color', 'Light')
 
@@ -80,7 +81,7 @@ def set_light_type(args: Dict[str, Any]):
     if not light_name:
         return fail_missing('name', 'set_light_type')
 
-    obj = data.objects.get(light_name)
+    obj = find_object(light_name)
     if not obj or obj.type != 'LIGHT':
         return fail_not_found(light_name, 'set_light_type', 'Light')
 
@@ -7,72 +7,37 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
+from app.infra import material_templates
 from app.infra.bridge import data, is_mock
+from app.infra.datablock_cache import is_shared
+from app.infra.object_handles import find_object
 
 
 @register_command('create_material')
 def create_material(args: Dict[str, Any]) -> DispatchResult:
-    """Create a new material with optional emission for glowing objects."""
+    """Create a new material with optional emission for glowing objects.
+
+    The node graph is copied from a per-topology template and only its
+    input values are set; a call repeating the name and args of an
+    earlier one returns that material untouched.
+    """
     mat_name = args.get('name', 'Material')
-    color = tuple(args.get('color', (0.8, 0.8, 0.8, 1.0)))
-    if len(color) == 3:
-        color = color + (1.0,)
-    emit = bool(args.get('emit', False))
-    emit_strength = float(args.get('emit_strength', 5.0))
-    use_noise = bool(args.get('use_noise_texture', False))
-    roughness = float(args.get('roughness', 0.4))
-    normal_strength = float(args.get('normal_strength', 0.0))
+    spec = material_templates.spec_from_args(args)
+
+    mat = material_templates.cached_material(mat_name, spec)
+    if mat is not None:
+        return DispatchResult.ok(
+            {'name': mat.name, 'cached': True}, command='create_material')
 
     old = data.materials.get(mat_name)
     if old and not is_mock():
         data.materials.remove(old)
-    mat = data.materials.new(mat_name)
-    mat.diffuse_color = color
-
-    if not is_mock():
-        # Node-based PBR material using Principled BSDF
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-        nodes.clear()
-
-        principled = nodes.new('ShaderNodeBsdfPrincipled')
-        principled.inputs['Base Color'].default_value = color
-        principled.inputs['Roughness'].default_value = roughness
-
-        final_shader_output = principled.outputs['BSDF']
-
-        # Optional emission mix for glowing rings/particles
-        if emit:
-            emit_node = nodes.new('ShaderNodeEmission')
-            emit_node.inputs['Color'].default_value = color
-            emit_node.inputs['Strength'].default_value = emit_strength
-            mix_shader = nodes.new('ShaderNodeMixShader')
-            # Fac = 1.0: full emission output (no BSDF bleed)
-            mix_shader.inputs['Fac'].default_value = 1.0
-            links.new(emit_node.outputs['Emission'], mix_shader.inputs[1])
-            links.new(principled.outputs['BSDF'], mix_shader.inputs[2])
-            final_shader_output = mix_shader.outputs[0]
-            # Disable back-face culling so emission is visible from ALL
-            # camera angles — critical for JetSouth whose normals face -Z
-            # and would be invisible when camera is in the +Z hemisphere.
-            try:
-                mat.use_backface_culling = False
-            except AttributeError:
-                pass  # Older Blender builds — safe to ignore
-
-
-        # Optional normal/bump generated from a noise texture for subtle detail
-        if use_noise and normal_strength > 0.0:
-            noise = nodes.new('ShaderNodeTexNoise')
-            noise.inputs['Scale'].default_value = 6.0
-            bump = nodes.new('ShaderNodeBump')
-            bump.inputs['Strength'].default_value = normal_strength
-            links.new(noise.outputs['Fac'], bump.inputs['Height'])
-            links.new(bump.outputs['Normal'], principled.inputs['Normal'])
-
-        output = nodes.new('ShaderNodeOutputMaterial')
-        links.new(final_shader_output, output.inputs['Surface'])
+    if is_mock():
+        mat = data.materials.new(mat_name)
+        mat.diffuse_color = spec.color
+    else:
+        mat = material_templates.instantiate(mat_name, spec)
+    material_templates.remember(mat_name, spec, mat)
 
     return DispatchResult.ok({'name': mat.name}, command='create_material')
 
@@ -87,7 +52,7 @@ def assign_material(args: Dict[str, Any]) -> DispatchResult:
         return DispatchResult.fail(
             "Missing arguments", command='assign_material')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {obj_name}", command='assign_material')
@@ -99,6 +64,15 @@ def assign_material(args: Dict[str, Any]) -> DispatchResult:
 
     if is_mock():
         obj.material_slots.append(mat)
+    elif is_shared(obj):
+        # Linked duplicates (and cached spawn meshes, whose siblings
+        # may come later) share mesh data: link the material to this
+        # object's slot so siblings keep their own materials.
+        if not obj.data.materials:
+            obj.data.materials.append(None)
+        slot = obj.material_slots[0]
+        slot.link = 'OBJECT'
+        slot.material = mat
     else:
         # Replace slot 0 if it exists (avoids default grey material blocking
         # our custom emission shader), otherwise append.
@@ -6,7 +6,8 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data, context, ops, is_mock
+from app.infra.bridge import context, ops, is_mock
+from app.infra.object_handles import find_object
 
 
 @register_command('add_particle_system')
@@ -35,7 +36,7 @@ def add_particle_system(args: Dict[str, Any]) -> DispatchResult:
             "Missing 'object'", command='add_particle_system'
         )
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {obj_name}", command='add_particle_system'
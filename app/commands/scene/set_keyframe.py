@@ -7,7 +7,7 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 VALID_PROPERTIES = {'location', 'rotation_euler', 'scale'}
@@ -32,7 +32,7 @@ def set_keyframe(args: Dict[str, Any]) -> DispatchResult:
             command='set_keyframe'
         )
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Object not found: {obj_name}",
@@ -1,10 +1,4 @@
 # File: app/commands/transforms/__init__.py
 # Transform commands package: move, rotate, scale, relative, utilities.
+# Modules load on demand through the command manifest.
 # All Rights Reserved Arodi Emmanuel
-
-from . import move_object
-from . import rotate_object
-from . import scale_object
-from . import transforms_rel
-from . import transform_utils
-from . import apply_transform
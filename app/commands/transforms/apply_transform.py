@@ -7,6 +7,8 @@ from typing import Any, Dict
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import data, is_mock
+from app.infra.datablock_cache import is_shared
+from app.infra.object_handles import find_object
 
 
 @register_command('apply_scale')
@@ -26,7 +28,7 @@ def apply_scale(
             "Missing 'name'",
             command='apply_scale',
         )
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Not found: {obj_name}",
@@ -39,6 +41,10 @@ def apply_scale(
         )
     try:
         import mathutils
+        if is_shared(obj):
+            # Never bake into mesh data other objects link to, or
+            # that the spawn cache hands to later identical spawns.
+            obj.data = obj.data.copy()
         s = obj.scale
         obj.data.transform(
             mathutils.Matrix.Diagonal((*s, 1.0))
@@ -7,7 +7,7 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 @register_command('rotate_object')
@@ -27,7 +27,7 @@ def rotate_object(args: Dict[str, Any]) -> DispatchResult:
             command='rotate_object'
         )
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(
             f"Object not found: {obj_name}",
@@ -7,7 +7,7 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 @register_command('reset_transform')
@@ -21,7 +21,7 @@ def reset_transform(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='reset_transform')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='reset_transform')
 
@@ -43,7 +43,7 @@ def apply_transform(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='apply_transform')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='apply_transform')
 
@@ -64,7 +64,7 @@ def set_origin(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='set_origin')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='set_origin')
 
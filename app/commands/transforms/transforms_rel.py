@@ -7,7 +7,7 @@ from typing import Any, Dict
 
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
-from app.infra.bridge import data
+from app.infra.object_handles import find_object
 
 
 @register_command('translate_relative')
@@ -19,7 +19,7 @@ def translate_relative(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='translate_relative')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='translate_relative')
 
@@ -46,7 +46,7 @@ def rotate_relative(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='rotate_relative')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='rotate_relative')
 
@@ -73,7 +73,7 @@ def scale_relative(args: Dict[str, Any]) -> DispatchResult:
     if not obj_name:
         return DispatchResult.fail("Missing 'name'", command='scale_relative')
 
-    obj = data.objects.get(obj_name)
+    obj = find_object(obj_name)
     if not obj:
         return DispatchResult.fail(f"Not found: {obj_name}", command='scale_relative')
 
@@ -1,6 +1,8 @@
 # File: app/components/__init__.py
 # Parent component layer — generic, scene-agnostic builders that any
 # child animation scene can import to assemble its pipeline.
+# Physical constants travel in a PhysicsContext; the legacy
+# SCHWARZSCHILD_RADIUS / JET_* names stay readable on their modules.
 # All Rights Reserved Arodi Emmanuel
 
 from .env_builder import build_environment
@@ -9,12 +11,19 @@ from .disk_physics import (
     pw_angular_velocity,
     gravitational_redshift_factor,
     keplerian_speed,
-    SCHWARZSCHILD_RADIUS,
     set_schwarzschild_radius,
     isco_radius,
 )
+from .physics_context import PhysicsContext, DEFAULT_PHYSICS
+from .timeline import Timeline, timeline
 from .disk_builder import build_ring
 from .disk_animator import build_disk_animation
+from . import disk_physics as _disk_physics
+
+
+def __getattr__(name: str):
+    # Legacy SCHWARZSCHILD_RADIUS, read live from the default context.
+    return getattr(_disk_physics, name)
 
 __all__ = [
     'build_environment',
@@ -22,9 +31,12 @@ __all__ = [
     'pw_angular_velocity',
     'gravitational_redshift_factor',
     'keplerian_speed',
-    'SCHWARZSCHILD_RADIUS',
     'set_schwarzschild_radius',
     'isco_radius',
+    'PhysicsContext',
+    'DEFAULT_PHYSICS',
+    'Timeline',
+    'timeline',
     'build_ring',
     'build_disk_animation',
 ]
@@ -4,13 +4,6 @@
 
 from .compact_object import build_compact_object
 from .jet_physics import (
-    JET_LORENTZ_FACTOR,
-    JET_REST_LENGTH,
-    JET_BASE_RADIUS,
-    JET_PRECESSION_FRACTION,
-    JET_PRECESSION_DEGREES,
-    JET_KNOT_COUNT,
-    JET_BASE_EMISSION,
     jet_beta,
     doppler_factor,
     observed_length,
@@ -19,16 +12,15 @@ from .jet_physics import (
     knot_emission,
 )
 from .jet_builder import build_jets
+from . import jet_physics as _jet_physics
+
+
+def __getattr__(name: str):
+    # Legacy JET_* constants, read live from the default PhysicsContext.
+    return getattr(_jet_physics, name)
 
 __all__ = [
     'build_compact_object',
-    'JET_LORENTZ_FACTOR',
-    'JET_REST_LENGTH',
-    'JET_BASE_RADIUS',
-    'JET_PRECESSION_FRACTION',
-    'JET_PRECESSION_DEGREES',
-    'JET_KNOT_COUNT',
-    'JET_BASE_EMISSION',
     'jet_beta',
     'doppler_factor',
     'observed_length',
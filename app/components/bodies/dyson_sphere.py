@@ -5,6 +5,8 @@
 import math
 from typing import Any, Dict, List
 
+from app.components.timeline import timeline
+
 
 def build_dyson_sphere(cfg: Dict[str, Any]) -> List[Dict]:
     """Return commands to create a parametric, non-intersecting Dyson Sphere.
@@ -18,7 +20,11 @@ def build_dyson_sphere(cfg: Dict[str, Any]) -> List[Dict]:
             parallels (int): Number of latitudinal horizontal rings.
             clearance (float): Delta radius added per ring to prevent Z-fighting.
             total_frames (int): Animation parameter.
-            step (int): Animation frame step.
+            step (int): Animation frame step ('keys' mode).
+            rotation_mode (str): 'constant' (default) spins each ring with
+                one set_constant_rotation; 'keys' keys every step frames.
+            timeline (Timeline): Key grid shared by all rings ('keys'
+                mode); default timeline(total_frames, step).
     """
     cmds: List[Dict] = []
     
@@ -31,6 +37,11 @@ def build_dyson_sphere(cfg: Dict[str, Any]) -> List[Dict]:
     
     total_frames = int(cfg.get('total_frames', 1200))
     step = int(cfg.get('step', 1))
+    constant = cfg.get('rotation_mode', 'constant') == 'constant'
+    tl = None if constant else (
+        cfg.get('timeline') or timeline(total_frames, step))
+    # Radians per frame for one revolution over the whole animation.
+    rev_rate = math.pi * 2.0 / max(1, total_frames - 1)
     
     current_radius = base_r
     
@@ -60,12 +71,18 @@ def build_dyson_sphere(cfg: Dict[str, Any]) -> List[Dict]:
         
         # Animate Meridians - Independent geared spin
         speed_mult = 1.0 + (i * 0.6)
-        for f in range(1, total_frames + 1, step):
-            t = (f - 1) / max(1, total_frames - 1)
-            spin = t * math.pi * 2.0 * speed_mult  # revolutions
-            cmds.append({'cmd': 'rotate_object', 'args': {
-                'name': ring_name, 'rotation': (math.pi/2, 0, start_angle + spin), 'frame': f
+        if constant:
+            cmds.append({'cmd': 'set_constant_rotation', 'args': {
+                'name': ring_name, 'axis': 'Z',
+                'rate': rev_rate * speed_mult,
+                'start': start_angle, 'start_frame': 1,
             }})
+        else:
+            for f, t in zip(tl.frames, tl.t):
+                spin = t * math.pi * 2.0 * speed_mult  # revolutions
+                cmds.append({'cmd': 'rotate_object', 'args': {
+                    'name': ring_name, 'rotation': (math.pi/2, 0, start_angle + spin), 'frame': f
+                }})
             
         current_radius += clearance
 
@@ -113,12 +130,18 @@ def build_dyson_sphere(cfg: Dict[str, Any]) -> List[Dict]:
             # Alternating speeds/directions per parallel
             direction = 1 if i % 2 == 0 else -1
             speed_mult = 0.5 + (i * 0.8)
-            for f in range(1, total_frames + 1, step):
-                t = (f - 1) / max(1, total_frames - 1)
-                spin = direction * t * math.pi * 2.0 * speed_mult
-                cmds.append({'cmd': 'rotate_object', 'args': {
-                    'name': ring_name, 'rotation': (0, 0, spin), 'frame': f
+            if constant:
+                cmds.append({'cmd': 'set_constant_rotation', 'args': {
+                    'name': ring_name, 'axis': 'Z',
+                    'rate': direction * rev_rate * speed_mult,
+                    'start': 0.0, 'start_frame': 1,
                 }})
+            else:
+                for f, t in zip(tl.frames, tl.t):
+                    spin = direction * t * math.pi * 2.0 * speed_mult
+                    cmds.append({'cmd': 'rotate_object', 'args': {
+                        'name': ring_name, 'rotation': (0, 0, spin), 'frame': f
+                    }})
                 
             current_radius += clearance
 
@@ -5,8 +5,10 @@
 # All Rights Reserved Arodi Emmanuel
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from app.components.physics_context import PhysicsContext, resolve
+from app.components.timeline import timeline
 from . import jet_physics as jp
 
 
@@ -14,8 +16,11 @@ _PREC_STEP = 15
 _KNOT_STEP = 6
 
 
-def _jet_materials(cfg: Dict[str, Any]) -> List[Dict]:
-    north_emit = round(cfg['base_emission'] * jp.doppler_factor(True), 2)
+def _jet_materials(
+    cfg: Dict[str, Any], ctx: PhysicsContext,
+) -> List[Dict]:
+    base = cfg.get('base_emission', ctx.jet_base_emission)
+    north_emit = round(base * jp.doppler_factor(True, ctx), 2)
     south_emit = north_emit
     return [
         {'cmd': 'create_material', 'args': {
@@ -31,9 +36,11 @@ def _jet_materials(cfg: Dict[str, Any]) -> List[Dict]:
     ]
 
 
-def _jet_geometry(cfg: Dict[str, Any]) -> List[Dict]:
-    length = jp.observed_length()
-    r_mid  = jp.collimation_radius(length * 0.5)
+def _jet_geometry(
+    cfg: Dict[str, Any], ctx: PhysicsContext,
+) -> List[Dict]:
+    length = jp.observed_length(ctx)
+    r_mid  = jp.collimation_radius(length * 0.5, ctx)
     parent = cfg['parent_object']
     specs = [
         (cfg['north_name'], length * 0.5,  cfg['north_mat']),
@@ -63,45 +70,52 @@ def _jet_geometry(cfg: Dict[str, Any]) -> List[Dict]:
 
 
 def _precession_keys(
-    parent: str, total_frames: int,
+    parent: str, total_frames: int, ctx: Optional[PhysicsContext] = None,
 ) -> List[Dict]:
+    tl = timeline(total_frames, _PREC_STEP)
     cmds: List[Dict] = []
-    for f in range(1, total_frames + 1, _PREC_STEP):
-        t    = (f - 1) / max(total_frames - 1, 1)
-        tilt = math.radians(jp.precession_offset(t))
+    for f, t in zip(tl.frames, tl.t):
+        tilt = math.radians(jp.precession_offset(t, ctx))
         cmds.append({'cmd': 'rotate_object', 'args': {
             'name': parent, 'rotation': (tilt, 0, 0), 'frame': f,
         }})
     return cmds
 
 
-def _knot_keys(total_frames: int) -> List[Dict]:
-    length = jp.observed_length()
+def _knot_keys(
+    total_frames: int, ctx: Optional[PhysicsContext] = None,
+) -> List[Dict]:
+    ctx    = resolve(ctx)
+    length = jp.observed_length(ctx)
     half   = length * 0.5
     sides  = [('North', -half, +half), ('South', +half, -half)]
+    tl     = timeline(total_frames, _KNOT_STEP)
     cmds: List[Dict] = []
-    for k in range(jp.JET_KNOT_COUNT):
-        phase = k / jp.JET_KNOT_COUNT
+    for k in range(ctx.jet_knot_count):
+        # Both sides of a knot share its phased t and scale rows.
+        ts     = tl.phased(k / ctx.jet_knot_count)
+        scales = [(s, s, s) for s in (1.5 - 0.7 * t for t in ts)]
         for side, z_start, z_end in sides:
             kname = f'Knot{side}_{k}'
-            for f in range(1, total_frames + 1, _KNOT_STEP):
-                t = ((f - 1) / max(total_frames - 1, 1) + phase) % 1.0
-                z = z_start + t * (z_end - z_start)
-                s = 1.5 - 0.7 * t
+            dz    = z_end - z_start
+            for f, t, scale in zip(tl.frames, ts, scales):
                 cmds += [
                     {'cmd': 'move_object', 'args': {
-                        'name': kname, 'location': (0, 0, z), 'frame': f,
+                        'name': kname, 'location': (0, 0, z_start + t * dz),
+                        'frame': f,
                     }},
                     {'cmd': 'scale_object', 'args': {
-                        'name': kname, 'scale': (s, s, s), 'frame': f,
+                        'name': kname, 'scale': scale, 'frame': f,
                     }},
                 ]
     return cmds
 
 
-def _knot_spawn(cfg: Dict[str, Any]) -> List[Dict]:
+def _knot_spawn(
+    cfg: Dict[str, Any], ctx: Optional[PhysicsContext] = None,
+) -> List[Dict]:
     cmds: List[Dict] = []
-    for k in range(jp.JET_KNOT_COUNT):
+    for k in range(resolve(ctx).jet_knot_count):
         for side in ('North', 'South'):
             kname = f'Knot{side}_{k}'
             mat   = cfg['north_mat'] if side == 'North' else cfg['south_mat']
@@ -132,15 +146,20 @@ def build_jets(cfg: Dict[str, Any]) -> List[Dict]:
             south_mat      — south material name
             north_color    — RGBA tuple (default blue-white)
             south_color    — RGBA tuple (default orange-red)
-            base_emission  — float
+            base_emission  — float (default physics.jet_base_emission)
             total_frames   — int
+            physics        — PhysicsContext (default: process default)
+
+    Precession and knot keys run on the shared timeline(total_frames,
+    step) grids (app.components.timeline), computed once per process.
     """
     parent       = cfg['parent_object']
     total_frames = cfg['total_frames']
+    ctx          = resolve(cfg.get('physics'))
     cmds = []
-    cmds += _jet_materials(cfg)
-    cmds += _jet_geometry(cfg)
-    cmds += _knot_spawn(cfg)
-    cmds += _precession_keys(parent, total_frames)
-    cmds += _knot_keys(total_frames)
+    cmds += _jet_materials(cfg, ctx)
+    cmds += _jet_geometry(cfg, ctx)
+    cmds += _knot_spawn(cfg, ctx)
+    cmds += _precession_keys(parent, total_frames, ctx)
+    cmds += _knot_keys(total_frames, ctx)
     return cmds
@@ -1,59 +1,79 @@
 # File: app/components/bodies/jet_physics.py
 # Generic relativistic jet physics: beaming, collimation, precession.
+# Constants come from a PhysicsContext (app/components/physics_context);
+# functions given none fall back to the process default.
 # Extracted from scenes/quasar_bh/animations/_jet_physics.py.
 # All Rights Reserved Arodi Emmanuel
 
 from math import sqrt, sin, pi
+from typing import Optional
 
-from app.components.disk_physics import SCHWARZSCHILD_RADIUS
+from app.components.physics_context import PhysicsContext, resolve
 
-# Default constants — scenes override by patching their local copy
-JET_LORENTZ_FACTOR: float = 7.0
-JET_REST_LENGTH: float    = 300.0
-JET_BASE_RADIUS: float    = 0.06
-JET_PRECESSION_FRACTION: float = 0.25
-JET_PRECESSION_DEGREES: float  = 3.5
-JET_KNOT_COUNT: int            = 10
-JET_BASE_EMISSION: float       = 30.0
+# Legacy constant names -> PhysicsContext fields, read live (never stale).
+_LEGACY = {
+    'JET_LORENTZ_FACTOR': 'jet_lorentz_factor',
+    'JET_REST_LENGTH': 'jet_rest_length',
+    'JET_BASE_RADIUS': 'jet_base_radius',
+    'JET_PRECESSION_FRACTION': 'jet_precession_fraction',
+    'JET_PRECESSION_DEGREES': 'jet_precession_degrees',
+    'JET_KNOT_COUNT': 'jet_knot_count',
+    'JET_BASE_EMISSION': 'jet_base_emission',
+}
 
 
-def jet_beta() -> float:
+def __getattr__(name: str):
+    if name in _LEGACY:
+        return getattr(resolve(None), _LEGACY[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def jet_beta(ctx: Optional[PhysicsContext] = None) -> float:
     """v/c: β = sqrt(1 - 1/Γ²)."""
-    g = JET_LORENTZ_FACTOR
+    g = resolve(ctx).jet_lorentz_factor
     return sqrt(max(0.0, 1.0 - 1.0 / (g * g)))
 
 
-def doppler_factor(approaching: bool) -> float:
+def doppler_factor(
+    approaching: bool, ctx: Optional[PhysicsContext] = None,
+) -> float:
     """Relativistic beaming D³ flux scalar (on-axis, α=1)."""
-    g = JET_LORENTZ_FACTOR
-    b = jet_beta()
+    g = resolve(ctx).jet_lorentz_factor
+    b = jet_beta(ctx)
     d = 1.0 / (g * (1.0 - b)) if approaching else 1.0 / (g * (1.0 + b))
     return d ** 3
 
 
-def observed_length() -> float:
+def observed_length(ctx: Optional[PhysicsContext] = None) -> float:
     """Lorentz-contracted visual length: L_obs = L_rest / Γ."""
-    return JET_REST_LENGTH / JET_LORENTZ_FACTOR
+    ctx = resolve(ctx)
+    return ctx.jet_rest_length / ctx.jet_lorentz_factor
 
 
-def collimation_radius(z: float) -> float:
+def collimation_radius(
+    z: float, ctx: Optional[PhysicsContext] = None,
+) -> float:
     """MHD parabolic funnel → recollimated cylinder."""
-    r_s = SCHWARZSCHILD_RADIUS
+    ctx = resolve(ctx)
+    r_s, base = ctx.schwarzschild_radius, ctx.jet_base_radius
     z0, z1 = 2.0 * r_s, 10.0 * r_s
     if z <= 0.0:
-        return JET_BASE_RADIUS * 0.05
+        return base * 0.05
     if z < z0:
-        return JET_BASE_RADIUS * sqrt(z / z0)
+        return base * sqrt(z / z0)
     if z < z1:
-        return JET_BASE_RADIUS * (z / z0) ** 0.3
-    r_at_z1 = JET_BASE_RADIUS * (z1 / z0) ** 0.3
+        return base * (z / z0) ** 0.3
+    r_at_z1 = base * (z1 / z0) ** 0.3
     return r_at_z1 * (z / z1) ** 0.05
 
 
-def precession_offset(t: float) -> float:
+def precession_offset(
+    t: float, ctx: Optional[PhysicsContext] = None,
+) -> float:
     """Jet-axis tilt in degrees at normalised time t ∈ [0,1]."""
-    return JET_PRECESSION_DEGREES * sin(
-        2.0 * pi * t / JET_PRECESSION_FRACTION
+    ctx = resolve(ctx)
+    return ctx.jet_precession_degrees * sin(
+        2.0 * pi * t / ctx.jet_precession_fraction
     )
 
 
@@ -3,9 +3,11 @@
 # Extracted from scenes/quasar_bh/animations/_cam.py.
 # All Rights Reserved Arodi Emmanuel
 
-import math
 from typing import Any, Dict, List
 
+from . import trajectories as traj
+from .timeline import timeline
+
 
 def build_camera(cfg: Dict[str, Any]) -> List[Dict]:
     """Return commands to create and animate the scene camera.
@@ -25,6 +27,11 @@ def build_camera(cfg: Dict[str, Any]) -> List[Dict]:
             el_freq          (float) — elevation freq mult     [3]
             breathe_amp      (float) — radial breathe fraction [0.25]
             breathe_freq     (float) — breathe cycles          [2.5]
+            timeline         (Timeline) — shared key grid; default
+                                timeline(total_frames, cam_step)
+
+    The whole path is sampled as one array (app.components.trajectories)
+    and keyed with a single keyframe_series.
     """
     name   = cfg['name']
     r      = cfg['radius']
@@ -41,19 +48,9 @@ def build_camera(cfg: Dict[str, Any]) -> List[Dict]:
         {'cmd': 'create_camera',    'args': {'name': name}},
         {'cmd': 'set_focal_length', 'args': {'name': name, 'focal_length': fl}},
     ]
-    for f in range(1, frames + 1, step):
-        t  = (f - 1) / max(frames - 1, 1)
-        az = t * 2 * math.pi
-        el = math.radians(el_b + el_a * math.sin(t * el_f * math.pi))
-        breathe = b_amp * math.sin(t * b_freq * 2 * math.pi)
-        dodge   = math.exp(-((t - 0.5) / 0.08) ** 2)
-        r_local = r * (1.0 - breathe - 0.15 * dodge)
-        x = r_local * math.cos(el) * math.cos(az)
-        y = r_local * math.cos(el) * math.sin(az)
-        z = r_local * math.sin(el)
-        cmds.append({'cmd': 'move_object', 'args': {
-            'name': name, 'location': (x, y, z), 'frame': f,
-        }})
+    keys = (cfg.get('timeline') or timeline(frames, step)).samples
+    path = traj.camera_orbit(keys, frames, r, el_b, el_a, el_f, b_amp, b_freq)
+    cmds.append(traj.series(name, 'location', keys, path))
     cmds.append({'cmd': 'set_camera_target', 'args': {
         'name': name, 'target': (0, 0, 0),
     }})
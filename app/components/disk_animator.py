@@ -1,5 +1,6 @@
 # File: app/components/disk_animator.py
-# Generic accretion-disk animator: PW rotation keys, emission pulses.
+# Generic accretion-disk animator: PW rotation (constant-rate fcurve or
+# keys), emission pulses.
 # Extracted from scenes/quasar_bh/animations/_disk_animate.py.
 # All Rights Reserved Arodi Emmanuel
 
@@ -7,6 +8,8 @@ import math
 from typing import Any, Dict, List
 
 from .disk_physics import pw_angular_velocity
+from .physics_context import PhysicsContext, resolve
+from .timeline import Timeline, timeline
 
 
 _PULSE_CYCLES = 4
@@ -16,30 +19,51 @@ def _frame_dt(
     total_frames: int,
     rotations: int,
     innermost_radius: float,
+    physics: PhysicsContext,
 ) -> float:
     """Scene time units per frame, calibrated to innermost ring."""
-    omega_inner = pw_angular_velocity(innermost_radius)
+    omega_inner = pw_angular_velocity(innermost_radius, physics)
     total_angle = 2.0 * math.pi * rotations
     return total_angle / (omega_inner * total_frames)
 
 
 def _rotation_keys(
+    i: int,
+    ring: Dict,
+    tl: Timeline,
+    rotations: int,
+    innermost_radius: float,
+    physics: PhysicsContext,
+) -> List[Dict]:
+    omega  = pw_angular_velocity(ring['radius'], physics)
+    dt     = _frame_dt(tl.total_frames, rotations, innermost_radius, physics)
+    return [{'cmd': 'keyframe_series', 'args': {
+        'name':      f"Ring_{i}",
+        'data_path': 'rotation_euler',
+        'frames':    list(tl.frames),
+        'values':    [(0, 0, omega * f * dt) for f in tl.frames],
+    }}]
+
+
+def _constant_rotation(
     i: int,
     ring: Dict,
     total_frames: int,
     rotations: int,
-    step: int,
     innermost_radius: float,
+    physics: PhysicsContext,
 ) -> List[Dict]:
-    omega = pw_angular_velocity(ring['radius'])
-    dt    = _frame_dt(total_frames, rotations, innermost_radius)
-    keys  = []
-    for f in range(1, total_frames + 1, step):
-        angle = omega * f * dt
-        keys.append({'cmd': 'rotate_object', 'args': {
-            'name': f"Ring_{i}", 'rotation': (0, 0, angle), 'frame': f,
-        }})
-    return keys
+    # Same angle(f) = omega * f * dt as the keyed path, as O(1) data.
+    rate = pw_angular_velocity(ring['radius'], physics) * _frame_dt(
+        total_frames, rotations, innermost_radius, physics,
+    )
+    return [{'cmd': 'set_constant_rotation', 'args': {
+        'name':        f"Ring_{i}",
+        'axis':        'Z',
+        'rate':        rate,
+        'start':       rate,
+        'start_frame': 1,
+    }}]
 
 
 def build_disk_animation(cfg: Dict[str, Any]) -> List[Dict]:
@@ -50,10 +74,14 @@ def build_disk_animation(cfg: Dict[str, Any]) -> List[Dict]:
             disk_rings       — list of ring dicts {radius, color}
             total_frames     (int)
             rotations        (int)
-            step             (int) — keyframe interval
+            step             (int) — keyframe interval ('keys' mode)
+            rotation_mode    (str) — 'constant' (default) | 'keys'
             pulse_inner      (bool)
             particles        (bool) — unused placeholder for parity
             emit_strength_fn — callable(i) -> float
+            physics          — PhysicsContext (default: process default)
+            timeline         — Timeline shared by all rings ('keys'
+                               mode); default timeline(total_frames, step)
     """
     disk_rings     = cfg['disk_rings']
     total_frames   = cfg['total_frames']
@@ -62,12 +90,21 @@ def build_disk_animation(cfg: Dict[str, Any]) -> List[Dict]:
     pulse_inner    = cfg.get('pulse_inner', False)
     emit_fn        = cfg['emit_strength_fn']
     innermost_r    = disk_rings[0]['radius']
+    constant       = cfg.get('rotation_mode', 'constant') == 'constant'
+    physics        = resolve(cfg.get('physics'))
+    tl             = None if constant else (
+        cfg.get('timeline') or timeline(total_frames, step))
 
     cmds: List[Dict] = []
     for i, ring in enumerate(disk_rings):
-        cmds += _rotation_keys(
-            i, ring, total_frames, rotations, step, innermost_r,
-        )
+        if constant:
+            cmds += _constant_rotation(
+                i, ring, total_frames, rotations, innermost_r, physics,
+            )
+        else:
+            cmds += _rotation_keys(
+                i, ring, tl, rotations, innermost_r, physics,
+            )
         if pulse_inner and i == 0:
             for cycle in range(_PULSE_CYCLES):
                 f = 1 + cycle * (total_frames // _PULSE_CYCLES)
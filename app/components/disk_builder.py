@@ -3,14 +3,10 @@
 # Extracted from scenes/quasar_bh/animations/_disk_build.py.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
-import math
+from typing import Dict, List, Optional
 
-from .disk_physics import (
-    gravitational_redshift_factor,
-    _pw_omega_scaled,
-    SCHWARZSCHILD_RADIUS,
-)
+from .disk_physics import gravitational_redshift_factor, _pw_omega_scaled
+from .physics_context import PhysicsContext, resolve
 
 _BH_CLEARANCE = 0.05  # minimum gap between inner tube edge and r_s
 
@@ -18,6 +14,7 @@ _BH_CLEARANCE = 0.05  # minimum gap between inner tube edge and r_s
 def _minor_radius(
     i: int, r: float,
     ring_radii: List[float],
+    r_s: float,
 ) -> float:
     """Tube radius for continuous plasma-cloud appearance."""
     if i + 1 < len(ring_radii):
@@ -26,7 +23,7 @@ def _minor_radius(
         half_gap = (ring_radii[-1] - ring_radii[-2]) * 1.15
     heat_factor = max(0.9, 1.45 - i * 0.05)
     raw = half_gap * heat_factor
-    max_allowed = r - (SCHWARZSCHILD_RADIUS + _BH_CLEARANCE)
+    max_allowed = r - (r_s + _BH_CLEARANCE)
     return round(min(raw, max_allowed), 3)
 
 
@@ -35,6 +32,7 @@ def build_ring(
     ring: Dict,
     ring_radii: List[float],
     emit_strength_fn,
+    physics: Optional[PhysicsContext] = None,
 ) -> List[Dict]:
     """Return batch commands for one accretion ring (material + torus).
 
@@ -43,19 +41,22 @@ def build_ring(
         ring            — dict with 'radius' and 'color' keys
         ring_radii      — sorted list of all ring radii (for gap calc)
         emit_strength_fn— callable(i) -> float for base emission
+        physics         — PhysicsContext (r_s); None for the default
     """
+    physics = resolve(physics)
     mat = f"RingMat_{i}"
     r   = ring['radius']
     base_emit  = emit_strength_fn(i)
-    g_factor   = gravitational_redshift_factor(r)
-    omega      = _pw_omega_scaled(r)
+    g_factor   = gravitational_redshift_factor(r, physics)
+    omega      = _pw_omega_scaled(r, physics)
     v          = abs(r * omega)
     beta       = min(v / 1.0, 0.999)
     doppler    = 1.0 + 0.5 * beta
     emit       = round(base_emit * g_factor * doppler, 3)
     rough      = 1.0
     normal     = max(0.8, 1.6 - 0.08 * i)
-    minor_r    = _minor_radius(i, r, ring_radii)
+    minor_r    = _minor_radius(
+        i, r, ring_radii, physics.schwarzschild_radius)
 
     return [
         {'cmd': 'create_material', 'args': {
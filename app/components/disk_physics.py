@@ -1,23 +1,38 @@
 # File: app/components/disk_physics.py
 # Generic disk/orbital physics: Keplerian, Paczyński-Wiita, redshift.
+# r_s comes from a PhysicsContext (physics_context.py); functions given
+# none fall back to the process default.
 # Extracted from scenes/quasar_bh/animations/_physics.py.
 # All Rights Reserved Arodi Emmanuel
 
 from math import sqrt
+from typing import Optional
 
-_R_REF = 3.0  # innermost ring radius — normalisation anchor
+from . import physics_context
+from .physics_context import PhysicsContext, resolve
 
-SCHWARZSCHILD_RADIUS: float = 1.0  # r_s in scene units; ISCO = 3 r_s
+_R_REF = 3.0  # innermost ring radius — normalisation anchor
 
 
 def set_schwarzschild_radius(r_s: float) -> None:
-    global SCHWARZSCHILD_RADIUS
-    SCHWARZSCHILD_RADIUS = float(r_s)
+    """Legacy: change r_s of the fallback context (not reentrant).
+
+    Prefer passing PhysicsContext(schwarzschild_radius=r_s) to builders.
+    """
+    physics_context.set_fallback(
+        resolve(None).replace(schwarzschild_radius=float(r_s)))
+
+
+def __getattr__(name: str):
+    # SCHWARZSCHILD_RADIUS is read live so it never goes stale.
+    if name == 'SCHWARZSCHILD_RADIUS':
+        return resolve(None).schwarzschild_radius
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def isco_radius() -> float:
+def isco_radius(ctx: Optional[PhysicsContext] = None) -> float:
     """Innermost stable circular orbit = 3 r_s."""
-    return 3.0 * SCHWARZSCHILD_RADIUS
+    return 3.0 * resolve(ctx).schwarzschild_radius
 
 
 def keplerian_speed(r: float) -> float:
@@ -25,26 +40,32 @@ def keplerian_speed(r: float) -> float:
     return (_R_REF / r) ** 1.5
 
 
-def pw_angular_velocity(r: float) -> float:
+def pw_angular_velocity(
+    r: float, ctx: Optional[PhysicsContext] = None,
+) -> float:
     """Paczyński-Wiita angular velocity for a circular orbit at radius r.
 
     Ω(r) = sqrt( 1 / ( r · (r - r_s)² ) )
     Returns 0 for r ≤ r_s (inside the horizon).
     """
-    r_s = SCHWARZSCHILD_RADIUS
+    r_s = resolve(ctx).schwarzschild_radius
     if r <= r_s:
         return 0.0
     return sqrt(1.0 / (r * (r - r_s) ** 2))
 
 
-def gravitational_redshift_factor(r: float) -> float:
+def gravitational_redshift_factor(
+    r: float, ctx: Optional[PhysicsContext] = None,
+) -> float:
     """sqrt(1 - r_s/r); returns 0 inside the Schwarzschild radius."""
-    r_s = SCHWARZSCHILD_RADIUS
+    r_s = resolve(ctx).schwarzschild_radius
     if r <= r_s:
         return 0.0
     return sqrt(max(0.0, 1.0 - (r_s / r)))
 
 
-def _pw_omega_scaled(r: float) -> float:
+def _pw_omega_scaled(
+    r: float, ctx: Optional[PhysicsContext] = None,
+) -> float:
     """Alias kept for backwards compatibility."""
-    return pw_angular_velocity(r)
+    return pw_angular_velocity(r, ctx)
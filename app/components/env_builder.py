@@ -1,10 +1,14 @@
 # File: app/components/env_builder.py
-# Generic scene environment builder — lights, world background, grid.
-# Extracted from scenes/quasar_bh/animations/_env.py.
+# Generic scene environment builder — lights, world background, grid,
+# instanced starfield. Extracted from scenes/quasar_bh/animations/_env.py.
 # All Rights Reserved Arodi Emmanuel
 
 from typing import Any, Dict, List
 
+from app.scene.atmospheres.space_atmosphere import generate_starfield
+
+STAR_MATERIAL = 'StarGlowMat'
+
 
 def build_environment(cfg: Dict[str, Any]) -> List[Dict]:
     """Return commands to initialise the scene environment.
@@ -20,6 +24,8 @@ def build_environment(cfg: Dict[str, Any]) -> List[Dict]:
             grid_bg_color  (tuple[float,4])
             grid_line_color(tuple[float,4])
             lights         (list[dict]) — each: {name, type}
+            starfield      (dict) — generate_starfield kwargs (star_count,
+                            radius, seed, ...); omitted for no stars
     """
     cmds: List[Dict] = []
     cmds.append({'cmd': 'clear_scene', 'args': {}})
@@ -42,4 +48,11 @@ def build_environment(cfg: Dict[str, Any]) -> List[Dict]:
             'name': light['name'],
             'type': light['type'],
         }})
+    stars = cfg.get('starfield')
+    if stars:
+        cmds.append({'cmd': 'create_material', 'args': {
+            'name': STAR_MATERIAL, 'color': (0.9, 0.9, 1.0, 1.0),
+            'emit': True, 'emit_strength': 3.0,
+        }})
+        cmds += generate_starfield(**{'material': STAR_MATERIAL, **stars})
     return cmds
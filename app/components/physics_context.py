@@ -0,0 +1,50 @@
+# File: app/components/physics_context.py
+# Immutable physics configuration threaded through the disk and jet
+# builders. Each batch carries its own PhysicsContext, so presets or a
+# parameter sweep can be generated concurrently in one process.
+# All Rights Reserved Arodi Emmanuel
+
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from app.infra.run_state import on_reset
+
+
+@dataclass(frozen=True)
+class PhysicsContext:
+    """Scene-unit constants for the compact object, disk and jets."""
+    schwarzschild_radius: float = 1.0      # r_s; ISCO = 3 r_s
+    jet_lorentz_factor: float = 7.0
+    jet_rest_length: float = 300.0
+    jet_base_radius: float = 0.06
+    jet_precession_fraction: float = 0.25
+    jet_precession_degrees: float = 3.5
+    jet_knot_count: int = 10
+    jet_base_emission: float = 30.0
+
+    def replace(self, **changes) -> 'PhysicsContext':
+        """Copy with some constants changed (e.g. one sweep step)."""
+        return replace(self, **changes)
+
+
+DEFAULT_PHYSICS = PhysicsContext()
+
+# Context used when a caller passes none. Only the legacy setter
+# (disk_physics.set_schwarzschild_radius) changes it; builders that are
+# handed a context never read it.
+_fallback = DEFAULT_PHYSICS
+
+
+def resolve(ctx: Optional[PhysicsContext]) -> PhysicsContext:
+    """ctx, or the process fallback when None."""
+    return _fallback if ctx is None else ctx
+
+
+def set_fallback(ctx: PhysicsContext) -> None:
+    global _fallback
+    _fallback = ctx
+
+
+@on_reset
+def _reset_fallback() -> None:
+    set_fallback(DEFAULT_PHYSICS)
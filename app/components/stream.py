@@ -0,0 +1,18 @@
+# File: app/components/stream.py
+# Helpers for builders written as generators: they yield instructions one
+# at a time (see dispatch_stream) and may return extra state at the end.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, Generator, List, Tuple
+
+
+def collect(
+    gen: Generator[Dict, None, Any],
+) -> Tuple[List[Dict], Any]:
+    """Drain a builder generator into (instructions, return value)."""
+    cmds: List[Dict] = []
+    while True:
+        try:
+            cmds.append(next(gen))
+        except StopIteration as stop:
+            return cmds, stop.value
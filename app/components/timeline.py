@@ -0,0 +1,72 @@
+# File: app/components/timeline.py
+# Shared keyframe timeline. timeline(total_frames, step) returns one
+# memoized Timeline per pair: the key frames 1, 1 + step, ... and their
+# normalised time t = (f - 1) / (total_frames - 1), computed once and
+# reused by every builder and object keyed on that grid.
+# All Rights Reserved Arodi Emmanuel
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from app.infra.run_state import on_reset
+
+from . import trajectories as traj
+
+
+class Timeline:
+    """Key frames of one (total_frames, step) grid with their t in [0, 1].
+
+    frames and t are tuples, so builders share them without copying;
+    a Timeline is never modified after its lazy caches are filled.
+    """
+
+    __slots__ = ('total_frames', 'step', 'frames', 't', '_phased',
+                 '_samples')
+
+    def __init__(self, total_frames: int, step: int = 1):
+        self.total_frames = total_frames
+        self.step = step
+        self.frames: Tuple[int, ...] = tuple(range(1, total_frames + 1, step))
+        span = max(total_frames - 1, 1)
+        self.t: Tuple[float, ...] = tuple((f - 1) / span for f in self.frames)
+        self._phased: Dict[float, Tuple[float, ...]] = {}
+        self._samples = None
+
+    def phased(self, phase: float) -> Tuple[float, ...]:
+        """(t + phase) % 1 per frame, cached per phase (e.g. jet knots)."""
+        out = self._phased.get(phase)
+        if out is None:
+            out = self._phased[phase] = tuple(
+                (t + phase) % 1.0 for t in self.t)
+        return out
+
+    @property
+    def samples(self) -> traj.Samples:
+        """frames for app.components.trajectories (and keyframe_series).
+
+        A shared read-only int array with NumPy; a fresh list without.
+        """
+        if not traj.HAS_NUMPY:
+            return list(self.frames)
+        if self._samples is None:
+            samples = traj.sample_frames(self.total_frames, self.step)
+            samples.setflags(write=False)
+            self._samples = samples
+        return self._samples
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __repr__(self) -> str:
+        return f'Timeline(total_frames={self.total_frames}, step={self.step})'
+
+
+@lru_cache(maxsize=64)
+def timeline(total_frames: int, step: int = 1) -> Timeline:
+    """The shared Timeline for (total_frames, step)."""
+    return Timeline(int(total_frames), int(step))
+
+
+@on_reset
+def _reset_timelines() -> None:
+    timeline.cache_clear()
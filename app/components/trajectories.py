@@ -0,0 +1,153 @@
+# File: app/components/trajectories.py
+# Vectorized trajectory sampling for camera and orbit builders. Computes
+# whole frame arrays at once with NumPy (bundled with Blender) and falls
+# back to the equivalent scalar loops when NumPy is not importable.
+# All Rights Reserved Arodi Emmanuel
+
+import math
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the interpreter
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Rows of (x, y, z): an (N, 3) float64 array with NumPy, else tuples.
+Samples = Any
+
+
+def _use_numpy(vectorized: bool) -> bool:
+    return vectorized and HAS_NUMPY
+
+
+def sample_frames(
+    total_frames: int, step: int, vectorized: bool = True,
+) -> Samples:
+    """Frames 1, 1 + step, ... <= total_frames (int array or list)."""
+    if _use_numpy(vectorized):
+        return np.arange(1, total_frames + 1, step, dtype=np.int64)
+    return list(range(1, total_frames + 1, step))
+
+
+def camera_orbit(
+    frames: Samples,
+    total_frames: int,
+    radius: float,
+    el_base_deg: float = 35.0,
+    el_amp_deg: float = 25.0,
+    el_freq: float = 3.0,
+    breathe_amp: float = 0.25,
+    breathe_freq: float = 2.5,
+    vectorized: bool = True,
+) -> Samples:
+    """Spherical orbit: one azimuth turn, elevation wave, breathe, dodge.
+
+    t runs 0..1 over the timeline; the radius breathes sinusoidally and
+    dips by 15% in a Gaussian "dodge" centred on t = 0.5.
+    """
+    span = max(total_frames - 1, 1)
+    if _use_numpy(vectorized):
+        t = (np.asarray(frames, dtype=np.float64) - 1.0) / span
+        az = t * (2.0 * math.pi)
+        el = np.radians(el_base_deg + el_amp_deg * np.sin(t * el_freq * math.pi))
+        breathe = breathe_amp * np.sin(t * (breathe_freq * 2.0 * math.pi))
+        dodge = np.exp(-((t - 0.5) / 0.08) ** 2)
+        r_local = radius * (1.0 - breathe - 0.15 * dodge)
+        r_flat = r_local * np.cos(el)
+        out = np.empty((len(t), 3))
+        out[:, 0] = r_flat * np.cos(az)
+        out[:, 1] = r_flat * np.sin(az)
+        out[:, 2] = r_local * np.sin(el)
+        return out
+    rows: List[Tuple[float, float, float]] = []
+    for f in frames:
+        t = (f - 1) / span
+        az = t * 2 * math.pi
+        el = math.radians(el_base_deg + el_amp_deg * math.sin(t * el_freq * math.pi))
+        breathe = breathe_amp * math.sin(t * breathe_freq * 2 * math.pi)
+        dodge = math.exp(-((t - 0.5) / 0.08) ** 2)
+        r_local = radius * (1.0 - breathe - 0.15 * dodge)
+        rows.append((
+            r_local * math.cos(el) * math.cos(az),
+            r_local * math.cos(el) * math.sin(az),
+            r_local * math.sin(el),
+        ))
+    return rows
+
+
+def orbit_angles(
+    frames: Samples, period: float, vectorized: bool = True,
+) -> Samples:
+    """Orbital angle 2*pi * f / period for every frame."""
+    if _use_numpy(vectorized):
+        return np.asarray(frames, dtype=np.float64) * (2.0 * math.pi / period)
+    return [2.0 * math.pi * (f / period) for f in frames]
+
+
+def keplerian_orbit(
+    angles: Samples, radius: float, inclination: float,
+    vectorized: bool = True,
+) -> Samples:
+    """Circular orbit of given radius, tilted by inclination about X."""
+    cos_i, sin_i = math.cos(inclination), math.sin(inclination)
+    if _use_numpy(vectorized):
+        a = np.asarray(angles, dtype=np.float64)
+        out = np.empty((len(a), 3))
+        out[:, 0] = radius * np.cos(a)
+        sin_a = radius * np.sin(a)
+        out[:, 1] = sin_a * cos_i
+        out[:, 2] = sin_a * sin_i
+        return out
+    return [(radius * math.cos(a),
+             radius * math.sin(a) * cos_i,
+             radius * math.sin(a) * sin_i) for a in angles]
+
+
+def spin(
+    angles: Samples, tilt: float = 0.0, mult: float = 1.0,
+    vectorized: bool = True,
+) -> Samples:
+    """Euler rows (tilt, 0, angle * mult)."""
+    if _use_numpy(vectorized):
+        a = np.asarray(angles, dtype=np.float64)
+        out = np.zeros((len(a), 3))
+        out[:, 0] = tilt
+        out[:, 2] = a * mult
+        return out
+    return [(tilt, 0.0, a * mult) for a in angles]
+
+
+def arm_pose(
+    positions: Samples, vectorized: bool = True,
+) -> Tuple[Samples, Samples]:
+    """(locations, rotations) of a +Z cylinder from origin to positions.
+
+    The arm sits halfway to each position and is pitched/yawed to point
+    at it: rotation (0, pi/2 - elevation, azimuth).
+    """
+    if _use_numpy(vectorized):
+        p = np.asarray(positions, dtype=np.float64)
+        rot = np.zeros_like(p)
+        rot[:, 1] = math.pi / 2.0 - np.arctan2(
+            p[:, 2], np.hypot(p[:, 0], p[:, 1]))
+        rot[:, 2] = np.arctan2(p[:, 1], p[:, 0])
+        return p * 0.5, rot
+    locs, rots = [], []
+    for px, py, pz in positions:
+        locs.append((px / 2.0, py / 2.0, pz / 2.0))
+        el = math.atan2(pz, math.hypot(px, py))
+        rots.append((0.0, math.pi / 2.0 - el, math.atan2(py, px)))
+    return locs, rots
+
+
+def series(
+    name: str, data_path: str, frames: Samples, values: Samples,
+) -> Dict[str, Any]:
+    """keyframe_series instruction for sampled frames and value rows."""
+    return {'cmd': 'keyframe_series', 'args': {
+        'name': name, 'data_path': data_path,
+        'frames': frames, 'values': values,
+    }}
+
@@ -0,0 +1,116 @@
+# File: domain/command_schemas.py
+# Declarative argument schemas for the registered commands: which args
+# are required, which are vectors or frames to coerce, which object and
+# material names a command creates, consumes, renames or deletes, and
+# which args take a fixed set of values. Read by the batch compiler and
+# the batch checker (app/kernel/batch_check.py).
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .primitive_geometry import GEOMETRY_DEFAULTS
+
+VECTOR_ARGS = ('location', 'rotation', 'scale', 'color')
+
+
+class ArgSchema(NamedTuple):
+    """Argument contract of one command."""
+    required: Tuple[str, ...] = ()
+    vectors: Tuple[str, ...] = ()
+    ints: Tuple[str, ...] = ()
+    creates: Optional[str] = None               # arg naming the new object
+    renames: Optional[Tuple[str, str]] = None   # (old arg, new arg)
+    deletes: Optional[str] = None               # arg naming removed object
+    clears: bool = False                        # removes every object
+    consumes: Tuple[str, ...] = ()              # args naming live objects
+    creates_material: Optional[str] = None      # arg naming new material
+    consumes_materials: Tuple[str, ...] = ()    # args naming materials
+    choices: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()  # (arg, values)
+
+
+_TRANSFORM = ArgSchema(vectors=('location', 'rotation', 'scale'),
+                       ints=('frame',), consumes=('name',))
+_ON_NAME = ArgSchema(consumes=('name',))
+_ON_OBJECT = ArgSchema(consumes=('object',))
+_RELATIVE = ArgSchema(ints=('frame',), consumes=('name',))
+
+COMMAND_SCHEMAS: Dict[str, ArgSchema] = {
+    # Creation
+    'spawn_primitive': ArgSchema(
+        vectors=('location', 'rotation', 'scale'), creates='name',
+        choices=(('type', tuple(GEOMETRY_DEFAULTS)),)),
+    'spawn_text': ArgSchema(
+        vectors=('location', 'rotation', 'scale'), creates='name'),
+    'spawn_polygon': ArgSchema(vectors=('location',), creates='name'),
+    'spawn_point_cloud': ArgSchema(
+        required=('name', 'points'), vectors=('location',), creates='name',
+        ints=('segments', 'rings'), consumes_materials=('material',)),
+    'create_camera': ArgSchema(vectors=('location',), creates='name'),
+    'create_light': ArgSchema(
+        vectors=('location', 'color'), creates='name'),
+    'clone_object': ArgSchema(
+        required=('name',), creates='new_name', consumes=('name',)),
+    'rename_object': ArgSchema(
+        required=('name', 'new_name'), renames=('name', 'new_name'),
+        consumes=('name',)),
+    'delete_object': ArgSchema(
+        required=('name',), deletes='name', consumes=('name',)),
+    'clear_scene': ArgSchema(clears=True),
+    # Transforms and animation
+    'move_object': _TRANSFORM._replace(required=('name', 'location')),
+    'rotate_object': _TRANSFORM._replace(required=('name', 'rotation')),
+    'scale_object': _TRANSFORM._replace(required=('name', 'scale')),
+    'translate_relative': _RELATIVE,
+    'rotate_relative': _RELATIVE,
+    'scale_relative': _RELATIVE,
+    'reset_transform': _ON_NAME,
+    'apply_transform': _ON_NAME,
+    'apply_scale': _ON_NAME,
+    'set_origin': _ON_NAME,
+    'lock_transforms': _ON_NAME,
+    'unlock_transforms': _ON_NAME,
+    'set_keyframe': ArgSchema(
+        required=('name',), ints=('frame',), consumes=('name',)),
+    'delete_keyframe': ArgSchema(ints=('frame',), consumes=('name',)),
+    'clear_animation': _ON_NAME,
+    'keyframe_series': ArgSchema(
+        required=('name', 'data_path', 'frames', 'values'),
+        consumes=('name',)),
+    'set_constant_rotation': ArgSchema(
+        required=('name', 'rate'), vectors=('rotation',),
+        ints=('start_frame',), consumes=('name',)),
+    # Visibility, hierarchy, selection
+    'hide_at_frame': ArgSchema(
+        required=('name', 'frame'), ints=('frame',), consumes=('name',)),
+    'hide_objects_at_frame': ArgSchema(ints=('frame',), consumes=('names',)),
+    'hide_object': _ON_NAME,
+    'show_object': _ON_NAME,
+    'set_render_visibility': _ON_NAME,
+    'set_object_color': _ON_NAME,
+    'select_object': _ON_NAME,
+    'parent_object': ArgSchema(
+        required=('child',), consumes=('child', 'parent')),
+    # Cameras and lights
+    'set_camera_target': _ON_NAME,
+    'set_focal_length': _ON_NAME,
+    'set_depth_of_field': _ON_NAME,
+    'set_light_color': _ON_NAME,
+    'set_light_energy': _ON_NAME,
+    'set_light_type': _ON_NAME,
+    # Materials
+    'create_material': ArgSchema(vectors=('color',), creates_material='name'),
+    'assign_material': ArgSchema(
+        required=('object', 'material'), consumes=('object',),
+        consumes_materials=('material',)),
+    'set_material_color': ArgSchema(consumes_materials=('name',)),
+    'keyframe_material_emission': ArgSchema(
+        ints=('frame',), consumes_materials=('material',)),
+    # Modifiers, physics, collections
+    'add_modifier': _ON_OBJECT,
+    'configure_modifier': _ON_OBJECT,
+    'remove_modifier': _ON_OBJECT,
+    'add_particle_system': _ON_OBJECT,
+    'add_rigid_body': _ON_OBJECT,
+    'link_to_collection': _ON_OBJECT,
+    'unlink_from_collection': _ON_OBJECT,
+}
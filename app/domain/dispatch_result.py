@@ -1,13 +1,15 @@
 # File: domain/dispatch_result.py
 # Value Object representing the result of a command execution. Contains
 # success status, optional data payload, and error message if failed.
+# Slotted: no per-instance __dict__, which matters when a batch keeps one
+# result per instruction.
 # All Rights Reserved Arodi Emmanuel
 
 from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DispatchResult:
     """Immutable result of command execution."""
 
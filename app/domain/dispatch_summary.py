@@ -0,0 +1,81 @@
+# File: domain/dispatch_summary.py
+# Aggregate of a dispatch run: success counts per command plus the full
+# record of every failure, instead of one DispatchResult per instruction.
+# All Rights Reserved Arodi Emmanuel
+
+from array import array
+from typing import Any, Dict, List, Tuple
+
+from .dispatch_result import DispatchResult
+
+
+class DispatchSummary:
+    """Counts and failures of a dispatch; memory independent of size.
+
+    Success counts live in one unsigned-int array indexed by an interned
+    command id. Failures are kept as (index, DispatchResult). With
+    samples > 0 the data payloads of the first `samples` successes of
+    each command are kept too.
+    """
+
+    __slots__ = ('total', 'succeeded', 'failures', 'samples',
+                 '_ids', '_counts', '_sample_limit')
+
+    def __init__(self, samples: int = 0):
+        self.total = 0
+        self.succeeded = 0
+        self.failures: List[Tuple[int, DispatchResult]] = []
+        self.samples: Dict[str, List[Any]] = {}
+        self._ids: Dict[str, int] = {}
+        self._counts = array('I')
+        self._sample_limit = samples
+
+    def add(self, index: int, cmd: str, result: DispatchResult) -> None:
+        """Fold one result in; index is its position in the stream."""
+        self.total += 1
+        if not result.success:
+            self.failures.append((index, result))
+            return
+        self.succeeded += 1
+        self._counts[self._intern(cmd)] += 1
+        if self._sample_limit:
+            kept = self.samples.setdefault(cmd, [])
+            if len(kept) < self._sample_limit:
+                kept.append(result.data)
+
+    def merge(self, other: 'DispatchSummary') -> None:
+        """Append another summary as if its results followed this one's."""
+        offset = self.total
+        self.total += other.total
+        self.succeeded += other.succeeded
+        self.failures.extend((offset + i, r) for i, r in other.failures)
+        for cmd, count in other.counts.items():
+            self._counts[self._intern(cmd)] += count
+        for cmd, payloads in other.samples.items():
+            if not self._sample_limit:
+                break
+            kept = self.samples.setdefault(cmd, [])
+            kept.extend(payloads[:max(0, self._sample_limit - len(kept))])
+
+    def _intern(self, cmd: str) -> int:
+        cid = self._ids.get(cmd)
+        if cid is None:
+            cid = self._ids[cmd] = len(self._counts)
+            self._counts.append(0)
+        return cid
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Successes per command name."""
+        return {cmd: self._counts[cid] for cmd, cid in self._ids.items()}
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    def __bool__(self) -> bool:
+        return not self.failures
+
+    def __repr__(self) -> str:
+        return (f"DispatchSummary(total={self.total}, "
+                f"succeeded={self.succeeded}, failed={self.failed})")
@@ -0,0 +1,186 @@
+# File: domain/primitive_geometry.py
+# Pure vertex/face generators for the built-in primitives. Buffers are
+# cached per normalized parameter key and stored as flat typed arrays so
+# the data-API spawn engine can hand them to foreach_set unchanged.
+# All Rights Reserved Arodi Emmanuel
+
+from array import array
+from functools import lru_cache
+from math import cos, sin, pi, tau
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+Vert = Tuple[float, float, float]
+Face = Tuple[int, ...]
+
+# Geometry-affecting parameters and Blender's operator defaults.
+GEOMETRY_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    'cube': {'size': 2.0},
+    'plane': {'size': 2.0},
+    'sphere': {'segments': 32, 'ring_count': 16, 'radius': 1.0},
+    'torus': {'major_segments': 48, 'minor_segments': 12,
+              'major_radius': 1.0, 'minor_radius': 0.25},
+    'cone': {'vertices': 32, 'radius1': 1.0, 'radius2': 0.0,
+             'depth': 2.0, 'end_fill_type': 'NGON'},
+    'cylinder': {'vertices': 32, 'radius': 1.0, 'depth': 2.0,
+                 'end_fill_type': 'NGON'},
+}
+
+
+# Torus sizing modes and the operator's exterior / interior defaults.
+TORUS_MODES = ('MAJOR_MINOR', 'EXT_INT')
+TORUS_EXT_INT = {'abso_major_rad': 1.25, 'abso_minor_rad': 0.75}
+
+
+class MeshBuffers(NamedTuple):
+    """Flat mesh arrays ready for foreach_set."""
+    co: array            # 3 floats per vertex
+    loop_verts: array    # vertex index per face corner
+    loop_starts: array   # first corner of each face
+    loop_totals: array   # corner count of each face
+
+
+def geometry_key(ptype: str, args: Dict[str, Any]) -> Tuple:
+    """Hashable (type, params) key with defaults filled and coerced."""
+    if ptype == 'torus':
+        args = _torus_radii(args)
+    defaults = GEOMETRY_DEFAULTS[ptype]
+    params = tuple(
+        (k, type(d)(args.get(k, d))) for k, d in sorted(defaults.items())
+    )
+    return (ptype,) + params
+
+
+def _torus_radii(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Torus args in major/minor radius form.
+
+    With mode='EXT_INT' the operator sizes the torus by its exterior and
+    interior radii (abso_major_rad / abso_minor_rad) instead; anything
+    but 'MAJOR_MINOR' or 'EXT_INT' raises ValueError.
+    """
+    mode = args.get('mode', 'MAJOR_MINOR')
+    if mode == 'MAJOR_MINOR':
+        return args
+    if mode != 'EXT_INT':
+        raise ValueError(
+            f"Invalid torus 'mode': expected one of {TORUS_MODES}")
+    outer = float(args.get('abso_major_rad', TORUS_EXT_INT['abso_major_rad']))
+    inner = float(args.get('abso_minor_rad', TORUS_EXT_INT['abso_minor_rad']))
+    return {**args, 'major_radius': (outer + inner) / 2,
+            'minor_radius': (outer - inner) / 2}
+
+
+def _ring(n: int, r: float, z: float) -> List[Vert]:
+    return [(r * cos(tau * i / n), r * sin(tau * i / n), z)
+            for i in range(n)]
+
+
+def _box(size: float) -> Tuple[List[Vert], List[Face]]:
+    h = size / 2
+    verts = [(x, y, z) for x in (-h, h) for y in (-h, h) for z in (-h, h)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+             (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    return verts, faces
+
+
+def _plane(size: float) -> Tuple[List[Vert], List[Face]]:
+    h = size / 2
+    return [(-h, -h, 0.0), (h, -h, 0.0), (h, h, 0.0), (-h, h, 0.0)], \
+        [(0, 1, 2, 3)]
+
+
+def _sphere(rings: int, r: float, seg: int):
+    verts: List[Vert] = [(0.0, 0.0, r)]
+    for j in range(1, rings):
+        phi = pi * j / rings
+        verts += _ring(seg, r * sin(phi), r * cos(phi))
+    verts.append((0.0, 0.0, -r))
+    bottom = len(verts) - 1
+
+    def at(j, i):
+        return 1 + (j - 1) * seg + i % seg
+    faces: List[Face] = [(0, at(1, i), at(1, i + 1)) for i in range(seg)]
+    for j in range(1, rings - 1):
+        faces += [(at(j, i), at(j + 1, i), at(j + 1, i + 1), at(j, i + 1))
+                  for i in range(seg)]
+    faces += [(bottom, at(rings - 1, i + 1), at(rings - 1, i))
+              for i in range(seg)]
+    return verts, faces
+
+
+def _torus(big_n: int, big_r: float, small_n: int, small_r: float):
+    verts: List[Vert] = []
+    for i in range(big_n):
+        u = tau * i / big_n
+        for j in range(small_n):
+            v = tau * j / small_n
+            w = big_r + small_r * cos(v)
+            verts.append((w * cos(u), w * sin(u), small_r * sin(v)))
+
+    def at(i, j):
+        return (i % big_n) * small_n + j % small_n
+    faces = [(at(i, j), at(i + 1, j), at(i + 1, j + 1), at(i, j + 1))
+             for i in range(big_n) for j in range(small_n)]
+    return verts, faces
+
+
+def _frustum(n: int, r1: float, r2: float, depth: float, fill: str):
+    h = depth / 2
+    bottom = _ring(n, r1, -h) if r1 > 0 else [(0.0, 0.0, -h)]
+    top = _ring(n, r2, h) if r2 > 0 else [(0.0, 0.0, h)]
+    verts = bottom + top
+    b, t = len(bottom), len(top)
+
+    def bi(i):
+        return i % n if b > 1 else 0
+
+    def ti(i):
+        return b + (i % n if t > 1 else 0)
+    faces: List[Face] = []
+    for i in range(n):
+        quad = (bi(i), bi(i + 1), ti(i + 1), ti(i))
+        faces.append(tuple(dict.fromkeys(quad)))
+    for ring, lo, up in ((bottom, 0, False), (top, b, True)):
+        if len(ring) == 1 or fill == 'NOTHING':
+            continue
+        idx = [lo + i for i in range(n)]
+        if fill == 'TRIFAN':
+            c = len(verts)
+            verts.append((0.0, 0.0, ring[0][2]))
+            pairs = [(idx[i], idx[(i + 1) % n]) for i in range(n)]
+            faces += [(c, a, z) if up else (c, z, a) for a, z in pairs]
+        else:
+            faces.append(tuple(idx if up else idx[::-1]))
+    return verts, faces
+
+
+def _generate(ptype: str, p: Dict[str, Any]):
+    if ptype == 'cube':
+        return _box(p['size'])
+    if ptype == 'plane':
+        return _plane(p['size'])
+    if ptype == 'sphere':
+        return _sphere(p['ring_count'], p['radius'], p['segments'])
+    if ptype == 'torus':
+        return _torus(p['major_segments'], p['major_radius'],
+                      p['minor_segments'], p['minor_radius'])
+    if ptype == 'cone':
+        return _frustum(p['vertices'], p['radius1'], p['radius2'],
+                        p['depth'], p['end_fill_type'])
+    return _frustum(p['vertices'], p['radius'], p['radius'],
+                    p['depth'], p['end_fill_type'])
+
+
+@lru_cache(maxsize=256)
+def primitive_buffers(key: Tuple) -> MeshBuffers:
+    """Flat mesh buffers for a geometry_key(); built once per key."""
+    verts, faces = _generate(key[0], dict(key[1:]))
+    starts, pos = [], 0
+    for face in faces:
+        starts.append(pos)
+        pos += len(face)
+    return MeshBuffers(
+        co=array('f', [c for v in verts for c in v]),
+        loop_verts=array('i', [i for face in faces for i in face]),
+        loop_starts=array('i', starts),
+        loop_totals=array('i', [len(face) for face in faces]),
+    )
@@ -0,0 +1,127 @@
+# File: app/infra/batch_cache.py
+# On-disk cache of generated (and optimized) instruction batches. An entry
+# is keyed by the builder source hash plus the preset / parameters, stored
+# as compressed marshal bytes in the per-user cache directory (never the
+# project tree), and evicted least-recently-used past a size budget.
+# All Rights Reserved Arodi Emmanuel
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _user_cache_root() -> Path:
+    """$XDG_CACHE_HOME, else %LOCALAPPDATA% (Windows), else ~/.cache."""
+    root = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+    return Path(root) if root else Path.home() / '.cache'
+
+
+CACHE_DIR = _user_cache_root() / 'animations' / 'batches'
+MAX_BYTES = 256 * 1024 * 1024
+SUFFIX = '.batch'
+
+# Shared code every cached batch depends on: the packages that generate
+# instructions (builders, atmospheres, act workers, origin tagging,
+# columnar transport), the optimizer passes, and this module's format.
+COMMON_SOURCES = (
+    PROJECT_ROOT / 'app' / 'components',
+    PROJECT_ROOT / 'app' / 'scene',
+    PROJECT_ROOT / 'app' / 'domain',
+    PROJECT_ROOT / 'app' / 'kernel',
+    Path(__file__).resolve(),
+)
+
+
+def cached_batch(
+    build: Callable[[], Any],
+    sources: Iterable[Path],
+    params: Dict[str, Any],
+    directory: Optional[Path] = None,
+    max_bytes: int = MAX_BYTES,
+) -> Any:
+    """Return build()'s result, from disk when sources and params match.
+
+    build returns a batch, or a tuple / dict of plain data holding one
+    (e.g. an optimized batch with its optimizer counts). sources are the
+    files or directories whose .py files define it (COMMON_SOURCES is
+    always included); params holds every value it depends on (preset
+    dict, overrides). A miss builds, stores and evicts the oldest
+    entries until the cache fits in max_bytes.
+    """
+    directory = Path(directory or CACHE_DIR)
+    path = directory / (cache_key(sources, params) + SUFFIX)
+    batch = load(path)
+    if batch is not None:
+        return batch
+    batch = build()
+    store(path, batch)
+    evict(directory, max_bytes)
+    return batch
+
+
+def cache_key(sources: Iterable[Path], params: Dict[str, Any]) -> str:
+    """Hash of Python version, builder sources and params."""
+    h = hashlib.blake2b(sys.version.encode(), digest_size=16)
+    for path in _source_files([*COMMON_SOURCES, *sources]):
+        h.update(os.path.relpath(path, PROJECT_ROOT).encode())
+        h.update(path.read_bytes())
+    h.update(json.dumps(params, sort_keys=True, default=repr).encode())
+    return h.hexdigest()
+
+
+def load(path: Path) -> Optional[Any]:
+    """Read an entry (refreshing its LRU stamp); None if absent or bad."""
+    try:
+        batch = marshal.loads(zlib.decompress(path.read_bytes()))
+        os.utime(path)
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+    return batch
+
+
+def store(path: Path, batch: Any) -> None:
+    """Write an entry atomically; array-valued args are stored as lists."""
+    payload = zlib.compress(marshal.dumps(_plain(batch)), 1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def evict(directory: Path, max_bytes: int) -> None:
+    """Delete least recently used entries until the total fits."""
+    entries = sorted(directory.glob('*' + SUFFIX),
+                     key=lambda p: p.stat().st_mtime_ns)
+    total = sum(p.stat().st_size for p in entries)
+    for path in entries[:-1]:
+        if total <= max_bytes:
+            break
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
+
+
+def _source_files(sources: Iterable[Path]) -> List[Path]:
+    files = set()
+    for source in sources:
+        source = Path(source).resolve()
+        files.update(source.rglob('*.py') if source.is_dir() else [source])
+    return sorted(files)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return value
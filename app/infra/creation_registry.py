@@ -0,0 +1,39 @@
+# File: app/infra/creation_registry.py
+# Creation tracking for operator-based spawns. Identifies the object an
+# operator just created in O(1) instead of diffing name snapshots of the
+# whole bpy.data.objects collection before and after every call.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, NamedTuple, Optional
+
+from .bridge import data, context
+
+
+class CreationMark(NamedTuple):
+    """Scene state captured right before an operator runs."""
+    count: int
+    active: Any
+
+
+def mark() -> CreationMark:
+    """Record object count and active object before an operator call."""
+    return CreationMark(
+        len(data.objects),
+        getattr(context, 'active_object', None),
+    )
+
+
+def created_since(m: CreationMark) -> Optional[Any]:
+    """Return the object created after mark m, or None.
+
+    Add operators always make the new object active, so the active
+    object is the creation if the object count grew and the active
+    object changed identity. Names are never compared, which keeps
+    the lookup correct when Blender suffixes or a command renames.
+    """
+    if len(data.objects) <= m.count:
+        return None
+    obj = getattr(context, 'active_object', None)
+    if obj is None or obj is m.active:
+        return None
+    return obj
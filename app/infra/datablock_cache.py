@@ -0,0 +1,74 @@
+# File: app/infra/datablock_cache.py
+# Geometry-instancing cache: maps a normalized spawn key to the mesh or
+# curve datablock the first spawn created, so identical later spawns link
+# a new object to the same data instead of building another copy. Also
+# holds material templates and finished materials (material_templates).
+# A cached datablock counts as shared from its first spawn on, so code
+# editing data in place copies it first and the cache stays pristine.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, Hashable, Optional
+
+from .run_state import on_reset
+
+_cache: Dict[Hashable, Any] = {}
+_keys: Dict[int, Hashable] = {}     # datablock identity -> its cache key
+
+
+def _ident(block: Any) -> int:
+    # bpy wrappers are recreated on access; as_pointer() is stable.
+    as_pointer = getattr(block, 'as_pointer', None)
+    return as_pointer() if as_pointer is not None else id(block)
+
+
+def lookup(key: Hashable, collection: Any) -> Optional[Any]:
+    """Return the cached datablock for key if it still lives in collection.
+
+    Entries whose datablock was removed (or whose bpy.data was reset) are
+    dropped, so the next spawn simply recreates and re-caches the data.
+    """
+    block = _cache.get(key)
+    if block is None:
+        return None
+    try:
+        alive = collection.get(block.name) == block
+    except ReferenceError:
+        alive = False
+    if not alive:
+        del _cache[key]
+        _keys.pop(_ident(block), None)
+        return None
+    return block
+
+
+def store(key: Hashable, block: Any) -> None:
+    """Remember block as the shared datablock for key."""
+    if block is not None:
+        old = _cache.get(key)
+        if old is not None:
+            _keys.pop(_ident(old), None)
+        _cache[key] = block
+        _keys[_ident(block)] = key
+
+
+def is_cached(block: Any) -> bool:
+    """True if block is the shared datablock of some cache key."""
+    return block is not None and _ident(block) in _keys
+
+
+def is_shared(obj: Any) -> bool:
+    """True if obj's data is, or may later be, used by other objects.
+
+    That is data linked by more than one object, or data in the cache
+    (even with one user: identical spawns will link to it). Edit such
+    data only after giving obj its own copy.
+    """
+    block = getattr(obj, 'data', None)
+    return getattr(block, 'users', 1) > 1 or is_cached(block)
+
+
+@on_reset
+def clear() -> None:
+    """Forget every cached datablock."""
+    _cache.clear()
+    _keys.clear()
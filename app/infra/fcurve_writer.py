@@ -0,0 +1,285 @@
+# File: app/infra/fcurve_writer.py
+# Bulk keyframe backend. Writes whole (frame, value) series straight into
+# action fcurves with keyframe_points.add + foreach_set instead of one
+# keyframe_insert round trip per frame.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .bridge import is_mock
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the interpreter
+    np = None
+
+Vec = Tuple[float, ...]
+
+# Keyframe.interpolation enum items as foreach_get/foreach_set see them
+# (eBezTriple_Interpolation order).
+INTERPOLATION_CODES = {
+    'CONSTANT': 0, 'LINEAR': 1, 'BEZIER': 2, 'BACK': 3, 'BOUNCE': 4,
+    'CIRC': 5, 'CUBIC': 6, 'ELASTIC': 7, 'EXPO': 8, 'QUAD': 9,
+    'QUART': 10, 'QUINT': 11, 'SINE': 12,
+}
+
+
+def _ensure_action(obj: Any, data_path: str, frame: int) -> Any:
+    """Return the object's action, creating it with one seed key."""
+    anim = obj.animation_data
+    if anim is None or anim.action is None:
+        # keyframe_insert builds action, slot and fcurves for any
+        # Blender version; the seed key is overwritten by the series.
+        obj.keyframe_insert(data_path, frame=frame)
+        anim = obj.animation_data
+    return anim.action
+
+
+def _ensure_fcurve(
+    obj: Any, action: Any, data_path: str, index: int,
+) -> Any:
+    """Find or create the fcurve for one channel of data_path."""
+    ensure = getattr(action, 'fcurve_ensure_for_datablock', None)
+    if ensure is not None:
+        return ensure(obj, data_path, index=index)
+    fcurves = action.fcurves
+    fc = fcurves.find(data_path, index=index)
+    return fc or fcurves.new(data_path, index=index)
+
+
+def _merge_arrays(
+    points: Any, old: int, frames: Sequence[int], values: Sequence[float],
+) -> Tuple[Any, Any]:
+    """NumPy variant of the merge: one interleaved float32 co buffer.
+
+    Returns the sorted key frames now on the fcurve and the existing
+    keys' {frame: mode} as (frames, modes) arrays, read before the
+    merge re-orders the points.
+    """
+    f = np.asarray(frames, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    before = (f[:0], np.empty(0, dtype=np.int32))
+    if old:
+        co = np.empty(old * 2, dtype=np.float32)
+        points.foreach_get('co', co)
+        modes = np.empty(old, dtype=np.int32)
+        points.foreach_get('interpolation', modes)
+        before = (co[0::2].astype(np.float64), modes)
+        f = np.concatenate([before[0], f])
+        v = np.concatenate([co[1::2], v])
+    # Last sample per frame wins, as with the dict merge.
+    f, idx = np.unique(f[::-1], return_index=True)
+    v = v[::-1][idx]
+    points.add(len(f) - old)
+    flat = np.empty(len(f) * 2, dtype=np.float32)
+    flat[0::2] = f
+    flat[1::2] = v
+    points.foreach_set('co', flat)
+    return f, before
+
+
+def _write_points(
+    fc: Any, frames: Sequence[int], values: Sequence[float],
+    interpolation: Optional[str] = None,
+) -> None:
+    """Merge samples into an fcurve with a single foreach_set.
+
+    Merging re-orders the points by frame, so the modes of existing
+    keys are read first and written back by frame, not by index.
+    """
+    points = fc.keyframe_points
+    old = len(points)
+    if np is not None:
+        keys, before = _merge_arrays(points, old, frames, values)
+        if old or interpolation is not None:
+            _set_interpolation_array(
+                points, old, keys, before, frames, interpolation)
+        fc.update()
+        return
+    merged: Dict[float, float] = {}
+    before: Dict[float, int] = {}
+    if old:
+        co = [0.0] * (old * 2)
+        points.foreach_get('co', co)
+        modes = [0] * old
+        points.foreach_get('interpolation', modes)
+        merged = dict(zip(co[0::2], co[1::2]))
+        before = dict(zip(co[0::2], modes))
+    merged.update(zip(map(float, frames), map(float, values)))
+    keys = sorted(merged)
+    points.add(len(keys) - old)
+    flat: List[float] = []
+    for f in keys:
+        flat += (f, merged[f])
+    points.foreach_set('co', flat)
+    if old or interpolation is not None:
+        _set_interpolation(points, old, keys, before, frames, interpolation)
+    fc.update()
+
+
+def _new_key_mode(points: Any, old: int, count: int) -> int:
+    """Mode Blender gave the points just added (user preference)."""
+    if count == old:
+        return 0
+    modes = [0] * count
+    points.foreach_get('interpolation', modes)
+    return int(modes[old])
+
+
+def _set_interpolation_array(
+    points: Any, old: int, keys: Any, before: Tuple[Any, Any],
+    frames: Sequence[int], interpolation: Optional[str],
+) -> None:
+    """NumPy variant of _set_interpolation: an int32 mode buffer."""
+    if not old:
+        points.foreach_set('interpolation', np.full(
+            len(keys), INTERPOLATION_CODES[interpolation], dtype=np.int32))
+        return
+    written = np.isin(keys, np.asarray(frames, dtype=np.float64))
+    modes = np.zeros(len(keys), dtype=np.int32)
+    if interpolation is None:
+        modes[:] = _new_key_mode(points, old, len(keys))
+    old_frames, old_modes = before
+    order = np.argsort(old_frames, kind='stable')
+    pos = np.searchsorted(old_frames[order], keys).clip(0, old - 1)
+    hit = old_frames[order][pos] == keys
+    modes[hit] = old_modes[order][pos[hit]]
+    if interpolation is not None:
+        modes[written] = INTERPOLATION_CODES[interpolation]
+    points.foreach_set('interpolation', modes)
+
+
+def _set_interpolation(
+    points: Any, old: int, keys: Sequence[float], before: Dict[float, int],
+    frames: Sequence[int], interpolation: Optional[str],
+) -> None:
+    """Set every key's interpolation by frame with one foreach_set.
+
+    keys are the merged frames in point order and before the existing
+    keys' {frame: mode}; written keys get interpolation (when given),
+    other existing keys keep their mode and new ones Blender's default.
+    """
+    if not old:
+        points.foreach_set('interpolation',
+                           [INTERPOLATION_CODES[interpolation]] * len(keys))
+        return
+    written = set(map(float, frames))
+    code = INTERPOLATION_CODES.get(interpolation)
+    default = 0
+    if code is None:
+        default = _new_key_mode(points, old, len(keys))
+    points.foreach_set('interpolation', [
+        code if code is not None and f in written else before.get(f, default)
+        for f in keys])
+
+
+def write_keyframe_series(
+    obj: Any,
+    data_path: str,
+    frames: Sequence[int],
+    values: Sequence[Vec],
+    interpolation: Optional[str] = None,
+) -> None:
+    """Key every (frame, value) sample of a vector property at once.
+
+    The property is left at the last sample, matching the state a
+    sequence of per-frame set-and-keyframe commands would leave.
+    interpolation, if given, is applied to the written keys only.
+    values may be an (N, 3) NumPy array; its columns then go to the
+    fcurves without a per-sample Python loop.
+    """
+    setattr(obj, data_path, tuple(map(float, values[-1])))
+    if is_mock():
+        if hasattr(values, 'tolist'):
+            frames = [int(f) for f in frames]
+            values = [tuple(v) for v in values.tolist()]
+        obj.animation_data.insert_keyframes(
+            data_path, frames, values, interpolation)
+        return
+    action = _ensure_action(obj, data_path, int(frames[0]))
+    for axis in range(len(values[0])):
+        fc = _ensure_fcurve(obj, action, data_path, axis)
+        if hasattr(values, 'shape'):
+            column = values[:, axis]
+        else:
+            column = [v[axis] for v in values]
+        _write_points(fc, frames, column, interpolation)
+
+
+def write_constant_rate(
+    obj: Any,
+    data_path: str,
+    index: int,
+    start_frame: int,
+    start_value: float,
+    rate: float,
+) -> None:
+    """Animate one channel as an endless straight line.
+
+    Two LINEAR keys (start_frame and start_frame + 1) on the channel's
+    fcurve plus LINEAR extrapolation give value = start + rate * (f -
+    start_frame) for every frame, with O(1) data instead of a key per
+    step. Existing keys on that channel are replaced.
+    """
+    vec = list(getattr(obj, data_path))
+    vec[index] = start_value
+    setattr(obj, data_path, tuple(vec))
+    if is_mock():
+        obj.animation_data.set_constant_rate(
+            data_path, index, start_frame, start_value, rate)
+        return
+    action = _ensure_action(obj, data_path, start_frame)
+    fc = _ensure_fcurve(obj, action, data_path, index)
+    points = fc.keyframe_points
+    if hasattr(points, 'clear'):
+        points.clear()
+    else:
+        for point in reversed(list(points)):
+            points.remove(point, fast=True)
+    _write_points(
+        fc, [start_frame, start_frame + 1],
+        [start_value, start_value + rate], 'LINEAR',
+    )
+    fc.extrapolation = 'LINEAR'
+
+
+def drive_constant_rate(
+    obj: Any,
+    data_path: str,
+    index: int,
+    start_frame: int,
+    start_value: float,
+    rate: float,
+    scene: Any,
+) -> None:
+    """Drive one channel from the scene frame without Python.
+
+    A SUM driver reads scene.frame_current and the driver fcurve's
+    Generator modifier maps it to start + rate * (f - start_frame), so
+    evaluation never enters the Python interpreter (unlike SCRIPTED).
+    """
+    vec = list(getattr(obj, data_path))
+    vec[index] = start_value
+    setattr(obj, data_path, tuple(vec))
+    if is_mock():
+        obj.animation_data.set_constant_rate(
+            data_path, index, start_frame, start_value, rate)
+        return
+    fc = obj.driver_add(data_path, index)
+    drv = fc.driver
+    drv.type = 'SUM'
+    var = drv.variables[0] if drv.variables else drv.variables.new()
+    var.name = 'frame'
+    var.type = 'SINGLE_PROP'
+    target = var.targets[0]
+    target.id_type = 'SCENE'
+    target.id = scene
+    target.data_path = 'frame_current'
+    gen = next((m for m in fc.modifiers if m.type == 'GENERATOR'), None)
+    if gen is None:
+        gen = fc.modifiers.new('GENERATOR')
+    gen.mode = 'POLYNOMIAL'
+    gen.poly_order = 1
+    gen.use_additive = False
+    gen.coefficients[0] = start_value - rate * start_frame
+    gen.coefficients[1] = rate
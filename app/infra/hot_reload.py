@@ -0,0 +1,178 @@
+# File: app/infra/hot_reload.py
+# Reload manager for launchers run repeatedly in one Blender session.
+# Reloads only modules whose source changed plus every module importing
+# them, keeps the command registry in step, and runs the run_state reset
+# hooks so state in unchanged modules starts each run fresh. Imports
+# nothing from app so it survives the reloads it performs.
+# All Rights Reserved Arodi Emmanuel
+
+import ast
+import hashlib
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Set, Tuple
+
+REGISTRY_MODULE = 'app.kernel.registry'
+RUN_STATE_MODULE = 'app.infra.run_state'
+
+
+class ReloadReport(NamedTuple):
+    """Outcome of one reload_changed() call."""
+    full: bool              # everything under the prefixes was dropped
+    changed: List[str]      # modules whose source changed
+    reloaded: List[str]     # changed modules plus their importers
+
+
+class ReloadManager:
+    """Tracks content hashes and imports of modules under prefixes."""
+
+    def __init__(self, prefixes: Tuple[str, ...] = ('app', 'scenes')):
+        self.prefixes = prefixes
+        self._hashes: Dict[str, str] = {}
+        self._imports: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+        self._last_run = None
+
+    def reload_changed(self) -> ReloadReport:
+        """Drop and re-import changed modules and their dependents.
+
+        The first call (or a change to this file) drops every tracked
+        module, like a cold start; later calls compare content hashes.
+        Commands registered by a dropped module are unregistered before
+        it is re-imported, so renamed or deleted commands disappear.
+        Every run_state reset hook runs last: caches and settings held
+        by modules that were not reloaded would otherwise carry over,
+        e.g. pointing at datablocks a clear_scene has freed.
+        """
+        if self._last_run is None or _self_changed():
+            # A stale copy of this module drops itself too; a fresh one
+            # (first call) keeps itself, it is what the launcher imported.
+            keep = () if _self_changed() else (__name__,)
+            names = sorted(n for n in self._tracked() if n not in keep)
+            self._drop(names)
+            self._finish()
+            _reset_state()
+            return ReloadReport(True, [], names)
+        tracked = self._tracked()
+        digests = {name: _digest(path) for name, path in tracked.items()}
+        changed = sorted(n for n, d in digests.items()
+                         if self._is_changed(n, d, tracked[n]))
+        reloaded = _dependents(changed, self._graph(tracked, digests))
+        self._drop(reloaded)
+        for name in reloaded:
+            importlib.import_module(name)
+        self._finish()
+        _reset_state()
+        return ReloadReport(False, changed, reloaded)
+
+    def _tracked(self) -> Dict[str, Path]:
+        return {
+            name: Path(module.__file__)
+            for name, module in list(sys.modules.items())
+            if name.startswith(self.prefixes) and module is not None
+            and getattr(module, '__file__', None)}
+
+    def _is_changed(self, name: str, digest: str, path: Path) -> bool:
+        known = self._hashes.get(name)
+        if known is not None:
+            return known != digest
+        # Imported after the last run: changed if edited since then.
+        return path.stat().st_mtime_ns > self._last_run
+
+    def _graph(
+        self, tracked: Dict[str, Path], digests: Dict[str, str],
+    ) -> Dict[str, FrozenSet[str]]:
+        graph = {}
+        for name, digest in digests.items():
+            cached = self._imports.get(name)
+            if cached is None or cached[0] != digest:
+                cached = (digest, _imports_of(name, tracked[name]))
+                self._imports[name] = cached
+            graph[name] = cached[1]
+        return graph
+
+    def _drop(self, names: List[str]) -> None:
+        registry = sys.modules.get(REGISTRY_MODULE)
+        dropped = set(names)
+        if registry is not None and REGISTRY_MODULE not in dropped:
+            commands = registry.get_registry()
+            for cmd, handler in list(commands.items()):
+                if getattr(handler, '__module__', None) in dropped:
+                    del commands[cmd]
+        run_state = sys.modules.get(RUN_STATE_MODULE)
+        if run_state is not None and RUN_STATE_MODULE not in dropped:
+            run_state.forget(dropped)
+        for name in names:
+            sys.modules.pop(name, None)
+            self._hashes.pop(name, None)
+
+    def _finish(self) -> None:
+        for name, path in self._tracked().items():
+            self._hashes.setdefault(name, _digest(path))
+        self._last_run = time.time_ns()
+
+
+def _reset_state() -> None:
+    run_state = sys.modules.get(RUN_STATE_MODULE)
+    if run_state is not None:
+        run_state.reset_all()
+
+
+def _dependents(changed: List[str], graph: Dict[str, FrozenSet[str]]):
+    """changed plus every module importing one of them, transitively."""
+    importers: Dict[str, Set[str]] = {}
+    for name, deps in graph.items():
+        for dep in deps:
+            importers.setdefault(dep, set()).add(name)
+    out, todo = set(changed), list(changed)
+    while todo:
+        for name in importers.get(todo.pop(), ()):
+            if name not in out:
+                out.add(name)
+                todo.append(name)
+    return sorted(out)
+
+
+def _imports_of(name: str, path: Path) -> FrozenSet[str]:
+    """Absolute names of loaded modules that name's source imports."""
+    try:
+        tree = ast.parse(path.read_bytes())
+    except (OSError, SyntaxError, ValueError):
+        return frozenset()
+    package = name if path.name == '__init__.py' else name.rpartition('.')[0]
+    deps = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            deps.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ''
+            if node.level:
+                parent = package.rsplit('.', node.level - 1)[0]
+                base = f"{parent}.{base}" if base else parent
+            for alias in node.names:
+                child = f"{base}.{alias.name}"
+                deps.add(child if child in sys.modules else base)
+    return frozenset(d for d in deps if d in sys.modules and d != name)
+
+
+def _digest(path: Path) -> str:
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return ''
+
+
+_OWN_DIGEST = _digest(Path(__file__))
+
+
+def _self_changed() -> bool:
+    return _digest(Path(__file__)) != _OWN_DIGEST
+
+
+MANAGER = ReloadManager()
+
+
+def reload_changed() -> ReloadReport:
+    """Reload changed app / scenes modules (see ReloadManager)."""
+    return MANAGER.reload_changed()
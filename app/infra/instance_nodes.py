@@ -0,0 +1,98 @@
+# File: app/infra/instance_nodes.py
+# Geometry-nodes instancer: a node group that puts one UV sphere on every
+# point of the mesh it modifies, scaled by a FLOAT point attribute. One
+# group per (segments, rings, radius, attribute, material), reused from
+# bpy.data.node_groups so a thousand-star field costs one modifier. Node
+# groups outlive clear_scene, so a group is only reused while its Set
+# Material node still holds the material asked for.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Optional
+
+from .bridge import data, is_mock
+
+GROUP_PREFIX = 'PointInstancer'
+
+
+def add_sphere_instancer(
+    obj: Any,
+    scale_attribute: str,
+    radius: float = 1.0,
+    segments: int = 16,
+    rings: int = 8,
+    material: Optional[Any] = None,
+) -> Any:
+    """Add a Geometry Nodes modifier instancing spheres on obj's points.
+
+    The mock has no geometry nodes; there the modifier is skipped and
+    None is returned (the point mesh and its attribute still exist).
+    """
+    if is_mock():
+        return None
+    group = _sphere_group(scale_attribute, radius, segments, rings, material)
+    modifier = obj.modifiers.new(name='Instances', type='NODES')
+    modifier.node_group = group
+    return modifier
+
+
+def _sphere_group(attribute, radius, segments, rings, material) -> Any:
+    mat_name = material.name if material is not None else ''
+    name = (f"{GROUP_PREFIX}_{attribute}_{segments}x{rings}_{radius:g}"
+            f"{'_' + mat_name if mat_name else ''}")
+    group = data.node_groups.get(name)
+    if group is not None:
+        if _group_material(group) == material:
+            return group
+        # Its material was removed (or replaced under the same name).
+        data.node_groups.remove(group)
+    group = data.node_groups.new(name, 'GeometryNodeTree')
+    _add_socket(group, 'Geometry', 'INPUT')
+    _add_socket(group, 'Geometry', 'OUTPUT')
+    nodes, links = group.nodes, group.links
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    sphere = nodes.new('GeometryNodeMeshUVSphere')
+    sphere.inputs['Segments'].default_value = segments
+    sphere.inputs['Rings'].default_value = rings
+    sphere.inputs['Radius'].default_value = radius
+    scale = nodes.new('GeometryNodeInputNamedAttribute')
+    scale.data_type = 'FLOAT'
+    scale.inputs['Name'].default_value = attribute
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+
+    mesh_out = sphere.outputs['Mesh']
+    if material is not None:
+        set_mat = nodes.new('GeometryNodeSetMaterial')
+        set_mat.inputs['Material'].default_value = material
+        links.new(mesh_out, set_mat.inputs['Geometry'])
+        mesh_out = set_mat.outputs['Geometry']
+    links.new(group_in.outputs[0], instance.inputs['Points'])
+    links.new(mesh_out, instance.inputs['Instance'])
+    links.new(_enabled_output(scale), instance.inputs['Scale'])
+    links.new(instance.outputs['Instances'], group_out.inputs[0])
+    return group
+
+
+def _group_material(group: Any) -> Optional[Any]:
+    """Material on the group's Set Material node (None without one, or
+    once Blender cleared the reference to a removed material)."""
+    for node in group.nodes:
+        if node.bl_idname == 'GeometryNodeSetMaterial':
+            return node.inputs['Material'].default_value
+    return None
+
+
+def _add_socket(group: Any, name: str, in_out: str) -> None:
+    """Group socket on Blender 4.x (interface) and 3.x (inputs/outputs)."""
+    if hasattr(group, 'interface'):
+        group.interface.new_socket(
+            name, in_out=in_out, socket_type='NodeSocketGeometry')
+    elif in_out == 'INPUT':
+        group.inputs.new('NodeSocketGeometry', name)
+    else:
+        group.outputs.new('NodeSocketGeometry', name)
+
+
+def _enabled_output(node: Any) -> Any:
+    """Blender 3.x keeps one hidden output per attribute data type."""
+    return next(s for s in node.outputs if s.enabled)
@@ -0,0 +1,138 @@
+# File: app/infra/material_templates.py
+# Material node-graph templates for create_material. Each graph topology
+# (plain, emission, bump, emission + bump) is built once as a template
+# material; materials are template.copy() with only the input values
+# patched. Identical specs reuse the finished material (datablock_cache).
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, NamedTuple, Tuple
+
+from . import datablock_cache
+from .bridge import data
+
+TEMPLATE_PREFIX = '.MaterialTemplate'
+NOISE_SCALE = 6.0
+
+
+class MaterialSpec(NamedTuple):
+    """Normalized create_material args; hashable cache key."""
+    color: Tuple[float, float, float, float]
+    emit: bool
+    emit_strength: float
+    roughness: float
+    normal_strength: float      # 0 unless a noise bump is requested
+
+    @property
+    def topology(self) -> Tuple[bool, bool]:
+        return self.emit, self.normal_strength > 0.0
+
+
+def spec_from_args(args: Dict[str, Any]) -> MaterialSpec:
+    color = tuple(float(c) for c in args.get('color', (0.8, 0.8, 0.8, 1.0)))
+    if len(color) == 3:
+        color = color + (1.0,)
+    use_noise = bool(args.get('use_noise_texture', False))
+    return MaterialSpec(
+        color=color,
+        emit=bool(args.get('emit', False)),
+        emit_strength=float(args.get('emit_strength', 5.0)),
+        roughness=float(args.get('roughness', 0.4)),
+        normal_strength=(float(args.get('normal_strength', 0.0))
+                         if use_noise else 0.0),
+    )
+
+
+def cached_material(name: str, spec: MaterialSpec) -> Any:
+    """The live material made earlier from the same name and spec.
+
+    None if it was renamed or recoloured (set_material_color) since.
+    """
+    mat = datablock_cache.lookup(('material', name, spec), data.materials)
+    if mat is None or mat.name != name:
+        return None
+    # diffuse_color is float32 in Blender: compare with a tolerance.
+    if any(abs(a - b) > 1e-6 for a, b in zip(mat.diffuse_color, spec.color)):
+        return None
+    return mat
+
+
+def remember(name: str, spec: MaterialSpec, mat: Any) -> None:
+    datablock_cache.store(('material', name, spec), mat)
+
+
+def instantiate(name: str, spec: MaterialSpec) -> Any:
+    """Copy the spec's topology template, rename it and patch values."""
+    mat = _template(spec.topology).copy()
+    mat.name = name
+    patch(mat, spec)
+    return mat
+
+
+def patch(mat: Any, spec: MaterialSpec) -> None:
+    """Write spec's constants into a templated material's nodes."""
+    mat.diffuse_color = spec.color
+    nodes = mat.node_tree.nodes
+    bsdf = nodes['BSDF'].inputs
+    bsdf['Base Color'].default_value = spec.color
+    bsdf['Roughness'].default_value = spec.roughness
+    if spec.emit:
+        emission = nodes['Emission'].inputs
+        emission['Color'].default_value = spec.color
+        emission['Strength'].default_value = spec.emit_strength
+    if spec.normal_strength > 0.0:
+        nodes['Bump'].inputs['Strength'].default_value = spec.normal_strength
+
+
+def _template(topology: Tuple[bool, bool]) -> Any:
+    key = ('material_template', topology)
+    mat = datablock_cache.lookup(key, data.materials)
+    if mat is None:
+        emit, bump = topology
+        mat = data.materials.new(
+            f"{TEMPLATE_PREFIX}{'_Emit' if emit else ''}"
+            f"{'_Bump' if bump else ''}")
+        _build_graph(mat, emit, bump)
+        datablock_cache.store(key, mat)
+    return mat
+
+
+def _build_graph(mat: Any, emit: bool, bump: bool) -> None:
+    """Principled BSDF [-> Emission mix] [+ noise bump] -> Output."""
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    principled = nodes.new('ShaderNodeBsdfPrincipled')
+    principled.name = 'BSDF'
+    final_shader_output = principled.outputs['BSDF']
+
+    # Optional emission mix for glowing rings/particles
+    if emit:
+        emit_node = nodes.new('ShaderNodeEmission')
+        emit_node.name = 'Emission'
+        mix_shader = nodes.new('ShaderNodeMixShader')
+        # Fac = 1.0: full emission output (no BSDF bleed)
+        mix_shader.inputs['Fac'].default_value = 1.0
+        links.new(emit_node.outputs['Emission'], mix_shader.inputs[1])
+        links.new(principled.outputs['BSDF'], mix_shader.inputs[2])
+        final_shader_output = mix_shader.outputs[0]
+        # Disable back-face culling so emission is visible from ALL
+        # camera angles — critical for JetSouth whose normals face -Z
+        # and would be invisible when camera is in the +Z hemisphere.
+        try:
+            mat.use_backface_culling = False
+        except AttributeError:
+            pass  # Older Blender builds — safe to ignore
+
+    # Optional normal/bump generated from a noise texture for subtle detail
+    if bump:
+        noise = nodes.new('ShaderNodeTexNoise')
+        noise.inputs['Scale'].default_value = NOISE_SCALE
+        bump_node = nodes.new('ShaderNodeBump')
+        bump_node.name = 'Bump'
+        links.new(noise.outputs['Fac'], bump_node.inputs['Height'])
+        links.new(bump_node.outputs['Normal'], principled.inputs['Normal'])
+
+    output = nodes.new('ShaderNodeOutputMaterial')
+    links.new(final_shader_output, output.inputs['Surface'])
@@ -0,0 +1,80 @@
+# File: app/infra/mesh_factory.py
+# Operator-free mesh/object creation. Fills bpy.data.meshes straight from
+# cached flat buffers with foreach_set and links objects without bpy.ops,
+# so no undo push, scene update or depsgraph evaluation per spawn.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from app.domain.primitive_geometry import MeshBuffers
+from .bridge import data, context, is_mock, bpy
+
+Vec = Tuple[float, float, float]
+
+
+def _loop_total_writable() -> bool:
+    """Blender < 4.0 needs loop_total set; 4.0+ derives it."""
+    if is_mock():
+        return True
+    prop = bpy.types.MeshPolygon.bl_rna.properties['loop_total']
+    return not prop.is_readonly
+
+
+def build_mesh(name: str, buffers: MeshBuffers) -> Any:
+    """Create a mesh datablock from flat vertex/face buffers."""
+    mesh = data.meshes.new(name)
+    co = buffers.co
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set('co', co)
+    mesh.loops.add(len(buffers.loop_verts))
+    mesh.loops.foreach_set('vertex_index', buffers.loop_verts)
+    mesh.polygons.add(len(buffers.loop_starts))
+    mesh.polygons.foreach_set('loop_start', buffers.loop_starts)
+    if _loop_total_writable():
+        mesh.polygons.foreach_set('loop_total', buffers.loop_totals)
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def build_point_mesh(
+    name: str,
+    co: Sequence[float],
+    attributes: Optional[Dict[str, Sequence[float]]] = None,
+) -> Any:
+    """Vertex-only mesh (a point cloud) from flat xyz coordinates, with
+    one FLOAT point attribute per entry of attributes."""
+    attributes = attributes or {}
+    mesh = data.meshes.new(name)
+    if is_mock():
+        mesh.vertices = [tuple(co[i:i + 3]) for i in range(0, len(co), 3)]
+        mesh.attributes.update(
+            {key: list(values) for key, values in attributes.items()})
+        return mesh
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set('co', co)
+    for key, values in attributes.items():
+        attr = mesh.attributes.new(key, 'FLOAT', 'POINT')
+        attr.data.foreach_set('value', values)
+    mesh.update()
+    return mesh
+
+
+def link_object(
+    name: str,
+    mesh: Any,
+    location: Vec,
+    rotation: Vec = (0.0, 0.0, 0.0),
+    scale: Vec = (1.0, 1.0, 1.0),
+) -> Any:
+    """Create an object for mesh, link it and make it active."""
+    obj = data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    obj.scale = scale
+    if is_mock():
+        context.view_layer.objects.link(obj)
+        context.active_object = obj
+    else:
+        context.collection.objects.link(obj)
+        context.view_layer.objects.active = obj
+    return obj
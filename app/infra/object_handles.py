@@ -0,0 +1,79 @@
+# File: app/infra/object_handles.py
+# Object lookup for command handlers. Outside a compiled plan this is just
+# bpy.data.objects.get; while a plan runs, names resolve through the plan's
+# handle table, which the plan keeps current on spawn/rename/delete.
+# All Rights Reserved Arodi Emmanuel
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from .bridge import data, context
+
+_table: Optional[Dict[str, Any]] = None
+
+
+def find_object(name: str) -> Optional[Any]:
+    """Resolve an object by name, through the active handle table if any.
+
+    A cached handle is trusted only while its name still matches, so a
+    rename or removal the plan did not see costs one fallback lookup.
+    """
+    table = _table
+    if table is None:
+        return data.objects.get(name)
+    obj = table.get(name)
+    if obj is not None:
+        try:
+            if obj.name == name:
+                return obj
+        except ReferenceError:
+            pass
+    obj = data.objects.get(name)
+    if obj is None:
+        table.pop(name, None)
+    else:
+        table[name] = obj
+    return obj
+
+
+@contextmanager
+def bound(table: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Route find_object through table for the duration of the block."""
+    global _table
+    previous, _table = _table, table
+    try:
+        yield table
+    finally:
+        _table = previous
+
+
+def note_created(name: str) -> None:
+    """Record the object a spawn just made active under name."""
+    if _table is None:
+        return
+    obj = getattr(context, 'active_object', None)
+    if obj is not None and getattr(obj, 'name', None) == name:
+        _table[name] = obj
+    else:
+        _table.pop(name, None)
+
+
+def note_renamed(old: str, new: str) -> None:
+    """Move a handle from old to new name."""
+    if _table is None:
+        return
+    obj = _table.pop(old, None)
+    if obj is not None:
+        _table[new] = obj
+
+
+def note_deleted(name: str) -> None:
+    """Drop the handle of a removed object."""
+    if _table is not None:
+        _table.pop(name, None)
+
+
+def note_cleared() -> None:
+    """Drop every handle (scene was cleared)."""
+    if _table is not None:
+        _table.clear()
@@ -0,0 +1,33 @@
+# File: app/infra/run_state.py
+# Reset hooks for module-level state that must not outlive one launcher
+# run (caches of datablocks, the selected spawn engine, ...). Modules
+# register a hook with @on_reset; hot_reload calls reset_all() at the
+# start of every run, since unchanged modules are no longer re-imported.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Callable, Dict, Iterable
+
+Hook = Callable[[], None]
+
+# module name -> {hook qualname: hook}; re-importing a module replaces
+# its hooks instead of adding stale copies.
+_hooks: Dict[str, Dict[str, Hook]] = {}
+
+
+def on_reset(hook: Hook) -> Hook:
+    """Decorator: call hook before each run to clear module state."""
+    _hooks.setdefault(hook.__module__, {})[hook.__qualname__] = hook
+    return hook
+
+
+def forget(modules: Iterable[str]) -> None:
+    """Drop the hooks of modules being unloaded."""
+    for name in modules:
+        _hooks.pop(name, None)
+
+
+def reset_all() -> None:
+    """Run every registered hook."""
+    for hooks in list(_hooks.values()):
+        for hook in list(hooks.values()):
+            hook()
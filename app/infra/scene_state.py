@@ -0,0 +1,25 @@
+# File: app/infra/scene_state.py
+# JSON state persisted as a custom property of the active scene, so it is
+# saved with the .blend file and survives script re-runs.
+# All Rights Reserved Arodi Emmanuel
+
+import json
+from typing import Any, Optional
+
+from .bridge import context
+
+
+def load(key: str) -> Optional[Any]:
+    """Return the value stored under key on the scene, or None."""
+    raw = context.scene.get(key)
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def save(key: str, value: Any) -> None:
+    """Store value (JSON-serialisable) under key on the scene."""
+    context.scene[key] = json.dumps(value, separators=(',', ':'))
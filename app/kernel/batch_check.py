@@ -0,0 +1,179 @@
+# File: app/kernel/batch_check.py
+# Single-pass batch checker. Walks an instruction list once against
+# COMMAND_SCHEMAS, keeping symbol tables of the object and material names
+# defined so far, and reports every instruction that could not succeed.
+# preflight() is the dry-run hook behind create_scene(..., dry_run=True).
+# All Rights Reserved Arodi Emmanuel
+
+from typing import (
+    AbstractSet, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple,
+)
+
+from app.domain.command_schemas import ArgSchema, COMMAND_SCHEMAS
+from .registry import list_commands
+
+
+# Per-command checks, unpacked once from its ArgSchema: (required,
+# choices, consumes, consumes_materials, schema if it defines names).
+_Rule = Tuple[tuple, tuple, tuple, tuple, Optional[ArgSchema]]
+
+# Marker rule for commands missing from the registry and manifest.
+_UNKNOWN: _Rule = ((), (), (), (), None)
+
+
+class Issue(NamedTuple):
+    """One finding: instruction position, command, message, severity."""
+    index: int
+    cmd: str
+    message: str
+    severity: str = 'error'
+
+
+def check_batch(
+    instructions: Iterable[Dict[str, Any]],
+    objects: Iterable[str] = (),
+    materials: Iterable[str] = (),
+    commands: Optional[AbstractSet[str]] = None,
+) -> List[Issue]:
+    """Check instructions in one linear pass.
+
+    Args:
+        instructions: Any iterable of instruction dicts (a generator is
+                      consumed once and never materialised).
+        objects / materials: Names that exist before the batch runs
+                      (see scene_symbols()).
+        commands: Known command names; defaults to the registry plus the
+                  command manifest.
+
+    Reports missing 'cmd', unknown commands, missing required args,
+    args outside their choices, references to objects or materials not
+    defined earlier (or deleted / renamed away) as errors, and names
+    created twice or objects / materials created without a name as
+    warnings. A known command without a schema is not checked, but its
+    'name' arg is recorded as an object it may create.
+    """
+    known = frozenset(list_commands()) if commands is None else commands
+    objs, mats = set(objects), set(materials)
+    rules: Dict[str, Optional[_Rule]] = {}
+    issues: List[Issue] = []
+    add = issues.append
+    for i, instruction in enumerate(instructions):
+        cmd = instruction.get('cmd')
+        try:
+            rule = rules[cmd]
+        except KeyError:
+            if not cmd:
+                add(Issue(i, '<none>', "missing 'cmd'"))
+                continue
+            rule = rules[cmd] = _compile(cmd, known)
+        if rule is None:        # no schema: record what it may create
+            name = (instruction.get('args') or {}).get('name')
+            if isinstance(name, str) and name:
+                objs.add(name)
+            continue
+        if rule is _UNKNOWN:
+            add(Issue(i, cmd, 'unknown command'))
+            continue
+        required, choices, consumes, consumes_mats, effects = rule
+        args = instruction.get('args') or {}
+        for key in required:
+            value = args.get(key)
+            if value is None or (isinstance(value, str) and not value):
+                add(Issue(i, cmd, f"missing '{key}'"))
+        for key, values in choices:
+            value = args.get(key)
+            if isinstance(value, str) and value.lower() not in values:
+                add(Issue(i, cmd, f"unknown {key} '{value}'"))
+        for key in consumes:
+            name = args.get(key)
+            if name.__class__ is str:       # the common case, inline
+                if name not in objs and name:
+                    add(Issue(i, cmd, f"unknown object '{name}'"))
+                continue
+            for name in _names(name):
+                if name not in objs:
+                    add(Issue(i, cmd, f"unknown object '{name}'"))
+        for key in consumes_mats:
+            for name in _names(args.get(key)):
+                if name not in mats:
+                    add(Issue(i, cmd, f"unknown material '{name}'"))
+        if effects is not None:
+            _define(effects, args, objs, mats, i, cmd, issues)
+    return issues
+
+
+def preflight(instructions: Iterable[Dict[str, Any]]) -> List[Issue]:
+    """Dry run: check instructions against the current scene."""
+    return check_batch(instructions, *scene_symbols())
+
+
+def scene_symbols() -> Tuple[List[str], List[str]]:
+    """(object names, material names) in the current scene."""
+    from app.infra.bridge import data
+    return list(data.objects.keys()), list(data.materials.keys())
+
+
+def _compile(cmd: str, known: AbstractSet[str]) -> Optional[_Rule]:
+    if cmd not in known:
+        return _UNKNOWN
+    schema = COMMAND_SCHEMAS.get(cmd)
+    if schema is None:
+        return None
+    defines = (schema.clears or schema.creates or schema.renames
+               or schema.deletes or schema.creates_material)
+    return (schema.required, schema.choices, schema.consumes,
+            schema.consumes_materials, schema if defines else None)
+
+
+def _define(schema: ArgSchema, args: Dict[str, Any], objs: set, mats: set,
+            i: int, cmd: str, issues: List[Issue]) -> None:
+    """Apply the schema's effect on the symbol tables."""
+    if schema.clears:
+        objs.clear()
+    if schema.creates:
+        name = _created_name(schema, schema.creates, args, i, cmd, issues)
+        if name is not None:
+            if name in objs:
+                issues.append(Issue(
+                    i, cmd, f"object '{name}' redefined", 'warning'))
+            objs.add(name)
+    if schema.renames:
+        old, new = (args.get(key) for key in schema.renames)
+        if isinstance(old, str) and isinstance(new, str) and new:
+            objs.discard(old)
+            objs.add(new)
+    if schema.deletes and isinstance(args.get(schema.deletes), str):
+        objs.discard(args[schema.deletes])
+    if schema.creates_material:
+        name = _created_name(schema, schema.creates_material, args, i, cmd,
+                             issues)
+        if name is not None:
+            if name in mats:
+                issues.append(Issue(
+                    i, cmd, f"material '{name}' redefined", 'warning'))
+            mats.add(name)
+
+
+def _created_name(schema: ArgSchema, key: str, args: Dict[str, Any], i: int,
+                  cmd: str, issues: List[Issue]) -> Optional[str]:
+    """The name args[key] gives a new object or material, if any.
+
+    An unnamed creation gets a default name at dispatch time that later
+    instructions cannot rely on, so it is reported as a warning (unless
+    the name is required, which is already an error).
+    """
+    name = args.get(key)
+    if isinstance(name, str) and name:
+        return name
+    if name is None or isinstance(name, str):      # unnamed
+        if key not in schema.required:
+            issues.append(Issue(i, cmd, f'{cmd} without name', 'warning'))
+    return None
+
+
+def _names(value: Any) -> Tuple[str, ...]:
+    if isinstance(value, str):
+        return (value,) if value else ()
+    if isinstance(value, (list, tuple)):
+        return tuple(v for v in value if isinstance(v, str))
+    return ()
@@ -0,0 +1,103 @@
+# File: app/kernel/batch_plan.py
+# Batch compiler. Turns an instruction list into an executable plan once:
+# handlers bound, args validated and coerced against their schema, and a
+# per-plan handle table for object names. Run it with dispatch_plan().
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from app.domain.command_schemas import ArgSchema, COMMAND_SCHEMAS
+from app.domain.dispatch_result import DispatchResult
+from .registry import get_command
+
+
+class PlanStep(NamedTuple):
+    """One compiled instruction; error is set if it can never succeed."""
+    cmd: Optional[str]
+    handler: Optional[Callable[[Dict[str, Any]], DispatchResult]]
+    args: Dict[str, Any]
+    schema: Optional[ArgSchema]
+    error: Optional[DispatchResult]
+    origin: Optional[str] = None   # builder tag, for the profiler
+
+
+class BatchPlan:
+    """Compiled batch: bound steps plus the object handle table."""
+
+    def __init__(self, steps: List[PlanStep]):
+        self.steps = steps
+        self.handles: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def _coerce(cmd: str, args: Dict[str, Any], schema: ArgSchema):
+    """Validate required args and coerce vectors/frames.
+
+    Returns (args, error). args is a fresh dict when anything changed so
+    the caller's instruction stays untouched.
+    """
+    for key in schema.required:
+        value = args.get(key)
+        if value is None or (isinstance(value, str) and not value):
+            return args, DispatchResult.fail(
+                f"Missing '{key}'", command=cmd)
+    coerced = None
+    for key in schema.vectors:
+        value = args.get(key)
+        if value is None or isinstance(value, tuple):
+            continue
+        try:
+            vec = tuple(float(v) for v in value)
+        except (TypeError, ValueError):
+            if key == 'scale' and isinstance(value, (int, float)):
+                continue
+            return args, DispatchResult.fail(
+                f"Invalid '{key}': expected a vector", command=cmd)
+        coerced = coerced or dict(args)
+        coerced[key] = vec
+    for key in schema.ints:
+        value = args.get(key)
+        if value is None or type(value) is int:
+            continue
+        try:
+            frame = int(value)
+        except (TypeError, ValueError):
+            return args, DispatchResult.fail(
+                f"Invalid '{key}': expected an integer", command=cmd)
+        coerced = coerced or dict(args)
+        coerced[key] = frame
+    return (coerced or args), None
+
+
+def compile_batch(instructions: List[Dict[str, Any]]) -> BatchPlan:
+    """Compile instructions into a BatchPlan.
+
+    Handlers are looked up once per command name. Instructions that are
+    malformed, unknown or fail schema checks compile to a step carrying
+    their failure, keeping result positions aligned with the input.
+    """
+    bound: Dict[str, Any] = {}
+    steps: List[PlanStep] = []
+    for instruction in instructions:
+        cmd = instruction.get('cmd')
+        args = instruction.get('args', {})
+        if not cmd:
+            steps.append(PlanStep(cmd, None, args, None, DispatchResult.fail(
+                "Missing 'cmd' key in instruction")))
+            continue
+        if cmd not in bound:
+            bound[cmd] = get_command(cmd)
+        handler = bound[cmd]
+        if handler is None:
+            steps.append(PlanStep(cmd, None, args, None, DispatchResult.fail(
+                f"Unknown command: {cmd}", command=cmd)))
+            continue
+        schema = COMMAND_SCHEMAS.get(cmd)
+        error = None
+        if schema is not None:
+            args, error = _coerce(cmd, args, schema)
+        steps.append(PlanStep(cmd, handler, args, schema, error,
+                              instruction.get('origin')))
+    return BatchPlan(steps)
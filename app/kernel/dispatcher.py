@@ -3,11 +3,19 @@
 # Looks up commands in registry and executes them blindly. Command agnostic.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from app.domain.columnar_batch import ColumnarBatch
 from app.domain.dispatch_result import DispatchResult
+from app.domain.dispatch_summary import DispatchSummary
+from app.infra import object_handles
+from . import profiler
+from .batch_plan import BatchPlan, PlanStep
 from .registry import get_command
 
+RESULT_MODES = ('list', 'summary')
+Results = Union[List[DispatchResult], DispatchSummary]
+
 
 def dispatch_single(instruction: Dict[str, Any]) -> DispatchResult:
     """Dispatch a single instruction to its command handler."""
@@ -25,18 +33,84 @@ def dispatch_single(instruction: Dict[str, Any]) -> DispatchResult:
         )
 
     try:
+        if profiler.ACTIVE is not None:
+            return profiler.ACTIVE.call(
+                handler, args, cmd_name, instruction.get(profiler.ORIGIN_KEY))
         return handler(args)
     except Exception as e:
         return DispatchResult.fail(str(e), command=cmd_name)
 
 
-def dispatch_batch(instructions: List[Dict[str, Any]]) -> List[DispatchResult]:
-    """Dispatch a batch of instructions in order."""
-    results = []
-    for instruction in instructions:
-        result = dispatch_single(instruction)
-        results.append(result)
-    return results
+def dispatch_batch(
+    instructions: Union[List[Dict[str, Any]], ColumnarBatch],
+    results: str = 'list',
+    samples: int = 0,
+) -> Results:
+    """Dispatch a batch of instructions in order.
+
+    results='summary' returns a DispatchSummary (keeping `samples`
+    success payloads per command) instead of one result per instruction.
+    A ColumnarBatch is dispatched natively by dispatch_columnar().
+    """
+    if isinstance(instructions, ColumnarBatch):
+        return dispatch_columnar(instructions, results, samples)
+    summary = _summary_sink(results, samples)
+    if summary is not None:
+        for index, instruction in enumerate(instructions):
+            summary.add(index, instruction.get('cmd'),
+                        dispatch_single(instruction))
+        return summary
+    return [dispatch_single(instruction) for instruction in instructions]
+
+
+def dispatch_stream(
+    instructions: Iterable[Dict[str, Any]],
+    samples: int = 0,
+) -> DispatchSummary:
+    """Dispatch instructions as they are produced (lists or generators).
+
+    Each instruction is dropped once dispatched and only a summary is
+    kept, so memory stays flat however long the stream is.
+    """
+    return dispatch_batch(instructions, 'summary', samples)
+
+
+def dispatch_columnar(
+    batch: ColumnarBatch, results: str = 'list', samples: int = 0,
+) -> Results:
+    """Dispatch a ColumnarBatch in row order without expanding it.
+
+    Handlers are looked up once per command id and keyframe rows get a
+    transient args dict; other rows go through dispatch_single().
+    """
+    summary = _summary_sink(results, samples)
+    out: List[DispatchResult] = []
+    handlers = [get_command(cmd) for cmd in batch.commands]
+    active = profiler.ACTIVE
+    for index in range(len(batch)):
+        cid = batch.cmd_ids[index]
+        if batch.is_key(index):
+            result = _call_key(
+                handlers[cid], batch.args(index), batch.commands[cid],
+                batch.origins[batch.origin_ids[index]] or None, active)
+        else:
+            result = dispatch_single(batch.extras[batch.obj_ids[index]])
+        if summary is not None:
+            summary.add(index, batch.commands[cid], result)
+        else:
+            out.append(result)
+    return summary if summary is not None else out
+
+
+def _call_key(handler, args, cmd, origin, active) -> DispatchResult:
+    if handler is None:
+        return DispatchResult.fail(f"Unknown command: {cmd}", command=cmd)
+    try:
+        if active is not None:
+            return active.call(handler, args, cmd, origin)
+        return handler(args)
+    except Exception as e:
+        return DispatchResult.fail(str(e), command=cmd)
 
 
 def dispatch_batch_stop_on_error(
@@ -50,3 +124,63 @@ def dispatch_batch_stop_on_error(
         if not result.success:
             break
     return results
+
+
+def dispatch_plan(
+    plan: BatchPlan, results: str = 'list', samples: int = 0,
+) -> Results:
+    """Dispatch a plan from compile_batch() in order.
+
+    Handlers resolve object names through the plan's handle table, which
+    is refreshed here after every successful spawn, rename or delete.
+    results / samples behave as in dispatch_batch().
+    """
+    summary = _summary_sink(results, samples)
+    out: List[DispatchResult] = []
+    plan.handles.clear()
+    active = profiler.ACTIVE
+    with object_handles.bound(plan.handles):
+        for index, step in enumerate(plan.steps):
+            if step.error is not None:
+                if summary is not None:
+                    summary.add(index, step.cmd, step.error)
+                else:
+                    out.append(step.error)
+                continue
+            try:
+                if active is not None:
+                    result = active.call(
+                        step.handler, step.args, step.cmd, step.origin)
+                else:
+                    result = step.handler(step.args)
+            except Exception as e:
+                result = DispatchResult.fail(str(e), command=step.cmd)
+            if result.success and step.schema is not None:
+                _track_names(step)
+            if summary is not None:
+                summary.add(index, step.cmd, result)
+            else:
+                out.append(result)
+    return summary if summary is not None else out
+
+
+def _summary_sink(mode: str, samples: int) -> Optional[DispatchSummary]:
+    """A fresh DispatchSummary for mode 'summary', None for 'list'."""
+    if mode not in RESULT_MODES:
+        raise ValueError(
+            f"results must be one of {list(RESULT_MODES)}; got '{mode}'")
+    return DispatchSummary(samples) if mode == 'summary' else None
+
+
+def _track_names(step: PlanStep) -> None:
+    """Update the active handle table after a name-changing step."""
+    schema, args = step.schema, step.args
+    if schema.creates and args.get(schema.creates):
+        object_handles.note_created(args[schema.creates])
+    elif schema.renames:
+        old, new = schema.renames
+        object_handles.note_renamed(args[old], args[new])
+    elif schema.deletes:
+        object_handles.note_deleted(args[schema.deletes])
+    elif schema.clears:
+        object_handles.note_cleared()
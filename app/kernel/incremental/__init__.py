@@ -0,0 +1,88 @@
+# File: app/kernel/incremental/__init__.py
+# Incremental rebuild. Each builder origin's instructions are hashed and
+# the digests, with the objects each origin created, are stored on the
+# scene; a re-run deletes and re-dispatches only the changed origins.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from app.domain.dispatch_result import DispatchResult
+from app.domain.dispatch_summary import DispatchSummary
+from app.infra import scene_state
+from app.infra.bridge import data
+from .segments import (
+    NAME_ARGS, REF_ARGS, RebuildPlan, Segment, digest, origin_of, plan_rebuild,
+    segment_batch,
+)
+
+STATE_KEY = 'anim_segments'
+
+Results = Union[List[DispatchResult], DispatchSummary]
+Dispatch = Callable[[List[Dict[str, Any]]], Results]
+
+
+def rebuild(
+    batch: List[Dict[str, Any]],
+    dispatch: Dispatch,
+    key: str = STATE_KEY,
+) -> Tuple[Results, RebuildPlan]:
+    """Dispatch only what changed in batch since the last rebuild().
+
+    dispatch runs one sub-batch (optimizer passes, plan compilation and
+    results mode are the caller's choice). Stale objects are deleted
+    first, then each run of consecutive instructions of a dirty origin
+    is dispatched in batch order; the names it adds to the scene are
+    recorded as that origin's objects. The first run, or any run whose
+    changes reach a clear_scene, rebuilds everything.
+    """
+    segments = segment_batch(batch)
+    previous = scene_state.load(key)
+    plan = plan_rebuild(segments, previous,
+                        frozenset(data.objects.keys()))
+    state = {} if plan.full else {o: previous[o] for o in plan.skipped}
+    dirty = set(plan.rebuilt)
+    for s in segments:
+        if s.origin in dirty:
+            state[s.origin] = {'digest': s.digest, 'objects': []}
+    parts = []
+    if plan.stale:
+        parts.append(dispatch([{'cmd': 'delete_object', 'args': {'name': n}}
+                               for n in plan.stale]))
+    for origin, run in _runs(batch, dirty):
+        before = set(data.objects.keys())
+        parts.append(dispatch(run))
+        state[origin]['objects'].extend(
+            sorted(set(data.objects.keys()) - before))
+    scene_state.save(key, state)
+    return _combine(parts or [dispatch([])]), plan
+
+
+def _runs(batch, dirty):
+    """Yield (origin, instructions) for consecutive runs of dirty origins."""
+    run: List[Dict[str, Any]] = []
+    current = None
+    for instruction in batch:
+        origin = origin_of(instruction)
+        if origin != current and run:
+            yield current, run
+            run = []
+        current = origin
+        if origin in dirty:
+            run.append(instruction)
+    if run:
+        yield current, run
+
+
+def _combine(parts: List[Results]) -> Results:
+    if parts and isinstance(parts[0], DispatchSummary):
+        total = parts[0]
+        for part in parts[1:]:
+            total.merge(part)
+        return total
+    return [result for part in parts for result in part]
+
+
+__all__ = [
+    'NAME_ARGS', 'REF_ARGS', 'STATE_KEY', 'RebuildPlan', 'Segment', 'digest',
+    'plan_rebuild', 'rebuild', 'segment_batch',
+]
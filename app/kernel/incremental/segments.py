@@ -0,0 +1,134 @@
+# File: app/kernel/incremental/segments.py
+# Splits a batch into per-origin segments, digests each one and decides,
+# against the digests stored with the scene, which segments to rebuild.
+# All Rights Reserved Arodi Emmanuel
+
+import hashlib
+import json
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional
+
+from app.kernel.profiler import ORIGIN_KEY, UNTAGGED
+
+# Args naming an object a segment creates or changes; segments sharing
+# one are rebuilt together.
+NAME_ARGS = ('name', 'new_name', 'object', 'child', 'parent', 'target')
+# Args that only read a datablock: users are rebuilt with its owner, not
+# the other way round.
+REF_ARGS = ('material',)
+
+
+class Segment(NamedTuple):
+    """Every instruction one builder origin produced."""
+    origin: str
+    instructions: List[Dict[str, Any]]
+    digest: str
+    names: FrozenSet[str]
+    refs: FrozenSet[str]
+
+
+class RebuildPlan(NamedTuple):
+    """What an incremental run dispatches and what it leaves alone."""
+    full: bool              # a changed segment clears the scene
+    rebuilt: List[str]      # origins to re-dispatch, in batch order
+    stale: List[str]        # previously created objects to delete first
+    skipped: List[str]      # unchanged origins, in batch order
+
+
+def origin_of(instruction: Dict[str, Any]) -> str:
+    return instruction.get(ORIGIN_KEY) or UNTAGGED
+
+
+def segment_batch(batch: List[Dict[str, Any]]) -> List[Segment]:
+    """Group instructions by origin, in order of first appearance."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for instruction in batch:
+        groups.setdefault(origin_of(instruction), []).append(instruction)
+    return [Segment(origin, cmds, digest(cmds), _args(cmds, NAME_ARGS),
+                    _args(cmds, REF_ARGS))
+            for origin, cmds in groups.items()]
+
+
+def digest(instructions: List[Dict[str, Any]]) -> str:
+    """Stable content hash of instructions (origin tags excluded)."""
+    h = hashlib.blake2b(digest_size=16)
+    for instruction in instructions:
+        h.update(json.dumps([instruction.get('cmd'),
+                             instruction.get('args', {})],
+                            sort_keys=True, default=_encode).encode())
+    return h.hexdigest()
+
+
+def plan_rebuild(
+    segments: List[Segment],
+    previous: Optional[Dict[str, Dict[str, Any]]],
+    existing: FrozenSet[str],
+) -> RebuildPlan:
+    """Choose the segments to rebuild against the previous run's state.
+
+    previous maps origin -> {'digest', 'objects'}; existing holds the
+    object names now in the scene. A segment is rebuilt when its digest
+    changed, it is new, or an object it created has gone. Segments that
+    share an object name (now or as created last time) are rebuilt
+    together, so an animation is redone with the objects it keys, and
+    a rebuilt material owner takes the segments assigning it along.
+    """
+    origins = [s.origin for s in segments]
+    if not previous:
+        return RebuildPlan(True, origins, [], [])
+    nodes = {s.origin: set(s.names) for s in segments}
+    changed = set()
+    for s in segments:
+        old = previous.get(s.origin)
+        if (old is None or old['digest'] != s.digest
+                or not existing.issuperset(old['objects'])):
+            changed.add(s.origin)
+    for origin, old in previous.items():
+        nodes.setdefault(origin, set()).update(old['objects'])
+        if origin not in origins:
+            changed.add(origin)
+    dirty = _spread(nodes, {s.origin: s.refs for s in segments}, changed)
+    if any(instr.get('cmd') == 'clear_scene'
+           for s in segments if s.origin in dirty for instr in s.instructions):
+        return RebuildPlan(True, origins, [], [])
+    stale = [name for origin in previous if origin in dirty
+             for name in previous[origin]['objects'] if name in existing]
+    return RebuildPlan(False, [o for o in origins if o in dirty], stale,
+                       [o for o in origins if o not in dirty])
+
+
+def _spread(
+    nodes: Dict[str, set], refs: Dict[str, FrozenSet[str]], changed: set,
+) -> set:
+    """Close changed over shared names, then over references to them."""
+    users: Dict[str, List[str]] = {}
+    for origin, names in nodes.items():
+        for name in names:
+            users.setdefault(name, []).append(origin)
+    for origin, names in refs.items():
+        for name in names:
+            users.setdefault(name, []).append(origin)
+    dirty, todo = set(changed), list(changed)
+    while todo:
+        for name in nodes.get(todo.pop(), ()):
+            for other in users[name]:
+                if other not in dirty:
+                    dirty.add(other)
+                    todo.append(other)
+    return dirty
+
+
+def _args(
+    instructions: List[Dict[str, Any]], keys: tuple,
+) -> FrozenSet[str]:
+    return frozenset(
+        value for instruction in instructions
+        for key, value in instruction.get('args', {}).items()
+        if key in keys and isinstance(value, str) and value)
+
+
+def _encode(value: Any) -> Any:
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return repr(value)
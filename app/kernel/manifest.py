@@ -0,0 +1,111 @@
+# File: app/kernel/manifest.py
+# Command manifest: command name -> module that registers it, generated by
+# scanning app/commands for @register_command decorators, plus the size
+# and content hash of each source file to detect a stale manifest. The
+# manifest is only written by: python -m app.kernel.manifest
+# All Rights Reserved Arodi Emmanuel
+
+import ast
+import hashlib
+import json
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+COMMANDS_ROOT = Path(__file__).resolve().parents[1] / 'commands'
+COMMANDS_PACKAGE = 'app.commands'
+MANIFEST_PATH = COMMANDS_ROOT / 'manifest.json'
+
+
+def load(path: Path = MANIFEST_PATH) -> Dict[str, str]:
+    """Return {command: module} from the manifest at path.
+
+    A missing or stale manifest is never rewritten here: it is replaced
+    by an in-memory scan for this process, with a warning to regenerate
+    the tracked file (python -m app.kernel.manifest). Only sources
+    modified after the manifest file are read for the staleness check.
+    """
+    try:
+        path = Path(path)
+        since = path.stat().st_mtime_ns
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        manifest = None
+    if manifest is None or is_stale(manifest, since):
+        state = 'missing' if manifest is None else 'stale'
+        warnings.warn(
+            f"command manifest {path} is {state}; scanning app/commands "
+            f"instead (regenerate: python -m app.kernel.manifest)",
+            stacklevel=2)
+        manifest = scan()
+    return manifest['commands']
+
+
+def is_stale(manifest: Dict[str, Any], since: Optional[int] = None) -> bool:
+    """True if any command source was added, removed or edited.
+
+    Sources are compared by path and size from a stat; the content hash
+    is checked only for files modified after since (an mtime in ns,
+    normally the manifest file's), or for every file when since is None.
+    """
+    recorded = manifest.get('sources') or {}
+    count = 0
+    for module, path in _sources():
+        entry = recorded.get(module)
+        stat = path.stat()
+        if not isinstance(entry, list) or entry[0] != stat.st_size:
+            return True
+        if since is None or stat.st_mtime_ns > since:
+            if _digest(path.read_bytes()) != entry[1]:
+                return True
+        count += 1
+    return count != len(recorded)
+
+
+def scan() -> Dict[str, Any]:
+    """Build the manifest from the command sources."""
+    commands: Dict[str, str] = {}
+    sources: Dict[str, List[Any]] = {}
+    for module, path in _sources():
+        source = path.read_bytes()
+        sources[module] = [len(source), _digest(source)]
+        for name in _registered(source):
+            commands[name] = module
+    return {'commands': dict(sorted(commands.items())), 'sources': sources}
+
+
+def write(manifest: Dict[str, Any], path: Path = MANIFEST_PATH) -> None:
+    Path(path).write_text(json.dumps(manifest, indent=1) + '\n')
+
+
+def _sources() -> Iterator[Tuple[str, Path]]:
+    for path in sorted(COMMANDS_ROOT.rglob('*.py')):
+        parts = path.relative_to(COMMANDS_ROOT).with_suffix('').parts
+        if parts[-1] == '__init__':
+            parts = parts[:-1]
+        yield '.'.join((COMMANDS_PACKAGE, *parts)), path
+
+
+def _registered(source: bytes) -> List[str]:
+    """Names passed to @register_command('...') in source."""
+    names = []
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for deco in node.decorator_list:
+            func = getattr(deco, 'func', None)
+            called = getattr(func, 'id', None) or getattr(func, 'attr', None)
+            if (called == 'register_command' and deco.args
+                    and isinstance(deco.args[0], ast.Constant)):
+                names.append(deco.args[0].value)
+    return names
+
+
+def _digest(source: bytes) -> str:
+    return hashlib.blake2b(source, digest_size=8).hexdigest()
+
+
+if __name__ == '__main__':
+    built = scan()
+    write(built)
+    print(f"{len(built['commands'])} commands -> {MANIFEST_PATH}")
@@ -0,0 +1,11 @@
+# File: app/kernel/optimizer/__init__.py
+# Instruction-list optimizer passes run on a batch before dispatch.
+# All Rights Reserved Arodi Emmanuel
+
+from .coalesce import coalesce_keyframes, CoalesceReport
+from .simplify import simplify_keyframes, SimplifyReport, DEFAULT_TOLERANCES
+
+__all__ = [
+    'coalesce_keyframes', 'CoalesceReport',
+    'simplify_keyframes', 'SimplifyReport', 'DEFAULT_TOLERANCES',
+]
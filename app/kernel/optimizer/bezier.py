@@ -0,0 +1,184 @@
+# File: app/kernel/optimizer/bezier.py
+# Bezier fcurve playback as Blender evaluates it. Keys written through
+# keyframe_points.add get auto-clamped handles, which fc.update() places
+# from each key's neighbours; a frame is then found on its segment by
+# solving x(t) = frame. simplify.py compares the playback of a reduced
+# key set against the original one frame by frame.
+# All Rights Reserved Arodi Emmanuel
+
+from bisect import bisect_right
+from typing import Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the interpreter
+    np = None
+
+# Auto handle length factor and neighbour ratio cap (BKE curve handles).
+HANDLE_SCALE = 2.5614
+MAX_RATIO = 5.0
+
+# Newton steps for x(t) = frame, from the straight-line guess; x(t) is
+# monotonic with x'(t) > 0 inside a segment, so this is far below 1e-9.
+_STEPS = 8
+
+Handles = Tuple[List[float], List[float], List[float], List[float]]
+
+
+def handles(x: Sequence[float], y: Sequence[float]) -> Handles:
+    """(left x, left y, right x, right y) of auto-clamped handles.
+
+    x must be strictly increasing with at least two keys. The first and
+    last keys get flat handles (constant extrapolation eases in and
+    out); a key at a local extreme gets flat handles and no handle
+    overshoots the value of the neighbour on its side.
+    """
+    n = len(x)
+    lx, ly, rx, ry = [0.0] * n, [0.0] * n, [0.0] * n, [0.0] * n
+    for i in range(n):
+        if i > 0:
+            x0, y0 = x[i - 1], y[i - 1]
+        else:
+            x0, y0 = 2 * x[0] - x[1], 2 * y[0] - y[1]
+        if i < n - 1:
+            x2, y2 = x[i + 1], y[i + 1]
+        else:
+            x2, y2 = 2 * x[i] - x[i - 1], 2 * y[i] - y[i - 1]
+        len_a, len_b = x[i] - x0, x2 - x[i]
+        slope = (y2 - y[i]) / len_b + (y[i] - y0) / len_a
+        len_a = min(len_a, MAX_RATIO * len_b)
+        len_b = min(len_b, MAX_RATIO * len_a)
+        ka = len_a / (2 * HANDLE_SCALE)
+        kb = len_b / (2 * HANDLE_SCALE)
+        lx[i], ly[i] = x[i] - 2 * ka, y[i] - slope * ka
+        rx[i], ry[i] = x[i] + 2 * kb, y[i] + slope * kb
+        if i == 0 or i == n - 1:
+            ly[i] = ry[i] = y[i]
+            continue
+        d1, d2 = y0 - y[i], y2 - y[i]
+        if (d1 <= 0 and d2 <= 0) or (d1 >= 0 and d2 >= 0):
+            ly[i] = ry[i] = y[i]
+            continue
+        left = (ly[i] < y0) if d1 <= 0 else (ly[i] > y0)
+        right = (ry[i] < y2) if d2 <= 0 else (ry[i] > y2)
+        if left:
+            ly[i] = y0
+            ry[i] = y[i] + (y[i] - ly[i]) / (x[i] - lx[i]) * (rx[i] - x[i])
+        elif right:
+            ry[i] = y2
+            ly[i] = y[i] - (ry[i] - y[i]) / (rx[i] - x[i]) * (x[i] - lx[i])
+    return lx, ly, rx, ry
+
+
+def _cubic(p0, p1, p2, p3, t):
+    s = 1 - t
+    return s * s * s * p0 + 3 * s * s * t * p1 + 3 * s * t * t * p2 \
+        + t * t * t * p3
+
+
+def playback(
+    x: Sequence[float], channels: Sequence[Sequence[float]],
+    at: Sequence[float],
+) -> Any:
+    """Each channel's value at every frame in at (within the key range).
+
+    Returns one row per channel (a NumPy array when NumPy is present).
+
+    channels share the key frames x (one fcurve per axis of a vector
+    property). Handle x positions depend on x alone, so each frame's
+    segment parameter t is solved once for every channel.
+    """
+    if np is not None:
+        return _playback_array(x, channels, at)
+    segments = []
+    t_at = []
+    for f in at:
+        k = min(max(bisect_right(x, f) - 1, 0), len(x) - 2)
+        segments.append(k)
+    hx = handles(x, channels[0])
+    for f, k in zip(at, segments):
+        p0, p1, p2, p3 = x[k], hx[2][k], hx[0][k + 1], x[k + 1]
+        fac = _shrink(p0, p1, p2, p3)
+        p1, p2 = p0 + (p1 - p0) * fac, p3 - (p3 - p2) * fac
+        t = (f - p0) / (p3 - p0)
+        for _ in range(_STEPS):
+            slope = _slope(p0, p1, p2, p3, t)
+            if slope <= 0:
+                break
+            t = min(max(t - (_cubic(p0, p1, p2, p3, t) - f) / slope, 0.0),
+                    1.0)
+        t_at.append(t)
+    out = []
+    for y in channels:
+        lx, ly, rx, ry = handles(x, y)
+        row = []
+        for k, t in zip(segments, t_at):
+            fac = _shrink(x[k], rx[k], lx[k + 1], x[k + 1])
+            p1 = y[k] + (ry[k] - y[k]) * fac
+            p2 = y[k + 1] - (y[k + 1] - ly[k + 1]) * fac
+            row.append(_cubic(y[k], p1, p2, y[k + 1], t))
+        out.append(row)
+    return out
+
+
+def _slope(p0, p1, p2, p3, t):
+    """d/dt of _cubic."""
+    s = 1 - t
+    return 3 * s * s * (p1 - p0) + 6 * s * t * (p2 - p1) \
+        + 3 * t * t * (p3 - p2)
+
+
+def _shrink(p0: float, p1: float, p2: float, p3: float) -> float:
+    """Handle scale keeping x(t) monotonic (BKE correct_bezpart)."""
+    reach = abs(p1 - p0) + abs(p3 - p2)
+    return min(1.0, (p3 - p0) / reach) if reach else 1.0
+
+
+def _handles_array(x, y):
+    """NumPy variant of handles for a (channels, keys) value array."""
+    x0 = np.concatenate([[2 * x[0] - x[1]], x[:-1]])
+    x2 = np.concatenate([x[1:], [2 * x[-1] - x[-2]]])
+    y0 = np.concatenate([2 * y[:, :1] - y[:, 1:2], y[:, :-1]], axis=1)
+    y2 = np.concatenate([y[:, 1:], 2 * y[:, -1:] - y[:, -2:-1]], axis=1)
+    len_a, len_b = x - x0, x2 - x
+    slope = (y2 - y) / len_b + (y - y0) / len_a
+    len_a = np.minimum(len_a, MAX_RATIO * len_b)
+    len_b = np.minimum(len_b, MAX_RATIO * len_a)
+    ka, kb = len_a / (2 * HANDLE_SCALE), len_b / (2 * HANDLE_SCALE)
+    lx, rx = x - 2 * ka, x + 2 * kb
+    ly, ry = y - slope * ka, y + slope * kb
+    d1, d2 = y0 - y, y2 - y
+    flat = ((d1 <= 0) & (d2 <= 0)) | ((d1 >= 0) & (d2 >= 0))
+    flat[:, 0] = flat[:, -1] = True
+    left = ~flat & np.where(d1 <= 0, ly < y0, ly > y0)
+    right = ~flat & ~left & np.where(d2 <= 0, ry < y2, ry > y2)
+    ly = np.where(left, y0, ly)
+    ry = np.where(left, y + (y - ly) / (x - lx) * (rx - x), ry)
+    ry = np.where(right, y2, ry)
+    ly = np.where(right, y - (ry - y) / (rx - x) * (x - lx), ly)
+    ly = np.where(flat, y, ly)
+    ry = np.where(flat, y, ry)
+    return lx, ly, rx, ry
+
+
+def _playback_array(x, channels, at):
+    """NumPy variant of playback: a (channels, frames) array."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(channels, dtype=np.float64)
+    at = np.asarray(at, dtype=np.float64)
+    k = np.clip(np.searchsorted(x, at, side='right') - 1, 0, len(x) - 2)
+    lx, ly, rx, ry = _handles_array(x, y)
+    p0, p3 = x[k], x[k + 1]
+    reach = (rx[k] - p0) + (p3 - lx[k + 1])
+    fac = np.minimum(1.0, (p3 - p0) / np.where(reach > 0, reach, 1.0))
+    p1, p2 = p0 + (rx[k] - p0) * fac, p3 - (p3 - lx[k + 1]) * fac
+    t = (at - p0) / (p3 - p0)
+    for _ in range(_STEPS):
+        slope = _slope(p0, p1, p2, p3, t)
+        step = (_cubic(p0, p1, p2, p3, t) - at) / np.where(
+            slope > 0, slope, 1.0)
+        t = np.clip(t - np.where(slope > 0, step, 0.0), 0.0, 1.0)
+    yk, yk1 = y[:, k], y[:, k + 1]
+    q1 = yk + (ry[:, k] - yk) * fac
+    q2 = yk1 - (yk1 - ly[:, k + 1]) * fac
+    return _cubic(yk, q1, q2, yk1, t)
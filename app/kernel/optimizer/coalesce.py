@@ -0,0 +1,126 @@
+# File: app/kernel/optimizer/coalesce.py
+# Keyframe coalescing pass. Merges the per-frame move/rotate/scale keyframe
+# instructions builders emit for one object property into one
+# keyframe_series instruction, without crossing any instruction that
+# could observe or change that object in between.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+# cmd -> (value arg, keyframed data_path)
+KEYFRAME_COMMANDS: Dict[str, Tuple[str, str]] = {
+    'move_object': ('location', 'location'),
+    'rotate_object': ('rotation', 'rotation_euler'),
+    'scale_object': ('scale', 'scale'),
+}
+
+# Commands that touch every object and so end every open group.
+GLOBAL_BARRIERS = {'clear_scene'}
+
+
+class CoalesceReport(NamedTuple):
+    """Optimized instructions and how many instructions were removed."""
+    instructions: List[Dict[str, Any]]
+    removed: int
+
+
+class _Group:
+    """Keyframe samples collected for one (object, data_path)."""
+    __slots__ = ('name', 'data_path', 'members', 'frames', 'values')
+
+    def __init__(self, name: str, data_path: str):
+        self.name = name
+        self.data_path = data_path
+        self.members: List[Dict[str, Any]] = []
+        self.frames: List[int] = []
+        self.values: List[Tuple[float, ...]] = []
+
+    def emit(self) -> Dict[str, Any]:
+        if len(self.members) == 1:
+            return self.members[0]
+        merged = {'cmd': 'keyframe_series', 'args': {
+            'name': self.name, 'data_path': self.data_path,
+            'frames': self.frames, 'values': self.values,
+        }}
+        if 'origin' in self.members[0]:
+            merged['origin'] = self.members[0]['origin']
+        return merged
+
+
+def _keyframe_sample(instruction: Dict[str, Any]):
+    """(name, data_path, frame, value) if coalescable, else None.
+
+    Only the plain set-and-keyframe form qualifies: a string name, an
+    explicit frame, a 3-vector value and no other args.
+    """
+    spec = KEYFRAME_COMMANDS.get(instruction.get('cmd'))
+    if spec is None:
+        return None
+    value_key, data_path = spec
+    args = instruction.get('args') or {}
+    name, frame, value = args.get('name'), args.get('frame'), args.get(value_key)
+    if not isinstance(name, str) or frame is None or len(args) != 3:
+        return None
+    if not isinstance(value, (tuple, list)) or len(value) != 3:
+        return None
+    try:
+        return name, data_path, int(frame), tuple(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _referenced_names(value: Any) -> Iterator[str]:
+    """Every string inside an args value (names may sit in lists)."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _referenced_names(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _referenced_names(item)
+
+
+def coalesce_keyframes(
+    instructions: List[Dict[str, Any]],
+) -> CoalesceReport:
+    """Merge per-frame transform keyframes into keyframe_series.
+
+    A group for (object, data_path) stays open across unrelated
+    instructions and closes at the first instruction that mentions the
+    object in its args (spawn, rename, parent, set_keyframe, ...) or at
+    a global barrier. The merged instruction takes the position of the
+    group's first member; groups of one are left as they were. Key
+    values, overwrites of the same frame and the property value left
+    after the batch are identical to dispatching the input.
+    """
+    slots: List[Any] = []
+    open_groups: Dict[Tuple[str, str], _Group] = {}
+    by_name: Dict[str, List[Tuple[str, str]]] = {}
+
+    for instruction in instructions:
+        sample = _keyframe_sample(instruction)
+        if sample is not None:
+            name, data_path, frame, value = sample
+            group = open_groups.get((name, data_path))
+            if group is None:
+                group = _Group(name, data_path)
+                open_groups[(name, data_path)] = group
+                by_name.setdefault(name, []).append((name, data_path))
+                slots.append(group)
+            group.members.append(instruction)
+            group.frames.append(frame)
+            group.values.append(value)
+            continue
+
+        if instruction.get('cmd') in GLOBAL_BARRIERS:
+            open_groups.clear()
+            by_name.clear()
+        else:
+            for ref in _referenced_names(instruction.get('args') or {}):
+                for key in by_name.pop(ref, ()):
+                    open_groups.pop(key, None)
+        slots.append(instruction)
+
+    out = [s.emit() if isinstance(s, _Group) else s for s in slots]
+    return CoalesceReport(out, len(instructions) - len(out))
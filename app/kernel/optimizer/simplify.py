@@ -0,0 +1,247 @@
+# File: app/kernel/optimizer/simplify.py
+# Keyframe simplification pass. Drops keys from keyframe_series (see
+# coalesce.py) only where the curve Blender plays back stays within a
+# per-data_path tolerance: Ramer-Douglas-Peucker on LINEAR series,
+# repeated values on CONSTANT ones, RDP checked against the Bezier
+# playback (bezier.py) at every whole frame on Bezier ones, and
+# constant tracks. The series' interpolation is never changed.
+# All Rights Reserved Arodi Emmanuel
+
+from bisect import bisect_right
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import bezier
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the interpreter
+    np = None
+
+# Max per-channel deviation allowed (Blender units / radians / factor).
+DEFAULT_TOLERANCES: Dict[str, float] = {
+    'location': 1e-3,
+    'rotation_euler': 1e-3,
+    'scale': 1e-3,
+}
+
+Vec = Tuple[float, ...]
+
+
+class SimplifyReport(NamedTuple):
+    """Simplified instructions with key counts before and after."""
+    instructions: List[Dict[str, Any]]
+    keys_before: int
+    keys_after: int
+
+
+def _deviation(frames, values, i: int, a: int, b: int) -> float:
+    """Max channel distance of sample i from the a-b line at its frame."""
+    t = (frames[i] - frames[a]) / (frames[b] - frames[a])
+    va, vb, vi = values[a], values[b], values[i]
+    return max(abs(va[c] + (vb[c] - va[c]) * t - vi[c])
+               for c in range(len(vi)))
+
+
+def _worst(frames, values, a: int, b: int) -> Tuple[float, int]:
+    """(deviation, index) of the sample farthest from the a-b line."""
+    if np is not None:
+        t = (frames[a + 1:b] - frames[a]) / (frames[b] - frames[a])
+        line = values[a] + (values[b] - values[a]) * t[:, None]
+        dev = np.abs(line - values[a + 1:b]).max(axis=1)
+        i = int(dev.argmax())
+        return float(dev[i]), a + 1 + i
+    worst, worst_i = -1.0, -1
+    for i in range(a + 1, b):
+        d = _deviation(frames, values, i, a, b)
+        if d > worst:
+            worst, worst_i = d, i
+    return worst, worst_i
+
+
+def rdp_indices(
+    frames: Sequence[int], values: Sequence[Vec], tolerance: float,
+) -> List[int]:
+    """Indices of the samples RDP keeps (first and last always kept).
+
+    Deviation is measured per channel along the frame axis. Between two
+    piecewise-linear curves the largest gap sits at a vertex of one of
+    them, so for LINEAR keys this bounds the error over the whole
+    played-back curve, not just at the samples. Each segment split
+    scans its samples once (vectorised with NumPy): O(n log n) for
+    typical tracks, O(n^2) when every split peels off one end.
+    Iterative to stay clear of recursion limits on long series.
+    """
+    n = len(frames)
+    if n <= 2:
+        return list(range(n))
+    if np is not None:
+        frames = np.asarray(frames, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        worst, worst_i = _worst(frames, values, a, b)
+        if worst > tolerance:
+            keep[worst_i] = True
+            stack += [(a, worst_i), (worst_i, b)]
+    return [i for i in range(n) if keep[i]]
+
+
+def _held_indices(values: Sequence[Vec], tolerance: float) -> List[int]:
+    """Keys a CONSTANT (stepped) track needs: each change of value."""
+    kept = [0]
+    for i in range(1, len(values)):
+        last = values[kept[-1]]
+        if max(abs(v - w) for v, w in zip(values[i], last)) > tolerance:
+            kept.append(i)
+    return kept
+
+
+def _bezier_indices(
+    frames: Sequence[int], values: Sequence[Vec], tolerance: float,
+) -> List[int]:
+    """Keys a Bezier (auto-clamped) track needs within tolerance.
+
+    Dropping a key moves its neighbours' handles, so the RDP keys are
+    only a first guess: the reduced curve is played back at every whole
+    frame of the track and compared per channel with the original one.
+    Wherever it strays past tolerance the dropped key nearest the worst
+    frame of that segment is restored, until every frame fits (at worst
+    all keys come back and the curves are identical).
+    """
+    x = [float(f) for f in frames]
+    channels = [[v[c] for v in values] for c in range(len(values[0]))]
+    at = list(range(int(-(-x[0] // 1)), int(x[-1] // 1) + 1))
+    target = bezier.playback(x, channels, at)
+    kept = set(rdp_indices(frames, values, tolerance))
+    while True:
+        keys = sorted(kept)
+        played = bezier.playback(
+            [x[i] for i in keys], [[ch[i] for i in keys] for ch in channels],
+            at)
+        errors = _errors(played, target)
+        worst = _worst_frames(x, keys, at, errors, tolerance)
+        if not worst:
+            return keys
+        for j in worst:
+            kept.add(_nearest_dropped(x, kept, at[j]))
+
+
+def _worst_frames(x, keys, at, errors, tolerance) -> List[int]:
+    """Per reduced segment, the frame (index into at) that strays most."""
+    if np is not None:
+        bad = np.flatnonzero(errors > tolerance)
+        if not len(bad):
+            return []
+        idx = np.maximum(np.searchsorted(x, np.asarray(at)[bad], 'right') - 1,
+                         0)
+        seg = np.searchsorted(keys, idx, 'right') - 1
+        order = np.lexsort((-errors[bad], seg))
+        _, first = np.unique(seg[order], return_index=True)
+        return bad[order][first].tolist()
+    worst: Dict[int, int] = {}
+    for j, e in enumerate(errors):
+        if e > tolerance:
+            seg = bisect_right(keys, _index_at(x, at[j])) - 1
+            if seg not in worst or e > errors[worst[seg]]:
+                worst[seg] = j
+    return list(worst.values())
+
+
+def _errors(played, target):
+    """Largest channel gap at each frame between two playbacks."""
+    if np is not None:
+        return np.abs(played - target).max(axis=0)
+    return [max(abs(p - t) for p, t in zip(ps, ts))
+            for ps, ts in zip(zip(*played), zip(*target))]
+
+
+def _index_at(x: Sequence[float], f: float) -> int:
+    """Index of the last original key at or before frame f."""
+    return max(bisect_right(x, f) - 1, 0)
+
+
+def _nearest_dropped(x: Sequence[float], kept: set, f: float) -> int:
+    """The dropped key closest to frame f (ties go to the earlier)."""
+    left = _index_at(x, f)
+    while left >= 0 and left in kept:
+        left -= 1
+    right = _index_at(x, f) + 1
+    while right < len(x) and right in kept:
+        right += 1
+    if right >= len(x) or (left >= 0 and f - x[left] <= x[right] - f):
+        return left
+    return right
+
+
+def _simplify_series(args: Dict[str, Any], tolerance: float):
+    """Simplified copy of keyframe_series args, or None to keep as is."""
+    frames, values = args['frames'], args['values']
+    if any(b <= a for a, b in zip(frames, frames[1:])):
+        return None   # unordered / repeated frames: leave untouched
+    values = [tuple(v) for v in values]
+    interpolation = args.get('interpolation')
+    if all(v == values[0] for v in values):
+        kept = [0]    # flat under any interpolation
+    elif interpolation == 'LINEAR':
+        kept = rdp_indices(frames, values, tolerance)
+    elif interpolation == 'CONSTANT':
+        kept = _held_indices(values, tolerance)
+    elif interpolation in (None, 'BEZIER'):
+        kept = _bezier_indices(frames, values, tolerance)
+    else:
+        return None   # easing modes: no playback model here
+    if len(kept) == len(frames):
+        return None
+    out = dict(args)
+    out['frames'] = [frames[i] for i in kept]
+    out['values'] = [values[i] for i in kept]
+    return out
+
+
+def simplify_keyframes(
+    instructions: List[Dict[str, Any]],
+    tolerances: Optional[Dict[str, float]] = None,
+) -> SimplifyReport:
+    """Drop redundant keys from every keyframe_series instruction.
+
+    Args:
+        instructions: Batch, usually the output of coalesce_keyframes.
+        tolerances:   data_path -> max deviation; merged over
+                      DEFAULT_TOLERANCES. A data_path mapped to None is
+                      left untouched.
+
+    Constant series collapse to a single key; LINEAR, CONSTANT and
+    Bezier series (no interpolation given: Blender's default) lose the
+    keys their playback reproduces within tolerance; easing modes are
+    kept as they are. The interpolation and the value left on the
+    object are unchanged.
+    """
+    tol = dict(DEFAULT_TOLERANCES)
+    tol.update(tolerances or {})
+    out: List[Dict[str, Any]] = []
+    before = after = 0
+    for instruction in instructions:
+        if instruction.get('cmd') != 'keyframe_series':
+            out.append(instruction)
+            continue
+        args = instruction.get('args') or {}
+        frames, values = args.get('frames'), args.get('values')
+        count = 0 if frames is None else len(frames)
+        before += count
+        tolerance = tol.get(args.get('data_path', 'location'))
+        simplified = None
+        if tolerance is not None and count > 1 \
+                and values is not None and len(values) == count:
+            simplified = _simplify_series(args, tolerance)
+        if simplified is None:
+            out.append(instruction)
+            after += count
+        else:
+            out.append(dict(instruction, args=simplified))
+            after += len(simplified['frames'])
+    return SimplifyReport(out, before, after)
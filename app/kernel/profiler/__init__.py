@@ -0,0 +1,67 @@
+# File: app/kernel/profiler/__init__.py
+# Opt-in dispatch profiler. While a profiler is active the dispatcher
+# times every handler call and records count, wall time and allocation
+# delta per command name and per builder origin.
+# All Rights Reserved Arodi Emmanuel
+
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .recorder import BatchProfiler, CallEvent, CallStats, UNTAGGED
+
+# Profiler the dispatcher reports to; None means profiling is off.
+ACTIVE: Optional[BatchProfiler] = None
+
+ORIGIN_KEY = 'origin'
+
+
+def tag_origin(
+    instructions: Iterable[Dict[str, Any]], origin: str,
+) -> Iterable[Dict[str, Any]]:
+    """Mark builder output with its origin (kept if already tagged).
+
+    Lists are tagged in place and returned; any other iterable (a
+    generator builder) is wrapped so it is tagged lazily. The
+    dispatcher ignores the key; the profiler groups by it.
+    """
+    if isinstance(instructions, list):
+        for instruction in instructions:
+            instruction.setdefault(ORIGIN_KEY, origin)
+        return instructions
+    return _tag_lazily(instructions, origin)
+
+
+def _tag_lazily(
+    instructions: Iterable[Dict[str, Any]], origin: str,
+) -> Iterator[Dict[str, Any]]:
+    for instruction in instructions:
+        instruction.setdefault(ORIGIN_KEY, origin)
+        yield instruction
+
+
+@contextmanager
+def profiling(track_allocations: bool = False) -> Iterator[BatchProfiler]:
+    """Profile every dispatch inside the block.
+
+    track_allocations turns on tracemalloc for the block (if it is not
+    already tracing), which slows dispatch noticeably.
+    """
+    global ACTIVE
+    profiler = BatchProfiler(track_allocations)
+    started = track_allocations and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    previous, ACTIVE = ACTIVE, profiler
+    try:
+        yield profiler
+    finally:
+        ACTIVE = previous
+        if started:
+            tracemalloc.stop()
+
+
+__all__ = [
+    'ORIGIN_KEY', 'UNTAGGED', 'BatchProfiler', 'CallEvent',
+    'CallStats', 'profiling', 'tag_origin',
+]
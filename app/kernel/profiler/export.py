@@ -0,0 +1,56 @@
+# File: app/kernel/profiler/export.py
+# Profiler output: sorted text report, JSON aggregates and Chrome trace
+# (Trace Event Format, viewable in chrome://tracing or Perfetto).
+# All Rights Reserved Arodi Emmanuel
+
+import json
+from typing import Any, Dict, Optional
+
+FORMATS = ('json', 'chrome')
+
+
+def format_report(profiler: Any, by: str, top: Optional[int]) -> str:
+    """Text table: count, total/p50/p95/max ms and KiB per key."""
+    rows = profiler.stats(by)[:top]
+    total = sum(e.duration for e in profiler.events)
+    lines = [
+        f"  {by:<28}{'calls':>7}{'total ms':>10}{'p50':>9}"
+        f"{'p95':>9}{'max':>9}{'KiB':>9}{'fail':>6}",
+    ]
+    for r in rows:
+        lines.append(
+            f"  {r.key[:27]:<28}{r.count:>7}{r.total * 1e3:>10.2f}"
+            f"{r.p50 * 1e3:>9.3f}{r.p95 * 1e3:>9.3f}{r.max * 1e3:>9.3f}"
+            f"{r.alloc / 1024:>9.1f}{r.failures:>6}")
+    lines.append(f"  {len(profiler.events)} calls, {total * 1e3:.2f} ms "
+                 f"in handlers")
+    return '\n'.join(lines)
+
+
+def to_json(profiler: Any) -> Dict[str, Any]:
+    """Aggregates by command and origin as plain data."""
+    return {
+        'calls': len(profiler.events),
+        'total': sum(e.duration for e in profiler.events),
+        'by_cmd': [r._asdict() for r in profiler.stats('cmd')],
+        'by_origin': [r._asdict() for r in profiler.stats('origin')],
+    }
+
+
+def to_chrome_trace(profiler: Any) -> Dict[str, Any]:
+    """One complete ('X') event per call, microsecond timestamps."""
+    return {'traceEvents': [{
+        'name': e.cmd, 'cat': e.origin, 'ph': 'X',
+        'ts': e.start * 1e6, 'dur': e.duration * 1e6,
+        'pid': 0, 'tid': 0,
+        'args': {'alloc': e.alloc, 'success': e.success},
+    } for e in profiler.events], 'displayTimeUnit': 'ms'}
+
+
+def save(profiler: Any, path: str, fmt: str = 'json') -> None:
+    """Write to_json() ('json') or to_chrome_trace() ('chrome')."""
+    if fmt not in FORMATS:
+        raise ValueError(f"fmt must be one of {FORMATS}; got '{fmt}'")
+    doc = to_json(profiler) if fmt == 'json' else to_chrome_trace(profiler)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(doc, fh, indent=1)
@@ -0,0 +1,111 @@
+# File: app/kernel/profiler/recorder.py
+# Call recorder: times handler calls (wall time, tracemalloc delta) and
+# aggregates them per command name or builder origin.
+# All Rights Reserved Arodi Emmanuel
+
+import math
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from . import export
+
+UNTAGGED = '<untagged>'
+
+
+class CallEvent(NamedTuple):
+    """One timed handler call."""
+    cmd: str
+    origin: str
+    start: float      # seconds since the profiler started
+    duration: float   # seconds
+    alloc: int        # bytes of traced memory gained (0 if not tracked)
+    success: bool
+
+
+class CallStats(NamedTuple):
+    """Aggregate for one command name or origin."""
+    key: str
+    count: int
+    total: float
+    p50: float
+    p95: float
+    max: float
+    alloc: int
+    failures: int
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class BatchProfiler:
+    """Collects CallEvents; use through profiling()."""
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.events: List[CallEvent] = []
+        self._t0 = time.perf_counter()
+
+    def call(
+        self,
+        handler: Callable[[Dict[str, Any]], Any],
+        args: Dict[str, Any],
+        cmd: str,
+        origin: Optional[str],
+    ) -> Any:
+        """Run handler(args) and record it, even if it raises."""
+        tracing = self.track_allocations and tracemalloc.is_tracing()
+        mem = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        success = False
+        try:
+            result = handler(args)
+            success = bool(getattr(result, 'success', True))
+            return result
+        finally:
+            end = time.perf_counter()
+            alloc = tracemalloc.get_traced_memory()[0] - mem if tracing else 0
+            self.events.append(CallEvent(
+                cmd, origin or UNTAGGED, start - self._t0,
+                end - start, alloc, success,
+            ))
+
+    def stats(self, by: str = 'cmd') -> List[CallStats]:
+        """Aggregates by 'cmd' or 'origin', slowest total first."""
+        if by not in ('cmd', 'origin'):
+            raise ValueError(f"by must be 'cmd' or 'origin'; got '{by}'")
+        groups: Dict[str, List[CallEvent]] = {}
+        for event in self.events:
+            groups.setdefault(getattr(event, by), []).append(event)
+        rows = []
+        for key, events in groups.items():
+            durations = sorted(e.duration for e in events)
+            rows.append(CallStats(
+                key, len(events), sum(durations),
+                _percentile(durations, 50), _percentile(durations, 95),
+                durations[-1], sum(e.alloc for e in events),
+                sum(not e.success for e in events),
+            ))
+        rows.sort(key=lambda r: r.total, reverse=True)
+        return rows
+
+    def report(self, by: str = 'cmd', top: Optional[int] = None) -> str:
+        """Text table: count, total/p50/p95/max ms and KiB per key."""
+        return export.format_report(self, by, top)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Aggregates by command and origin as plain data."""
+        return export.to_json(self)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format (chrome://tracing, Perfetto) document."""
+        return export.to_chrome_trace(self)
+
+    def save(self, path: str, fmt: str = 'json') -> None:
+        """Write to_json() ('json') or to_chrome_trace() ('chrome')."""
+        export.save(self, path, fmt)
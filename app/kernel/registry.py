@@ -1,19 +1,37 @@
 # File: app/registry.py
 # Command registry with decorator for auto-registration. Central dictionary
 # maps command names to handler functions. Zero-friction command addition.
+# Handlers of app/commands are imported on first lookup via the manifest.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Callable, Dict
+import importlib
+import sys
+from typing import Any, Callable, Dict, Optional
 
+from app.domain.command_schemas import ArgSchema, COMMAND_SCHEMAS
 from app.domain.dispatch_result import DispatchResult
+from . import manifest
 
 
 # Global command registry
 _commands: Dict[str, Callable[[Dict[str, Any]], DispatchResult]] = {}
 
+# command -> owning module, loaded on the first lookup miss
+_manifest: Optional[Dict[str, str]] = None
+
+
+def register_command(
+    name: str, schema: Optional[ArgSchema] = None,
+) -> Callable:
+    """Decorator to register a command handler function.
+
+    schema declares the command's args and the names it creates or
+    consumes (app.domain.command_schemas) for commands defined outside
+    COMMAND_SCHEMAS, e.g. scene-local ones.
+    """
+    if schema is not None:
+        COMMAND_SCHEMAS[name] = schema
 
-def register_command(name: str) -> Callable:
-    """Decorator to register a command handler function."""
     def decorator(func: Callable[[Dict[str, Any]], DispatchResult]) -> Callable:
         _commands[name] = func
         return func
@@ -21,13 +39,22 @@ def register_command(name: str) -> Callable:
 
 
 def get_command(name: str) -> Callable | None:
-    """Get command handler by name."""
-    return _commands.get(name)
+    """Get command handler by name, importing its module on first use."""
+    handler = _commands.get(name)
+    if handler is None:
+        handler = _import_owner(name)
+    return handler
 
 
 def list_commands() -> list:
-    """List all registered command names."""
-    return list(_commands.keys())
+    """List all command names, registered or importable on demand."""
+    return list(dict.fromkeys([*_commands, *_lazy_manifest()]))
+
+
+def load_all() -> None:
+    """Import every module in the manifest (eager registration)."""
+    for module in sorted(set(_lazy_manifest().values())):
+        importlib.import_module(module)
 
 
 def clear_commands() -> None:
@@ -38,3 +65,21 @@ def clear_commands() -> None:
 def get_registry() -> Dict[str, Callable]:
     """Get the raw registry dict."""
     return _commands
+
+
+def _lazy_manifest() -> Dict[str, str]:
+    global _manifest
+    if _manifest is None:
+        _manifest = manifest.load()
+    return _manifest
+
+
+def _import_owner(name: str) -> Callable | None:
+    """Import name's module, which registers it. A module that is
+    already imported registered its handlers then and is left alone
+    (never reloaded, never re-registered)."""
+    module = _lazy_manifest().get(name)
+    if module is None or module in sys.modules:
+        return None
+    importlib.import_module(module)
+    return _commands.get(name)
@@ -0,0 +1,119 @@
+# File: app/kernel/scene_run.py
+# Shared create_scene() modes. A scene lists its builders as Acts and
+# hands them to run_scene() with the caller's options; streaming,
+# incremental rebuilds, the batch cache, dry runs, worker processes,
+# profiling and the results mode behave the same in every scene.
+# All Rights Reserved Arodi Emmanuel
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from app.infra.batch_cache import cached_batch
+from .batch_check import preflight
+from .batch_plan import compile_batch
+from .dispatcher import Results, dispatch_plan, dispatch_stream
+from .incremental import rebuild
+from .optimizer import coalesce_keyframes, simplify_keyframes
+from .parallel_build import Act, generate_acts, iter_acts
+from .profiler import profiling
+
+
+def run_scene(
+    acts: Sequence[Act],
+    info: Dict[str, Any],
+    sources: Iterable[Path] = (),
+    params: Optional[Dict[str, Any]] = None,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
+) -> Dict[str, Any]:
+    """Generate, optimize and dispatch a scene's acts.
+
+    Args:
+        acts:    The scene's builders, in dispatch order
+        info:    Scene fields copied into the result ('frames', ...)
+        sources: Builder code the cached batch depends on
+        params:  Every value the batch depends on (preset, overrides);
+                 the cache key together with sources
+        profile: Time every dispatched command (see app.kernel.profiler)
+        stream:  Dispatch instructions as they are generated, skipping
+                 the whole-batch optimizer passes
+        results: 'list' (one DispatchResult per command) or 'summary'
+                 (a DispatchSummary under 'summary' instead of 'results')
+        incremental: Re-dispatch only the act origins whose instructions
+                 changed since the last incremental run
+                 (see app.kernel.incremental)
+        cache:   Reuse the optimized batch from the on-disk batch cache
+                 (app.infra.batch_cache) when sources and params match
+        dry_run: Check the optimized batch against the current scene
+                 (app.kernel.batch_check.preflight) and return its issues
+                 under 'issues' instead of dispatching
+        workers: > 1 (None: one per CPU) generates the acts in that many
+                 processes (app.kernel.parallel_build); ignored by stream
+
+    Returns:
+        info plus 'status', the results ('results' or 'summary') and
+        'profile' (BatchProfiler, or None when profile is False).
+        Optimized runs add 'coalesced' (instructions removed by keyframe
+        coalescing) and 'keys' ((before, after) keyframe
+        simplification); incremental runs add 'rebuilt' / 'skipped'
+        origins instead; dry runs return 'issues' and dispatch nothing.
+    """
+    info = {**info, 'status': 'OK'}
+    key = 'results' if results == 'list' else 'summary'
+    if stream:
+        summary, prof = _profiled(
+            profile, lambda: dispatch_stream(iter_acts(acts)))
+        return {'summary': summary, **info, 'profile': prof}
+    if incremental:
+        def run(sub: List[Dict[str, Any]]) -> Results:
+            sub = coalesce_keyframes(sub).instructions
+            sub = simplify_keyframes(sub).instructions
+            return dispatch_plan(compile_batch(sub), results)
+
+        batch = _generate(acts, workers)
+        (out, plan), prof = _profiled(profile, lambda: rebuild(batch, run))
+        return {key: out, **info, 'rebuilt': plan.rebuilt,
+                'skipped': plan.skipped, 'profile': prof}
+
+    def build():
+        batch, coalesced = coalesce_keyframes(_generate(acts, workers))
+        batch, keys_before, keys_after = simplify_keyframes(batch)
+        return batch, coalesced, (keys_before, keys_after)
+
+    if cache:
+        batch, coalesced, keys = cached_batch(build, sources, params or {})
+    else:
+        batch, coalesced, keys = build()
+    counts = {'coalesced': coalesced, 'keys': keys}
+    if dry_run:
+        return {'issues': preflight(batch), **info, **counts}
+    out, prof = _profiled(
+        profile, lambda: dispatch_plan(compile_batch(batch), results))
+    return {key: out, **info, **counts, 'profile': prof}
+
+
+def _generate(
+    acts: Sequence[Act], workers: Optional[int],
+) -> List[Dict[str, Any]]:
+    """The acts' instructions, from worker processes when workers != 1.
+
+    Worker output travels as a ColumnarBatch, whose float64 columns give
+    back the serial instructions exactly.
+    """
+    if workers == 1:
+        return list(iter_acts(acts))
+    return generate_acts(acts, workers).to_instructions()
+
+
+def _profiled(profile: bool, run: Callable[[], Any]):
+    """(run(), BatchProfiler) when profiling, else (run(), None)."""
+    if not profile:
+        return run(), None
+    with profiling(track_allocations=True) as prof:
+        out = run()
+    return out, prof
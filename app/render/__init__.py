@@ -0,0 +1,16 @@
+# File: app/render/__init__.py
+# Headless rendering: a local render farm that builds a scene once and
+# renders frame chunks in parallel background Blender processes.
+# All Rights Reserved Arodi Emmanuel
+
+from .chunks import Chunk, ChunkPlanner
+from .farm import FarmResult, build_blend, frame_path, render_farm
+
+__all__ = [
+    'Chunk',
+    'ChunkPlanner',
+    'FarmResult',
+    'build_blend',
+    'frame_path',
+    'render_farm',
+]
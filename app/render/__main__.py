@@ -0,0 +1,7 @@
+# File: app/render/__main__.py
+# python -m app.render <scene> [--kwargs JSON] [-j N] [-o DIR] ...
+# All Rights Reserved Arodi Emmanuel
+
+from .farm import main
+
+raise SystemExit(main())
@@ -0,0 +1,69 @@
+# File: app/render/build_blend.py
+# Runs inside `blender -b --python app/render/build_blend.py -- ...`:
+# builds one scene through its create_scene(), prepares it for headless
+# rendering, saves the .blend and writes its frame range as JSON for
+# the render-farm driver (app/render/farm.py).
+# All Rights Reserved Arodi Emmanuel
+
+import argparse
+import importlib
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _parse(argv):
+    parser = argparse.ArgumentParser(prog='build_blend')
+    parser.add_argument('--scene', required=True,
+                        help='package under scenes/, e.g. quasar_bh')
+    parser.add_argument('--blend', required=True)
+    parser.add_argument('--info', required=True)
+    parser.add_argument('--kwargs', default='{}',
+                        help='JSON keyword arguments for create_scene')
+    parser.add_argument('--engine', default='CYCLES',
+                        help="'CYCLES' (CPU) or 'scene' to keep the "
+                             "scene's own engine")
+    parser.add_argument('--samples', type=int, default=None)
+    parser.add_argument('--format', default='PNG')
+    return parser.parse_args(argv)
+
+
+def _use_cycles_cpu(scene, samples):
+    """Cycles on the CPU: Eevee needs a GPU / display a farm may lack."""
+    if samples is None:
+        # Keep the quality preset's sample count (set by configure_eevee).
+        samples = getattr(scene.eevee, 'taa_render_samples', 64)
+    scene.render.engine = 'CYCLES'
+    scene.cycles.device = 'CPU'
+    scene.cycles.samples = samples
+    scene.cycles.use_denoising = True
+
+
+def main(argv):
+    import bpy
+
+    args = _parse(argv)
+    module = importlib.import_module(f'scenes.{args.scene}.scene')
+    module.create_scene(**json.loads(args.kwargs))
+
+    scene = bpy.context.scene
+    if args.engine.upper() == 'CYCLES':
+        _use_cycles_cpu(scene, args.samples)
+    scene.render.image_settings.file_format = args.format
+    bpy.ops.wm.save_as_mainfile(filepath=args.blend)
+    Path(args.info).write_text(json.dumps({
+        'frame_start': scene.frame_start,
+        'frame_end': scene.frame_end,
+        'fps': scene.render.fps,
+        'engine': scene.render.engine,
+        'resolution': [scene.render.resolution_x,
+                       scene.render.resolution_y],
+    }))
+
+
+if __name__ == '__main__':
+    main(sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else [])
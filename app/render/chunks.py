@@ -0,0 +1,131 @@
+# File: app/render/chunks.py
+# Frame-chunk scheduling for the render farm. Chunks are contiguous frame
+# runs sized from the measured seconds per frame, shrinking towards the
+# end of the range so workers finish together; failed frames are queued
+# again up to a retry limit.
+# All Rights Reserved Arodi Emmanuel
+
+import threading
+from collections import deque
+from typing import Deque, Iterable, List, NamedTuple, Optional, Set
+
+
+class Chunk(NamedTuple):
+    """Frames start..end (inclusive); attempt counts earlier failures."""
+    start: int
+    end: int
+    attempt: int = 0
+
+    @property
+    def frames(self) -> range:
+        return range(self.start, self.end + 1)
+
+
+class ChunkPlanner:
+    """Thread-safe queue of frame chunks for N workers.
+
+    Until a frame time is known, chunks are probe_frames long. After
+    that a chunk aims at target_seconds of rendering, but never more
+    than an equal share of the frames left, so the tail is split finely
+    (guided scheduling). Frames of a failed chunk come back first, as
+    their own chunks, until they have failed retries + 1 times.
+    """
+
+    def __init__(
+        self,
+        frames: Iterable[int],
+        workers: int,
+        target_seconds: float = 60.0,
+        probe_frames: int = 2,
+        retries: int = 2,
+    ):
+        self.workers = max(1, workers)
+        self.target_seconds = target_seconds
+        self.probe_frames = max(1, probe_frames)
+        self.retries = retries
+        self.seconds_per_frame: Optional[float] = None
+        self.done: Set[int] = set()
+        self.failed: List[int] = []
+        self.retried = 0
+        self._pending: Deque[int] = deque(sorted(set(frames)))
+        self._again: Deque[Chunk] = deque()
+        self._running = 0
+        self._cond = threading.Condition()
+
+    @property
+    def remaining(self) -> int:
+        return len(self._pending) + sum(len(c.frames) for c in self._again)
+
+    def take(self) -> Optional[Chunk]:
+        """Next chunk; waits while running chunks may still fail.
+
+        None once every frame is rendered or given up on.
+        """
+        with self._cond:
+            while not self._pending and not self._again and self._running:
+                self._cond.wait()
+            if self._again:
+                chunk = self._again.popleft()
+            elif self._pending:
+                chunk = self._carve(self._chunk_size())
+            else:
+                return None
+            self._running += 1
+            return chunk
+
+    def finish(
+        self, chunk: Chunk, rendered: Iterable[int],
+        frame_seconds: Iterable[float] = (),
+    ) -> List[int]:
+        """Record a finished chunk; returns its frames left unrendered.
+
+        Those are queued again (one chunk per contiguous run) unless the
+        chunk already used up its retries, in which case they are failed.
+        """
+        with self._cond:
+            self._running -= 1
+            rendered = set(rendered) & set(chunk.frames)
+            self.done |= rendered
+            self._measure(list(frame_seconds))
+            missing = [f for f in chunk.frames if f not in rendered]
+            if missing and chunk.attempt < self.retries:
+                self.retried += 1
+                for start, end in _runs(missing):
+                    self._again.append(Chunk(start, end, chunk.attempt + 1))
+            elif missing:
+                self.failed.extend(missing)
+            self._cond.notify_all()
+            return missing
+
+    def _chunk_size(self) -> int:
+        if self.seconds_per_frame is None:
+            return self.probe_frames
+        share = -(-len(self._pending) // self.workers)     # ceil
+        wanted = int(self.target_seconds / self.seconds_per_frame)
+        return max(1, min(wanted, share))
+
+    def _carve(self, size: int) -> Chunk:
+        start = end = self._pending.popleft()
+        while size > end - start + 1 and self._pending \
+                and self._pending[0] == end + 1:
+            end = self._pending.popleft()
+        return Chunk(start, end)
+
+    def _measure(self, seconds: List[float]) -> None:
+        if not seconds:
+            return
+        mean = sum(seconds) / len(seconds)
+        old = self.seconds_per_frame
+        # Moving average: follows heavier / lighter parts of the shot.
+        self.seconds_per_frame = mean if old is None else 0.5 * (old + mean)
+
+
+def _runs(frames: List[int]) -> List[tuple]:
+    """Contiguous (start, end) runs of sorted frames."""
+    runs = []
+    for f in frames:
+        if runs and runs[-1][1] == f - 1:
+            runs[-1][1] = f
+        else:
+            runs.append([f, f])
+    return [tuple(r) for r in runs]
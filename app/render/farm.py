@@ -0,0 +1,207 @@
+# File: app/render/farm.py
+# Local render farm: builds a scene once into a .blend (in a background
+# Blender), then renders it with N `blender -b` worker processes, each
+# taking frame chunks from a ChunkPlanner until the range is done.
+#   python -m app.render quasar_bh --kwargs '{"quality": "low"}' -j 2
+# All Rights Reserved Arodi Emmanuel
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .chunks import Chunk, ChunkPlanner
+
+BUILD_SCRIPT = Path(__file__).with_name('build_blend.py')
+FRAME_DIGITS = 4
+
+# File extension Blender gives each output format (-x 1).
+EXTENSIONS = {'PNG': 'png', 'JPEG': 'jpg', 'OPEN_EXR': 'exr',
+              'TIFF': 'tif', 'BMP': 'bmp'}
+
+# "Saved: '/out/frame_0012.png'" — printed once per written frame.
+_SAVED = re.compile(r"Saved: '(.*)'")
+
+Log = Callable[[str], None]
+
+
+class FarmResult(NamedTuple):
+    """Outcome of render_farm(); failed frames exhausted their retries."""
+    rendered: List[int]
+    failed: List[int]
+    skipped: int            # frames already on disk before the run
+    retried: int            # chunks queued again after a failure
+    seconds: float
+    seconds_per_frame: Optional[float]
+
+
+def build_blend(
+    scene: str, blend: Path, kwargs: Optional[Dict] = None,
+    blender: str = 'blender', engine: str = 'CYCLES',
+    samples: Optional[int] = None, file_format: str = 'PNG',
+) -> Dict:
+    """Build scenes/<scene> in a background Blender and save it to blend.
+
+    Returns the saved scene's info (frame_start, frame_end, fps,
+    engine, resolution). Raises CalledProcessError if Blender fails.
+    """
+    blend = Path(blend).resolve()
+    info = blend.with_suffix('.json')
+    cmd = [blender, '-b', '--factory-startup', '--python', str(BUILD_SCRIPT),
+           '--', '--scene', scene, '--blend', str(blend), '--info', str(info),
+           '--kwargs', json.dumps(kwargs or {}), '--engine', engine,
+           '--format', file_format]
+    if samples is not None:
+        cmd += ['--samples', str(samples)]
+    blend.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+    return json.loads(info.read_text())
+
+
+def frame_path(out_dir: Path, frame: int, ext: str = 'png') -> Path:
+    """Where Blender writes frame with output prefix out_dir/frame_."""
+    return Path(out_dir) / f'frame_{frame:0{FRAME_DIGITS}d}.{ext}'
+
+
+def render_farm(
+    blend: Path, out_dir: Path, frames: Sequence[int],
+    workers: int = 1, blender: str = 'blender',
+    threads: Optional[int] = None, target_seconds: float = 60.0,
+    retries: int = 2, file_format: str = 'PNG', log: Log = print,
+) -> FarmResult:
+    """Render frames of blend into out_dir with workers Blender processes.
+
+    Frames already on disk are skipped, so an interrupted run resumes.
+    Each worker renders with threads CPU threads (default: the CPUs
+    split evenly between workers). A chunk whose process fails or
+    leaves frames unwritten has those frames queued again, up to
+    retries times.
+    """
+    out_dir = Path(out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ext = EXTENSIONS.get(file_format, file_format.lower())
+    todo = [f for f in frames if not frame_path(out_dir, f, ext).exists()]
+    planner = ChunkPlanner(todo, workers, target_seconds, retries=retries)
+    threads = threads or max(1, (os.cpu_count() or 1) // max(1, workers))
+    base = [blender, '-b', str(Path(blend).resolve()),
+            '-o', str(out_dir / 'frame_') + '#' * FRAME_DIGITS,
+            '-F', file_format, '-x', '1', '-t', str(threads)]
+    started = time.perf_counter()
+    progress = _Progress(len(todo), planner, started, log)
+
+    def work():
+        while True:
+            chunk = planner.take()
+            if chunk is None:
+                return
+            rendered, seconds = _render_chunk(base, chunk)
+            rendered = [f for f in rendered
+                        if frame_path(out_dir, f, ext).exists()]
+            missing = planner.finish(chunk, rendered, seconds)
+            progress.report(chunk, missing)
+
+    pool = [threading.Thread(target=work, daemon=True)
+            for _ in range(max(1, min(workers, len(todo))))]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return FarmResult(
+        rendered=sorted(planner.done),
+        failed=sorted(planner.failed),
+        skipped=len(frames) - len(todo),
+        retried=planner.retried,
+        seconds=time.perf_counter() - started,
+        seconds_per_frame=planner.seconds_per_frame,
+    )
+
+
+def _render_chunk(base: List[str], chunk: Chunk):
+    """Run one Blender on chunk: (frames saved, seconds per frame).
+
+    Frame times are the gaps between 'Saved:' lines; the first frame's
+    gap, which includes loading the .blend, is left out unless it is
+    the only one.
+    """
+    cmd = base + ['-s', str(chunk.start), '-e', str(chunk.end), '-a']
+    start = time.perf_counter()
+    stamps, rendered = [start], []
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True,
+                                errors='replace')
+    except OSError:
+        return [], []
+    with proc:
+        for line in proc.stdout:
+            match = _SAVED.search(line)
+            frame = match and _frame_of(match.group(1))
+            if frame is not None:
+                rendered.append(frame)
+                stamps.append(time.perf_counter())
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    return rendered, gaps[1:] or gaps
+
+
+def _frame_of(path: str) -> Optional[int]:
+    match = re.search(r'(\d+)\.\w+$', path)
+    return int(match.group(1)) if match else None
+
+
+class _Progress:
+    def __init__(self, total: int, planner: ChunkPlanner, started: float,
+                 log: Log):
+        self.total, self.planner = total, planner
+        self.started, self.log = started, log
+        self._lock = threading.Lock()
+
+    def report(self, chunk: Chunk, missing: List[int]) -> None:
+        with self._lock:
+            done = len(self.planner.done)
+            elapsed = time.perf_counter() - self.started
+            eta = elapsed / done * (self.total - done) if done else 0.0
+            status = f'{len(missing)} missing' if missing else 'ok'
+            self.log(f'[{done}/{self.total}] frames {chunk.start}-'
+                     f'{chunk.end} {status}; '
+                     f'{self.planner.seconds_per_frame or 0:.2f} s/frame, '
+                     f'ETA {eta:.0f} s')
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m app.render',
+        description='Build a scene once and render it with N background '
+                    'Blender processes.')
+    parser.add_argument('scene', help='package under scenes/')
+    parser.add_argument('--kwargs', default='{}',
+                        help='JSON keyword arguments for create_scene')
+    parser.add_argument('-o', '--out', default='renders')
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    parser.add_argument('-t', '--threads', type=int, default=None)
+    parser.add_argument('--blender', default='blender')
+    parser.add_argument('--engine', default='CYCLES')
+    parser.add_argument('--samples', type=int, default=None)
+    parser.add_argument('--frames', default=None,
+                        help='START-END (default: the scene range)')
+    parser.add_argument('--chunk-seconds', type=float, default=60.0)
+    parser.add_argument('--retries', type=int, default=2)
+    args = parser.parse_args(argv)
+
+    out = Path(args.out)
+    blend = out / f'{args.scene}.blend'
+    info = build_blend(args.scene, blend, json.loads(args.kwargs),
+                       args.blender, args.engine, args.samples)
+    first, last = info['frame_start'], info['frame_end']
+    if args.frames:
+        first, last = (int(v) for v in args.frames.split('-'))
+    result = render_farm(blend, out, range(first, last + 1), args.workers,
+                         args.blender, args.threads, args.chunk_seconds,
+                         args.retries)
+    print(f'{len(result.rendered)} rendered, {result.skipped} skipped, '
+          f'{len(result.failed)} failed in {result.seconds:.0f} s')
+    return 1 if result.failed else 0
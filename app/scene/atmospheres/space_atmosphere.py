@@ -1,73 +1,113 @@
 # File: app/atmospheres/space_atmosphere.py
 # Procedural space atmosphere generator with gravity-clustered starfields.
-# Creates realistic star distributions using clustering algorithms.
+# Transforms a seeded uniform stream into star positions and sizes
+# (NumPy's generator and array maths when importable, random.Random and
+# the equivalent scalar loops otherwise) and emits one instanced point
+# cloud instead of an object per star.
 # All Rights Reserved Arodi Emmanuel
 
-import random
 import math
-from typing import Any, Dict, List, Tuple
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the interpreter
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _cluster_counts(star_count: int, num_clusters: int) -> List[int]:
+    """Stars per cluster; the first star_count % num_clusters get one more."""
+    base, extra = divmod(star_count, num_clusters)
+    return [base + (1 if i < extra else 0) for i in range(num_clusters)]
 
 
-def _generate_cluster_centers(num_clusters: int, radius: float) -> List[Tuple[float, float, float]]:
-    """Generate random cluster centers in 3D space."""
+def _uniforms(seed: Optional[int], count: int) -> List[float]:
+    """count uniforms in [0, 1) from a random.Random(seed) stream."""
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(count)]
+
+
+def _sample_numpy(
+    counts: List[int], min_size: float, max_size: float,
+    radius: float, seed: Optional[int],
+) -> Tuple[List[float], List[float]]:
+    k, n = len(counts), sum(counts)
+    u = np.random.default_rng(seed).random(4 * k + 7 * n)
+    theta = 2.0 * math.pi * u[0:k]
+    phi = math.pi * u[k:2 * k]
+    r = radius * (0.3 + 0.7 * u[2 * k:3 * k])
+    centers = np.column_stack((
+        r * np.sin(phi) * np.cos(theta),
+        r * np.sin(phi) * np.sin(theta),
+        r * np.cos(phi),
+    ))
+    # Spread varies per cluster for visual variety
+    spread = radius * (0.1 + 0.2 * u[3 * k:4 * k])
+    # Box-Muller: one standard normal per (u1, u2) pair.
+    u1, u2 = u[4 * k:4 * k + 6 * n:2], u[4 * k + 1:4 * k + 6 * n:2]
+    normal = np.sqrt(-2.0 * np.log(1.0 - u1)) * np.cos(2.0 * math.pi * u2)
+    owner = np.repeat(np.arange(k), counts)
+    points = centers[owner] + normal.reshape(n, 3) * spread[owner, None]
+    sizes = min_size + (max_size - min_size) * u[4 * k + 6 * n:]
+    return points.ravel().tolist(), sizes.tolist()
+
+
+def _sample_scalar(
+    counts: List[int], min_size: float, max_size: float,
+    radius: float, seed: Optional[int],
+) -> Tuple[List[float], List[float]]:
+    k, n = len(counts), sum(counts)
+    u = _uniforms(seed, 4 * k + 7 * n)
     centers = []
-    for _ in range(num_clusters):
-        # Random spherical coordinates
-        theta = random.uniform(0, 2 * math.pi)
-        phi = random.uniform(0, math.pi)
-        r = random.uniform(radius * 0.3, radius)
-        
-        x = r * math.sin(phi) * math.cos(theta)
-        y = r * math.sin(phi) * math.sin(theta)
-        z = r * math.cos(phi)
-        centers.append((x, y, z))
-    return centers
-
-
-def _generate_stars_around_cluster(
-    center: Tuple[float, float, float],
-    count: int,
-    spread: float,
-    min_size: float,
-    max_size: float
-) -> List[Dict[str, Any]]:
-    """Generate stars around a cluster center."""
-    stars = []
-    cx, cy, cz = center
-    
-    for _ in range(count):
-        # Random offset from center
-        offset_x = random.gauss(0, spread)
-        offset_y = random.gauss(0, spread)
-        offset_z = random.gauss(0, spread)
-        
-        x = cx + offset_x
-        y = cy + offset_y
-        z = cz + offset_z
-        
-        # Random size within bounds
-        size = random.uniform(min_size, max_size)
-        
-        stars.append({
-            'cmd': 'spawn_primitive',
-            'args': {
-                # Spheres are visible from any angle; planes disappear edge-on
-                'type': 'sphere',
-                'name': f'Star_{random.randint(100000, 999999)}',
-                'location': (x, y, z)
-            }
-        })
-        
-        # Scale command for size
-        stars.append({
-            'cmd': 'scale_object',
-            'args': {
-                'name': stars[-1]['args']['name'],
-                'scale': (size, size, size)
-            }
-        })
-    
-    return stars
+    for i in range(k):
+        theta = 2.0 * math.pi * u[i]
+        phi = math.pi * u[k + i]
+        r = radius * (0.3 + 0.7 * u[2 * k + i])
+        centers.append((
+            r * math.sin(phi) * math.cos(theta),
+            r * math.sin(phi) * math.sin(theta),
+            r * math.cos(phi),
+        ))
+    spreads = [radius * (0.1 + 0.2 * u[3 * k + i]) for i in range(k)]
+    pairs = iter(u[4 * k:4 * k + 6 * n])
+    points: List[float] = []
+    for center, spread, count in zip(centers, spreads, counts):
+        for _ in range(count):
+            for c in center:
+                u1, u2 = next(pairs), next(pairs)
+                normal = (math.sqrt(-2.0 * math.log(1.0 - u1))
+                          * math.cos(2.0 * math.pi * u2))
+                points.append(c + normal * spread)
+    sizes = [min_size + (max_size - min_size) * v
+             for v in u[4 * k + 6 * n:]]
+    return points, sizes
+
+
+def sample_starfield(
+    star_count: int = 1150,
+    min_size: float = 0.01,
+    max_size: float = 0.05,
+    radius: float = 50.0,
+    num_clusters: int = 8,
+    seed: Optional[int] = 0,
+    vectorized: bool = True,
+) -> Tuple[List[float], List[float]]:
+    """Star positions (flat xyz floats) and sizes, one per star.
+
+    Cluster centres are uniform in spherical coordinates between 0.3 and
+    1.0 of radius; stars scatter around them with a Gaussian of 0.1-0.3
+    radius. Both samplers lay the uniforms out the same way, but NumPy
+    draws them from np.random.default_rng(seed) and the fallback from
+    random.Random(seed): a seed repeats its field on every run of the
+    same sampler, while the two samplers give different (equally
+    distributed) fields. seed=None draws a fresh one.
+    """
+    counts = _cluster_counts(star_count, num_clusters)
+    sample = _sample_numpy if vectorized and HAS_NUMPY else _sample_scalar
+    return sample(counts, min_size, max_size, radius, seed)
 
 
 def generate_starfield(
@@ -75,41 +115,31 @@ def generate_starfield(
     min_size: float = 0.01,
     max_size: float = 0.05,
     radius: float = 50.0,
-    num_clusters: int = 8
+    num_clusters: int = 8,
+    seed: Optional[int] = 0,
+    name: str = 'Starfield',
+    material: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Generate a gravity-clustered starfield.
-    
+
     Args:
         star_count: Total number of stars (1000-1300 recommended)
         min_size: Minimum star size
         max_size: Maximum star size
         radius: Sphere radius for distribution
         num_clusters: Number of gravity-like cluster regions
-    
+        seed: Random seed (reproducible field); None for a fresh one
+        name: Name of the starfield object
+        material: Optional material for every star (created beforehand)
+
     Returns:
-        List of command dictionaries for batch dispatch
+        Command list for batch dispatch: a single spawn_point_cloud, one
+        sphere instanced per star and scaled by its size.
     """
-    commands = []
-    
-    # Generate cluster centers
-    centers = _generate_cluster_centers(num_clusters, radius)
-    
-    # Distribute stars across clusters
-    stars_per_cluster = star_count // num_clusters
-    remaining_stars = star_count % num_clusters
-    
-    for i, center in enumerate(centers):
-        count = stars_per_cluster
-        if i < remaining_stars:
-            count += 1
-        
-        # Spread varies per cluster for visual variety
-        spread = random.uniform(radius * 0.1, radius * 0.3)
-        
-        cluster_stars = _generate_stars_around_cluster(
-            center, count, spread, min_size, max_size
-        )
-        commands.extend(cluster_stars)
-    
-    return commands
+    points, sizes = sample_starfield(
+        star_count, min_size, max_size, radius, num_clusters, seed)
+    args: Dict[str, Any] = {'name': name, 'points': points, 'scales': sizes}
+    if material:
+        args['material'] = material
+    return [{'cmd': 'spawn_point_cloud', 'args': args}]
@@ -3,6 +3,8 @@
 # Root launcher — delegates to whichever scene is active.
 # You can also paste the scene-specific launcher directly in Blender:
 #   scenes/quasar_bh/launcher.py
+# To render frames headless instead (several background Blenders):
+#   python -m app.render quasar_bh --kwargs '{"quality": "low"}' -j 2
 # ─────────────────────────────────────────────────────────────────────────────
 # All Rights Reserved Arodi Emmanuel
 
@@ -44,17 +46,15 @@ if __name__ == '__main__':
     print(f"  QUASAR BLACK HOLE  [quality = {QUALITY}]")
     print("=" * 60)
 
-    result = run_scene(quality=QUALITY)
+    result = run_scene(quality=QUALITY, results='summary')
 
-    ok_count = sum(1 for r in result['results'] if r.success)
-    total    = len(result['results'])
+    summary = result['summary']
     print(f"\n  Frames   : {result['frames']}")
-    print(f"  Commands : {ok_count} / {total} OK")
+    print(f"  Commands : {summary.succeeded} / {summary.total} OK")
 
-    failed = [r for r in result['results'] if not r.success]
-    if failed:
-        print(f"\n  ── {len(failed)} errors ──")
-        for r in failed:
+    if summary.failures:
+        print(f"\n  ── {summary.failed} errors ──")
+        for _, r in summary.failures:
             print(f"    [FAIL] {r.command_name}: {r.error}")
 
     _setup_viewport()
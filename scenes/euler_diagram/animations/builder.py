@@ -1,57 +1,64 @@
 # Orchestrates all sub-builders for the Euler Diagram.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from .domain.timing import Timing
 from .domain.spiral import configure as _cfg_spiral
 from .staging.materials import build_materials
 from .staging.background import build_background
 from .staging.labels import build_labels
-from .sets.odds import build_odds
-from .sets.naturals import build_naturals
-from .sets.integers import build_integers
-from .sets.rationals import build_rationals
-from .sets.irrationals import build_irrationals
+from .sets.odds import iter_odds
+from .sets.naturals import iter_naturals
+from .sets.integers import iter_integers
+from .sets.rationals import iter_rationals
+from .sets.irrationals import iter_irrationals
 
 
-def build_euler_diagram(
+def iter_euler_diagram(
     total_frames: int,
     timing: Timing = None,
     spiral_scale: float = 1.0,
     emit_overrides: dict = None,
     label_size: float = 1.80,
-) -> List[Dict]:
-    """Build all commands for the 5-act spiral."""
+) -> Iterator[Dict]:
+    """Yield all commands for the 5-act spiral, one at a time."""
     _cfg_spiral(spiral_scale)
     t = timing or Timing()
-    cmds: List[Dict] = build_materials(emit_overrides)
-    cmds += build_background()
+    yield from build_materials(emit_overrides)
+    yield from build_background()
 
-    odds_cmds, slot, idx = build_odds(
+    slot, idx = yield from iter_odds(
         t.odds_start, total_frames=total_frames,
         start_slot=0, start_index=0,
     )
-    cmds += odds_cmds
-    nat_cmds, slot, idx = build_naturals(
+    slot, idx = yield from iter_naturals(
         t.nat_start, total_frames=total_frames,
         start_slot=slot, start_index=idx,
     )
-    cmds += nat_cmds
-    int_cmds, slot, idx = build_integers(
+    slot, idx = yield from iter_integers(
         t.int_start, total_frames=total_frames,
         start_slot=slot, start_index=idx,
     )
-    cmds += int_cmds
-    rat_cmds, slot, idx = build_rationals(
+    slot, idx = yield from iter_rationals(
         t.rat_start, total_frames=total_frames,
         start_slot=slot, start_index=idx,
     )
-    cmds += rat_cmds
-    real_cmds, _, _ = build_irrationals(
+    yield from iter_irrationals(
         t.real_start, total_frames=total_frames,
         start_slot=slot, start_index=idx,
     )
-    cmds += real_cmds
-    cmds += build_labels(t, label_sz=label_size)
-    return cmds
+    yield from build_labels(t, label_sz=label_size)
+
+
+def build_euler_diagram(
+    total_frames: int,
+    timing: Timing = None,
+    spiral_scale: float = 1.0,
+    emit_overrides: dict = None,
+    label_size: float = 1.80,
+) -> List[Dict]:
+    """Build all commands for the 5-act spiral."""
+    return list(iter_euler_diagram(
+        total_frames, timing, spiral_scale, emit_overrides, label_size,
+    ))
@@ -2,30 +2,42 @@
 # All Rights Reserved Arodi Emmanuel
 
 import math
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 # Bob height proportional to text size (passed from caller)
 _PERIOD = 60   # frames per full cycle (~2.5s at 24fps)
 _STEP   = 10   # keyframe every 10 frames
 
 
-def build_idle_bob(
+def iter_idle_bob(
     name: str,
     x: float,
     y: float,
     appear_frame: int,
     total_frames: int,
     amplitude: float = 0.08,
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """Sinusoidal Z float — text hovers like paper in breeze."""
-    cmds: List[Dict] = []
     start = appear_frame + _PERIOD
     for f in range(start, total_frames, _STEP):
         t = (f - start) / _PERIOD
         z = amplitude * math.sin(t * math.tau)
-        cmds.append({'cmd': 'move_object', 'args': {
+        yield {'cmd': 'move_object', 'args': {
             'name': name,
             'location': (x, y, z),
             'frame': f,
-        }})
-    return cmds
+        }}
+
+
+def build_idle_bob(
+    name: str,
+    x: float,
+    y: float,
+    appear_frame: int,
+    total_frames: int,
+    amplitude: float = 0.08,
+) -> List[Dict]:
+    """List form of iter_idle_bob."""
+    return list(iter_idle_bob(
+        name, x, y, appear_frame, total_frames, amplitude,
+    ))
@@ -2,10 +2,11 @@
 # All Rights Reserved Arodi Emmanuel
 
 from fractions import Fraction as _F
-from typing import Dict, List, Tuple
+from typing import Dict, Generator, List, Tuple
 
+from app.components.stream import collect
 from ..domain.reveal import text_reveal
-from ..domain.motion import build_idle_bob
+from ..domain.motion import iter_idle_bob
 from ..domain.spiral import pos_slot, display_sz, RAT_START
 from ..domain.layout import slots_advance, _GROWTH_STEP
 
@@ -34,27 +35,42 @@ def _gen() -> List[str]:
 _NUMS = _gen()
 
 
-def build_rationals(
+def iter_rationals(
     appear_frame: int,
     total_frames: int = _TOTAL_FRAMES,
     start_slot: int = RAT_START,
     start_index: int = 0,
-) -> Tuple[List[Dict], int, int]:
-    """60 fractions, green, sequential."""
-    cmds: List[Dict] = []
+) -> Generator[Dict, None, Tuple[int, int]]:
+    """60 fractions, green, sequential.
+
+    Yields instructions; returns (next slot, next index).
+    """
     slot = start_slot
     for i, text in enumerate(_NUMS):
         x, y, _ = pos_slot(slot)
         growth = 1.0 + (start_index + i) * _GROWTH_STEP
         sz = display_sz(slot) * growth
         f = appear_frame + i * _STAGGER
-        cmds += text_reveal(
+        yield from text_reveal(
             f'Rat{i}', text, x, y, 'MatRat', f,
             sz=sz, extrude=sz * 0.18,
         )
-        cmds += build_idle_bob(
+        yield from iter_idle_bob(
             f'Rat{i}', x, y, f,
             total_frames, amplitude=sz * 0.18,
         )
         slot += slots_advance(slot, text)
-    return cmds, slot, start_index + len(_NUMS)
+    return slot, start_index + len(_NUMS)
+
+
+def build_rationals(
+    appear_frame: int,
+    total_frames: int = _TOTAL_FRAMES,
+    start_slot: int = RAT_START,
+    start_index: int = 0,
+) -> Tuple[List[Dict], int, int]:
+    """60 fractions, green, sequential."""
+    cmds, (slot, index) = collect(iter_rationals(
+        appear_frame, total_frames, start_slot, start_index,
+    ))
+    return cmds, slot, index
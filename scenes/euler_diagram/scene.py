@@ -2,16 +2,91 @@
 # Orchestrator for the Expansive Euler Diagram.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
-from app.kernel.dispatcher import dispatch_batch
+from app.kernel.parallel_build import Act, iter_acts
+from app.kernel.scene_run import run_scene
 import app.commands
 
 from app.components.env_builder import build_environment
-from .animations.builder import build_euler_diagram
+from .animations.builder import iter_euler_diagram
 from .animations.staging.camera import build_camera
 from .animations.domain.timing import Timing
 
+# Builder code the cached batch depends on (beyond app/components).
+_SOURCES = (Path(__file__).parent,)
+
+
+def _lights() -> List[Dict[str, Any]]:
+    return [
+        {'cmd': 'set_light_energy', 'args': {
+            'name': 'KeyLight', 'energy': 2000.0,
+        }},
+        {'cmd': 'move_object', 'args': {
+            'name': 'KeyLight', 'location': (0, 0, 60),
+        }},
+        {'cmd': 'set_light_energy', 'args': {
+            'name': 'FillLight', 'energy': 700.0,
+        }},
+        {'cmd': 'move_object', 'args': {
+            'name': 'FillLight', 'location': (20, -20, 45),
+        }},
+        {'cmd': 'set_light_energy', 'args': {
+            'name': 'TopLight', 'energy': 5000.0,
+        }},
+        {'cmd': 'move_object', 'args': {
+            'name': 'TopLight', 'location': (0, 0, 25),
+        }},
+    ]
+
+
+def _render_settings() -> List[Dict[str, Any]]:
+    return [{'cmd': 'configure_eevee', 'args': {
+        'samples': 32, 'width': 1920, 'height': 1080,
+    }}]
+
+
+def scene_acts(
+    total_frames: int = 2400,
+    timing: Timing = None,
+    spiral_scale: float = 1.0,
+    emit_overrides: dict = None,
+    label_size: float = 1.0,
+) -> List[Act]:
+    """Environment, lights, render settings, the diagram and camera."""
+    return [
+        Act('environment', build_environment, ({
+            'total_frames': total_frames,
+            'world_color': (0.008, 0.009, 0.02),
+            'grid': False,
+            'lights': [
+                {'name': 'KeyLight',  'type': 'POINT'},
+                {'name': 'FillLight', 'type': 'POINT'},
+                {'name': 'TopLight',  'type': 'POINT'},
+            ],
+        },)),
+        Act('lights', _lights),
+        Act('render', _render_settings),
+        Act('diagram', iter_euler_diagram, (
+            total_frames, timing, spiral_scale, emit_overrides, label_size,
+        )),
+        Act('camera', build_camera, (total_frames, spiral_scale)),
+    ]
+
+
+def iter_batch(
+    total_frames: int = 2400,
+    timing: Timing = None,
+    spiral_scale: float = 1.0,
+    emit_overrides: dict = None,
+    label_size: float = 1.0,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the Euler Diagram instructions lazily, in dispatch order."""
+    return iter_acts(scene_acts(
+        total_frames, timing, spiral_scale, emit_overrides, label_size,
+    ))
+
 
 def create_scene(
     total_frames: int = 2400,
@@ -19,47 +94,29 @@ def create_scene(
     spiral_scale: float = 1.0,
     emit_overrides: dict = None,
     label_size: float = 1.0,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
 ) -> Dict[str, Any]:
-    """Build and dispatch the Euler Diagram animation."""
-    batch = []
-    batch += build_environment({
-        'total_frames': total_frames,
-        'world_color': (0.008, 0.009, 0.02),
-        'grid': False,
-        'lights': [
-            {'name': 'KeyLight',  'type': 'POINT'},
-            {'name': 'FillLight', 'type': 'POINT'},
-            {'name': 'TopLight',  'type': 'POINT'},
-        ],
-    })
-    batch.append({'cmd': 'set_light_energy', 'args': {
-        'name': 'KeyLight', 'energy': 2000.0,
-    }})
-    batch.append({'cmd': 'move_object', 'args': {
-        'name': 'KeyLight', 'location': (0, 0, 60),
-    }})
-    batch.append({'cmd': 'set_light_energy', 'args': {
-        'name': 'FillLight', 'energy': 700.0,
-    }})
-    batch.append({'cmd': 'move_object', 'args': {
-        'name': 'FillLight', 'location': (20, -20, 45),
-    }})
-    batch.append({'cmd': 'set_light_energy', 'args': {
-        'name': 'TopLight', 'energy': 5000.0,
-    }})
-    batch.append({'cmd': 'move_object', 'args': {
-        'name': 'TopLight', 'location': (0, 0, 25),
-    }})
-    batch.append({'cmd': 'configure_eevee', 'args': {
-        'samples': 32, 'width': 1920, 'height': 1080,
-    }})
-    batch += build_euler_diagram(
-        total_frames,
-        timing=timing,
-        spiral_scale=spiral_scale,
-        emit_overrides=emit_overrides,
-        label_size=label_size,
+    """Build and dispatch the Euler Diagram animation.
+
+    The mode arguments (profile ... workers) and the returned dict are
+    documented on app.kernel.scene_run.run_scene.
+    """
+    acts = scene_acts(
+        total_frames, timing, spiral_scale, emit_overrides, label_size,
+    )
+    return run_scene(
+        acts, {'frames': total_frames},
+        _SOURCES, {'scene': 'euler_diagram', 'total_frames': total_frames,
+                   'timing': timing, 'spiral_scale': spiral_scale,
+                   'emit_overrides': emit_overrides,
+                   'label_size': label_size},
+        profile=profile, stream=stream, results=results,
+        incremental=incremental, cache=cache, dry_run=dry_run,
+        workers=workers,
     )
-    batch += build_camera(total_frames, scale=spiral_scale)
-    results = dispatch_batch(batch)
-    return {'results': results, 'frames': total_frames, 'status': 'OK'}
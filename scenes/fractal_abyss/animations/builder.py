@@ -3,6 +3,8 @@
 
 from typing import Dict, List
 
+from app.kernel.parallel_build import Act, iter_acts
+
 from .domain.timing import Timing
 from .staging.materials import build_materials
 from .staging.labels import build_labels
@@ -15,18 +17,25 @@ from .acts.act4_fractal import build_fractal
 from .acts.act5_abyss import build_abyss
 
 
+def fractal_abyss_acts(
+    total: int,
+    timing: Timing,
+) -> List[Act]:
+    """The independent builders of the 5 acts, in batch order."""
+    return [
+        Act('materials', build_materials),
+        Act('act1', build_naturals, (timing.act1, total)),
+        Act('act2', build_rationals, (timing.act2, total)),
+        Act('act3', build_irrationals, (timing.act3, total)),
+        Act('act4', build_fractal, (timing.act4, total)),
+        Act('act5', build_abyss, (timing.act5, total)),
+        Act('labels', build_labels, (timing,)),
+    ]
+
+
 def build_fractal_abyss(
     total: int,
     timing: Timing,
 ) -> List[Dict]:
     """Build all commands for 5-act animation."""
-    cmds = build_materials()
-    cmds += build_naturals(timing.act1, total)
-    cmds += build_rationals(timing.act2, total)
-    cmds += build_irrationals(
-        timing.act3, total,
-    )
-    cmds += build_fractal(timing.act4, total)
-    cmds += build_abyss(timing.act5, total)
-    cmds += build_labels(timing)
-    return cmds
+    return list(iter_acts(fractal_abyss_acts(total, timing)))
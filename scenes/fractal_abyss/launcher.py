@@ -8,9 +8,9 @@ _PATH = r"d:\zProyectos\01Python\animations"
 if _PATH not in sys.path:
     sys.path.insert(0, _PATH)
 
-for m in list(sys.modules.keys()):
-    if m.startswith(('app.', 'scenes.')):
-        del sys.modules[m]
+from app.infra.hot_reload import reload_changed
+
+reload_changed()  # re-imports only modules edited since the last run
 
 from scenes.fractal_abyss.scene import create_scene
 from scenes.fractal_abyss.animations.domain.timing import (
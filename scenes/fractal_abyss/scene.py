@@ -1,53 +1,81 @@
 # Fractal Abyss scene orchestrator.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from app.kernel.dispatcher import dispatch_batch
+from app.kernel.parallel_build import Act
+from app.kernel.scene_run import run_scene
 import app.commands
 
 from app.components.env_builder import (
     build_environment,
 )
-from .animations.builder import build_fractal_abyss
+from .animations.builder import fractal_abyss_acts
 from .animations.staging.camera import build_camera
 from .animations.staging.lights import build_lights
 from .animations.domain.timing import Timing
 
+# Builder code the cached batch depends on (beyond app/components).
+_SOURCES = (Path(__file__).parent,)
 
-def create_scene(
-    total_frames: int = 2880,
-    timing: Timing = None,
-) -> Dict[str, Any]:
-    """Build and dispatch the Fractal Abyss."""
-    t = timing or Timing()
-    batch = []
-    batch += build_environment({
-        'total_frames': total_frames,
-        'world_color': (0.01, 0.01, 0.03),
-        'grid': False,
-        'lights': [
-            {'name': 'Key', 'type': 'POINT'},
-            {'name': 'Fill', 'type': 'POINT'},
-            {'name': 'Rim', 'type': 'POINT'},
-        ],
-    })
-    batch += build_lights()
-    batch.append({
+
+def _render_settings() -> List[Dict[str, Any]]:
+    return [{
         'cmd': 'configure_eevee',
         'args': {
             'samples': 32,
             'width': 1920,
             'height': 1080,
         },
-    })
-    batch += build_fractal_abyss(
-        total_frames, t,
+    }]
+
+
+def scene_acts(
+    total_frames: int = 2880,
+    timing: Timing = None,
+) -> List[Act]:
+    """Environment, lights, render settings, the acts and the camera."""
+    t = timing or Timing()
+    return [
+        Act('environment', build_environment, ({
+            'total_frames': total_frames,
+            'world_color': (0.01, 0.01, 0.03),
+            'grid': False,
+            'lights': [
+                {'name': 'Key', 'type': 'POINT'},
+                {'name': 'Fill', 'type': 'POINT'},
+                {'name': 'Rim', 'type': 'POINT'},
+            ],
+        },)),
+        Act('lights', build_lights),
+        Act('render', _render_settings),
+        *fractal_abyss_acts(total_frames, t),
+        Act('camera', build_camera, (total_frames, t)),
+    ]
+
+
+def create_scene(
+    total_frames: int = 2880,
+    timing: Timing = None,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
+) -> Dict[str, Any]:
+    """Build and dispatch the Fractal Abyss.
+
+    The mode arguments (profile ... workers) and the returned dict are
+    documented on app.kernel.scene_run.run_scene.
+    """
+    return run_scene(
+        scene_acts(total_frames, timing), {'frames': total_frames},
+        _SOURCES, {'scene': 'fractal_abyss', 'total_frames': total_frames,
+                   'timing': timing},
+        profile=profile, stream=stream, results=results,
+        incremental=incremental, cache=cache, dry_run=dry_run,
+        workers=workers,
     )
-    batch += build_camera(total_frames, t)
-    results = dispatch_batch(batch)
-    return {
-        'results': results,
-        'frames': total_frames,
-        'status': 'OK',
-    }
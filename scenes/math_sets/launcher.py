@@ -8,9 +8,9 @@ PROJECT_PATH = r"d:\zProyectos\01Python\animations"
 if PROJECT_PATH not in sys.path:
     sys.path.insert(0, PROJECT_PATH)
 
-for m in list(sys.modules.keys()):
-    if m.startswith('app.') or m.startswith('scenes.'):
-        del sys.modules[m]
+from app.infra.hot_reload import reload_changed
+
+reload_changed()  # re-imports only modules edited since the last run
 
 from scenes.math_sets.scene import create_scene
 from scenes.math_sets.animations._timing import Timing
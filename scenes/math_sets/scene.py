@@ -2,49 +2,85 @@
 # Orchestrator for the Mathematical Sets animation.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from app.kernel.dispatcher import dispatch_batch
-import app.commands  # triggers all command registrations
+from app.kernel.parallel_build import Act
+from app.kernel.scene_run import run_scene
+import app.commands  # handlers import on first use (command manifest)
 
 from app.components.env_builder import build_environment
 from .animations._builder import build_math_sets
 from .animations._camera import build_camera
 from .animations._timing import Timing
 
+# Builder code the cached batch depends on (beyond app/components).
+_SOURCES = (Path(__file__).parent,)
+
+
+def _world_and_render() -> List[Dict[str, Any]]:
+    return [
+        {'cmd': 'create_space_world', 'args': {
+            'star_density': 400,
+            'star_brightness': 2.0,
+        }},
+        {'cmd': 'animate_space_world', 'args': {}},
+        {'cmd': 'configure_eevee', 'args': {
+            'samples': 16,
+            'width': 1280,
+            'height': 720,
+        }},
+    ]
+
+
+def _sets(total_frames: int, timing: Timing) -> List[Dict[str, Any]]:
+    return build_math_sets(total_frames, timing=timing)
+
+
+def scene_acts(
+    total_frames: int = 900,
+    camera_radius: float = 30.0,
+    timing: Timing = None,
+) -> List[Act]:
+    """Environment, space world and render settings, sets and camera."""
+    return [
+        Act('environment', build_environment, ({
+            'total_frames': total_frames,
+            'world_color': (0.001, 0.001, 0.001),
+            'grid': False,
+            'lights': [
+                {'name': 'KeyLight', 'type': 'POINT'},
+            ],
+        },)),
+        Act('world', _world_and_render),
+        Act('sets', _sets, (total_frames, timing)),
+        Act('camera', build_camera, (camera_radius, total_frames)),
+    ]
+
 
 def create_scene(
     total_frames: int = 900,
     camera_radius: float = 30.0,
     timing: Timing = None,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
 ) -> Dict[str, Any]:
-    """Build and dispatch the Math Sets animation."""
-    batch = []
-    batch += build_environment({
-        'total_frames': total_frames,
-        'world_color': (0.001, 0.001, 0.001),
-        'grid': False,
-        'lights': [
-            {'name': 'KeyLight', 'type': 'POINT'},
-        ],
-    })
-    batch.append({'cmd': 'create_space_world', 'args': {
-        'star_density': 400,
-        'star_brightness': 2.0,
-    }})
-    batch.append({'cmd': 'animate_space_world', 'args': {}})
-    batch.append({'cmd': 'configure_eevee', 'args': {
-        'samples': 16,
-        'width': 1280,
-        'height': 720,
-    }})
-    batch += build_math_sets(
-        total_frames, timing=timing,
+    """Build and dispatch the Math Sets animation.
+
+    The mode arguments (profile ... workers) and the returned dict are
+    documented on app.kernel.scene_run.run_scene.
+    """
+    return run_scene(
+        scene_acts(total_frames, camera_radius, timing),
+        {'frames': total_frames},
+        _SOURCES, {'scene': 'math_sets', 'total_frames': total_frames,
+                   'camera_radius': camera_radius, 'timing': timing},
+        profile=profile, stream=stream, results=results,
+        incremental=incremental, cache=cache, dry_run=dry_run,
+        workers=workers,
     )
-    batch += build_camera(camera_radius, total_frames)
-    results = dispatch_batch(batch)
-    return {
-        'results': results,
-        'frames': total_frames,
-        'status': 'OK',
-    }
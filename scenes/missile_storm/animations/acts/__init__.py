@@ -2,10 +2,11 @@
 # Act builders for butterfly meadow scene.
 # All Rights Reserved Arodi Emmanuel
 
-from .butterfly_flight import build_flight
+from .butterfly_flight import build_flight, iter_flight
 from .village import build_village
 
 __all__ = [
     'build_flight',
+    'iter_flight',
     'build_village',
 ]
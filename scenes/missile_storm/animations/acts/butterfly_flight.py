@@ -2,30 +2,38 @@
 # Butterfly flies over meadow in one direction.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from app.components.objects import build_butterfly, build_meadow
 from ..domain.timing import Timing
-from .flight_path import build_flight_path
+from .flight_path import iter_flight_path
 
 
-def build_flight(
+def iter_flight(
     timing: Timing,
     half_cycle: int = 6,
     altitude: float = 8.0,
     speed: float = 0.5,
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """Meadow + butterfly character + straight flight."""
-    cmds: List[Dict] = []
-    cmds += build_meadow()
-    cmds += build_butterfly(
+    yield from build_meadow()
+    yield from build_butterfly(
         end_f=timing.flight_end,
         half_cycle=half_cycle,
     )
-    cmds += build_flight_path(
+    yield from iter_flight_path(
         timing,
         altitude=altitude,
         half_cycle=half_cycle,
         speed=speed,
     )
-    return cmds
+
+
+def build_flight(
+    timing: Timing,
+    half_cycle: int = 6,
+    altitude: float = 8.0,
+    speed: float = 0.5,
+) -> List[Dict]:
+    """List form of iter_flight."""
+    return list(iter_flight(timing, half_cycle, altitude, speed))
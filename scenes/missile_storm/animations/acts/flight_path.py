@@ -3,7 +3,7 @@
 # All Rights Reserved Arodi Emmanuel
 
 import math
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from ..domain.timing import Timing
 
@@ -23,20 +23,31 @@ def _rot(f, rot):
     }}
 
 
-def build_flight_path(
+def iter_flight_path(
     timing: Timing,
     step: int = 2,
     altitude: float = 8.0,
     half_cycle: int = 6,
     speed: float = 0.5,
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """Butterfly flies straight along +Y with body bob."""
-    cmds: List[Dict] = []
     for f in range(
         timing.flight_start, timing.flight_end, step,
     ):
         t = f - timing.flight_start
         bob = _BOB * math.sin(math.pi * f / half_cycle)
-        cmds.append(_mv(f, (0.0, t * speed, altitude + bob)))
-        cmds.append(_rot(f, (0, 0, 0)))
-    return cmds
+        yield _mv(f, (0.0, t * speed, altitude + bob))
+        yield _rot(f, (0, 0, 0))
+
+
+def build_flight_path(
+    timing: Timing,
+    step: int = 2,
+    altitude: float = 8.0,
+    half_cycle: int = 6,
+    speed: float = 0.5,
+) -> List[Dict]:
+    """List form of iter_flight_path."""
+    return list(iter_flight_path(
+        timing, step, altitude, half_cycle, speed,
+    ))
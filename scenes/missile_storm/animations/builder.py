@@ -2,20 +2,58 @@
 # Assembles butterfly meadow scene.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
+
+from app.kernel.parallel_build import Act, iter_acts
 
 from .domain.timing import Timing
 from .staging import (
-    build_storm_camera,
+    iter_storm_camera,
     build_storm_lights,
     build_storm_materials,
 )
 from .acts import (
-    build_flight,
+    iter_flight,
     build_village,
 )
 
 
+def missile_storm_acts(
+    timing: Timing,
+    cam_step: int = 4,
+    wing_half_cycle: int = 6,
+    flight_speed: float = 0.5,
+    flight_altitude: float = 8.0,
+) -> List[Act]:
+    """The independent builders of the animation, in batch order."""
+    return [
+        Act('materials', build_storm_materials),
+        Act('lights', build_storm_lights),
+        Act('flight', iter_flight, (
+            timing, wing_half_cycle,
+            flight_altitude, flight_speed,
+        )),
+        Act('village', build_village),
+        Act('camera', iter_storm_camera, (
+            timing, cam_step,
+            wing_half_cycle, flight_speed, flight_altitude,
+        )),
+    ]
+
+
+def iter_missile_storm(
+    timing: Timing,
+    cam_step: int = 4,
+    wing_half_cycle: int = 6,
+    flight_speed: float = 0.5,
+    flight_altitude: float = 8.0,
+) -> Iterator[Dict]:
+    """Yield the butterfly meadow animation, one command at a time."""
+    return iter_acts(missile_storm_acts(
+        timing, cam_step, wing_half_cycle, flight_speed, flight_altitude,
+    ))
+
+
 def build_missile_storm(
     timing: Timing,
     cam_step: int = 4,
@@ -24,16 +62,6 @@ def build_missile_storm(
     flight_altitude: float = 8.0,
 ) -> List[Dict]:
     """Assemble butterfly meadow animation."""
-    cmds: List[Dict] = []
-    cmds += build_storm_materials()
-    cmds += build_storm_lights()
-    cmds += build_flight(
-        timing, wing_half_cycle,
-        flight_altitude, flight_speed,
-    )
-    cmds += build_village()
-    cmds += build_storm_camera(
-        timing, cam_step,
-        wing_half_cycle, flight_speed, flight_altitude,
-    )
-    return cmds
+    return list(iter_missile_storm(
+        timing, cam_step, wing_half_cycle, flight_speed, flight_altitude,
+    ))
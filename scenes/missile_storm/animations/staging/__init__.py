@@ -2,12 +2,13 @@
 # Staging subpackage: camera, lights, materials.
 # All Rights Reserved Arodi Emmanuel
 
-from .camera import build_storm_camera
+from .camera import build_storm_camera, iter_storm_camera
 from .lights import build_storm_lights
 from .materials import build_storm_materials
 
 __all__ = [
     'build_storm_camera',
+    'iter_storm_camera',
     'build_storm_lights',
     'build_storm_materials',
 ]
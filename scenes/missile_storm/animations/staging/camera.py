@@ -2,21 +2,21 @@
 # Camera follows butterfly throughout the scene.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from ..domain.timing import Timing
-from .camera_follow import build_follow_phase
+from .camera_follow import iter_follow_phase
 
 
-def build_storm_camera(
+def iter_storm_camera(
     timing: Timing,
     step: int = 4,
     half_cycle: int = 6,
     speed: float = 0.5,
     altitude: float = 8.0,
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """Camera rig: create + follow butterfly."""
-    cmds: List[Dict] = [
+    yield from [
         {
             'cmd': 'create_camera',
             'args': {'name': 'StormCam'},
@@ -36,8 +36,20 @@ def build_storm_camera(
             },
         },
     ]
-    cmds += build_follow_phase(
+    yield from iter_follow_phase(
         timing, step,
         half_cycle, speed, altitude,
     )
-    return cmds
+
+
+def build_storm_camera(
+    timing: Timing,
+    step: int = 4,
+    half_cycle: int = 6,
+    speed: float = 0.5,
+    altitude: float = 8.0,
+) -> List[Dict]:
+    """List form of iter_storm_camera."""
+    return list(iter_storm_camera(
+        timing, step, half_cycle, speed, altitude,
+    ))
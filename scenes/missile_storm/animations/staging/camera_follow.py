@@ -3,7 +3,7 @@
 # All Rights Reserved Arodi Emmanuel
 
 import math
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from ..domain.timing import Timing
 
@@ -26,15 +26,14 @@ def _butterfly_pos(
     return 0.0, t * speed, altitude + bob
 
 
-def build_follow_phase(
+def iter_follow_phase(
     timing: Timing,
     step: int = 4,
     half_cycle: int = 6,
     speed: float = 0.5,
     altitude: float = 8.0,
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """Camera tracks butterfly from behind and above."""
-    cmds: List[Dict] = []
     for f in range(
         timing.flight_start, timing.flight_end, step,
     ):
@@ -42,14 +41,26 @@ def build_follow_phase(
             f, half_cycle, speed,
             altitude, timing.flight_start,
         )
-        cmds.append({'cmd': 'move_object', 'args': {
+        yield {'cmd': 'move_object', 'args': {
             'name': 'StormCam',
             'location': (bx, by - _CAM_BACK, bz + _CAM_UP),
             'frame': f,
-        }})
-        cmds.append({'cmd': 'move_object', 'args': {
+        }}
+        yield {'cmd': 'move_object', 'args': {
             'name': '_target_StormCam',
             'location': (bx, by + _LOOK_AHEAD, bz),
             'frame': f,
-        }})
-    return cmds
+        }}
+
+
+def build_follow_phase(
+    timing: Timing,
+    step: int = 4,
+    half_cycle: int = 6,
+    speed: float = 0.5,
+    altitude: float = 8.0,
+) -> List[Dict]:
+    """List form of iter_follow_phase."""
+    return list(iter_follow_phase(
+        timing, step, half_cycle, speed, altitude,
+    ))
@@ -24,18 +24,14 @@ WING_HALF_CYCLE = 6
 FLIGHT_SPEED = 0.5
 # Altitude above ground (meters). Bob adds ±0.35 m.
 FLIGHT_ALTITUDE = 8.0
+# Re-dispatch only the acts whose instructions changed since the last
+# incremental run (digests are kept on the scene). First run is full.
+INCREMENTAL = False
 
-# -- Purge cache -----------------------------
-import shutil
-from pathlib import Path
+# -- Reload modules edited since last run ---
+from app.infra.hot_reload import reload_changed
 
-for _pc in Path(PROJECT_PATH).rglob('__pycache__'):
-    shutil.rmtree(_pc, ignore_errors=True)
-for _m in [
-    k for k in sys.modules
-    if k.startswith(('scenes', 'app'))
-]:
-    del sys.modules[_m]
+reload_changed()  # re-imports only modules edited since the last run
 
 # -- Run scene --------------------------------
 from scenes.missile_storm.scene import create_scene
@@ -68,7 +64,10 @@ if __name__ == '__main__':
     result = create_scene(
         TIMING, CAM_STEP, WING_HALF_CYCLE,
         FLIGHT_SPEED, FLIGHT_ALTITUDE,
+        incremental=INCREMENTAL,
     )
+    if INCREMENTAL:
+        print(f"  Rebuilt: {', '.join(result['rebuilt']) or '-'}")
     ok_n = sum(
         1 for r in result['results'] if r.success
     )
@@ -2,14 +2,63 @@
 # Butterfly meadow scene orchestrator.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
-from app.kernel.dispatcher import dispatch_batch
+from app.kernel.parallel_build import Act, iter_acts
+from app.kernel.scene_run import run_scene
 from app.components.env_builder import build_environment
 import app.commands
 
 from .animations.domain.timing import Timing
-from .animations.builder import build_missile_storm
+from .animations.builder import missile_storm_acts
+
+# Builder code the cached batch depends on (beyond app/components).
+_SOURCES = (Path(__file__).parent,)
+
+
+def _render_settings() -> List[Dict[str, Any]]:
+    return [{'cmd': 'configure_eevee', 'args': {
+        'width': 1920, 'height': 1080,
+        'samples': 32,
+    }}]
+
+
+def scene_acts(
+    timing: Timing = Timing(),
+    cam_step: int = 4,
+    wing_half_cycle: int = 6,
+    flight_speed: float = 0.5,
+    flight_altitude: float = 8.0,
+) -> List[Act]:
+    """Render settings, environment and the animation acts, in order."""
+    return [
+        Act('render', _render_settings),
+        Act('environment', build_environment, ({
+            'total_frames': timing.flight_end,
+            'world_color': (0.45, 0.65, 0.85),
+            'grid': False,
+            'lights': [],
+        },)),
+        *missile_storm_acts(
+            timing, cam_step, wing_half_cycle,
+            flight_speed, flight_altitude,
+        ),
+    ]
+
+
+def iter_batch(
+    timing: Timing = Timing(),
+    cam_step: int = 4,
+    wing_half_cycle: int = 6,
+    flight_speed: float = 0.5,
+    flight_altitude: float = 8.0,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the butterfly meadow instructions lazily."""
+    return iter_acts(scene_acts(
+        timing, cam_step, wing_half_cycle,
+        flight_speed, flight_altitude,
+    ))
 
 
 def create_scene(
@@ -18,26 +67,30 @@ def create_scene(
     wing_half_cycle: int = 6,
     flight_speed: float = 0.5,
     flight_altitude: float = 8.0,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
 ) -> Dict[str, Any]:
-    """Build and dispatch butterfly meadow scene."""
-    total = timing.flight_end
-    batch = [{'cmd': 'configure_eevee', 'args': {
-        'width': 1920, 'height': 1080,
-        'samples': 32,
-    }}]
-    batch += build_environment({
-        'total_frames': total,
-        'world_color': (0.45, 0.65, 0.85),
-        'grid': False,
-        'lights': [],
-    })
-    batch += build_missile_storm(
+    """Build and dispatch butterfly meadow scene.
+
+    The mode arguments (profile ... workers) and the returned dict are
+    documented on app.kernel.scene_run.run_scene.
+    """
+    acts = scene_acts(
         timing, cam_step, wing_half_cycle,
         flight_speed, flight_altitude,
     )
-    results = dispatch_batch(batch)
-    return {
-        'results': results,
-        'frames': total,
-        'status': 'OK',
-    }
+    return run_scene(
+        acts, {'frames': timing.flight_end},
+        _SOURCES, {'scene': 'missile_storm', 'timing': timing,
+                   'cam_step': cam_step, 'wing_half_cycle': wing_half_cycle,
+                   'flight_speed': flight_speed,
+                   'flight_altitude': flight_altitude},
+        profile=profile, stream=stream, results=results,
+        incremental=incremental, cache=cache, dry_run=dry_run,
+        workers=workers,
+    )
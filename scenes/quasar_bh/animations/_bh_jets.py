@@ -2,20 +2,21 @@
 # Quasar jet wrapper — delegates to app.components.bodies.jet_builder.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import List
+from typing import List, Optional
 
-# Ensure quasar constants are applied before jet_builder reads them
-from . import _jet_physics  # noqa: F401
 from ._black_hole import build_black_hole  # noqa: F401 (for backward mapping)
+from ._jet_physics import QUASAR_PHYSICS
 from app.components.bodies.jet_builder import build_jets as _build
-from app.components.bodies.jet_physics import JET_BASE_EMISSION
+from app.components.physics_context import PhysicsContext
 
 
 def build_jets(
     _use_particles: bool = False,
     total_frames: int = 900,
+    physics: Optional[PhysicsContext] = None,
 ) -> List[dict]:
     """Build relativistic jets using the generic jet builder."""
+    physics = physics or QUASAR_PHYSICS
     return _build({
         'parent_object': 'BlackHole',
         'north_name':    'JetNorth',
@@ -24,6 +25,7 @@ def build_jets(
         'south_mat':     'JetSouthMat',
         'north_color':   (0.55, 0.85, 1.0, 1.0),
         'south_color':   (1.0, 0.40, 0.15, 1.0),
-        'base_emission': JET_BASE_EMISSION,
+        'base_emission': physics.jet_base_emission,
         'total_frames':  total_frames,
+        'physics':       physics,
     })
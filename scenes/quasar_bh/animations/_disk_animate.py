@@ -2,16 +2,19 @@
 # Quasar disk-animation wrapper — delegates to app.components.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from app.components.disk_animator import build_disk_animation as _build
+from app.components.physics_context import PhysicsContext
 from ._disk_build import ring_emit_strength
+from ._jet_physics import QUASAR_PHYSICS
 
 
 def build_disk_animation(
     disk_rings: List[Dict], total_frames: int,
     rotations: int, step: int,
     pulse_inner: bool, particles: bool,
+    physics: Optional[PhysicsContext] = None,
 ) -> List[Dict]:
     """Build disk animation using the generic disk_animator."""
     return _build({
@@ -22,4 +25,5 @@ def build_disk_animation(
         'pulse_inner':    pulse_inner,
         'particles':      particles,
         'emit_strength_fn': ring_emit_strength,
+        'physics':        physics or QUASAR_PHYSICS,
     })
@@ -2,9 +2,11 @@
 # Quasar disk-ring wrapper — delegates to app.components.disk_builder.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from app.components.disk_builder import build_ring as _build_ring
+from app.components.physics_context import PhysicsContext
+from ._jet_physics import QUASAR_PHYSICS
 from ._physics import DISK_RINGS
 
 _RING_RADII = [r['radius'] for r in DISK_RINGS]
@@ -15,6 +17,9 @@ def ring_emit_strength(i: int) -> float:
     return round(8.0 * max(0.3, 1.0 - i * 0.08), 2)
 
 
-def build_ring(i: int, ring: Dict) -> List[Dict]:
+def build_ring(
+    i: int, ring: Dict, physics: Optional[PhysicsContext] = None,
+) -> List[Dict]:
     """Build one accretion ring using the generic disk builder."""
-    return _build_ring(i, ring, _RING_RADII, ring_emit_strength)
+    return _build_ring(i, ring, _RING_RADII, ring_emit_strength,
+                       physics or QUASAR_PHYSICS)
@@ -3,7 +3,6 @@
 # All Rights Reserved Arodi Emmanuel
 
 from app.components.disk_physics import (      # noqa: F401 (re-export)
-    SCHWARZSCHILD_RADIUS,
     set_schwarzschild_radius,
     isco_radius,
     keplerian_speed,
@@ -11,6 +10,14 @@ from app.components.disk_physics import (      # noqa: F401 (re-export)
     gravitational_redshift_factor,
     _pw_omega_scaled,
 )
+import app.components.disk_physics as _dp
+from ._jet_physics import QUASAR_PHYSICS  # noqa: F401 (re-export)
+
+
+def __getattr__(name: str):
+    # Legacy SCHWARZSCHILD_RADIUS, read live from the default context.
+    return getattr(_dp, name)
+
 
 # ── Quasar-specific ring data (not generic) ────────────────────────
 DISK_RINGS = [
@@ -25,17 +25,18 @@ if PROJECT_PATH not in sys.path:
 #   'ultra'  →  9 rings, 3600 f  (120 s) 1920×1080  + particles
 #
 QUALITY = 'ultra'
+PROFILE = False  # Per-command timing report (+ JSON / Chrome trace)
+# Re-dispatch only rings / camera / ... whose instructions changed since
+# the last incremental run (digests are kept on the scene).
+INCREMENTAL = False
+CACHE = False  # Reuse the generated batch from the user cache dir
 
-# ── 3. Purge stale bytecode + cached modules ───────────────────────────────
-import importlib
-import shutil
+# ── 3. Reload only modules edited since the last run (+ importers) ─────────
 from pathlib import Path
 
-for _pycache in Path(PROJECT_PATH).rglob('__pycache__'):
-    shutil.rmtree(_pycache, ignore_errors=True)
+from app.infra.hot_reload import reload_changed
 
-for _mod in [k for k in sys.modules if k.startswith(('scenes', 'app'))]:
-    del sys.modules[_mod]
+reload_changed()
 
 # ── 4. Run ────────────────────────────────────────────────────────────────
 from scenes.quasar_bh.scene import create_scene
@@ -62,20 +63,28 @@ if __name__ == '__main__':
     print(f"  QUASAR BLACK HOLE  [quality = {QUALITY}]")
     print("=" * 60)
 
-    result = create_scene(quality=QUALITY)
-
-    ok_count = sum(1 for r in result['results'] if r.success)
-    total    = len(result['results'])
+    result = create_scene(quality=QUALITY, profile=PROFILE,
+                          results='summary', incremental=INCREMENTAL,
+                          cache=CACHE)
 
+    summary = result['summary']
     print(f"\n  Frames   : {result['frames']}")
-    print(f"  Commands : {ok_count} / {total} OK")
+    print(f"  Commands : {summary.succeeded} / {summary.total} OK")
+    if INCREMENTAL:
+        print(f"  Rebuilt  : {', '.join(result['rebuilt']) or '-'}")
 
-    failed = [r for r in result['results'] if not r.success]
-    if failed:
-        print(f"\n  ── {len(failed)} errors ──")
-        for r in failed:
+    if summary.failures:
+        print(f"\n  ── {summary.failed} errors ──")
+        for _, r in summary.failures:
             print(f"    [FAIL] {r.command_name}: {r.error}")
 
+    if result['profile'] is not None:
+        print("\n" + result['profile'].report())
+        print("\n" + result['profile'].report(by='origin'))
+        result['profile'].save(str(Path(PROJECT_PATH) / 'profile.json'))
+        result['profile'].save(
+            str(Path(PROJECT_PATH) / 'profile_trace.json'), fmt='chrome')
+
     _setup_viewport()
 
     print("\n" + "=" * 60)
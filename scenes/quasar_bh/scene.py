@@ -2,13 +2,17 @@
 # Quasar black-hole scene — thin orchestrator.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
-from app.kernel.dispatcher import dispatch_batch
-import app.commands  # triggers all command registrations
+from app.components.physics_context import PhysicsContext
+from app.kernel.parallel_build import Act, iter_acts
+from app.kernel.scene_run import run_scene
+import app.commands  # handlers import on first use (command manifest)
 
 from .materials._presets import PRESETS
-from .animations._physics import DISK_RINGS
+from .animations._physics import DISK_RINGS, QUASAR_PHYSICS
 from .animations._env import build_environment
 from .animations._black_hole import build_black_hole
 from .animations._bh_jets import build_jets
@@ -16,47 +20,85 @@ from .animations._disk_build import build_ring
 from .animations._disk_animate import build_disk_animation
 from .animations._cam import build_camera
 
+# Builder code the cached batch depends on (beyond app/components).
+_SOURCES = (Path(__file__).parent,)
 
-def create_scene(quality: str = 'low') -> Dict[str, Any]:
-    """
-    Build and dispatch the quasar black-hole animation.
 
-    Args:
-        quality: 'low' | 'medium' | 'high' | 'ultra'
+def scene_acts(
+    quality: str = 'low', physics: Optional[PhysicsContext] = None,
+) -> List[Act]:
+    """Environment, black hole, rings, disk animation, jets and camera.
 
-    Returns:
-        Dict with 'results', 'frames', and 'quality'.
+    quality is checked here; physics replaces QUASAR_PHYSICS (e.g. one
+    step of an r_s sweep). The acts read no module state, so batches
+    for different presets or contexts can be built concurrently.
     """
     if quality not in PRESETS:
         raise ValueError(
             f"quality must be one of {list(PRESETS)};"
             f" got '{quality}'"
         )
-
     p = PRESETS[quality]
+    physics = physics or QUASAR_PHYSICS
     disk_rings = DISK_RINGS[:p['disk_ring_count']]
+    return [
+        Act('environment', build_environment, (p,)),
+        Act('black_hole', build_black_hole, (physics,)),
+        *(Act(f'ring_{i}', build_ring, (i, ring, physics))
+          for i, ring in enumerate(disk_rings)),
+        Act('disk_animation', build_disk_animation, (
+            disk_rings, p['total_frames'], p['disk_rotations'],
+            p['disk_step'], p['pulse_inner'], p['particles'], physics,
+        )),
+        Act('jets', build_jets,
+            (p['particles'], p['total_frames'], physics)),
+        Act('camera', build_camera,
+            (p['total_frames'], p['cam_step'], p['dof'])),
+    ]
+
+
+def iter_batch(
+    quality: str = 'low', physics: Optional[PhysicsContext] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the quasar instructions lazily (quality checked up front)."""
+    return iter_acts(scene_acts(quality, physics))
 
-    batch = []
-    batch += build_environment(p)
-    batch += build_black_hole()
-    for i, ring in enumerate(disk_rings):
-        batch += build_ring(i, ring)
-    batch += build_disk_animation(
-        disk_rings,
-        p['total_frames'],
-        p['disk_rotations'],
-        p['disk_step'],
-        p['pulse_inner'],
-        p['particles'],
-    )
-    batch += build_jets(p['particles'], p['total_frames'])
-    batch += build_camera(
-        p['total_frames'], p['cam_step'], p['dof'],
-    )
 
-    results = dispatch_batch(batch)
-    return {
-        'results': results,
-        'frames': p['total_frames'],
-        'quality': quality,
-    }
+def build_batch(
+    quality: str = 'low', physics: Optional[PhysicsContext] = None,
+) -> List[Dict[str, Any]]:
+    """Generate the quasar instruction batch without dispatching it."""
+    return list(iter_batch(quality, physics))
+
+
+def create_scene(
+    quality: str = 'low',
+    physics: Optional[PhysicsContext] = None,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
+) -> Dict[str, Any]:
+    """Build and dispatch the quasar black-hole animation.
+
+    Args:
+        quality: 'low' | 'medium' | 'high' | 'ultra'
+        physics: PhysicsContext replacing QUASAR_PHYSICS (r_s, jets)
+
+    The remaining arguments select the dispatch mode and are documented
+    on app.kernel.scene_run.run_scene, as is the returned dict ('frames'
+    and 'quality' plus the mode's results).
+    """
+    acts = scene_acts(quality, physics)
+    return run_scene(
+        acts, {'frames': PRESETS[quality]['total_frames'],
+               'quality': quality},
+        _SOURCES, {'scene': 'quasar_bh', 'preset': PRESETS[quality],
+                   'physics': asdict(physics or QUASAR_PHYSICS)},
+        profile=profile, stream=stream, results=results,
+        incremental=incremental, cache=cache, dry_run=dry_run,
+        workers=workers,
+    )
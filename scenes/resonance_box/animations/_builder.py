@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 from app.components.bodies.celestial_body import build_celestial_body
 from app.components.bodies.dyson_sphere import build_dyson_sphere
+from app.components import trajectories as traj
 from ._materials import generate_glass_planet_material
 from ._strobe import build_strobe_keyframes
 
@@ -47,11 +48,13 @@ def _build_mechanism(i: int, planet: Dict, total: int, step: int) -> List[Dict]:
     cmds.append({'cmd': 'move_object', 'args': {'name': track, 'location': (0, 0, 0), 'frame': 1}})
     cmds.append({'cmd': 'rotate_object', 'args': {'name': track, 'rotation': (inc, 0, 0), 'frame': 1}})
     
-    # Precession of the track
+    # Precession of the track: constant rate, angle(f) = 2*pi * f / p_period
     p_period = period * 4.0
-    for f in range(1, total + 1, step):
-        t_angle = 2.0 * math.pi * (f / p_period)
-        cmds.append({'cmd': 'rotate_object', 'args': {'name': track, 'rotation': (inc, 0, t_angle), 'frame': f}})
+    p_rate = 2.0 * math.pi / p_period
+    cmds.append({'cmd': 'set_constant_rotation', 'args': {
+        'name': track, 'axis': 'Z', 'rate': p_rate,
+        'start': p_rate, 'start_frame': 1,
+    }})
     
     # Copper Connecting Arm
     arm = f"{name}_Arm"
@@ -65,22 +68,15 @@ def _build_mechanism(i: int, planet: Dict, total: int, step: int) -> List[Dict]:
     # Strobe Keyframes
     cmds += build_strobe_keyframes(mat_name, period, total)
     
-    # Animation transform
-    for f in range(1, total + 1, step):
-        angle = 2.0 * math.pi * (f / period)
-        px = r * math.cos(angle)
-        py = r * math.sin(angle) * math.cos(inc)
-        pz = r * math.sin(angle) * math.sin(inc)
-        
-        cmds.append({'cmd': 'move_object', 'args': {'name': name, 'location': (px, py, pz), 'frame': f}})
-        cmds.append({'cmd': 'rotate_object', 'args': {'name': name, 'rotation': (inc, 0, angle * 4.0), 'frame': f}})
-        
-        ax, ay, az_z = px / 2.0, py / 2.0, pz / 2.0
-        cmds.append({'cmd': 'move_object', 'args': {'name': arm, 'location': (ax, ay, az_z), 'frame': f}})
-        
-        az = math.atan2(py, px)
-        el = math.atan2(pz, math.hypot(px, py))
-        cmds.append({'cmd': 'rotate_object', 'args': {'name': arm, 'rotation': (0.0, math.pi / 2.0 - el, az), 'frame': f}})
+    # Animation transform: whole-timeline arrays, one series per channel
+    frames = traj.sample_frames(total, step)
+    angles = traj.orbit_angles(frames, period)
+    orbit = traj.keplerian_orbit(angles, r, inc)
+    arm_loc, arm_rot = traj.arm_pose(orbit)
+    cmds.append(traj.series(name, 'location', frames, orbit))
+    cmds.append(traj.series(name, 'rotation_euler', frames, traj.spin(angles, inc, 4.0)))
+    cmds.append(traj.series(arm, 'location', frames, arm_loc))
+    cmds.append(traj.series(arm, 'rotation_euler', frames, arm_rot))
 
     return cmds
 
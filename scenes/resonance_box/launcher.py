@@ -12,22 +12,32 @@ project_root = os.path.abspath(os.path.join(current_dir, '..', '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# Force reload engine modules to flush PyCache during Blender run
-for m in list(sys.modules.keys()):
-    if m.startswith('app.') or m.startswith('scenes.'):
-        del sys.modules[m]
+# Re-import only engine modules edited since the last run in this session
+from app.infra.hot_reload import reload_changed
+
+reload_changed()
 
 from scenes.resonance_box.scene import create_scene
 
+PROFILE = False  # Per-command timing report (+ JSON / Chrome trace)
+CACHE = False    # Reuse the generated batch from the user cache dir
+
 
 def run():
     print("--- Starting Resonance Box Scene Generation ---")
     
     # Render highly visible parameters by default to see the music box
-    results = create_scene('ultra', total_frames=1200, camera_radius=90.0)
+    results = create_scene('ultra', total_frames=1200, camera_radius=90.0,
+                           profile=PROFILE, cache=CACHE)
     
     print(f"Generated {len(results['results'])} commands.")
     print(f"Quality: {results['quality']}, Frames: {results['frames']}")
+    if results['profile'] is not None:
+        print(results['profile'].report())
+        print(results['profile'].report(by='origin'))
+        results['profile'].save(os.path.join(project_root, 'profile.json'))
+        results['profile'].save(
+            os.path.join(project_root, 'profile_trace.json'), fmt='chrome')
     print("--- Done ---")
     
     # Viewport configurations
@@ -2,10 +2,12 @@
 # Resonance Box Scene — an independent orchestrator.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
-from app.kernel.dispatcher import dispatch_batch
-import app.commands  # triggers all command registrations
+from app.kernel.parallel_build import Act, iter_acts
+from app.kernel.scene_run import run_scene
+import app.commands  # handlers import on first use (command manifest)
 
 from app.components.env_builder import build_environment
 from app.components.camera_builder import build_camera
@@ -16,11 +18,99 @@ import scenes.solar_system.commands  # noqa: F401
 from scenes.solar_system.materials._presets import PRESETS
 from .animations._builder import build_resonance_box
 
+# Builder code the cached batch depends on (beyond app/components).
+_SOURCES = (Path(__file__).parent,
+            Path(__file__).parent.parent / 'solar_system')
 
-def create_scene(
+
+def _space_world() -> List[Dict[str, Any]]:
+    return [{'cmd': 'create_space_world', 'args': {
+        'star_density': 400.0,
+        'star_brightness': 3.0,
+    }}]
+
+
+def scene_acts(
+    quality: str = 'low',
+    total_frames: int | None = None,
+    camera_radius: float | None = None,
+) -> List[Act]:
+    """Environment, space world, resonance_box and camera.
+
+    quality is checked when called, not on first iteration.
+    """
+    if quality not in PRESETS:
+        raise ValueError(
+            f"quality must be one of {list(PRESETS)};"
+            f" got '{quality}'"
+        )
+    p = PRESETS[quality].copy()  # Clone preset
+    if total_frames is not None:
+        p['total_frames'] = total_frames
+    rad = camera_radius if camera_radius is not None else 100.0
+    return [
+        Act('environment', build_environment, ({
+            'total_frames': p['total_frames'],
+            'world_color':  (0.01, 0.01, 0.012),  # slightly darker than orrery
+            'grid':         False,
+            'lights': [
+                {'name': 'SunLight', 'type': 'POINT'},
+            ],
+        },)),
+        Act('space_world', _space_world),
+        Act('resonance_box', build_resonance_box, (
+            p['planets'], p['total_frames'], p['cam_step'],
+        )),
+        Act('camera', build_camera, ({
+            'name':          'SceneCamera',
+            'total_frames':  p['total_frames'],
+            'cam_step':      p['cam_step'],
+            'radius':        rad,
+            'focal_length':  55.0,
+            'dof':           False,
+            'dof_focus_dist': 14.0,
+            'dof_fstop':      4.0,
+            'el_base_deg':   0.0,
+            'el_amp_deg':    70.0,
+            'el_freq':        2.0,
+            'breathe_amp':   0.0,
+            'breathe_freq':  0.0,
+        },)),
+    ]
+
+
+def iter_batch(
+    quality: str = 'low',
+    total_frames: int | None = None,
+    camera_radius: float | None = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield the Rhythmic Resonance instructions lazily.
+
+    quality is checked when called, not on first iteration.
+    """
+    return iter_acts(scene_acts(quality, total_frames, camera_radius))
+
+
+def build_batch(
     quality: str = 'low',
     total_frames: int | None = None,
     camera_radius: float | None = None
+) -> List[Dict[str, Any]]:
+    """Generate the Rhythmic Resonance batch without dispatching it."""
+    return list(iter_batch(quality, total_frames, camera_radius))
+
+
+def create_scene(
+    quality: str = 'low',
+    total_frames: int | None = None,
+    camera_radius: float | None = None,
+    profile: bool = False,
+    stream: bool = False,
+    results: str = 'list',
+    incremental: bool = False,
+    cache: bool = False,
+    dry_run: bool = False,
+    workers: Optional[int] = 1,
 ) -> Dict[str, Any]:
     """Build and dispatch the Rhythmic Resonance animation.
 
@@ -28,49 +118,19 @@ def create_scene(
         quality: 'low' | 'medium' | 'high' | 'ultra' (from shared presets)
         total_frames: Optional override for duration
         camera_radius: Optional override for camera distance
-    """
-    if quality not in PRESETS:
-        raise ValueError(f"quality must be one of {list(PRESETS)}; got '{quality}'")
-        
-    p = PRESETS[quality].copy()
-    if total_frames is not None:
-        p['total_frames'] = total_frames
-    
-    rad = camera_radius if camera_radius is not None else 100.0
 
-    batch = []
-    batch += build_environment({
-        'total_frames': p['total_frames'],
-        'world_color':  (0.01, 0.01, 0.012), # slightly darker than orrery
-        'grid':         False,
-        'lights': [{'name': 'SunLight', 'type': 'POINT'}],
-    })
-    batch.append({'cmd': 'create_space_world', 'args': {
-        'star_density': 400.0,
-        'star_brightness': 3.0,
-    }})
-    batch += build_resonance_box(
-        p['planets'], p['total_frames'], step=p['cam_step'],
+    The remaining arguments select the dispatch mode and are documented
+    on app.kernel.scene_run.run_scene, as is the returned dict ('frames'
+    and 'quality' plus the mode's results).
+    """
+    acts = scene_acts(quality, total_frames, camera_radius)
+    return run_scene(
+        acts, {'frames': total_frames or PRESETS[quality]['total_frames'],
+               'quality': quality},
+        _SOURCES, {'scene': 'resonance_box', 'preset': PRESETS[quality],
+                   'total_frames': total_frames,
+                   'camera_radius': camera_radius},
+        profile=profile, stream=stream, results=results,
+        incremental=incremental, cache=cache, dry_run=dry_run,
+        workers=workers,
     )
-    batch += build_camera({
-        'name':          'SceneCamera',
-        'total_frames':  p['total_frames'],
-        'cam_step':      p['cam_step'],
-        'radius':        rad,
-        'focal_length':  55.0,
-        'dof':           False,
-        'dof_focus_dist': 14.0,
-        'dof_fstop':      4.0,
-        'el_base_deg':   0.0,
-        'el_amp_deg':    70.0,
-        'el_freq':        2.0,
-        'breathe_amp':   0.0,
-        'breathe_freq':  0.0,
-    })
-
-    results = dispatch_batch(batch)
-    return {
-        'results': results,
-        'frames':  p['total_frames'],
-        'quality': quality,
-    }
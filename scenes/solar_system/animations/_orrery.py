@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 from app.components.bodies.celestial_body import build_celestial_body
 from app.components.bodies.dyson_sphere import build_dyson_sphere
+from app.components import trajectories as traj
 
 
 def _build_materials() -> List[Dict]:
@@ -114,11 +115,10 @@ def _build_planet_mechanism(
     
     # Orbiting Precession for the Track (so it's not a static ring)
     track_precession_period = period * 4.0 # The track rotates much slower than the planet
-    for f in range(1, total_frames + 1, step):
-        t_angle = 2.0 * math.pi * (f / track_precession_period)
-        cmds.append({'cmd': 'rotate_object', 'args': {
-            'name': track, 'rotation': (inc, 0.0, t_angle), 'frame': f
-        }})
+    frames = traj.sample_frames(total_frames, step)
+    cmds.append(traj.series(track, 'rotation_euler', frames, traj.spin(
+        traj.orbit_angles(frames, track_precession_period), inc,
+    )))
     
     # 2. The Arm (Cylinder connecting center to planet)
     arm = f"{name}_Arm"
@@ -142,43 +142,22 @@ def _build_planet_mechanism(
         'subsurf': 1,
     })
     
-    # 4. Animation
-    for f in range(1, total_frames + 1, step):
-        # Calculate angle
-        angle = 2.0 * math.pi * (f / period)
-        
-        # Move planet to 3D point on track (tilted by inc on X axis)
-        px = r * math.cos(angle)
-        py = r * math.sin(angle) * math.cos(inc)
-        pz = r * math.sin(angle) * math.sin(inc)
-        cmds.append({'cmd': 'move_object', 'args': {
-            'name': name, 'location': (px, py, pz + z_offset), 'frame': f
-        }})
-        
-        # Self-rotation for the planet
-        cmds.append({'cmd': 'rotate_object', 'args': {
-            'name': name, 'rotation': (inc, 0.0, angle * 4.0), 'frame': f
-        }})
-        
-        # Arm transform
-        # The arm spans -r/2 to r/2 on Z. We want it pointing from Origin to Planet.
-        # So we rotate it to point at (px, py, pz)
-        az = math.atan2(py, px)
-        el = math.atan2(pz, math.hypot(px, py))
-        
-        # Center of the arm is halfway between Origin and Planet
-        ax = px / 2.0
-        ay = py / 2.0
-        az_z = pz / 2.0
-        
-        cmds.append({'cmd': 'move_object', 'args': {
-            'name': arm, 'location': (ax, ay, az_z + z_offset), 'frame': f
-        }})
-        # Default cylinder points strict UP(+Z).
-        # We need it pointing at the planet.
-        cmds.append({'cmd': 'rotate_object', 'args': {
-            'name': arm, 'rotation': (0.0, math.pi / 2.0 - el, az), 'frame': f
-        }})
+    # 4. Animation (whole-timeline arrays, one keyframe_series each)
+    angles = traj.orbit_angles(frames, period)
+    
+    # Planet on its track (tilted by inc on X axis) + self-rotation.
+    # z_offset is 0: the shaft is not stacked yet.
+    orbit = traj.keplerian_orbit(angles, r, inc)
+    cmds.append(traj.series(name, 'location', frames, orbit))
+    cmds.append(traj.series(name, 'rotation_euler', frames, traj.spin(
+        angles, inc, 4.0,
+    )))
+    
+    # Arm: default cylinder points +Z and spans -r/2..r/2, so centre it
+    # halfway to the planet and rotate it to point at the planet.
+    arm_loc, arm_rot = traj.arm_pose(orbit)
+    cmds.append(traj.series(arm, 'location', frames, arm_loc))
+    cmds.append(traj.series(arm, 'rotation_euler', frames, arm_rot))
 
     return cmds
 
@@ -5,12 +5,14 @@
 
 from typing import Any, Dict
 
+from app.domain.command_schemas import ArgSchema
 from app.domain.dispatch_result import DispatchResult
 from app.kernel.registry import register_command
 from app.infra.bridge import data, is_mock
 
 
-@register_command('create_metal_material')
+@register_command('create_metal_material',
+                  ArgSchema(creates_material='name'))
 def create_metal_material(args: Dict[str, Any]) -> DispatchResult:
     """Create a fully customizable Metallic PBR material.
 
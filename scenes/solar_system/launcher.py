@@ -27,17 +27,15 @@ if PROJECT_PATH not in sys.path:
 QUALITY = 'ultra'
 TOTAL_FRAMES  = 1200   # Set to None to use Preset defaults
 CAMERA_RADIUS = 100.0  # Set to None to use 100.0 default
+PROFILE       = False  # Per-command timing report (+ JSON / Chrome trace)
+CACHE         = False  # Reuse the generated batch from the user cache dir
 
-# ── 3. Purge stale bytecode + cached modules ───────────────────────────────
-import importlib
-import shutil
+# ── 3. Reload only modules edited since the last run (+ importers) ─────────
 from pathlib import Path
 
-for _pycache in Path(PROJECT_PATH).rglob('__pycache__'):
-    shutil.rmtree(_pycache, ignore_errors=True)
+from app.infra.hot_reload import reload_changed
 
-for _mod in [k for k in sys.modules if k.startswith(('scenes', 'app'))]:
-    del sys.modules[_mod]
+reload_changed()
 
 # ── 4. Run ─────────────────────────────────────────────────────────────────
 from scenes.solar_system.scene import create_scene
@@ -67,21 +65,28 @@ if __name__ == '__main__':
     result = create_scene(
         quality=QUALITY,
         total_frames=TOTAL_FRAMES,
-        camera_radius=CAMERA_RADIUS
+        camera_radius=CAMERA_RADIUS,
+        profile=PROFILE,
+        results='summary',
+        cache=CACHE,
     )
 
-    ok_count = sum(1 for r in result['results'] if r.success)
-    total    = len(result['results'])
-
+    summary = result['summary']
     print(f"\n  Frames   : {result['frames']}")
-    print(f"  Commands : {ok_count} / {total} OK")
+    print(f"  Commands : {summary.succeeded} / {summary.total} OK")
 
-    failed = [r for r in result['results'] if not r.success]
-    if failed:
-        print(f"\n  ── {len(failed)} errors ──")
-        for r in failed:
+    if summary.failures:
+        print(f"\n  ── {summary.failed} errors ──")
+        for _, r in summary.failures:
             print(f"    [FAIL] {r.command_name}: {r.error}")
 
+    if result['profile'] is not None:
+        print("\n" + result['profile'].report())
+        print("\n" + result['profile'].report(by='origin'))
+        result['profile'].save(str(Path(PROJECT_PATH) / 'profile.json'))
+        result['profile'].save(
+            str(Path(PROJECT_PATH) / 'profile_trace.json'), fmt='chrome')
+
     _setup_viewport()
 
     print("\n" + "=" * 60)
@@ -0,0 +1,3 @@
+# File: tests/benchmarks/__init__.py
+# Standalone performance benchmarks (not collected by pytest).
+# All Rights Reserved Arodi Emmanuel
@@ -0,0 +1,51 @@
+# File: tests/benchmarks/keyframe_report.py
+# Keyframe counts per scene preset before and after the optimizer passes:
+# coalescing (instructions) and curve simplification (keys).
+# Run: python -m tests.benchmarks.keyframe_report
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.kernel.optimizer import coalesce_keyframes, simplify_keyframes
+from scenes.quasar_bh import scene as quasar
+from scenes.solar_system import scene as solar
+from scenes.resonance_box import scene as resonance
+
+SCENES = {
+    'quasar_bh': (quasar.build_batch, quasar.PRESETS),
+    'solar_system': (solar.build_batch, solar.PRESETS),
+    'resonance_box': (resonance.build_batch, resonance.PRESETS),
+}
+
+
+def run() -> list:
+    """Rows of (scene, preset, instructions, coalesced, before, after)."""
+    rows = []
+    for scene, (build, presets) in SCENES.items():
+        for preset in presets:
+            batch = build(preset)
+            merged, removed = coalesce_keyframes(batch)
+            _, before, after = simplify_keyframes(merged)
+            rows.append((scene, preset, len(batch), removed, before, after))
+    return rows
+
+
+def main() -> None:
+    print("=" * 72)
+    print("  KEYFRAME REPORT  [coalesce + simplify]")
+    print("=" * 72)
+    print(f"  {'scene':<14}{'preset':<8}{'instr':>9}{'merged':>9}"
+          f"{'keys':>10}{'simplified':>12}{'cut':>8}")
+    for scene, preset, n, removed, before, after in run():
+        cut = 100.0 * (before - after) / before if before else 0.0
+        print(f"  {scene:<14}{preset:<8}{n:>9}{removed:>9}"
+              f"{before:>10}{after:>12}{cut:>7.1f}%")
+
+
+if __name__ == '__main__':
+    main()
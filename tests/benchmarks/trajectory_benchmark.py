@@ -0,0 +1,121 @@
+# File: tests/benchmarks/trajectory_benchmark.py
+# Scalar per-frame generation (math calls + one command dict per frame)
+# against the vectorized trajectory arrays feeding keyframe_series.
+# Run: python -m tests.benchmarks.trajectory_benchmark [frames] [repeats]
+# All Rights Reserved Arodi Emmanuel
+
+import math
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.components import trajectories as traj
+
+
+def scalar_camera(total: int, step: int = 1) -> list:
+    """The pre-vectorization camera loop: one move_object per frame."""
+    cmds = []
+    for f in range(1, total + 1, step):
+        t = (f - 1) / max(total - 1, 1)
+        az = t * 2 * math.pi
+        el = math.radians(35.0 + 25.0 * math.sin(t * 3.0 * math.pi))
+        breathe = 0.25 * math.sin(t * 2.5 * 2 * math.pi)
+        dodge = math.exp(-((t - 0.5) / 0.08) ** 2)
+        r_local = 240.0 * (1.0 - breathe - 0.15 * dodge)
+        cmds.append({'cmd': 'move_object', 'args': {'name': 'Cam', 'location': (
+            r_local * math.cos(el) * math.cos(az),
+            r_local * math.cos(el) * math.sin(az),
+            r_local * math.sin(el),
+        ), 'frame': f}})
+    return cmds
+
+
+def scalar_orbit(total: int, step: int = 1) -> list:
+    """The pre-vectorization planet + arm loop: four dicts per frame."""
+    r, period, inc = 3.0, 600.0, math.radians(7.0)
+    cmds = []
+    for f in range(1, total + 1, step):
+        angle = 2.0 * math.pi * (f / period)
+        px = r * math.cos(angle)
+        py = r * math.sin(angle) * math.cos(inc)
+        pz = r * math.sin(angle) * math.sin(inc)
+        az = math.atan2(py, px)
+        el = math.atan2(pz, math.hypot(px, py))
+        cmds += [
+            {'cmd': 'move_object', 'args': {'name': 'P', 'location': (px, py, pz), 'frame': f}},
+            {'cmd': 'rotate_object', 'args': {'name': 'P', 'rotation': (inc, 0, angle * 4.0), 'frame': f}},
+            {'cmd': 'move_object', 'args': {'name': 'A', 'location': (px / 2, py / 2, pz / 2), 'frame': f}},
+            {'cmd': 'rotate_object', 'args': {'name': 'A', 'rotation': (0.0, math.pi / 2 - el, az), 'frame': f}},
+        ]
+    return cmds
+
+
+def vector_camera(total: int, step: int = 1, vectorized: bool = True) -> list:
+    frames = traj.sample_frames(total, step, vectorized)
+    path = traj.camera_orbit(frames, total, 240.0, vectorized=vectorized)
+    return [traj.series('Cam', 'location', frames, path)]
+
+
+def vector_orbit(total: int, step: int = 1, vectorized: bool = True) -> list:
+    frames = traj.sample_frames(total, step, vectorized)
+    angles = traj.orbit_angles(frames, 600.0, vectorized)
+    orbit = traj.keplerian_orbit(angles, 3.0, math.radians(7.0), vectorized)
+    arm_loc, arm_rot = traj.arm_pose(orbit, vectorized)
+    return [
+        traj.series('P', 'location', frames, orbit),
+        traj.series('P', 'rotation_euler', frames,
+                    traj.spin(angles, math.radians(7.0), 4.0, vectorized)),
+        traj.series('A', 'location', frames, arm_loc),
+        traj.series('A', 'rotation_euler', frames, arm_rot),
+    ]
+
+
+def _best(fn, repeats: int, *args) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def run(total: int = 3600, repeats: int = 20) -> list:
+    """Rows of (case, scalar ms, fallback ms, vectorized ms or None)."""
+    rows = []
+    for case, scalar, vector in (
+        ('camera', scalar_camera, vector_camera),
+        ('orbit+arm', scalar_orbit, vector_orbit),
+    ):
+        rows.append((
+            case,
+            _best(scalar, repeats, total, 1),
+            _best(vector, repeats, total, 1, False),
+            _best(vector, repeats, total, 1, True) if traj.HAS_NUMPY else None,
+        ))
+    return rows
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print("=" * 60)
+    print(f"  TRAJECTORY BENCHMARK  [{total} frames, step=1]")
+    print("=" * 60)
+    print(f"  {'case':<12}{'scalar':>12}{'fallback':>12}{'numpy':>12}")
+    for case, scalar, fallback, vector in run(total, repeats):
+        numpy_col = f"{vector:10.2f}ms" if vector is not None else "     n/a"
+        print(f"  {case:<12}{scalar:10.2f}ms{fallback:10.2f}ms{numpy_col}")
+        if vector:
+            print(f"  {'':<12}speed-up vs scalar: {scalar / vector:.1f}x")
+    if not traj.HAS_NUMPY:
+        print("\n  NumPy not importable: run inside Blender's Python "
+              "for the vectorized column.")
+
+
+if __name__ == '__main__':
+    main()
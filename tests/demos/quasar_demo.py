@@ -98,13 +98,8 @@ def create_quasar_animation(quality: str = 'low') -> Dict[str, Any]:
         'name': 'StarGlowMat', 'color': (0.9, 0.9, 1.0, 1.0),
         'emit': True, 'emit_strength': 3.0,
     }})
-    star_commands = generate_starfield(star_count=star_count, radius=150.0)
-    for star_cmd in star_commands:
-        batch.append(star_cmd)
-        if star_cmd['cmd'] == 'spawn_primitive' and 'Star_' in star_cmd['args']['name']:
-            batch.append({'cmd': 'assign_material', 'args': {
-                'object': star_cmd['args']['name'], 'material': 'StarGlowMat',
-            }})
+    batch.extend(generate_starfield(
+        star_count=star_count, radius=150.0, material='StarGlowMat'))
 
     # 4. Black Hole — pure black sphere, no emission
     batch.append({'cmd': 'create_material', 'args': {'name': 'BlackHoleMat', 'color': (0, 0, 0, 1)}})
@@ -0,0 +1,126 @@
+# File: tests/e2e/integration/test_batch_cache.py
+# E2E tests for the on-disk instruction batch cache.
+# All Rights Reserved Arodi Emmanuel
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra import batch_cache
+from app.infra.batch_cache import cached_batch
+from app.infra.bridge import reset
+
+
+@pytest.fixture(autouse=True)
+def clean_state(tmp_path, monkeypatch):
+    reset()
+    monkeypatch.setattr(batch_cache, 'CACHE_DIR', tmp_path / 'cache')
+    yield
+    reset()
+
+
+def _builder(calls, n=3):
+    def build():
+        calls.append(1)
+        return [{'cmd': 'move_object', 'origin': 'o', 'args': {
+            'name': 'C', 'location': (float(i), 0.0, 0.0), 'frame': i}}
+            for i in range(n)]
+    return build
+
+
+class TestBatchCache:
+    """Tests for cached_batch()."""
+
+    def test_hit_returns_identical_batch(self, tmp_path):
+        calls = []
+        src = tmp_path / 'builder.py'
+        src.write_text('X = 1\n')
+        first = cached_batch(_builder(calls), [src], {'q': 'low'})
+        second = cached_batch(_builder(calls), [src], {'q': 'low'})
+        assert calls == [1] and second == first
+        assert isinstance(second[0]['args']['location'], tuple)
+
+    def test_params_and_sources_in_key(self, tmp_path):
+        calls = []
+        src = tmp_path / 'builder.py'
+        src.write_text('X = 1\n')
+        cached_batch(_builder(calls), [src], {'q': 'low'})
+        cached_batch(_builder(calls), [src], {'q': 'high'})
+        src.write_text('X = 2\n')
+        cached_batch(_builder(calls), [src], {'q': 'low'})
+        assert len(calls) == 3
+
+    def test_lru_eviction(self, tmp_path):
+        """Past max_bytes the least recently used entry goes first."""
+        directory = tmp_path / 'lru'
+        for q in ('a', 'b'):
+            cached_batch(_builder([], 50), [], {'q': q}, directory)
+        oldest = sorted(directory.iterdir(), key=os.path.getmtime)[0]
+        os.utime(oldest, (1, 1))
+        cached_batch(_builder([], 50), [], {'q': 'a'}, directory)  # touch
+        size = max(p.stat().st_size for p in directory.iterdir())
+        cached_batch(_builder([], 50), [], {'q': 'c'}, directory,
+                     max_bytes=size * 2)
+        assert len(list(directory.iterdir())) == 2
+        calls = []
+        cached_batch(_builder(calls, 50), [], {'q': 'a'}, directory)
+        cached_batch(_builder(calls, 50), [], {'q': 'b'}, directory)
+        assert len(calls) == 1
+
+    def test_corrupt_entry_rebuilt(self, tmp_path):
+        calls = []
+        cached_batch(_builder(calls), [], {})
+        for entry in (tmp_path / 'cache').iterdir():
+            entry.write_bytes(b'garbage')
+        assert len(cached_batch(_builder(calls), [], {})) == 3
+        assert len(calls) == 2
+
+    def test_scene_caches_optimized_batch(self):
+        """A cached create_scene dispatches the same optimized batch."""
+        from scenes.quasar_bh.scene import create_scene
+        fresh = create_scene('low', results='summary')
+        for _ in range(2):
+            reset()
+            cached = create_scene('low', results='summary', cache=True)
+            assert cached['keys'] == fresh['keys']
+            assert cached['coalesced'] == fresh['coalesced']
+            assert cached['summary'].counts == fresh['summary'].counts
+        assert len(list(batch_cache.CACHE_DIR.iterdir())) == 1
+
+    def test_key_covers_every_instruction_package(self):
+        """Every app module a scene build imports feeds the key, except
+        the command handlers and the Blender-side runtime."""
+        import importlib
+        for scene in ('quasar_bh', 'solar_system', 'resonance_box',
+                      'missile_storm', 'euler_diagram', 'fractal_abyss',
+                      'math_sets'):
+            importlib.import_module(f'scenes.{scene}.scene')
+        runtime = ('app.commands', 'app.core', 'app.infra', 'app.render')
+        hashed = batch_cache._source_files(batch_cache.COMMON_SOURCES)
+        for name, module in list(sys.modules.items()):
+            if (name.startswith('app.') and not name.startswith(runtime)
+                    and getattr(module, '__file__', None)):
+                assert Path(module.__file__).resolve() in hashed, name
+
+    def test_cache_lives_outside_the_project(self, tmp_path, monkeypatch):
+        """The default directory is the per-user cache, not the tree."""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        assert batch_cache._user_cache_root() == tmp_path
+        monkeypatch.delenv('XDG_CACHE_HOME')
+        monkeypatch.delenv('LOCALAPPDATA', raising=False)
+        assert batch_cache._user_cache_root() == Path.home() / '.cache'
+        default = batch_cache._user_cache_root() / 'animations' / 'batches'
+        assert batch_cache.PROJECT_ROOT not in default.parents
+
+    @pytest.mark.parametrize('scene', ['quasar_bh', 'solar_system',
+                                       'resonance_box'])
+    def test_launchers_leave_the_cache_off(self, scene):
+        """Caching is opt-in: no launcher ships with CACHE = True."""
+        launcher = batch_cache.PROJECT_ROOT / 'scenes' / scene / 'launcher.py'
+        flags = [line.split('#')[0].split('=')[1].strip()
+                 for line in launcher.read_text().splitlines()
+                 if line.startswith('CACHE ')]
+        assert flags == ['False']
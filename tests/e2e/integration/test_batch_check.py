@@ -0,0 +1,168 @@
+# File: tests/e2e/integration/test_batch_check.py
+# E2E tests for the single-pass, schema-driven batch checker.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.kernel.batch_check import check_batch, preflight
+from app.kernel.dispatcher import dispatch_batch
+from app.domain.command_schemas import COMMAND_SCHEMAS
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _spawn(name, kind='cube'):
+    return {'cmd': 'spawn_primitive', 'args': {'type': kind, 'name': name}}
+
+
+def _found(issues):
+    return [(it.index, it.message, it.severity) for it in issues]
+
+
+class TestBatchCheck:
+    """Tests for app/kernel/batch_check.py."""
+
+    def test_clean_batch_has_no_issues(self):
+        batch = [
+            _spawn('Box'),
+            {'cmd': 'spawn_text', 'args': {'name': 'Title', 'text': 'Hi'}},
+            {'cmd': 'spawn_polygon', 'args': {'name': 'Tri', 'verts': []}},
+            {'cmd': 'create_camera', 'args': {'name': 'Cam'}},
+            {'cmd': 'create_material', 'args': {'name': 'Red'}},
+            {'cmd': 'assign_material',
+             'args': {'object': 'Title', 'material': 'Red'}},
+            {'cmd': 'set_focal_length', 'args': {'name': 'Cam'}},
+            {'cmd': 'parent_object', 'args': {'child': 'Tri', 'parent': 'Box'}},
+            {'cmd': 'hide_objects_at_frame',
+             'args': {'names': ['Box', 'Tri'], 'frame': 3}},
+        ]
+        assert check_batch(batch) == []
+
+    def test_symbol_table_follows_rename_delete_clear(self):
+        batch = [
+            _spawn('A'),
+            {'cmd': 'rename_object', 'args': {'name': 'A', 'new_name': 'B'}},
+            {'cmd': 'move_object', 'args': {'name': 'A', 'location': [0] * 3}},
+            {'cmd': 'delete_object', 'args': {'name': 'B'}},
+            {'cmd': 'hide_object', 'args': {'name': 'B'}},
+            _spawn('C'),
+            {'cmd': 'clear_scene', 'args': {}},
+            {'cmd': 'show_object', 'args': {'name': 'C'}},
+        ]
+        assert _found(check_batch(batch)) == [
+            (2, "unknown object 'A'", 'error'),
+            (4, "unknown object 'B'", 'error'),
+            (7, "unknown object 'C'", 'error'),
+        ]
+
+    def test_reports_commands_args_and_redefinitions(self):
+        batch = [
+            {'args': {}},
+            {'cmd': 'fly_to_moon', 'args': {}},
+            _spawn('A', 'dodecahedron'),
+            _spawn('A'),
+            {'cmd': 'move_object', 'args': {'name': 'A'}},
+            {'cmd': 'assign_material',
+             'args': {'object': 'A', 'material': 'Nope'}},
+        ]
+        assert _found(check_batch(batch)) == [
+            (0, "missing 'cmd'", 'error'),
+            (1, 'unknown command', 'error'),
+            (2, "unknown type 'dodecahedron'", 'error'),
+            (3, "object 'A' redefined", 'warning'),
+            (4, "missing 'location'", 'error'),
+            (5, "unknown material 'Nope'", 'error'),
+        ]
+
+    def test_array_args_are_not_treated_as_empty(self):
+        """Required args holding NumPy arrays (keyframe_series) pass."""
+        np = pytest.importorskip('numpy')
+        batch = [
+            _spawn('A'),
+            {'cmd': 'keyframe_series',
+             'args': {'name': 'A', 'data_path': 'location',
+                      'frames': np.arange(1, 4),
+                      'values': np.zeros((3, 3))}},
+            {'cmd': 'keyframe_series',
+             'args': {'name': 'A', 'data_path': '', 'frames': np.arange(1),
+                      'values': None}},
+        ]
+        assert _found(check_batch(batch)) == [
+            (2, "missing 'data_path'", 'error'),
+            (2, "missing 'values'", 'error'),
+        ]
+
+    def test_unnamed_creations_warn(self):
+        """Objects and materials created without a name are reported."""
+        batch = [
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube'}},
+            {'cmd': 'create_camera', 'args': {'name': ''}},
+            {'cmd': 'create_material', 'args': {}},
+            {'cmd': 'spawn_point_cloud', 'args': {'points': []}},
+        ]
+        assert _found(check_batch(batch)) == [
+            (0, 'spawn_primitive without name', 'warning'),
+            (1, 'create_camera without name', 'warning'),
+            (2, 'create_material without name', 'warning'),
+            (3, "missing 'name'", 'error'),
+        ]
+
+    def test_schemaless_commands_record_their_name(self):
+        """A command without a schema still defines its 'name'."""
+        batch = [
+            {'cmd': 'create_cartesian_grid', 'args': {'name': 'Grid'}},
+            {'cmd': 'move_object', 'args': {
+                'name': 'Grid', 'location': (0, 0, 1)}},
+            {'cmd': 'configure_eevee', 'args': {'samples': 8}},
+            {'cmd': 'move_object', 'args': {
+                'name': 'Ghost', 'location': (0, 0, 1)}},
+        ]
+        assert 'create_cartesian_grid' not in COMMAND_SCHEMAS
+        assert _found(check_batch(batch)) == [
+            (3, "unknown object 'Ghost'", 'error')]
+
+    def test_generator_consumed_in_one_pass(self):
+        batch = (_spawn(f'O{i}') for i in range(1000))
+        assert check_batch(batch) == []
+
+    def test_preflight_seeds_existing_scene_objects(self):
+        dispatch_batch([_spawn('Existing'),
+                        {'cmd': 'create_material', 'args': {'name': 'M'}}])
+        batch = [{'cmd': 'assign_material',
+                  'args': {'object': 'Existing', 'material': 'M'}}]
+        assert check_batch(batch) != []
+        assert preflight(batch) == []
+
+    def test_every_manifest_command_has_a_schema(self):
+        from app.kernel import manifest
+        missing = set(manifest.load()) - set(COMMAND_SCHEMAS)
+        # Scene-wide settings: no args naming objects or materials.
+        assert missing <= {
+            'animate_space_world', 'configure_eevee', 'create_cartesian_grid',
+            'create_collection', 'create_space_world', 'set_current_frame',
+            'set_frame_range', 'set_spawn_engine', 'set_world_background'}
+
+    @pytest.mark.parametrize(
+        'scene', ['quasar_bh', 'solar_system', 'resonance_box'])
+    def test_scene_dry_run_dispatches_nothing(self, scene):
+        import importlib
+        from app.infra.bridge import data
+        module = importlib.import_module(f'scenes.{scene}.scene')
+        out = module.create_scene('low', dry_run=True)
+        assert out['issues'] == []
+        assert 'results' not in out
+        assert len(data.objects.keys()) == 0
+
+    def test_validator_runs_on_scene(self):
+        from validators.batch_validator import run_on_scene
+        assert run_on_scene('low') == []
@@ -0,0 +1,82 @@
+# File: tests/e2e/integration/test_batch_plan.py
+# E2E tests for compile_batch/dispatch_plan: parity with dispatch_batch,
+# compile-time validation and coercion, and the per-plan handle table.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.batch_plan import compile_batch
+from app.kernel.dispatcher import dispatch_batch, dispatch_plan
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+SCENE = [
+    {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'Box'}},
+    {'cmd': 'move_object', 'args': {'name': 'Box', 'location': [1, 2, 3],
+                                    'frame': 5.0}},
+    {'cmd': 'rename_object', 'args': {'name': 'Box', 'new_name': 'Crate'}},
+    {'cmd': 'scale_object', 'args': {'name': 'Crate', 'scale': [2, 2, 2]}},
+    {'cmd': 'move_object', 'args': {'name': 'Box', 'location': (0, 0, 0)}},
+    {'cmd': 'fly_to_moon', 'args': {}},
+]
+
+
+class TestBatchPlan:
+    """Tests for the compiled batch plan."""
+
+    def test_plan_matches_batch_outcome(self):
+        """dispatch_plan succeeds and fails where dispatch_batch does."""
+        expected = [r.success for r in dispatch_batch(SCENE)]
+        reset()
+        results = dispatch_plan(compile_batch(SCENE))
+        assert [r.success for r in results] == expected
+        crate = data.objects.get('Crate')
+        assert tuple(crate.location) == (1, 2, 3)
+        assert tuple(crate.scale) == (2, 2, 2)
+
+    def test_compile_coerces_once_without_mutating_input(self):
+        """Vectors become float tuples and frames ints in the plan only."""
+        plan = compile_batch(SCENE)
+        args = plan.steps[1].args
+        assert args['location'] == (1.0, 2.0, 3.0)
+        assert args['frame'] == 5 and type(args['frame']) is int
+        assert SCENE[1]['args']['location'] == [1, 2, 3]
+
+    def test_compile_rejects_invalid_args(self):
+        """Missing or malformed args fail at compile time."""
+        plan = compile_batch([
+            {'cmd': 'move_object', 'args': {'name': 'A'}},
+            {'cmd': 'move_object', 'args': {'name': 'A', 'location': 5}},
+            {'args': {}},
+        ])
+        assert all(step.error is not None for step in plan.steps)
+        assert "Missing 'location'" in plan.steps[0].error.error
+
+    def test_handles_track_spawn_rename_delete(self):
+        """The handle table follows spawns, renames and deletes."""
+        plan = compile_batch([
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube',
+                                                'name': 'A'}},
+            {'cmd': 'rename_object', 'args': {'name': 'A', 'new_name': 'B'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube',
+                                                'name': 'C'}},
+            {'cmd': 'delete_object', 'args': {'name': 'C'}},
+            {'cmd': 'move_object', 'args': {'name': 'C',
+                                            'location': (1, 1, 1)}},
+        ])
+        results = dispatch_plan(plan)
+        assert [r.success for r in results] == [True] * 4 + [False]
+        assert set(plan.handles) == {'B'}
+        assert plan.handles['B'] is data.objects.get('B')
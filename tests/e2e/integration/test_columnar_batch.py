@@ -0,0 +1,101 @@
+# File: tests/e2e/integration/test_columnar_batch.py
+# E2E tests for ColumnarBatch and its native dispatch.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.domain.columnar_batch import ColumnarBatch, NO_FRAME
+from app.kernel.dispatcher import dispatch_batch
+from app.kernel.profiler import profiling
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _batch():
+    batch = [{'cmd': 'spawn_primitive', 'origin': 'setup',
+              'args': {'type': 'cube', 'name': 'C'}}]
+    for f in range(1, 6):
+        batch.append({'cmd': 'move_object', 'origin': 'anim', 'args': {
+            'name': 'C', 'location': (f * 0.5, 0.0, 1.0), 'frame': f}})
+        batch.append({'cmd': 'rotate_object', 'args': {
+            'name': 'C', 'rotation': (0.0, 0.0, f * 0.25), 'frame': f}})
+    batch.append({'cmd': 'scale_object', 'args': {
+        'name': 'C', 'scale': (2, 2, 2)}})
+    return batch
+
+
+class TestColumnarBatch:
+    """Tests for the columnar representation."""
+
+    def test_round_trip(self):
+        batch = _batch()
+        columnar = ColumnarBatch.from_instructions(iter(batch))
+        assert len(columnar) == 12 and columnar.key_rows == 11
+        assert columnar.to_instructions() == batch
+        assert columnar.frames[-1] == NO_FRAME
+
+    def test_values_round_trip_exactly(self):
+        columnar = ColumnarBatch.from_instructions([{
+            'cmd': 'move_object', 'args': {
+                'name': 'C', 'location': (0.1, 1 / 3, 1e-300), 'frame': 1}}])
+        assert columnar.row(0)['args']['location'] == (0.1, 1 / 3, 1e-300)
+
+    def test_irregular_instructions_kept_as_dicts(self):
+        odd = [
+            {'cmd': 'move_object', 'args': {
+                'name': 'C', 'location': (0, 0, 0), 'frame': 1,
+                'interpolation': 'CONSTANT'}},
+            {'cmd': 'move_object', 'args': {
+                'name': 'C', 'location': (True, 0, 0)}},
+            {'cmd': 'scale_object', 'args': {'name': 'C', 'scale': 2.0}},
+        ]
+        columnar = ColumnarBatch.from_instructions(odd)
+        assert columnar.key_rows == 0
+        assert all(a is b for a, b in zip(columnar, odd))
+
+    def test_compact_rows(self):
+        columnar = ColumnarBatch()
+        row = sum(a.itemsize for a in (
+            columnar.cmd_ids, columnar.obj_ids, columnar.origin_ids,
+            columnar.frames)) + 3 * columnar.values.itemsize
+        assert row <= 36
+
+
+class TestColumnarDispatch:
+    """dispatch_batch consumes a ColumnarBatch natively."""
+
+    def test_same_scene_state(self):
+        listed = dispatch_batch(_batch())
+        keys = data.objects.get('C').animation_data.get_keyframes('location')
+        reset()
+        columnar = dispatch_batch(ColumnarBatch.from_instructions(_batch()))
+        assert [r.success for r in columnar] == [r.success for r in listed]
+        assert data.objects.get('C').animation_data.get_keyframes(
+            'location') == keys
+        assert tuple(data.objects.get('C').scale) == (2.0, 2.0, 2.0)
+
+    def test_summary_and_failures(self):
+        batch = _batch() + [{'cmd': 'move_object', 'args': {
+            'name': 'Gone', 'location': (0, 0, 0), 'frame': 1}}]
+        summary = dispatch_batch(
+            ColumnarBatch.from_instructions(batch), results='summary')
+        assert summary.counts['move_object'] == 5
+        (index, failure), = summary.failures
+        assert index == 12 and 'Gone' in failure.error
+
+    def test_profiler_sees_origins(self):
+        with profiling() as prof:
+            dispatch_batch(ColumnarBatch.from_instructions(_batch()))
+        origins = {s.key for s in prof.stats(by='origin')}
+        assert {'setup', 'anim'} <= origins
@@ -0,0 +1,111 @@
+# File: tests/e2e/integration/test_command_manifest.py
+# E2E tests for lazy command registration through the command manifest.
+# All Rights Reserved Arodi Emmanuel
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pytest
+from app.infra.bridge import reset
+from app.kernel import manifest
+from app.kernel.registry import get_registry, list_commands, load_all
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+class TestCommandManifest:
+    """Tests for app/kernel/manifest.py and lazy get_command."""
+
+    def test_committed_manifest_is_fresh(self):
+        """Fails when a command file changed without regenerating."""
+        committed = json.loads(manifest.MANIFEST_PATH.read_text())
+        assert not manifest.is_stale(committed), (
+            "run: python -m app.kernel.manifest")
+
+    def test_manifest_matches_registrations(self):
+        load_all()
+        registry = get_registry()
+        for cmd, module in manifest.scan()['commands'].items():
+            assert registry[cmd].__module__ == module
+        assert set(manifest.scan()['commands']) <= set(list_commands())
+
+    def test_stale_manifest_warns_and_is_not_rewritten(self, tmp_path):
+        """A stale manifest is scanned around, never written back."""
+        path = tmp_path / 'manifest.json'
+        stale = manifest.scan()
+        stale['sources']['app.commands.scene.materials'] = 'edited'
+        del stale['commands']['create_material']
+        manifest.write(stale, path)
+        before = path.read_text()
+        with pytest.warns(UserWarning, match='stale'):
+            assert 'create_material' in manifest.load(path)
+        assert path.read_text() == before
+
+    def test_loaded_module_is_not_imported_again(self):
+        """A lookup miss leaves an already imported module alone."""
+        from app.kernel.registry import clear_commands, get_command
+        handler = get_command('set_spawn_engine')
+        module = sys.modules[handler.__module__]
+        saved = dict(get_registry())
+        clear_commands()
+        try:
+            assert get_command('set_spawn_engine') is None
+            assert get_registry() == {}
+            assert sys.modules[handler.__module__] is module
+        finally:
+            get_registry().update(saved)
+
+    def test_staleness_hashes_only_newer_sources(self, tmp_path,
+                                                 monkeypatch):
+        """Sources older than the manifest are checked by stat alone; a
+        newer same-size edit is still caught by its hash."""
+        root = tmp_path / 'commands'
+        root.mkdir()
+        for name in ('a', 'b'):
+            (root / f'{name}.py').write_text(
+                f"@register_command('{name}')\ndef f(args): pass\n")
+        monkeypatch.setattr(manifest, 'COMMANDS_ROOT', root)
+        path = tmp_path / 'manifest.json'
+        manifest.write(manifest.scan(), path)
+        written = path.stat().st_mtime_ns
+        for source in root.iterdir():
+            os.utime(source, ns=(written - 10 ** 9,) * 2)
+        hashed = []
+        digest = manifest._digest
+        monkeypatch.setattr(manifest, '_digest',
+                            lambda b: hashed.append(b) or digest(b))
+        assert manifest.load(path) == {'a': 'app.commands.a',
+                                       'b': 'app.commands.b'}
+        assert hashed == []
+        (root / 'b.py').write_text(
+            "@register_command('c')\ndef f(args): pass\n")
+        os.utime(root / 'b.py', ns=(written + 10 ** 9,) * 2)
+        with pytest.warns(UserWarning, match='stale'):
+            assert 'c' in manifest.load(path)
+
+    def test_get_command_imports_only_owner(self):
+        """A fresh interpreter imports just the modules it looks up."""
+        code = (
+            "import sys\n"
+            "import app.commands\n"
+            "from app.kernel.registry import get_command\n"
+            "assert get_command('move_object') is not None\n"
+            "assert get_command('no_such_command') is None\n"
+            "loaded = [m for m in sys.modules if m.startswith('app.commands.')]\n"
+            "print(','.join(sorted(loaded)))\n")
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        loaded = out.stdout.strip().split(',')
+        assert 'app.commands.transforms.move_object' in loaded
+        assert 'app.commands.advanced.modifiers' not in loaded
@@ -0,0 +1,99 @@
+# File: tests/e2e/integration/test_dispatch_stream.py
+# E2E tests for dispatch_stream and generator-based scene builders.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_batch, dispatch_stream
+from app.domain.dispatch_summary import DispatchSummary
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _gen(n):
+    yield {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'C'}}
+    for f in range(n):
+        yield {'cmd': 'move_object', 'args': {
+            'name': 'C', 'location': (f, 0, 0), 'frame': f}}
+    yield {'cmd': 'move_object', 'args': {'name': 'Missing',
+                                          'location': (0, 0, 0)}}
+
+
+class TestDispatchStream:
+    """Tests for dispatch_stream."""
+
+    def test_consumes_generator_into_summary(self):
+        """Counts per command plus failure records, nothing else."""
+        summary = dispatch_stream(_gen(50))
+        assert isinstance(summary, DispatchSummary)
+        assert summary.total == 52 and summary.succeeded == 51
+        assert summary.counts == {'spawn_primitive': 1, 'move_object': 50}
+        (index, failure), = summary.failures
+        assert index == 51 and 'Missing' in failure.error
+        assert not summary
+
+    def test_same_state_as_dispatch_batch(self):
+        """Streaming leaves the scene exactly as dispatch_batch does."""
+        dispatch_batch(list(_gen(20)))
+        keys = data.objects.get('C').animation_data.get_keyframes('location')
+        reset()
+        dispatch_stream(_gen(20))
+        assert data.objects.get('C').animation_data.get_keyframes(
+            'location') == keys
+
+    def test_consumed_lazily(self):
+        """Each instruction is dispatched before the next is generated."""
+        seen = []
+
+        def gen():
+            for i in range(3):
+                seen.append(len(data.objects))
+                yield {'cmd': 'spawn_primitive',
+                       'args': {'type': 'cube', 'name': f'L{i}'}}
+
+        dispatch_stream(gen())
+        assert seen == [0, 1, 2]
+
+
+class TestStreamingScenes:
+    """Scene generators match their list builders."""
+
+    def test_euler_sets_thread_slots(self):
+        """Set generators hand slot/index on; all 250 numbers spawn."""
+        from scenes.euler_diagram.animations.builder import (
+            iter_euler_diagram,
+        )
+        gen = iter_euler_diagram(600)
+        assert next(gen)['cmd'] == 'create_material'
+        texts = [i['args']['name'] for i in gen if i['cmd'] == 'spawn_text']
+        numbers = [t for t in texts
+                   if t.startswith(('Odd', 'Nat', 'Int', 'Rat', 'Real'))]
+        assert len(set(numbers)) == 250
+
+    def test_missile_storm_streamed(self):
+        """create_scene(stream=True) returns a summary, not a list."""
+        from scenes.missile_storm.scene import create_scene, iter_batch
+        from scenes.missile_storm.animations.domain.timing import Timing
+        timing = Timing(flight_start=1, flight_end=60)
+        count = sum(1 for _ in iter_batch(timing))
+        reset()
+        result = create_scene(timing, stream=True)
+        assert 'results' not in result
+        assert result['summary'].total == count
+
+    def test_quality_checked_eagerly(self):
+        """A bad preset fails when iter_batch is called."""
+        from scenes.quasar_bh.scene import iter_batch
+        with pytest.raises(ValueError):
+            iter_batch('bogus')
@@ -0,0 +1,76 @@
+# File: tests/e2e/integration/test_dispatch_summary.py
+# E2E tests for the 'summary' results mode of dispatch_batch / dispatch_plan.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.kernel.batch_plan import compile_batch
+from app.kernel.dispatcher import dispatch_batch, dispatch_plan
+from app.domain.dispatch_result import DispatchResult
+from app.domain.dispatch_summary import DispatchSummary
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _batch(n):
+    batch = [{'cmd': 'spawn_primitive',
+              'args': {'type': 'cube', 'name': 'C'}}]
+    batch += [{'cmd': 'move_object', 'args': {
+        'name': 'C', 'location': (f, 0, 0), 'frame': f}} for f in range(n)]
+    batch.append({'cmd': 'no_such_command', 'args': {}})
+    return batch
+
+
+class TestSummaryMode:
+    """Tests for results='summary'."""
+
+    def test_batch_summary_matches_list(self):
+        """Same totals and failures as walking the result list."""
+        listed = dispatch_batch(_batch(10))
+        reset()
+        summary = dispatch_batch(_batch(10), results='summary')
+        assert isinstance(summary, DispatchSummary)
+        assert summary.total == len(listed)
+        assert summary.succeeded == sum(1 for r in listed if r.success)
+        (index, failure), = summary.failures
+        assert index == 11 and failure.command_name == 'no_such_command'
+
+    def test_plan_summary(self):
+        """dispatch_plan counts per command, compile errors included."""
+        summary = dispatch_plan(compile_batch(_batch(5)), results='summary')
+        assert summary.counts == {'spawn_primitive': 1, 'move_object': 5}
+        assert summary.failed == 1
+
+    def test_samples_kept_per_command(self):
+        """samples=N keeps the first N success payloads only."""
+        summary = dispatch_batch(_batch(10), results='summary', samples=2)
+        assert len(summary.samples['move_object']) == 2
+        assert len(summary.samples['spawn_primitive']) == 1
+        assert dispatch_batch(_batch(1), results='summary').samples == {}
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            dispatch_batch(_batch(1), results='dict')
+
+    def test_results_are_slotted(self):
+        """Neither container carries a per-instance __dict__."""
+        assert not hasattr(DispatchResult.ok(), '__dict__')
+        assert not hasattr(DispatchSummary(), '__dict__')
+
+    def test_scene_summary_mode(self):
+        """create_scene(results='summary') swaps 'results' for 'summary'."""
+        from scenes.quasar_bh.scene import create_scene
+        result = create_scene('low', results='summary')
+        assert 'results' not in result
+        assert result['summary'].total > 0
@@ -0,0 +1,115 @@
+# File: tests/e2e/integration/test_hot_reload.py
+# E2E tests for the launcher reload manager (app.infra.hot_reload).
+# All Rights Reserved Arodi Emmanuel
+
+import importlib
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.infra import run_state
+from app.infra.hot_reload import ReloadManager
+from app.kernel.registry import get_command, get_registry
+
+PKG = 'hotreload_fixture_pkg'
+
+FILES = {
+    '__init__.py': 'from . import cmds\n',
+    'cmds.py': (
+        'from app.kernel.registry import register_command\n\n'
+        "@register_command('hr_fixture_cmd')\n"
+        'def cmd(args):\n    return None\n'),
+    'util.py': 'VALUE = 1\n',
+    'user.py': 'from .util import VALUE\n',
+    'other.py': 'X = 1\n',
+    'state.py': (
+        'from app.infra.run_state import on_reset\n\n'
+        'CACHE = {}\n\n'
+        '@on_reset\n'
+        'def _clear():\n    CACHE.clear()\n'),
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_state(tmp_path):
+    reset()
+    root = tmp_path / PKG
+    root.mkdir()
+    for name, text in FILES.items():
+        (root / name).write_text(text)
+    sys.path.insert(0, str(tmp_path))
+    yield root
+    sys.path.remove(str(tmp_path))
+    names = [n for n in sys.modules if n.startswith(PKG)]
+    for name in names:
+        del sys.modules[name]
+    run_state.forget(names)
+    for cmd in ('hr_fixture_cmd', 'hr_fixture_renamed'):
+        get_registry().pop(cmd, None)
+    reset()
+
+
+def _started() -> ReloadManager:
+    manager = ReloadManager((PKG,))
+    assert manager.reload_changed().full
+    for name in ('', '.user', '.other', '.state'):
+        importlib.import_module(PKG + name)
+    return manager
+
+
+class TestReloadManager:
+    """Tests for ReloadManager.reload_changed()."""
+
+    def test_unchanged_reloads_nothing(self):
+        manager = _started()
+        report = manager.reload_changed()
+        assert not report.full and report.reloaded == []
+
+    def test_changed_module_and_importers_only(self, clean_state):
+        manager = _started()
+        other = sys.modules[PKG + '.other']
+        (clean_state / 'util.py').write_text('VALUE = 2\n')
+        report = manager.reload_changed()
+        assert report.changed == [PKG + '.util']
+        assert report.reloaded == [PKG + '.user', PKG + '.util']
+        assert sys.modules[PKG + '.user'].VALUE == 2
+        assert sys.modules[PKG + '.other'] is other
+
+    def test_registry_follows_reload(self, clean_state):
+        manager = _started()
+        assert get_command('hr_fixture_cmd') is not None
+        (clean_state / 'cmds.py').write_text(FILES['cmds.py'].replace(
+            'hr_fixture_cmd', 'hr_fixture_renamed'))
+        report = manager.reload_changed()
+        assert PKG in report.reloaded        # the package imports cmds
+        assert get_command('hr_fixture_cmd') is None
+        assert get_command('hr_fixture_renamed') is not None
+
+    def test_unchanged_module_state_is_reset(self):
+        """Reset hooks clear state in modules that were not reloaded."""
+        from app.commands.objects.spawn_engine import current_engine
+        from app.kernel.dispatcher import dispatch_single
+        manager = _started()
+        state = sys.modules[PKG + '.state']
+        state.CACHE['mesh'] = object()
+        dispatch_single({'cmd': 'set_spawn_engine',
+                         'args': {'engine': 'data'}})
+        report = manager.reload_changed()
+        assert report.reloaded == []
+        assert sys.modules[PKG + '.state'] is state
+        assert state.CACHE == {}
+        assert current_engine() == 'ops'
+
+    def test_dropped_module_hooks_are_replaced(self, clean_state):
+        """A reloaded module's hook replaces the stale one."""
+        manager = _started()
+        (clean_state / 'state.py').write_text(
+            FILES['state.py'] + '# edited\n')
+        manager.reload_changed()
+        hooks = run_state._hooks[PKG + '.state']
+        assert list(hooks) == ['_clear']
+        assert hooks['_clear'].__globals__ is \
+            vars(sys.modules[PKG + '.state'])
@@ -0,0 +1,116 @@
+# File: tests/e2e/integration/test_incremental.py
+# E2E tests for incremental rebuild (app.kernel.incremental).
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import context, data, reset
+from app.kernel.dispatcher import dispatch_batch
+from app.kernel.incremental import STATE_KEY, rebuild, segment_batch
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _cube(name, origin, x=0.0):
+    return {'cmd': 'spawn_primitive', 'origin': origin,
+            'args': {'type': 'cube', 'name': name, 'location': (x, 0, 0)}}
+
+
+def _batch(a_x=0.0, with_c=True):
+    batch = [{'cmd': 'clear_scene', 'origin': 'env', 'args': {}},
+             _cube('A', 'a', a_x), _cube('B', 'b')]
+    batch.append({'cmd': 'move_object', 'origin': 'anim', 'args': {
+        'name': 'B', 'location': (1, 1, 1), 'frame': 5}})
+    if with_c:
+        batch.append(_cube('C', 'c'))
+    return batch
+
+
+class TestRebuild:
+    """Tests for rebuild()."""
+
+    def test_first_run_full_then_nothing(self):
+        """No stored state dispatches all; an identical re-run nothing."""
+        _, plan = rebuild(_batch(), dispatch_batch)
+        assert plan.full and plan.rebuilt == ['env', 'a', 'b', 'anim', 'c']
+        assert STATE_KEY in context.scene
+        results, plan = rebuild(_batch(), dispatch_batch)
+        assert results == [] and plan.rebuilt == []
+        assert sorted(data.objects.keys()) == ['A', 'B', 'C']
+
+    def test_changed_segment_recreated(self):
+        """Only the changed origin is deleted and dispatched again."""
+        rebuild(_batch(), dispatch_batch)
+        results, plan = rebuild(_batch(a_x=3.0), dispatch_batch)
+        assert plan.rebuilt == ['a'] and plan.stale == ['A']
+        assert [r.command_name for r in results] == [
+            'delete_object', 'spawn_primitive']
+        assert data.objects.get('A').location[0] == 3.0
+        assert 'A.001' not in data.objects
+
+    def test_shared_names_rebuilt_together(self):
+        """An animation is redone when the object it keys is rebuilt."""
+        rebuild(_batch(), dispatch_batch)
+        batch = _batch()
+        batch[2]['args']['location'] = (0, 2, 0)
+        _, plan = rebuild(batch, dispatch_batch)
+        assert plan.rebuilt == ['b', 'anim']
+
+    def test_removed_origin_deleted(self):
+        rebuild(_batch(), dispatch_batch)
+        _, plan = rebuild(_batch(with_c=False), dispatch_batch)
+        assert plan.stale == ['C'] and 'C' not in data.objects
+
+    def test_missing_object_rebuilds_segment(self):
+        rebuild(_batch(), dispatch_batch)
+        data.objects.remove(data.objects.get('B'))
+        _, plan = rebuild(_batch(), dispatch_batch)
+        assert plan.rebuilt == ['b', 'anim']
+
+    def test_clear_scene_change_is_full(self):
+        rebuild(_batch(), dispatch_batch)
+        batch = _batch()
+        batch[0]['args'] = {'keep': True}
+        _, plan = rebuild(batch, dispatch_batch)
+        assert plan.full and len(plan.rebuilt) == 5
+
+    def test_digest_ignores_origin_and_tuple_type(self):
+        one = segment_batch([_cube('A', 'x')])[0]
+        two = _cube('A', 'x')
+        two['args']['location'] = [0.0, 0, 0]
+        assert segment_batch([two])[0].digest == one.digest
+
+
+class TestIncrementalScenes:
+    """Scene-level incremental mode."""
+
+    def test_quasar_camera_tweak(self, monkeypatch):
+        """Changing a camera-only preset field rebuilds just the camera."""
+        from scenes.quasar_bh.scene import create_scene
+        from scenes.quasar_bh.materials._presets import PRESETS
+        first = create_scene('low', incremental=True, results='summary')
+        count = len(data.objects)
+        monkeypatch.setitem(PRESETS['low'], 'dof', not PRESETS['low']['dof'])
+        second = create_scene('low', incremental=True, results='summary')
+        assert second['rebuilt'] == ['camera']
+        assert 0 < second['summary'].total < first['summary'].total
+        assert len(data.objects) == count
+
+    def test_missile_storm_acts(self):
+        from scenes.missile_storm.scene import create_scene
+        from scenes.missile_storm.animations.domain.timing import Timing
+        timing = Timing(flight_start=1, flight_end=40)
+        create_scene(timing, incremental=True)
+        result = create_scene(timing, cam_step=2, incremental=True)
+        assert result['rebuilt'] == ['camera']
+        assert 'flight' in result['skipped']
@@ -0,0 +1,108 @@
+# File: tests/e2e/integration/test_keyframe_coalescing.py
+# E2E tests for the keyframe coalescing pass: removal counts, dependency
+# barriers, and mock scene state identical to the unoptimized batch.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_batch
+from app.kernel.optimizer import coalesce_keyframes
+from app.components.camera_builder import build_camera
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _snapshot():
+    """Transforms, keyframes and parents of every mock object."""
+    return {
+        obj.name: (
+            obj.location.to_tuple(), obj.rotation_euler.to_tuple(),
+            obj.scale.to_tuple(), obj.animation_data._keyframes,
+            obj.parent.name if obj.parent else None,
+        )
+        for obj in data.objects
+    }
+
+
+def _move(name, x, frame):
+    return {'cmd': 'move_object', 'args': {
+        'name': name, 'location': (x, 0, 0), 'frame': frame}}
+
+
+def _spin(name, z, frame):
+    return {'cmd': 'rotate_object', 'args': {
+        'name': name, 'rotation': (0, 0, z), 'frame': frame}}
+
+
+class TestKeyframeCoalescing:
+    """Tests for coalesce_keyframes."""
+
+    def test_interleaved_objects_merge(self):
+        """Per-frame keys of two objects merge into one series each."""
+        batch = [
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'A'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'B'}},
+        ]
+        for f in range(1, 11):
+            batch += [_move('A', f, f), _spin('A', f, f), _move('B', -f, f)]
+        report = coalesce_keyframes(batch)
+        assert report.removed == 27
+        cmds = [i['cmd'] for i in report.instructions]
+        assert cmds.count('keyframe_series') == 3
+
+    def test_dependencies_end_groups(self):
+        """Spawn, rename and parent of the object are never crossed."""
+        batch = [
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'A'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'P'}},
+            _move('A', 1, 1), _move('A', 2, 2),
+            {'cmd': 'parent_object', 'args': {'child': 'A', 'parent': 'P'}},
+            _move('A', 3, 3), _move('A', 4, 4),
+            {'cmd': 'rename_object', 'args': {'name': 'A', 'new_name': 'C'}},
+            _move('C', 5, 5), _move('P', 1, 1), _move('C', 6, 6),
+            {'cmd': 'set_keyframe', 'args': {'name': 'C', 'frame': 9}},
+            _move('C', 7, 7),
+        ]
+        report = coalesce_keyframes(batch)
+        assert report.removed == 3
+        cmds = [i['cmd'] for i in report.instructions]
+        assert cmds.index('parent_object') == 3
+        assert cmds.index('rename_object') == 5
+
+    def test_state_identical_to_unoptimized(self):
+        """Mock scene after dispatch matches the original batch exactly."""
+        batch = [
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'A'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'P'}},
+        ]
+        batch += build_camera({
+            'name': 'Cam', 'radius': 10.0, 'total_frames': 60,
+            'cam_step': 5,
+        })
+        for f in range(1, 30, 3):
+            batch += [_move('A', f, f), _spin('P', f, f), _move('A', f, f)]
+        batch += [{'cmd': 'parent_object', 'args': {'child': 'A',
+                                                    'parent': 'P'}}]
+        batch += [_move('A', 0, 1), _spin('A', 1, 40)]
+        batch += [{'cmd': 'rename_object',
+                   'args': {'name': 'A', 'new_name': 'Z'}}]
+        batch += [_move('Z', 9, 50), _move('Z', 8, 60)]
+
+        assert all(dispatch_batch(batch))
+        expected = _snapshot()
+        reset()
+        report = coalesce_keyframes(batch)
+        assert report.removed > 0
+        assert all(dispatch_batch(report.instructions))
+        assert _snapshot() == expected
@@ -0,0 +1,165 @@
+# File: tests/e2e/integration/test_keyframe_simplify.py
+# E2E tests for the keyframe simplification pass: RDP error bound,
+# Bezier playback bound, constant tracks, tolerances per data_path and
+# dispatch of the result.
+# All Rights Reserved Arodi Emmanuel
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_batch
+from app.kernel.optimizer import simplify_keyframes
+from app.kernel.optimizer import bezier, simplify
+from app.kernel.optimizer.simplify import rdp_indices
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _series(name, data_path, frames, values, interpolation='LINEAR'):
+    args = {'name': name, 'data_path': data_path,
+            'frames': frames, 'values': values}
+    if interpolation is not None:
+        args['interpolation'] = interpolation
+    return {'cmd': 'keyframe_series', 'args': args}
+
+
+def _lerp_at(frames, values, kept, f):
+    """Linear reconstruction from kept keys at frame f."""
+    for a, b in zip(kept, kept[1:]):
+        if frames[a] <= f <= frames[b]:
+            t = (f - frames[a]) / (frames[b] - frames[a])
+            return [va + (vb - va) * t
+                    for va, vb in zip(values[a], values[b])]
+    return list(values[kept[-1]])
+
+
+class TestKeyframeSimplify:
+    """Tests for simplify_keyframes."""
+
+    def test_linear_track_keeps_endpoints(self):
+        """A constant-speed spin needs only its two end keys."""
+        frames = list(range(1, 361, 2))
+        values = [(0, 0, 0.01 * f) for f in frames]
+        out, before, after = simplify_keyframes(
+            [_series('R', 'rotation_euler', frames, values)])
+        assert (before, after) == (180, 2)
+        assert out[0]['args']['frames'] == [1, 359]
+        assert out[0]['args']['interpolation'] == 'LINEAR'
+
+    def test_constant_track_collapses(self):
+        """A static track becomes a single key, whatever its mode."""
+        out, before, after = simplify_keyframes(
+            [_series('S', 'location', [1, 5, 9], [(1, 2, 3)] * 3, None)])
+        assert (before, after) == (3, 1)
+        assert 'interpolation' not in out[0]['args']
+
+    @pytest.mark.parametrize('numpy', [True, False])
+    def test_bezier_playback_stays_within_tolerance(self, numpy, monkeypatch):
+        """Every played frame of a thinned Bezier track stays in bound."""
+        if numpy:
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(simplify, 'np', None)
+            monkeypatch.setattr(bezier, 'np', None)
+        frames = list(range(1, 241, 2))
+        values = [(math.sin(f / 20), 0.0, 0.1 * f) for f in frames]
+        for mode in (None, 'BEZIER'):
+            out, before, after = simplify_keyframes(
+                [_series('C', 'location', frames, values, mode)])
+            args = out[0]['args']
+            assert after < before and args.get('interpolation') == mode
+            at = list(range(1, 240))
+            channels = list(zip(*values))
+            full = bezier.playback(frames, channels, at)
+            thin = bezier.playback(args['frames'],
+                                   list(zip(*args['values'])), at)
+            assert max(abs(a - b) for fa, fb in zip(full, thin)
+                       for a, b in zip(fa, fb)) <= 1e-3
+
+    def test_bezier_keys_match_with_and_without_numpy(self, monkeypatch):
+        """Both playback paths keep the same Bezier keys."""
+        pytest.importorskip('numpy')
+        frames = list(range(1, 300, 4))
+        values = [(math.sin(f / 15), math.cos(f / 40), 0.0)
+                  for f in frames]
+        fast = simplify._bezier_indices(frames, values, 1e-3)
+        monkeypatch.setattr(simplify, 'np', None)
+        monkeypatch.setattr(bezier, 'np', None)
+        assert simplify._bezier_indices(frames, values, 1e-3) == fast
+
+    def test_bezier_handles_ease_and_clamp(self):
+        """End keys ease in and out; extremes do not overshoot."""
+        eased = bezier.playback([0, 10], [[0.0, 1.0]], [0, 5, 10])[0]
+        assert [round(float(v), 9) for v in eased] == [0.0, 0.5, 1.0]
+        peak = bezier.playback([0, 10, 20], [[0.0, 1.0, 0.0]],
+                               list(range(21)))[0]
+        assert max(peak) <= 1.0 + 1e-12
+
+    def test_easing_modes_left_alone(self):
+        """Modes without a playback model keep every key."""
+        frames = list(range(1, 100, 6))
+        values = [(0.5 * f, 0, 0) for f in frames]
+        batch = [_series('C', 'location', frames, values, 'ELASTIC')]
+        out, before, after = simplify_keyframes(batch)
+        assert before == after == len(frames)
+        assert out[0] is batch[0]
+
+    def test_stepped_series_keeps_each_change(self):
+        """CONSTANT series keep the keys where the held value changes."""
+        values = [(0, 0, 0), (0, 0, 0), (1, 0, 0), (1, 0, 0), (0, 0, 0)]
+        out, _, after = simplify_keyframes(
+            [_series('H', 'location', [1, 2, 3, 4, 5], values, 'CONSTANT')])
+        assert out[0]['args']['frames'] == [1, 3, 5]
+        assert out[0]['args']['interpolation'] == 'CONSTANT'
+
+    def test_error_stays_within_tolerance(self):
+        """Every dropped sample lies within tolerance of the new curve."""
+        frames = list(range(1, 241))
+        values = [(math.sin(f / 20), 0.0, 0.1 * f) for f in frames]
+        kept = rdp_indices(frames, values, 1e-3)
+        assert len(kept) < len(frames)
+        for i, f in enumerate(frames):
+            approx = _lerp_at(frames, values, kept, f)
+            assert max(abs(a - v) for a, v in zip(approx, values[i])) \
+                <= 1e-3 + 1e-12
+
+    def test_vectorised_matches_scalar(self, monkeypatch):
+        """The NumPy scan keeps the same keys as the Python loop."""
+        pytest.importorskip('numpy')
+        frames = list(range(1, 400, 3))
+        values = [(math.sin(f / 15), math.cos(f / 40), 0.01 * f)
+                  for f in frames]
+        fast = rdp_indices(frames, values, 1e-3)
+        monkeypatch.setattr(simplify, 'np', None)
+        assert rdp_indices(frames, values, 1e-3) == fast
+
+    def test_tolerance_per_data_path(self):
+        """A None tolerance leaves that data_path untouched."""
+        batch = [_series('S', 'scale', [1, 2, 3], [(1, 1, 1)] * 3)]
+        _, before, after = simplify_keyframes(batch, {'scale': None})
+        assert before == after == 3
+
+    def test_simplified_batch_dispatches(self):
+        """Simplified series dispatch and leave the last value set."""
+        frames = list(range(1, 50))
+        batch = [
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'A'}},
+            _series('A', 'location', frames, [(f, 0, 0) for f in frames]),
+        ]
+        out, _, _ = simplify_keyframes(batch)
+        assert all(dispatch_batch(out))
+        obj = data.objects.get('A')
+        assert obj.location.to_tuple() == (49, 0, 0)
+        assert sorted(obj.animation_data.get_keyframes('location')) \
+            == [1, 49]
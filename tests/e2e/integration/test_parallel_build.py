@@ -0,0 +1,101 @@
+# File: tests/e2e/integration/test_parallel_build.py
+# E2E tests for act-level parallel generation: worker processes build
+# ColumnarBatch parts that merge in act order, equal to a serial build.
+# All Rights Reserved Arodi Emmanuel
+
+import pickle
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.domain.columnar_batch import ColumnarBatch
+from app.kernel import parallel_build
+from app.kernel.parallel_build import Act, generate_acts, iter_acts
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _keys(name, count, irregular=False):
+    cmds = [{'cmd': 'spawn_primitive',
+             'args': {'type': 'cube', 'name': name}}]
+    for f in range(1, count + 1):
+        cmds.append({'cmd': 'move_object', 'args': {
+            'name': name, 'location': (f * 0.5, 0.0, 1.0), 'frame': f}})
+    if irregular:
+        cmds.append({'cmd': 'move_object', 'args': {
+            'name': name, 'location': (0, 0, 0), 'relative': True}})
+    return cmds
+
+
+def _same(a, b):
+    assert a.to_instructions() == b.to_instructions()
+    assert (a.commands, a.names, a.origins) == (b.commands, b.names,
+                                                 b.origins)
+
+
+def _acts():
+    return [Act('one', _keys, ('A', 4)),
+            Act('two', _keys, ('B', 3, True)),
+            Act('three', _keys, ('A', 2, True))]
+
+
+class TestParallelBuild:
+    """Tests for generate_acts and the ColumnarBatch merge."""
+
+    def test_extend_equals_one_batch(self):
+        """Merged parts intern names, commands and origins in order."""
+        parts = [ColumnarBatch.from_instructions(iter_acts([act]))
+                 for act in _acts()]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.extend(part)
+        _same(merged, ColumnarBatch.from_instructions(iter_acts(_acts())))
+
+    def test_pickle_round_trip_keeps_interning(self):
+        """An unpickled batch appends to the same name ids."""
+        batch = ColumnarBatch.from_instructions(iter_acts(_acts()[:2]))
+        copy = pickle.loads(pickle.dumps(batch))
+        for instruction in iter_acts(_acts()[2:]):
+            batch.append(instruction)
+            copy.append(instruction)
+        _same(copy, batch)
+
+    def test_process_pool_matches_serial(self):
+        """Acts built in worker processes merge deterministically."""
+        from scenes.fractal_abyss.scene import scene_acts
+        acts = scene_acts(600)
+        _same(generate_acts(acts, workers=3),
+              ColumnarBatch.from_instructions(iter_acts(acts)))
+
+    def test_serial_inside_blender(self, monkeypatch):
+        """No pool is started when the bridge is real Blender."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError('pool started inside Blender')
+
+        monkeypatch.setattr(parallel_build, 'is_mock', lambda: False)
+        monkeypatch.setattr(parallel_build, 'ProcessPoolExecutor', no_pool)
+        _same(generate_acts(_acts(), workers=4),
+              ColumnarBatch.from_instructions(iter_acts(_acts())))
+
+    def test_scene_dispatch_matches_serial(self):
+        """missile_storm with workers=2 dispatches like a serial run."""
+        from scenes.missile_storm.animations.domain.timing import Timing
+        from scenes.missile_storm.scene import create_scene
+
+        def outcome(workers):
+            reset()
+            results = create_scene(Timing(1, 96), workers=workers)
+            return [(r.command_name, r.success)
+                    for r in results['results']]
+
+        serial = outcome(1)
+        assert serial and outcome(2) == serial
@@ -0,0 +1,100 @@
+# File: tests/e2e/integration/test_physics_context.py
+# E2E tests for PhysicsContext: builders read constants from the context
+# they are handed, so presets and sweeps generate concurrently.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.components import disk_physics
+from app.components.bodies import jet_physics
+from app.components.bodies.jet_builder import build_jets
+from app.components.disk_builder import build_ring
+from app.components.physics_context import (
+    DEFAULT_PHYSICS, PhysicsContext, resolve, set_fallback,
+)
+from scenes.quasar_bh.materials._presets import PRESETS
+from scenes.quasar_bh.scene import build_batch
+
+_JETS = {
+    'parent_object': 'BH', 'north_name': 'N', 'south_name': 'S',
+    'north_mat': 'NMat', 'south_mat': 'SMat', 'total_frames': 30,
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    fallback = resolve(None)
+    yield
+    set_fallback(fallback)
+    reset()
+
+
+def _plain(value):
+    """value with NumPy arrays as lists, so batches compare with ==."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_plain(v) for v in value)
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return value
+
+
+def _minor_radius(physics):
+    ring = {'radius': 3.0, 'color': (1.0, 1.0, 1.0)}
+    cmds = build_ring(0, ring, [3.0, 3.5], lambda i: 1.0, physics)
+    return cmds[1]['args']['minor_radius']
+
+
+class TestPhysicsContext:
+    """Tests for context-scoped physics constants."""
+
+    def test_builders_use_the_context_given(self):
+        """r_s and knot count come from the context, not globals."""
+        wide = PhysicsContext(schwarzschild_radius=2.9)
+        assert _minor_radius(wide) < _minor_radius(DEFAULT_PHYSICS)
+        few = DEFAULT_PHYSICS.replace(jet_knot_count=2)
+        spawned = [c for c in build_jets({**_JETS, 'physics': few})
+                   if c['cmd'] == 'spawn_primitive']
+        assert len(spawned) == 2 + 2 * 2
+
+    def test_legacy_setter_only_moves_the_fallback(self):
+        """set_schwarzschild_radius leaves explicit contexts alone."""
+        before = _minor_radius(DEFAULT_PHYSICS)
+        disk_physics.set_schwarzschild_radius(2.9)
+        assert disk_physics.SCHWARZSCHILD_RADIUS == 2.9
+        assert _minor_radius(None) < before
+        assert _minor_radius(DEFAULT_PHYSICS) == before
+
+    def test_legacy_constants_read_live(self):
+        """JET_* names track the fallback context (never stale)."""
+        set_fallback(DEFAULT_PHYSICS.replace(jet_lorentz_factor=3.0))
+        assert jet_physics.JET_LORENTZ_FACTOR == 3.0
+        assert jet_physics.observed_length() == pytest.approx(100.0)
+
+    def test_parallel_presets_match_serial(self):
+        """All quasar presets built in threads equal serial builds."""
+        serial = {q: build_batch(q) for q in PRESETS}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = dict(zip(PRESETS, pool.map(build_batch, PRESETS)))
+        assert _plain(parallel) == _plain(serial)
+
+    def test_parallel_sweep_keeps_each_context(self):
+        """An r_s sweep in threads gives each batch its own radius."""
+        sweep = [PhysicsContext(schwarzschild_radius=r)
+                 for r in (0.5, 0.75, 1.0)]
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            batches = list(pool.map(lambda c: build_batch('low', c), sweep))
+        for ctx, batch in zip(sweep, batches):
+            bh = next(c for c in batch if c['cmd'] == 'scale_object'
+                      and c['args']['name'] == 'BlackHole')
+            r_s = ctx.schwarzschild_radius
+            assert bh['args']['scale'] == (r_s, r_s, r_s)
+        assert _plain(batches[0]) != _plain(batches[2])
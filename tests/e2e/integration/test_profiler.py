@@ -0,0 +1,86 @@
+# File: tests/e2e/integration/test_profiler.py
+# E2E tests for the opt-in dispatch profiler under the mock bridge.
+# All Rights Reserved Arodi Emmanuel
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.kernel import profiler
+from app.kernel.batch_plan import compile_batch
+from app.kernel.dispatcher import dispatch_batch, dispatch_plan
+from app.kernel.profiler import profiling, tag_origin
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _batch():
+    cubes = [{'cmd': 'spawn_primitive',
+              'args': {'type': 'cube', 'name': f'C{i}'}} for i in range(5)]
+    moves = [{'cmd': 'move_object', 'args': {
+        'name': 'C0', 'location': (f, 0, 0), 'frame': f}} for f in range(3)]
+    return (tag_origin(cubes, 'cubes') + tag_origin(moves, 'motion')
+            + [{'cmd': 'no_such_cmd', 'args': {}}])
+
+
+class TestProfiler:
+    """Tests for app.kernel.profiler."""
+
+    def test_off_by_default(self):
+        """No profiler is active outside profiling()."""
+        dispatch_batch(_batch())
+        assert profiler.ACTIVE is None
+
+    @pytest.mark.parametrize('run', [
+        dispatch_batch, lambda b: dispatch_plan(compile_batch(b)),
+    ])
+    def test_counts_per_command_and_origin(self, run):
+        """Both dispatch paths record every handler call."""
+        with profiling() as prof:
+            run(_batch())
+        by_cmd = {r.key: r for r in prof.stats('cmd')}
+        assert by_cmd['spawn_primitive'].count == 5
+        assert by_cmd['move_object'].count == 3
+        assert 'no_such_cmd' not in by_cmd   # never reached a handler
+        by_origin = {r.key: r.count for r in prof.stats('origin')}
+        assert by_origin == {'cubes': 5, 'motion': 3}
+        row = by_cmd['spawn_primitive']
+        assert row.p50 <= row.p95 <= row.max <= row.total
+
+    def test_allocations_and_failures(self):
+        """tracemalloc deltas are recorded; failed handlers are counted."""
+        with profiling(track_allocations=True) as prof:
+            dispatch_batch(_batch() + [{'cmd': 'move_object', 'args': {}}])
+        by_cmd = {r.key: r for r in prof.stats('cmd')}
+        assert by_cmd['spawn_primitive'].alloc > 0
+        assert by_cmd['move_object'].failures == 1
+
+    def test_exports(self, tmp_path):
+        """JSON aggregates and Chrome trace events are written."""
+        with profiling() as prof:
+            dispatch_batch(_batch())
+        prof.save(str(tmp_path / 'p.json'))
+        prof.save(str(tmp_path / 't.json'), fmt='chrome')
+        doc = json.loads((tmp_path / 'p.json').read_text())
+        assert doc['calls'] == 8
+        assert doc['by_cmd'][0]['key'] in ('spawn_primitive', 'move_object')
+        trace = json.loads((tmp_path / 't.json').read_text())
+        assert {e['ph'] for e in trace['traceEvents']} == {'X'}
+        assert 'spawn_primitive' in prof.report()
+
+    def test_origin_survives_coalescing(self):
+        """Merged keyframe_series keep their builder origin."""
+        from app.kernel.optimizer import coalesce_keyframes
+        merged = coalesce_keyframes(_batch()).instructions
+        series = [i for i in merged if i['cmd'] == 'keyframe_series']
+        assert series[0]['origin'] == 'motion'
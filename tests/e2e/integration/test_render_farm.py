@@ -0,0 +1,110 @@
+# File: tests/e2e/integration/test_render_farm.py
+# E2E tests for the render farm: chunk planning, retries and resuming,
+# driven against tests/mocks/fake_blender.py in place of Blender.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.render import ChunkPlanner, build_blend, frame_path, render_farm
+
+FAKE = Path(__file__).parent.parent.parent / 'mocks' / 'fake_blender.py'
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture
+def blender(tmp_path):
+    exe = tmp_path / 'blender'
+    exe.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE}" "$@"\n')
+    exe.chmod(0o755)
+    return str(exe)
+
+
+def _drain(planner, seconds_per_frame=None):
+    chunks = []
+    while True:
+        chunk = planner.take()
+        if chunk is None:
+            return chunks
+        chunks.append(chunk)
+        times = [seconds_per_frame] * len(chunk.frames) \
+            if seconds_per_frame else []
+        planner.finish(chunk, chunk.frames, times)
+
+
+class TestChunkPlanner:
+    """Tests for chunk sizing and retries."""
+
+    def test_chunks_grow_then_shrink(self):
+        """Probe, then target_seconds worth, then shares of the tail."""
+        planner = ChunkPlanner(range(1, 101), workers=2, target_seconds=20,
+                               probe_frames=2)
+        sizes = [len(c.frames) for c in _drain(planner, 1.0)]
+        assert sizes[0] == 2
+        assert max(sizes) == 20
+        assert sizes[-1] < 20
+        assert sorted(planner.done) == list(range(1, 101))
+
+    def test_missing_frames_retried_then_failed(self):
+        """Unrendered frames come back as runs until retries run out."""
+        planner = ChunkPlanner(range(1, 5), workers=1, probe_frames=4,
+                               retries=1)
+        chunk = planner.take()
+        assert planner.finish(chunk, [1, 4]) == [2, 3]
+        again = planner.take()
+        assert (again.start, again.end, again.attempt) == (2, 3, 1)
+        planner.finish(again, [])
+        assert planner.take() is None
+        assert planner.failed == [2, 3]
+
+
+class TestRenderFarm:
+    """Tests for build_blend and render_farm with a fake Blender."""
+
+    def test_build_blend_reports_scene_info(self, tmp_path, blender):
+        """The build step saves the .blend and returns its frame range."""
+        info = build_blend('quasar_bh', tmp_path / 'q.blend',
+                           {'quality': 'low'}, blender)
+        assert (tmp_path / 'q.blend').exists()
+        assert (info['frame_start'], info['frame_end']) == (1, 12)
+        assert info['kwargs'] == {'quality': 'low'}
+
+    def test_renders_every_frame_and_retries_crash(
+            self, tmp_path, blender, monkeypatch):
+        """A worker crash on one frame is retried; all frames land."""
+        monkeypatch.setenv('FAKE_BLENDER_FAIL', '7')
+        out = tmp_path / 'out'
+        lines = []
+        result = render_farm(tmp_path / 'q.blend', out, range(1, 13),
+                             workers=3, blender=blender, log=lines.append)
+        assert result.rendered == list(range(1, 13))
+        assert result.failed == [] and result.retried == 1
+        assert all(frame_path(out, f).exists() for f in range(1, 13))
+        assert lines and lines[-1].startswith('[12/12]')
+
+    def test_resume_skips_rendered_frames(self, tmp_path, blender,
+                                          monkeypatch):
+        """Frames already on disk are not rendered again."""
+        log = tmp_path / 'chunks.log'
+        monkeypatch.setenv('FAKE_BLENDER_LOG', str(log))
+        out = tmp_path / 'out'
+        out.mkdir()
+        for f in range(1, 9):
+            frame_path(out, f).write_bytes(b'PNG')
+        result = render_farm(tmp_path / 'q.blend', out, range(1, 13),
+                             blender=blender, log=lambda _: None)
+        assert result.skipped == 8
+        assert result.rendered == [9, 10, 11, 12]
+        rendered = [int(f) for line in log.read_text().split()
+                    for f in line.split('-')]
+        assert min(rendered) == 9
@@ -0,0 +1,77 @@
+# File: tests/e2e/integration/test_scan_project.py
+# E2E tests for the parallel, incremental project scanner.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from validators import scan_project
+from validators.scan_project import scan_and_validate
+
+GOOD = ("BATCH = [{'cmd': 'spawn_primitive',"
+        " 'args': {'type': 'cube', 'name': 'A'}}]\n")
+BAD = "BATCH = [{'cmd': 'fly_to_moon', 'args': {}}]\n"
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for i in range(6):
+        (tmp_path / f"good_{i}.py").write_text(GOOD)
+    (tmp_path / "bad.py").write_text(BAD)
+    (tmp_path / "broken.py").write_text("BATCH = [\n")
+    return tmp_path
+
+
+def _messages(results):
+    return {Path(p).name: [it.message for _, issues in items for it in issues]
+            for p, items in results.items()}
+
+
+class TestScanProject:
+    """Tests for validators/scan_project.py."""
+
+    def test_reports_only_files_with_issues(self, tree):
+        assert _messages(scan_and_validate(str(tree), workers=1)) == {
+            'bad.py': ['unknown command']}
+
+    def test_pool_matches_serial(self, tree, monkeypatch):
+        monkeypatch.setattr(scan_project, 'PARALLEL_MIN_FILES', 1)
+        serial = scan_and_validate(str(tree), workers=1)
+        assert _messages(scan_and_validate(str(tree), workers=2)) == \
+            _messages(serial)
+
+    def test_incremental_rescans_changed_files_only(self, tree, monkeypatch):
+        seen = []
+        run = scan_project._run
+        monkeypatch.setattr(scan_project, '_run', lambda todo, *a: (
+            seen.append(sorted(Path(p).name for p in todo)) or run(todo, *a)))
+        scan_and_validate(str(tree), incremental=True)
+        assert len(seen[0]) == 8
+
+        (tree / "good_0.py").write_text(BAD)
+        (tree / "good_1.py").touch()             # touched, same content
+        results = scan_and_validate(str(tree), incremental=True)
+        assert seen[1] == ['good_0.py']
+        assert set(_messages(results)) == {'bad.py', 'good_0.py'}
+
+    def test_command_set_built_once(self, tree, monkeypatch):
+        calls = []
+        real = scan_project.registered_commands
+        monkeypatch.setattr(scan_project, 'registered_commands',
+                            lambda: calls.append(1) or real())
+        import validators.batch_validator as bv
+        monkeypatch.setattr(bv, 'registered_commands',
+                            lambda: calls.append(1) or real())
+        scan_and_validate(str(tree), workers=1)
+        assert len(calls) == 1
@@ -0,0 +1,115 @@
+# File: tests/e2e/integration/test_scene_run.py
+# E2E tests for the shared create_scene() modes: every scene takes the
+# same mode arguments and run_scene() dispatches acts in each mode.
+# All Rights Reserved Arodi Emmanuel
+
+import importlib
+import inspect
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra import batch_cache
+from app.infra.bridge import data, reset
+from app.kernel.parallel_build import Act
+from app.kernel.scene_run import _generate, run_scene
+import app.commands  # noqa: F401
+
+SCENES = ('quasar_bh', 'solar_system', 'resonance_box', 'missile_storm',
+          'euler_diagram', 'fractal_abyss', 'math_sets')
+
+MODES = {'profile': False, 'stream': False, 'results': 'list',
+         'incremental': False, 'cache': False, 'dry_run': False,
+         'workers': 1}
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _cube(name, frames):
+    cmds = [{'cmd': 'spawn_primitive',
+             'args': {'type': 'cube', 'name': name}}]
+    for f in range(1, frames + 1):
+        cmds.append({'cmd': 'move_object', 'args': {
+            'name': name, 'location': (f * 0.5, 0.0, 1.0), 'frame': f}})
+    return cmds
+
+
+def _drift(name, step):
+    return [{'cmd': 'move_object', 'args': {
+        'name': name, 'location': (f * step, -f * step, 1.0), 'frame': f}}
+        for f in range(1, 6)]
+
+
+def _acts(frames=4):
+    return [Act('a', _cube, ('A', frames)), Act('b', _cube, ('B', 3))]
+
+
+class TestSceneRun:
+    """Tests for run_scene and the scene signatures built on it."""
+
+    @pytest.mark.parametrize('scene', SCENES)
+    def test_every_scene_takes_the_same_modes(self, scene):
+        params = inspect.signature(
+            importlib.import_module(f'scenes.{scene}.scene').create_scene
+        ).parameters
+        assert list(params)[-len(MODES):] == list(MODES)
+        assert {k: params[k].default for k in MODES} == MODES
+
+    def test_default_run_optimizes_and_dispatches(self):
+        out = run_scene(_acts(), {'frames': 4})
+        assert out['status'] == 'OK' and out['frames'] == 4
+        assert out['coalesced'] > 0 and out['profile'] is None
+        assert all(r.success for r in out['results'])
+        assert data.objects.get('A') and data.objects.get('B')
+
+    def test_stream_skips_the_optimizer(self):
+        out = run_scene(_acts(), {}, stream=True)
+        assert 'coalesced' not in out
+        assert out['summary'].total == 9 and out['summary'].failed == 0
+
+    def test_dry_run_dispatches_nothing(self):
+        out = run_scene(_acts(), {}, dry_run=True)
+        assert out['issues'] == [] and 'results' not in out
+        assert data.objects.get('A') is None
+
+    def test_incremental_rebuilds_changed_acts(self):
+        run_scene(_acts(), {}, incremental=True)
+        out = run_scene(_acts(5), {}, incremental=True, results='summary')
+        assert out['rebuilt'] == ['a'] and out['skipped'] == ['b']
+
+    def test_workers_match_serial(self):
+        serial = run_scene(_acts(), {})
+        reset()
+        parallel = run_scene(_acts(), {}, workers=2)
+        assert ([(r.command_name, r.success) for r in parallel['results']]
+                == [(r.command_name, r.success) for r in serial['results']])
+
+    def test_parallel_generation_equals_serial(self):
+        """Worker output is exact: values that float32 would round and a
+        real scene's acts come back identical to a serial run."""
+        from scenes.math_sets.scene import scene_acts
+        for acts in ([Act('a', _drift, ('A', 0.1)),
+                      Act('b', _drift, ('B', 1 / 3))],
+                     scene_acts(total_frames=120)):
+            assert _generate(acts, 2) == _generate(acts, 1)
+
+    def test_cache_reuses_the_optimized_batch(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(batch_cache, 'CACHE_DIR', tmp_path)
+        fresh = run_scene(_acts(), {}, results='summary')
+        for _ in range(2):
+            reset()
+            cached = run_scene(_acts(), {}, params={'frames': 4},
+                               results='summary', cache=True)
+            assert cached['keys'] == fresh['keys']
+            assert cached['summary'].counts == fresh['summary'].counts
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_profile_returns_a_profiler(self):
+        assert run_scene(_acts(), {}, profile=True)['profile'] is not None
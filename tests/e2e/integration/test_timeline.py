@@ -0,0 +1,80 @@
+# File: tests/e2e/integration/test_timeline.py
+# E2E tests for the shared keyframe Timeline and the builders using it.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import reset
+from app.components.timeline import Timeline, timeline
+from app.components.camera_builder import build_camera
+from app.components.bodies.dyson_sphere import build_dyson_sphere
+from app.components.bodies.jet_builder import _knot_keys
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+class TestTimeline:
+    """Tests for Timeline and its memoized lookup."""
+
+    def test_frames_and_normalised_t(self):
+        """Frames step from 1; t runs 0..1 over total_frames."""
+        tl = Timeline(9, 4)
+        assert tl.frames == (1, 5, 9)
+        assert tl.t == (0.0, 0.5, 1.0)
+        assert len(tl) == 3
+
+    def test_memoized_per_grid(self):
+        """One shared instance per (total_frames, step)."""
+        assert timeline(120, 6) is timeline(120, 6)
+        assert timeline(120, 6) is not timeline(120, 5)
+
+    def test_phased_wraps_and_is_cached(self):
+        """phased(p) is (t + p) % 1, computed once per phase."""
+        tl = Timeline(5, 1)
+        assert tl.phased(0.5) == (0.5, 0.75, 0.0, 0.25, 0.5)
+        assert tl.phased(0.5) is tl.phased(0.5)
+
+    def test_samples_not_shared_mutably(self):
+        """Series frames cannot corrupt the shared timeline."""
+        tl = timeline(50, 10)
+        samples = tl.samples
+        try:
+            samples[0] = 99
+        except ValueError:
+            pass        # NumPy: read-only array
+        assert tl.samples[0] == 1
+
+    def test_builders_accept_a_timeline(self):
+        """Camera and Dyson keys follow the timeline they are given."""
+        tl = Timeline(40, 13)
+        cam = build_camera({'name': 'Cam', 'radius': 5.0,
+                            'total_frames': 40, 'cam_step': 13,
+                            'timeline': tl})
+        series = next(c for c in cam if c['cmd'] == 'keyframe_series')
+        assert list(series['args']['frames']) == [1, 14, 27, 40]
+        dyson = build_dyson_sphere({'total_frames': 40, 'step': 13,
+                                    'meridians': 1, 'parallels': 0,
+                                    'rotation_mode': 'keys',
+                                    'timeline': tl})
+        keyed = [c['args']['frame'] for c in dyson
+                 if c['cmd'] == 'rotate_object']
+        assert keyed == [1, 1, 14, 27, 40]
+
+    def test_knot_sides_share_phase(self):
+        """North and South knots reuse one row of scales per knot."""
+        cmds = _knot_keys(60)
+        scales = [c['args']['scale'] for c in cmds
+                  if c['cmd'] == 'scale_object'
+                  and c['args']['name'] in ('KnotNorth_3', 'KnotSouth_3')]
+        half = len(scales) // 2
+        assert scales[:half] == scales[half:]
+        assert scales[0] is scales[half]
@@ -0,0 +1,93 @@
+# File: tests/e2e/integration/test_trajectories.py
+# E2E tests for the vectorized trajectory module and the builders that
+# key whole sampled paths with keyframe_series.
+# All Rights Reserved Arodi Emmanuel
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_batch
+from app.components import trajectories as traj
+from app.components.camera_builder import build_camera
+from tests.benchmarks.trajectory_benchmark import (
+    scalar_camera, scalar_orbit, vector_camera, vector_orbit,
+)
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def _close(rows_a, rows_b):
+    return all(math.isclose(a, b, abs_tol=1e-9)
+               for ra, rb in zip(rows_a, rows_b) for a, b in zip(ra, rb))
+
+
+class TestTrajectories:
+    """Trajectory samples match the scalar per-frame loops."""
+
+    @pytest.mark.parametrize('vectorized', [False, True])
+    def test_camera_matches_scalar(self, vectorized):
+        """Sampled camera path equals the old move_object locations."""
+        scalar = scalar_camera(360, 7)
+        series = vector_camera(360, 7, vectorized)[0]['args']
+        assert list(series['frames']) == [c['args']['frame'] for c in scalar]
+        assert _close(series['values'],
+                      [c['args']['location'] for c in scalar])
+
+    @pytest.mark.parametrize('vectorized', [False, True])
+    def test_orbit_and_arm_match_scalar(self, vectorized):
+        """Planet/arm location and rotation series equal the old loop."""
+        scalar = scalar_orbit(240, 3)
+        for k, cmd in enumerate(vector_orbit(240, 3, vectorized)):
+            old = scalar[k::4]
+            key = 'location' if old[0]['cmd'] == 'move_object' else 'rotation'
+            assert _close(cmd['args']['values'],
+                          [c['args'][key] for c in old])
+
+    def test_numpy_matches_fallback(self):
+        """The NumPy path produces (N, 3) arrays equal to the fallback."""
+        pytest.importorskip('numpy')
+        frames = traj.sample_frames(100, 1)
+        path = traj.camera_orbit(frames, 100, 10.0)
+        assert path.shape == (100, 3)
+        assert _close(path, traj.camera_orbit(
+            traj.sample_frames(100, 1, False), 100, 10.0, vectorized=False))
+
+
+class TestBuildersUseSeries:
+    """Camera and orbit builders emit one series per channel."""
+
+    def test_camera_keyed_by_one_series(self):
+        """build_camera keys every sampled frame in one dispatch."""
+        cmds = build_camera({'name': 'Cam', 'radius': 10.0,
+                             'total_frames': 3600, 'cam_step': 1})
+        series = [c for c in cmds if c['cmd'] == 'keyframe_series']
+        assert len(series) == 1 and len(series[0]['args']['frames']) == 3600
+        assert all(dispatch_batch(cmds))
+        keys = data.objects.get('Cam').animation_data.get_keyframes('location')
+        assert len(keys) == 3600
+
+    def test_orrery_dispatches(self):
+        """Solar-system orrery keys planets and arms without per-frame cmds."""
+        from scenes.solar_system.animations._orrery import build_orrery
+        planets = [{'name': 'Mars', 'radius_au': 3.0, 'size': 0.2,
+                    'period_frames': 120, 'inclination_deg': 5.0,
+                    'color': (1, 0, 0, 1)}]
+        cmds = build_orrery(planets, 240, 2)
+        assert not [c for c in cmds if c['cmd'] in ('move_object',
+                                                    'rotate_object')
+                    and c['args'].get('frame', 1) > 1]
+        import scenes.solar_system.commands  # noqa: F401
+        dispatch_batch(cmds)
+        arm = data.objects.get('Mars_Arm')
+        assert len(arm.animation_data.get_keyframes('rotation_euler')) == 120
@@ -71,3 +71,47 @@ class TestSpawnPrimitive:
         })
         assert not result.success
         assert 'Unknown primitive' in result.error
+
+
+class TestCreationTracking:
+    """Spawned objects are identified without name snapshots."""
+
+    def test_rename_targets_new_object_on_name_collision(self):
+        """Second cube gets the requested name, first is untouched."""
+        dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube'}},
+            {'cmd': 'spawn_primitive',
+             'args': {'type': 'cube', 'name': 'Second'}},
+        ])
+        assert data.objects.get('Cube') is not None
+        assert data.objects.get('Second') is not None
+        assert len(data.objects) == 2
+
+    def test_failed_operator_renames_nothing(self, monkeypatch):
+        """Operator errors never rename the previously active object."""
+        from app.commands.objects import spawn_primitive as sp
+
+        def _boom(**kwargs):
+            raise RuntimeError('operator failed')
+
+        dispatch_single({
+            'cmd': 'spawn_primitive',
+            'args': {'type': 'cube', 'name': 'Keep'}
+        })
+        monkeypatch.setitem(sp.PRIMITIVE_MAP, 'sphere', _boom)
+        result = dispatch_single({
+            'cmd': 'spawn_primitive',
+            'args': {'type': 'sphere', 'name': 'Bad'}
+        })
+        assert not result.success
+        assert data.objects.get('Keep') is not None
+        assert data.objects.get('Bad') is None
+
+    def test_spawn_text_named_after_collision(self):
+        """Text objects are tracked the same way."""
+        dispatch_batch([
+            {'cmd': 'spawn_text', 'args': {'text': 'a', 'name': 'T1'}},
+            {'cmd': 'spawn_text', 'args': {'text': 'b', 'name': 'T2'}},
+        ])
+        assert data.objects.get('T1').data.body == 'a'
+        assert data.objects.get('T2').data.body == 'b'
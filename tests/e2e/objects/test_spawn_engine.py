@@ -0,0 +1,190 @@
+# File: tests/e2e/objects/test_spawn_engine.py
+# E2E tests for the data-API spawn engine: engine selection per batch and
+# per spawn, naming, transforms, cached buffers and shared datablocks.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data
+from app.kernel.dispatcher import dispatch_single, dispatch_batch
+from app.domain.primitive_geometry import geometry_key, primitive_buffers
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def ops_engine():
+    """Every test starts and ends on the default operator engine."""
+    dispatch_single({'cmd': 'set_spawn_engine', 'args': {'engine': 'ops'}})
+    yield
+    dispatch_single({'cmd': 'set_spawn_engine', 'args': {'engine': 'ops'}})
+
+
+class TestSpawnEngine:
+    """Tests for set_spawn_engine and spawn_primitive engine='data'."""
+
+    def test_data_engine_spawns_named_object(self):
+        """Data engine creates and names the object without operators."""
+        result = dispatch_single({'cmd': 'spawn_primitive', 'args': {
+            'type': 'sphere', 'name': 'Planet', 'location': (1, 2, 3),
+            'segments': 8, 'ring_count': 4, 'engine': 'data',
+        }})
+        assert result.success
+        obj = data.objects.get('Planet')
+        assert obj is not None
+        assert tuple(obj.location) == (1, 2, 3)
+        assert len(obj.data.vertices) == 8 * 3 + 2
+
+    def test_batch_switches_engine(self):
+        """set_spawn_engine applies to every following spawn."""
+        results = dispatch_batch([
+            {'cmd': 'set_spawn_engine', 'args': {'engine': 'data'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'A'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'torus', 'name': 'B'}},
+        ])
+        assert all(r.success for r in results)
+        assert len(data.objects.get('A').data.vertices) == 8
+        assert len(data.objects.get('B').data.vertices) == 48 * 12
+
+    def test_bulk_mesh_build(self):
+        """The data engine fills vertices, loops and polygons through
+        foreach_set; a shared spawn links that mesh, smooth-shaded."""
+        dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {
+                'type': 'cone', 'name': 'A', 'engine': 'data',
+                'vertices': 6, 'shade_smooth': True}},
+            {'cmd': 'spawn_primitive', 'args': {
+                'type': 'cone', 'name': 'B', 'engine': 'data',
+                'vertices': 6, 'shade_smooth': True}},
+        ])
+        buf = primitive_buffers(geometry_key('cone', {'vertices': 6}))
+        mesh = data.objects.get('A').data
+        assert data.objects.get('B').data is mesh and len(data.meshes) == 1
+        assert [c for v in mesh.vertices for c in v.co] == list(buf.co)
+        assert [p.loop_start for p in mesh.polygons] == list(buf.loop_starts)
+        assert [p.loop_total for p in mesh.polygons] == list(buf.loop_totals)
+        assert ([lp.vertex_index for lp in mesh.loops]
+                == list(buf.loop_verts))
+        assert len(mesh.edges) == 12
+        assert all(p.use_smooth for p in mesh.polygons)
+
+    def test_torus_exterior_interior_radii(self):
+        """mode='EXT_INT' sizes the torus by abso_* radii, as the
+        operator does; an unknown mode is rejected."""
+        results = dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {
+                'type': 'torus', 'name': 'Ring', 'engine': 'data',
+                'mode': 'EXT_INT', 'abso_major_rad': 3.0,
+                'abso_minor_rad': 1.0}},
+            {'cmd': 'spawn_primitive', 'args': {
+                'type': 'torus', 'name': 'Bad', 'engine': 'data',
+                'mode': 'OUTER'}},
+        ])
+        assert [r.success for r in results] == [True, False]
+        expected = primitive_buffers(geometry_key('torus', {
+            'major_radius': 2.0, 'minor_radius': 1.0}))
+        co = [c for v in data.objects.get('Ring').data.vertices for c in v.co]
+        assert co == list(expected.co)
+        assert data.objects.get('Bad') is None
+
+    def test_invalid_engine_fails(self):
+        """Unknown engine names are rejected by both entry points."""
+        result = dispatch_single({
+            'cmd': 'set_spawn_engine', 'args': {'engine': 'fast'}
+        })
+        assert not result.success
+        result = dispatch_single({'cmd': 'spawn_primitive', 'args': {
+            'type': 'cube', 'engine': 'fast',
+        }})
+        assert not result.success
+        assert len(data.objects) == 0
+
+
+class TestPrimitiveBuffers:
+    """Tests for the cached vertex/face buffers."""
+
+    def test_default_counts_match_blender(self):
+        """Default primitives have Blender's vertex and face counts."""
+        expected = {'cube': (8, 6), 'plane': (4, 1), 'sphere': (482, 512),
+                    'torus': (576, 576), 'cone': (33, 33),
+                    'cylinder': (64, 34)}
+        for ptype, (verts, faces) in expected.items():
+            buf = primitive_buffers(geometry_key(ptype, {}))
+            assert len(buf.co) // 3 == verts, ptype
+            assert len(buf.loop_starts) == faces, ptype
+
+    def test_key_normalizes_args(self):
+        """Equivalent args share one key and one cached buffer."""
+        a = geometry_key('sphere', {'segments': 32.0, 'name': 'X'})
+        b = geometry_key('sphere', {})
+        assert a == b
+        assert primitive_buffers(a) is primitive_buffers(b)
+
+
+class TestSharedMeshes:
+    """Tests for the shared mesh datablock cache."""
+
+    def test_identical_spawns_share_mesh(self):
+        """Second identical spawn links to the first spawn's mesh."""
+        dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {'type': 'sphere',
+                                                'name': 'Boom_0'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'sphere',
+                                                'name': 'Boom_1',
+                                                'location': (4, 0, 0)}},
+        ])
+        a, b = data.objects.get('Boom_0'), data.objects.get('Boom_1')
+        assert a.data is b.data
+        assert len(data.meshes) == 1
+        assert tuple(b.location) == (4, 0, 0)
+
+    def test_different_geometry_gets_own_mesh(self):
+        """Spawns with different geometry never share."""
+        dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {'type': 'sphere',
+                                                'name': 'S', 'radius': 1}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'sphere',
+                                                'name': 'L', 'radius': 2}},
+        ])
+        assert data.objects.get('S').data is not data.objects.get('L').data
+
+    def test_share_data_opt_out(self):
+        """share_data=False always builds a fresh mesh."""
+        dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube',
+                                                'name': 'A'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cube', 'name': 'B',
+                                                'share_data': False}},
+        ])
+        assert data.objects.get('A').data is not data.objects.get('B').data
+
+    def test_cached_mesh_counts_as_shared(self):
+        """A first spawn's mesh is shared before any sibling links it.
+
+        apply_scale and assign_material then copy or link by object
+        instead of editing the mesh later identical spawns receive.
+        """
+        from app.infra.datablock_cache import is_shared
+        dispatch_batch([
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cone',
+                                                'name': 'First'}},
+            {'cmd': 'spawn_primitive', 'args': {'type': 'cone', 'name': 'Own',
+                                                'share_data': False}},
+        ])
+        assert is_shared(data.objects.get('First'))
+        assert not is_shared(data.objects.get('Own'))
+
+    def test_identical_text_shares_data(self):
+        """Identical text spawns reuse one text datablock."""
+        dispatch_batch([
+            {'cmd': 'spawn_text', 'args': {'text': 'x', 'name': 'T1'}},
+            {'cmd': 'spawn_text', 'args': {'text': 'x', 'name': 'T2'}},
+            {'cmd': 'spawn_text', 'args': {'text': 'y', 'name': 'T3'}},
+        ])
+        t1, t2, t3 = (data.objects.get(n) for n in ('T1', 'T2', 'T3'))
+        assert t1.data is t2.data
+        assert t1.data is not t3.data
+        assert t2.type == 'FONT'
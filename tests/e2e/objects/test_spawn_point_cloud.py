@@ -0,0 +1,160 @@
+# File: tests/e2e/objects/test_spawn_point_cloud.py
+# E2E tests for spawn_point_cloud and the seeded, instanced starfield:
+# one object per field, per-point scale attribute, reproducible samples.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_batch, dispatch_single
+from app.commands.objects.spawn_point_cloud import SCALE_ATTRIBUTE
+from app.infra import instance_nodes
+from app.scene.atmospheres.space_atmosphere import (
+    HAS_NUMPY, generate_starfield, sample_starfield,
+)
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Reset mock state before each test."""
+    reset()
+    yield
+    reset()
+
+
+class TestSpawnPointCloud:
+    """Tests for spawn_point_cloud command."""
+
+    def test_points_and_scales_on_one_mesh(self):
+        result = dispatch_single({'cmd': 'spawn_point_cloud', 'args': {
+            'name': 'Cloud', 'points': [(0, 0, 0), (1, 2, 3)],
+            'scales': [0.5, 2.0],
+        }})
+        assert result.success and result.data['points'] == 2
+        mesh = data.objects['Cloud'].data
+        assert mesh.vertices == [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0)]
+        assert mesh.attributes[SCALE_ATTRIBUTE] == [0.5, 2.0]
+
+    def test_invalid_args_fail(self):
+        def spawn(**args):
+            return dispatch_single(
+                {'cmd': 'spawn_point_cloud', 'args': args})
+        assert not spawn(points=[0, 0, 0]).success
+        assert not spawn(name='C', points=[0, 0]).success
+        assert not spawn(name='C', points=[0, 0, 0], scales=[1, 2]).success
+        assert not spawn(name='C', points=[0, 0, 0], material='Nope').success
+        assert len(data.objects) == 0
+
+
+class TestStarfield:
+    """Tests for app/scene/atmospheres/space_atmosphere.py."""
+
+    def test_single_object_per_field(self):
+        batch = [{'cmd': 'create_material', 'args': {'name': 'Glow'}}]
+        batch += generate_starfield(star_count=1150, material='Glow')
+        assert [r.success for r in dispatch_batch(batch)] == [True, True]
+        assert list(data.objects.keys()) == ['Starfield']
+        mesh = data.objects['Starfield'].data
+        assert len(mesh.vertices) == 1150
+        sizes = mesh.attributes[SCALE_ATTRIBUTE]
+        assert all(0.01 <= s <= 0.05 for s in sizes)
+
+    @pytest.mark.parametrize('vectorized', [False, True])
+    def test_seed_reproducible(self, vectorized):
+        if vectorized and not HAS_NUMPY:
+            pytest.skip('NumPy not installed')
+        first = sample_starfield(300, seed=7, vectorized=vectorized)
+        assert sample_starfield(300, seed=7, vectorized=vectorized) == first
+        assert sample_starfield(300, seed=8, vectorized=vectorized) != first
+        points, sizes = first
+        assert len(points) == 900 and len(sizes) == 300
+
+    @pytest.mark.parametrize('vectorized', [False, True])
+    def test_cluster_layout(self, vectorized):
+        """Both samplers place one cluster inside 0.3-1.0 of radius."""
+        if vectorized and not HAS_NUMPY:
+            pytest.skip('NumPy not installed')
+        points, _ = sample_starfield(
+            2000, radius=50.0, num_clusters=1, seed=1, vectorized=vectorized)
+        xs, ys, zs = points[0::3], points[1::3], points[2::3]
+        cx, cy, cz = (sum(v) / len(v) for v in (xs, ys, zs))
+        assert 15.0 * 0.5 < (cx * cx + cy * cy + cz * cz) ** 0.5 < 50.0 * 1.2
+
+
+class _Socket(SimpleNamespace):
+    enabled = True
+
+
+class _Sockets(defaultdict):
+    """Sockets by name or index; iterates over sockets, like bpy."""
+
+    def __init__(self):
+        super().__init__(_Socket, {0: _Socket()})
+
+    def __iter__(self):
+        return iter(list(self.values()))
+
+
+class _Node:
+    def __init__(self, bl_idname):
+        self.bl_idname = bl_idname
+        self.inputs = _Sockets()
+        self.outputs = _Sockets()
+
+
+class _Nodes(list):
+    def new(self, bl_idname):
+        self.append(_Node(bl_idname))
+        return self[-1]
+
+
+class _Group:
+    """Just enough of a GeometryNodeTree for _sphere_group."""
+
+    def __init__(self, name):
+        self.name = name
+        self.nodes = _Nodes()
+        self.links = SimpleNamespace(new=lambda *a: None)
+        self.interface = SimpleNamespace(new_socket=lambda *a, **k: None)
+
+
+class _NodeGroups(dict):
+    def new(self, name, kind):
+        group = self[name] = _Group(name)
+        return group
+
+    def remove(self, group):
+        del self[group.name]
+
+
+class TestInstanceNodes:
+    """Node-group reuse across clear_scene (app/infra/instance_nodes)."""
+
+    @pytest.fixture
+    def groups(self, monkeypatch):
+        groups = _NodeGroups()
+        monkeypatch.setattr(instance_nodes, 'data',
+                            SimpleNamespace(node_groups=groups))
+        return groups
+
+    def test_group_rebuilt_when_material_removed(self, groups):
+        mat = SimpleNamespace(name='StarGlow')
+        first = instance_nodes._sphere_group('scale', 1.0, 8, 4, mat)
+        assert instance_nodes._sphere_group('scale', 1.0, 8, 4, mat) \
+            is first
+        # clear_scene removed the material: Blender nulls the reference.
+        setter = next(n for n in first.nodes
+                      if n.bl_idname == 'GeometryNodeSetMaterial')
+        setter.inputs['Material'].default_value = None
+        again = SimpleNamespace(name='StarGlow')
+        rebuilt = instance_nodes._sphere_group('scale', 1.0, 8, 4, again)
+        assert rebuilt is not first
+        assert instance_nodes._group_material(rebuilt) is again
+        assert list(groups.values()) == [rebuilt]
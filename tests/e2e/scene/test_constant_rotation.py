@@ -0,0 +1,87 @@
+# File: tests/e2e/scene/test_constant_rotation.py
+# E2E tests for set_constant_rotation and the builders that use it in
+# place of one rotation key per step.
+# All Rights Reserved Arodi Emmanuel
+
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_single
+from app.components.disk_animator import build_disk_animation
+from app.components.bodies.dyson_sphere import build_dyson_sphere
+import app.commands  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    dispatch_single({'cmd': 'spawn_primitive',
+                     'args': {'type': 'torus', 'name': 'Ring'}})
+    yield
+    reset()
+
+
+def _spin(**args):
+    return dispatch_single({'cmd': 'set_constant_rotation',
+                            'args': {'name': 'Ring', **args}})
+
+
+class TestSetConstantRotation:
+    """Tests for set_constant_rotation."""
+
+    def test_fcurve_mode_records_rate(self):
+        """Rate, start and base rotation land on the object."""
+        result = _spin(rate=0.1, start=0.5, rotation=(1.0, 0, 0))
+        assert result.success
+        obj = data.objects.get('Ring')
+        assert obj.rotation_euler.to_tuple() == (1.0, 0.0, 0.5)
+        assert obj.animation_data.get_rate('rotation_euler', 2) \
+            == (1, 0.5, 0.1)
+
+    def test_driver_mode_and_axis(self):
+        """Driver mode spins the requested axis from its current angle."""
+        result = _spin(rate=-0.2, axis='x', mode='driver', start_frame=10)
+        assert result.success
+        obj = data.objects.get('Ring')
+        assert obj.animation_data.get_rate('rotation_euler', 0) \
+            == (10, 0.0, -0.2)
+
+    def test_invalid_args_fail(self):
+        """Missing rate, bad axis or mode and unknown object fail."""
+        assert not _spin().success
+        assert not _spin(rate=1, axis='W').success
+        assert not _spin(rate=1, mode='scripted').success
+        assert not dispatch_single({'cmd': 'set_constant_rotation',
+                                    'args': {'name': 'Nope', 'rate': 1}})
+
+
+class TestConstantRotationBuilders:
+    """Builders emit one command per spinning ring."""
+
+    def test_disk_rings_are_o_rings(self):
+        """Disk rings spin with one command each, matching keyed angles."""
+        rings = [{'radius': 3.0}, {'radius': 4.5}]
+        cfg = {'disk_rings': rings, 'total_frames': 3600, 'rotations': 2,
+               'step': 1, 'emit_strength_fn': lambda i: 1.0}
+        cmds = build_disk_animation(cfg)
+        assert [c['cmd'] for c in cmds] == ['set_constant_rotation'] * 2
+        keyed = build_disk_animation({**cfg, 'rotation_mode': 'keys'})
+        series = keyed[1]['args']
+        spin = cmds[1]['args']
+        for f, (_, _, z) in zip(series['frames'], series['values']):
+            expected = spin['start'] + spin['rate'] * (f - 1)
+            assert math.isclose(z, expected, rel_tol=1e-9)
+
+    def test_dyson_rings_use_constant_rotation(self):
+        """No per-frame rotation keys remain in the dyson cage."""
+        cmds = build_dyson_sphere({'meridians': 4, 'parallels': 3,
+                                   'total_frames': 1200, 'step': 1})
+        per_frame = [c for c in cmds if c['cmd'] == 'rotate_object'
+                     and c['args']['frame'] > 1]
+        assert per_frame == []
+        assert sum(c['cmd'] == 'set_constant_rotation' for c in cmds) == 7
@@ -0,0 +1,173 @@
+# File: tests/e2e/scene/test_keyframe_series.py
+# E2E tests for the keyframe_series bulk command. Tests series insertion,
+# equivalence with per-frame transform keys, and argument validation.
+# All Rights Reserved Arodi Emmanuel
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import pytest
+from types import SimpleNamespace
+from app.infra import fcurve_writer
+from app.infra.bridge import data, reset
+from app.kernel.dispatcher import dispatch_single, dispatch_batch
+import app.commands  # noqa: F401
+from tests.mocks.core.fcurves import DEFAULT_INTERPOLATION, MockAction
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset()
+    yield
+    reset()
+
+
+def create_cube(name: str = 'Cube'):
+    dispatch_single({
+        'cmd': 'spawn_primitive',
+        'args': {'type': 'cube', 'name': name}
+    })
+
+
+def series(name, frames, values, prop='location'):
+    return dispatch_single({'cmd': 'keyframe_series', 'args': {
+        'name': name, 'data_path': prop,
+        'frames': frames, 'values': values,
+    }})
+
+
+class TestKeyframeSeries:
+    """Tests for keyframe_series command."""
+
+    def test_series_keys_every_frame(self):
+        """Every sample becomes a keyframe."""
+        create_cube()
+        result = series('Cube', [1, 10, 20], [(0, 0, 0), (1, 0, 0),
+                                              (2, 0, 0)])
+        assert result.success
+        assert result.data['count'] == 3
+        keys = data.objects.get('Cube').animation_data.get_keyframes(
+            'location')
+        assert keys == {1: (0, 0, 0), 10: (1, 0, 0), 20: (2, 0, 0)}
+
+    def test_series_matches_per_frame_commands(self):
+        """Series leaves the same keys and state as per-frame rotates."""
+        create_cube('A')
+        create_cube('B')
+        frames = [1, 5, 9]
+        values = [(0, 0, 0.1 * f) for f in frames]
+        dispatch_batch([
+            {'cmd': 'rotate_object', 'args': {
+                'name': 'A', 'rotation': v, 'frame': f}}
+            for f, v in zip(frames, values)
+        ])
+        series('B', frames, values, prop='rotation_euler')
+        a, b = data.objects.get('A'), data.objects.get('B')
+        assert (a.animation_data.get_keyframes('rotation_euler')
+                == b.animation_data.get_keyframes('rotation_euler'))
+        assert a.rotation_euler == b.rotation_euler
+
+    def test_series_merges_with_existing_keys(self):
+        """Keys outside the series are preserved."""
+        create_cube()
+        dispatch_single({'cmd': 'move_object', 'args': {
+            'name': 'Cube', 'location': (9, 9, 9), 'frame': 100}})
+        series('Cube', [1], [(0, 0, 0)])
+        keys = data.objects.get('Cube').animation_data.get_keyframes(
+            'location')
+        assert set(keys) == {1, 100}
+
+    def test_length_mismatch_fails(self):
+        """Frames and values must have equal length."""
+        create_cube()
+        result = series('Cube', [1, 2], [(0, 0, 0)])
+        assert not result.success
+        assert 'Length mismatch' in result.error
+
+    def test_invalid_data_path_fails(self):
+        """Only transform properties are accepted."""
+        create_cube()
+        result = series('Cube', [1], [(0, 0, 0)], prop='color')
+        assert not result.success
+
+    def test_missing_object_fails(self):
+        """Unknown object returns not-found failure."""
+        result = series('Ghost', [1], [(0, 0, 0)])
+        assert not result.success
+        assert 'not found' in result.error
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def blender_writer(request, monkeypatch):
+    """fcurve_writer on its real-Blender path, with and without NumPy."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(fcurve_writer, 'np', None)
+    monkeypatch.setattr(fcurve_writer, 'is_mock', lambda: False)
+    return fcurve_writer
+
+
+def _blender_object():
+    action = MockAction()
+    obj = SimpleNamespace(location=(0.0, 0.0, 0.0),
+                          animation_data=SimpleNamespace(action=action))
+    return obj, action
+
+
+class TestFcurveWriter:
+    """fcurve_writer against bulk-only keyframe_points mocks."""
+
+    def test_series_written_in_bulk(self, blender_writer):
+        """co and interpolation each go through one foreach_set."""
+        obj, action = _blender_object()
+        blender_writer.write_keyframe_series(
+            obj, 'location', [1, 5, 9],
+            [(0, 0, 0), (1, 2, 3), (2, 4, 6)], 'LINEAR')
+        assert obj.location == (2.0, 4.0, 6.0)
+        linear = blender_writer.INTERPOLATION_CODES['LINEAR']
+        for axis in range(3):
+            fc = action.fcurves.find('location', axis)
+            points = fc.keyframe_points
+            assert points.frames() == [1.0, 5.0, 9.0]
+            assert points.values() == [0.0, axis + 1.0, 2 * axis + 2.0]
+            assert points.interpolations() == [linear] * 3
+            assert points.calls == [('set', 'co'), ('set', 'interpolation')]
+
+    def test_merge_keeps_other_keys_interpolation(self, blender_writer):
+        """Only the written keys change mode; existing ones keep theirs."""
+        obj, action = _blender_object()
+        blender_writer.write_keyframe_series(
+            obj, 'location', [1, 10], [(0, 0, 0), (1, 1, 1)])
+        blender_writer.write_keyframe_series(
+            obj, 'location', [5, 10], [(5, 5, 5), (9, 9, 9)], 'CONSTANT')
+        points = action.fcurves.find('location', 0).keyframe_points
+        assert points.frames() == [1.0, 5.0, 10.0]
+        assert points.values() == [0.0, 5.0, 9.0]
+        assert points.interpolations() == [DEFAULT_INTERPOLATION, 0, 0]
+
+    def test_interleaved_keys_keep_their_interpolation(self, blender_writer):
+        """New frames between existing keys leave theirs on the right key."""
+        obj, action = _blender_object()
+        blender_writer.write_keyframe_series(
+            obj, 'location', [1, 10], [(0, 0, 0), (1, 1, 1)], 'CONSTANT')
+        blender_writer.write_keyframe_series(
+            obj, 'location', [5], [(5, 5, 5)], 'LINEAR')
+        blender_writer.write_keyframe_series(
+            obj, 'location', [3, 7], [(3, 3, 3), (7, 7, 7)])
+        points = action.fcurves.find('location', 0).keyframe_points
+        assert points.frames() == [1.0, 3.0, 5.0, 7.0, 10.0]
+        assert points.interpolations() == [
+            0, DEFAULT_INTERPOLATION, 1, DEFAULT_INTERPOLATION, 0]
+
+    def test_constant_rate_keys_are_linear(self, blender_writer):
+        """write_constant_rate leaves two LINEAR keys, extrapolated."""
+        obj, action = _blender_object()
+        blender_writer.write_constant_rate(obj, 'location', 2, 1, 0.5, 2.0)
+        fc = action.fcurves.find('location', 2)
+        assert fc.keyframe_points.frames() == [1.0, 2.0]
+        assert fc.keyframe_points.values() == [0.5, 2.5]
+        assert fc.keyframe_points.interpolations() == [1, 1]
+        assert fc.extrapolation == 'LINEAR'
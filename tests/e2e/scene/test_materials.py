@@ -67,3 +67,94 @@ class TestMaterials:
         })
         obj = data.objects.get('Cube')
         assert obj.color[0] == 0.5
+
+
+class _Sockets(dict):
+    def __missing__(self, key):
+        self[key] = sock = type('Socket', (), {'default_value': None})()
+        return sock
+
+
+class _Nodes(list):
+    def new(self, kind):
+        node = type('Node', (), {})()
+        node.name, node.type = kind, kind
+        node.inputs, node.outputs = _Sockets(), _Sockets()
+        self.append(node)
+        return node
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return next(n for n in self if n.name == key)
+        return list.__getitem__(self, key)
+
+
+class _FakeMaterial:
+    """Node-tree stand-in: records nodes and links, copy() is deep."""
+
+    def __init__(self, name):
+        self.name, self.diffuse_color, self.use_nodes = name, None, False
+        self.node_tree = type('Tree', (), {})()
+        self.node_tree.nodes = _Nodes()
+        self.node_tree.links = type('Links', (list,), {
+            'new': lambda s, a, b: s.append((a, b))})()
+
+    def copy(self):
+        import copy
+        self.copies = getattr(self, 'copies', 0) + 1
+        return copy.deepcopy(self)
+
+
+class TestMaterialTemplates:
+    def test_identical_args_return_existing_material(self):
+        args = {'name': 'Glow', 'color': (1, 0, 0), 'emit': True}
+        first = dispatch_single({'cmd': 'create_material', 'args': args})
+        again = dispatch_single({'cmd': 'create_material', 'args': args})
+        assert again.success and again.data == {'name': 'Glow', 'cached': True}
+        assert 'cached' not in first.data
+        assert data.materials.keys() == ['Glow']
+
+    def test_changed_args_or_recolour_rebuild(self):
+        dispatch_single({'cmd': 'create_material', 'args': {'name': 'M'}})
+        changed = dispatch_single({'cmd': 'create_material', 'args': {
+            'name': 'M', 'roughness': 0.9}})
+        assert 'cached' not in changed.data
+        dispatch_single({'cmd': 'set_material_color', 'args': {
+            'name': changed.data['name'], 'color': (0, 1, 0, 1)}})
+        again = dispatch_single({'cmd': 'create_material', 'args': {
+            'name': 'M', 'roughness': 0.9}})
+        assert 'cached' not in again.data
+
+    def test_spec_normalization(self):
+        from app.infra.material_templates import spec_from_args
+        spec = spec_from_args({'color': [1, 0, 0], 'normal_strength': 2.0})
+        assert spec.color == (1.0, 0.0, 0.0, 1.0)
+        assert spec.topology == (False, False)   # bump needs noise texture
+        assert spec_from_args({'use_noise_texture': True,
+                               'normal_strength': 2.0}).topology == \
+            (False, True)
+
+    def test_template_built_once_per_topology(self, monkeypatch):
+        from app.infra import material_templates as mt
+        made, stored = [], []
+        monkeypatch.setattr(mt.data.materials, 'new',
+                            lambda name: made.append(_FakeMaterial(name))
+                            or made[-1])
+        monkeypatch.setattr(mt.datablock_cache, 'lookup',
+                            lambda key, coll: dict(stored).get(key))
+        monkeypatch.setattr(mt.datablock_cache, 'store',
+                            lambda key, block: stored.append((key, block)))
+
+        spec = mt.spec_from_args({'color': (1, 0, 0, 1), 'emit': True,
+                                  'emit_strength': 9.0})
+        a = mt.instantiate('RingMat_0', spec)
+        b = mt.instantiate('RingMat_1', spec._replace(emit_strength=2.0))
+        assert len(made) == 1 and made[0].copies == 2
+        assert (a.name, b.name) == ('RingMat_0', 'RingMat_1')
+        nodes = a.node_tree.nodes
+        assert nodes['Emission'].inputs['Strength'].default_value == 9.0
+        assert b.node_tree.nodes['Emission'].inputs[
+            'Strength'].default_value == 2.0
+        assert nodes['BSDF'].inputs['Base Color'].default_value == \
+            (1.0, 0.0, 0.0, 1.0)
+        assert len(a.node_tree.links) == 3      # emit, bsdf -> mix -> out
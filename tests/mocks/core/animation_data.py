@@ -3,7 +3,7 @@
 # specific frames, mimicking Blender's animation_data and action system.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class AnimationData:
@@ -11,6 +11,8 @@ class AnimationData:
 
     def __init__(self):
         self._keyframes: Dict[str, Dict[int, Any]] = {}
+        self._interpolation: Dict[str, Dict[int, str]] = {}
+        self._rates: Dict[Tuple[str, int], Tuple[int, float, float]] = {}
 
     def insert_keyframe(
         self, property_name: str, frame: int, value: Any
@@ -20,6 +22,30 @@ class AnimationData:
             self._keyframes[property_name] = {}
         self._keyframes[property_name][frame] = value
 
+    def insert_keyframes(
+        self, property_name: str, frames: List[int], values: List[Any],
+        interpolation: Optional[str] = None,
+    ) -> None:
+        """Insert a whole series of keyframes (foreach_set analogue)."""
+        keys = self._keyframes.setdefault(property_name, {})
+        keys.update(zip(frames, values))
+        if interpolation is not None:
+            modes = self._interpolation.setdefault(property_name, {})
+            modes.update((f, interpolation) for f in frames)
+
+    def set_constant_rate(
+        self, property_name: str, index: int,
+        start_frame: int, start_value: float, rate: float,
+    ) -> None:
+        """Animate one channel linearly forever (extrapolated fcurve)."""
+        self._rates[(property_name, index)] = (start_frame, start_value, rate)
+
+    def get_rate(
+        self, property_name: str, index: int
+    ) -> Optional[Tuple[int, float, float]]:
+        """(start_frame, start_value, rate) of a channel, or None."""
+        return self._rates.get((property_name, index))
+
     def get_keyframes(self, property_name: str) -> Dict[int, Any]:
         """Get all keyframes for a property."""
         return self._keyframes.get(property_name, {}).copy()
@@ -3,7 +3,7 @@
 # and view layer. Essential for Blender API compatibility.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..entities.mock_object import MockObject
@@ -17,6 +17,20 @@ class MockScene:
         self.frame_current: int = 1
         self.frame_start: int = 1
         self.frame_end: int = 250
+        self._props: Dict[str, Any] = {}
+
+    # Custom properties (scene['key'] = value in bpy)
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._props.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._props[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._props[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._props
 
 
 class MockViewLayer:
@@ -21,6 +21,7 @@ class MockData:
         self.materials = MaterialsCollection()
         self.cameras: Dict[str, MockCamera] = {}
         self.lights: Dict[str, MockLight] = {}
+        self.curves: Dict[str, object] = {}
         self.collections: Dict[str, MockCollection] = {}
 
     def reset(self) -> None:
@@ -30,6 +31,7 @@ class MockData:
         self.materials = MaterialsCollection()
         self.cameras.clear()
         self.lights.clear()
+        self.curves.clear()
         self.collections.clear()
 
 
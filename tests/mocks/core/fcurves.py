@@ -0,0 +1,98 @@
+# File: tests/mocks/core/fcurves.py
+# Action / FCurve / keyframe_points mocks with Blender's bulk access
+# shape: flat foreach_get / foreach_set buffers (co as float32 pairs,
+# interpolation as int32 enum codes) and no per-point access, so code
+# written against them cannot fall back to a Python loop over points.
+# All Rights Reserved Arodi Emmanuel
+
+from typing import Any, Dict, List, Tuple
+
+# Per-attribute (values per point, NumPy dtype Blender requires).
+_ATTRS = {'co': (2, 'float32'), 'interpolation': (1, 'int32')}
+
+# Interpolation new keys get (the BEZIER user-preference default).
+DEFAULT_INTERPOLATION = 2
+
+
+class MockKeyframePoints:
+    """FCurve.keyframe_points: add() and flat foreach_get/foreach_set."""
+
+    def __init__(self):
+        self._attrs: Dict[str, List[Any]] = {'co': [], 'interpolation': []}
+        self.calls: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._attrs['interpolation'])
+
+    def add(self, count: int) -> None:
+        self._attrs['co'] += [0.0, 0.0] * count
+        self._attrs['interpolation'] += [DEFAULT_INTERPOLATION] * count
+
+    def clear(self) -> None:
+        self._attrs = {'co': [], 'interpolation': []}
+
+    def foreach_get(self, attr: str, seq: Any) -> None:
+        values = self._check(attr, seq)
+        for i, value in enumerate(values):
+            seq[i] = value
+        self.calls.append(('get', attr))
+
+    def foreach_set(self, attr: str, seq: Any) -> None:
+        self._check(attr, seq)
+        cast = float if attr == 'co' else int
+        self._attrs[attr] = [cast(v) for v in seq]
+        self.calls.append(('set', attr))
+
+    def _check(self, attr: str, seq: Any) -> List[Any]:
+        size, dtype = _ATTRS[attr]
+        values = self._attrs[attr]
+        if len(seq) != len(self) * size:
+            raise RuntimeError(
+                f"foreach: {attr} expects {len(self) * size} items, "
+                f"got {len(seq)}")
+        if hasattr(seq, 'dtype') and str(seq.dtype) != dtype:
+            raise TypeError(f'foreach: {attr} buffer must be {dtype}')
+        return values
+
+    def frames(self) -> List[float]:
+        return self._attrs['co'][0::2]
+
+    def values(self) -> List[float]:
+        return self._attrs['co'][1::2]
+
+    def interpolations(self) -> List[int]:
+        return list(self._attrs['interpolation'])
+
+
+class MockFCurve:
+    """One channel: data_path[index] with its keyframe_points."""
+
+    def __init__(self, data_path: str, index: int):
+        self.data_path = data_path
+        self.array_index = index
+        self.keyframe_points = MockKeyframePoints()
+        self.extrapolation = 'CONSTANT'
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+class MockFCurves:
+    """Action.fcurves: find() and new() keyed on (data_path, index)."""
+
+    def __init__(self):
+        self._curves: Dict[Tuple[str, int], MockFCurve] = {}
+
+    def find(self, data_path: str, index: int = 0):
+        return self._curves.get((data_path, index))
+
+    def new(self, data_path: str, index: int = 0) -> MockFCurve:
+        curve = self._curves[(data_path, index)] = MockFCurve(
+            data_path, index)
+        return curve
+
+
+class MockAction:
+    def __init__(self):
+        self.fcurves = MockFCurves()
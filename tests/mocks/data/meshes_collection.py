@@ -1,19 +1,69 @@
 # File: tests/mocks/meshes_collection.py
 # Collection for managing mesh data objects. Mimics bpy.data.meshes with
 # creation and management of mesh data for objects like cubes and spheres.
+# Vertices, loops and polygons take Blender's bulk calls (add() and flat
+# foreach_set buffers checked for length) so operator-free mesh builds
+# run against the mock unchanged.
 # All Rights Reserved Arodi Emmanuel
 
-from typing import Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+# Values per element of each foreach_set attribute.
+_SIZES = {'co': 3, 'vertex_index': 1, 'loop_start': 1, 'loop_total': 1}
+
+
+class MockMeshElements(list):
+    """MeshVertices / MeshLoops / MeshPolygons: add() and foreach_set."""
+
+    def add(self, count: int) -> None:
+        self.extend(SimpleNamespace() for _ in range(count))
+
+    def foreach_set(self, attr: str, seq: Any) -> None:
+        size = _SIZES[attr]
+        if len(seq) != len(self) * size:
+            raise RuntimeError(
+                f"foreach: {attr} expects {len(self) * size} items, "
+                f"got {len(seq)}")
+        for i, element in enumerate(self):
+            value = tuple(seq[i * size:(i + 1) * size])
+            setattr(element, attr, value[0] if size == 1 else value)
 
 
 class MockMesh:
     """Minimal mesh data representation."""
 
-    def __init__(self, name: str):
-        self.name: str = name
-        self.vertices: List = []
+    def __init__(self, name: str, owner: Optional['MeshesCollection'] = None):
+        self._name: str = name
+        self._owner = owner
+        self.vertices: List = MockMeshElements()
+        self.loops: List = MockMeshElements()
         self.edges: List = []
-        self.polygons: List = []
+        self.polygons: List = MockMeshElements()
+        self.attributes: Dict[str, List] = {}
+
+    def update(self, calc_edges: bool = False) -> None:
+        """Derive edges from the polygon loops when calc_edges is set."""
+        if not calc_edges:
+            return
+        edges = {}
+        for poly in self.polygons:
+            ring = [self.loops[poly.loop_start + k].vertex_index
+                    for k in range(poly.loop_total)]
+            for a, b in zip(ring, ring[1:] + ring[:1]):
+                edges.setdefault((min(a, b), max(a, b)), None)
+        self.edges = list(edges)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        old = self._name
+        self._name = value
+        if old != value and self._owner is not None:
+            self._owner._rekey(old, value)
 
     def __repr__(self) -> str:
         return f"MockMesh(name='{self.name}')"
@@ -28,7 +78,7 @@ class MeshesCollection:
     def new(self, name: str) -> MockMesh:
         """Create a new mesh with unique name."""
         unique_name = self._make_unique_name(name)
-        mesh = MockMesh(unique_name)
+        mesh = MockMesh(unique_name, self)
         self._meshes[unique_name] = mesh
         return mesh
 
@@ -41,6 +91,11 @@ class MeshesCollection:
         if mesh.name in self._meshes:
             del self._meshes[mesh.name]
 
+    def _rekey(self, old_name: str, new_name: str) -> None:
+        """Update dict key when a mesh is renamed."""
+        if old_name in self._meshes:
+            self._meshes[new_name] = self._meshes.pop(old_name)
+
     def _make_unique_name(self, name: str) -> str:
         """Ensure unique name."""
         if name not in self._meshes:
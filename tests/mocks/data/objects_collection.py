@@ -19,6 +19,8 @@ class ObjectsCollection:
         unique_name = self._make_unique_name(name)
         obj = MockObject(unique_name)
         obj.data = data
+        if type(data).__name__ == 'MockFontData':
+            obj.type = 'FONT'
         obj._collections.append(self)
         self._objects[unique_name] = obj
         return obj
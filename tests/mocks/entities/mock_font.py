@@ -2,13 +2,28 @@
 # Mock FontCurve data for 3D text objects.
 # All Rights Reserved Arodi Emmanuel
 
+from typing import Dict, Optional
+
 
 class MockFontData:
     """Mock bpy.types.TextCurve (FONT object data)."""
 
-    def __init__(self, name: str = "Text"):
-        self.name = name
+    def __init__(self, name: str = "Text", owner: Optional[Dict] = None):
+        self._name = name
+        self._owner = owner
         self.body = ""
         self.extrude = 0.05
         self.align_x = 'CENTER'
         self.align_y = 'CENTER'
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """Rename, keeping the owning bpy.data.curves key in sync."""
+        if self._owner is not None and self._owner.get(self._name) is self:
+            del self._owner[self._name]
+            self._owner[value] = self
+        self._name = value
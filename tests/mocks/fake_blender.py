@@ -0,0 +1,55 @@
+# File: tests/mocks/fake_blender.py
+# Stand-in for the `blender` executable in render-farm tests. Handles the
+# two invocations app.render.farm makes: `--python build_blend.py -- ...`
+# (writes the .blend and its info JSON) and `-b x.blend -o prefix ... -s
+# S -e E -a` (writes one file per frame, printing Blender's "Saved:"
+# lines). FAKE_BLENDER_FAIL names a frame whose first render crashes.
+# All Rights Reserved Arodi Emmanuel
+
+import json
+import os
+import sys
+from pathlib import Path
+
+
+def _opt(argv, flag):
+    return argv[argv.index(flag) + 1]
+
+
+def _build(argv):
+    args = argv[argv.index('--') + 1:]
+    Path(_opt(args, '--blend')).write_bytes(b'BLENDER-fake')
+    Path(_opt(args, '--info')).write_text(json.dumps({
+        'frame_start': 1, 'frame_end': 12, 'fps': 24,
+        'engine': _opt(args, '--engine'), 'resolution': [64, 36],
+        'kwargs': json.loads(_opt(args, '--kwargs')),
+    }))
+
+
+def _render(argv):
+    prefix = _opt(argv, '-o')
+    first, last = int(_opt(argv, '-s')), int(_opt(argv, '-e'))
+    fail = int(os.environ.get('FAKE_BLENDER_FAIL', '0'))
+    log = os.environ.get('FAKE_BLENDER_LOG')
+    if log:
+        with open(log, 'a') as fh:
+            fh.write(f'{first}-{last}\n')
+    for frame in range(first, last + 1):
+        marker = Path(prefix).parent / f'.crashed_{frame}'
+        if frame == fail and not marker.exists():
+            marker.touch()
+            print('Segmentation fault', flush=True)
+            return 139
+        path = prefix.replace('####', f'{frame:04d}') + '.png'
+        Path(path).write_bytes(b'PNG')
+        print(f"Fra:{frame} Mem:1.00M | Rendering", flush=True)
+        print(f"Saved: '{path}'", flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    argv = sys.argv[1:]
+    if '--python' in argv:
+        _build(argv)
+        sys.exit(0)
+    sys.exit(_render(argv))
@@ -137,7 +137,14 @@ class ObjectOps:
     ) -> Set[str]:
         """Add a FONT (text) object."""
         from ..entities.mock_font import MockFontData
-        font = MockFontData("Text")
+        curves = bpy_data.data.curves
+        name = "Text"
+        counter = 0
+        while name in curves:
+            counter += 1
+            name = f"Text.{counter:03d}"
+        font = MockFontData(name, curves)
+        curves[name] = font
         obj = bpy_data.data.objects.new("Text", font)
         obj.type = 'FONT'
         obj.location = location
@@ -0,0 +1,77 @@
+"""On-disk cache of per-file scan results for `validators.scan_project`.
+
+Entries are keyed by path. A file whose (mtime_ns, size) still matches is
+a hit without being read; otherwise its content hash decides. The whole
+cache is dropped when its signature (registered commands plus validator
+sources) changes, since every result may then differ.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .core import Issue
+
+FileResults = List[Tuple[int, List[Issue]]]
+
+
+def digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ScanCache:
+    def __init__(self, path: Optional[str], signature: str,
+                 load: bool = True):
+        self.path = path
+        self.signature = signature
+        self.entries: Dict[str, dict] = {}
+        if load and path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+            except (OSError, ValueError):
+                data = {}
+            if data.get("signature") == signature:
+                self.entries = data.get("files", {})
+
+    def lookup(self, path: str, st: os.stat_result) -> Optional[FileResults]:
+        """Results for an unchanged file, reading it only if touched."""
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        if entry["stat"] == [st.st_mtime_ns, st.st_size]:
+            return _decode(entry["results"])
+        try:
+            with open(path, "rb") as fh:
+                same = digest(fh.read()) == entry["digest"]
+        except OSError:
+            return None
+        if not same:
+            return None
+        entry["stat"] = [st.st_mtime_ns, st.st_size]
+        return _decode(entry["results"])
+
+    def store(self, path: str, st: os.stat_result, content_digest: str,
+              results: FileResults) -> None:
+        self.entries[path] = {
+            "stat": [st.st_mtime_ns, st.st_size],
+            "digest": content_digest,
+            "results": [[lineno, [[it.index, it.cmd, it.message, it.severity]
+                                  for it in issues]]
+                        for lineno, issues in results],
+        }
+
+    def save(self, keep: List[str]) -> None:
+        """Write the cache, dropping entries for files no longer seen."""
+        if not self.path:
+            return
+        files = {p: self.entries[p] for p in keep if p in self.entries}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"signature": self.signature, "files": files}, fh)
+        os.replace(tmp, self.path)
+
+
+def _decode(raw) -> FileResults:
+    return [(lineno, [Issue(*it) for it in issues]) for lineno, issues in raw]
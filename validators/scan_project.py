@@ -1,9 +1,23 @@
 import ast
 import os
-from typing import Dict, List, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
-from .batch_validator import validate_batch
-from .core import Issue
+from app.domain import command_schemas
+from app.kernel import batch_check
+
+from . import batch_validator, core
+from .batch_validator import registered_commands, validate_batch
+from .scan_cache import FileResults, ScanCache, digest
+
+# Below this many files to parse, pool start-up costs more than it saves.
+PARALLEL_MIN_FILES = 64
+DEFAULT_CACHE = os.path.join(".cache", "scan_project.json")
+SKIP_DIRS = {".git", ".cache", "__pycache__", ".venv", "venv", ".tox",
+             ".pytest_cache", ".mypy_cache", ".ruff_cache"}
 
 
 def _is_candidate_list(node: ast.AST) -> bool:
@@ -34,45 +48,128 @@ def _safe_literal_eval(node: ast.AST):
         return None
 
 
-def scan_and_validate(root: str) -> Dict[str, List[Tuple[int, List[Issue]]]]:
-    results: Dict[str, List[Tuple[int, List[Issue]]]] = {}
-    for dirpath, _, filenames in os.walk(root):
-        for fname in filenames:
-            if not fname.endswith(".py"):
-                continue
-            path = os.path.join(dirpath, fname)
-            try:
-                with open(path, "r", encoding="utf-8") as fh:
-                    src = fh.read()
-                tree = ast.parse(src, filename=path)
-            except Exception:
-                continue
-
-            file_results: List[Tuple[int, List[Issue]]] = []
-            batches = _collect_batches_from_ast(tree)
-            for lineno, node in batches:
-                literal = _safe_literal_eval(node)
-                if not isinstance(literal, list):
-                    continue
-                # ensure list of dicts with 'cmd'
-                if not all(isinstance(el, dict) and "cmd" in el for el in literal):
-                    continue
-                issues = validate_batch(literal)
-                if issues:
-                    file_results.append((lineno, issues))
-
-            if file_results:
-                results[path] = file_results
-
-    return results
+def _scan_source(src: bytes, path: str, regs: FrozenSet[str]) -> FileResults:
+    try:
+        tree = ast.parse(src, filename=path)
+    except Exception:
+        return []
+
+    file_results: FileResults = []
+    batches = _collect_batches_from_ast(tree)
+    for lineno, node in batches:
+        literal = _safe_literal_eval(node)
+        if not isinstance(literal, list):
+            continue
+        # ensure list of dicts with 'cmd'
+        if not all(isinstance(el, dict) and "cmd" in el for el in literal):
+            continue
+        issues = validate_batch(literal, regs)
+        if issues:
+            file_results.append((lineno, issues))
+    return file_results
+
+
+def _scan_file(path: str, regs: FrozenSet[str]) -> Tuple[str, FileResults]:
+    """Worker: (content digest, results) for one file."""
+    try:
+        with open(path, "rb") as fh:
+            src = fh.read()
+    except OSError:
+        return "", []
+    return digest(src), _scan_source(src, path, regs)
+
+
+def _python_files(root: str) -> List[str]:
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        paths.extend(os.path.join(dirpath, f)
+                     for f in filenames if f.endswith(".py"))
+    return paths
+
+
+def _signature(regs: FrozenSet[str]) -> str:
+    """Cache signature: command set plus the validator sources."""
+    parts = ["\n".join(sorted(regs)).encode()]
+    for module in (batch_validator, batch_check, command_schemas, core,
+                   sys.modules[__name__]):
+        with open(module.__file__, "rb") as fh:
+            parts.append(fh.read())
+    return digest(b"\0".join(parts))
+
+
+def _run(todo: List[str], regs: FrozenSet[str], workers: Optional[int]):
+    """Scan todo in a process pool, or serially when not worth it."""
+    if workers != 1 and len(todo) >= PARALLEL_MIN_FILES:
+        count = workers or os.cpu_count() or 1
+        try:
+            with ProcessPoolExecutor(max_workers=count) as pool:
+                chunk = max(1, len(todo) // (4 * count))
+                return list(pool.map(_scan_file, todo, repeat(regs),
+                                     chunksize=chunk))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no fork/spawn here (e.g. inside Blender): go serial
+    return [_scan_file(path, regs) for path in todo]
+
+
+def scan_and_validate(
+    root: str,
+    workers: Optional[int] = None,
+    incremental: bool = False,
+    cache_path: Optional[str] = None,
+) -> Dict[str, FileResults]:
+    """Validate every literal instruction list in .py files under root.
+
+    Files are parsed in a process pool (``workers`` processes, default
+    one per CPU; ``workers=1`` or a small tree scans serially). The set
+    of registered commands is computed once and shared by all files.
+    With ``incremental`` the previous results are read from
+    ``cache_path`` (default ``<root>/.cache/scan_project.json``) and only
+    files whose mtime/size and content hash changed are rescanned; every
+    run with a cache path refreshes it.
+    """
+    regs = registered_commands()
+    if incremental and cache_path is None:
+        cache_path = os.path.join(root, DEFAULT_CACHE)
+    cache = ScanCache(cache_path, _signature(regs), load=incremental)
+
+    paths = _python_files(root)
+    known: Dict[str, FileResults] = {}
+    todo: List[Tuple[str, os.stat_result]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        hit = cache.lookup(path, st) if incremental else None
+        if hit is None:
+            todo.append((path, st))
+        else:
+            known[path] = hit
+
+    scanned = _run([path for path, _ in todo], regs, workers)
+    for (path, st), (content_digest, file_results) in zip(todo, scanned):
+        known[path] = file_results
+        if content_digest:
+            cache.store(path, st, content_digest, file_results)
+    cache.save(paths)
+
+    return {path: known[path] for path in paths if known.get(path)}
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
     from .core import format_issues
 
-    root = sys.argv[1] if len(sys.argv) > 1 else os.getcwd()
-    res = scan_and_validate(root)
+    parser = argparse.ArgumentParser(
+        description="Validate literal instruction batches in a tree.")
+    parser.add_argument("root", nargs="?", default=os.getcwd())
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="rescan only files changed since the last run")
+    opts = parser.parse_args()
+    res = scan_and_validate(opts.root, opts.jobs, opts.incremental)
     if not res:
         print("No issues found in project literals.")
         raise SystemExit(0)
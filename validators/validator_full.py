@@ -4,7 +4,7 @@ This file is intentionally small: real implementations live in
 `validators.core` and `validators.batch_validator`.
 """
 from .core import Issue, format_issues
-from .batch_validator import validate_batch, run_on_scene
+from .batch_validator import registered_commands, validate_batch, run_on_scene
 from .scan_project import scan_and_validate
 
-__all__ = ("validate_batch", "format_issues", "Issue", "run_on_scene", "scan_and_validate")
+__all__ = ("validate_batch", "registered_commands", "format_issues", "Issue", "run_on_scene", "scan_and_validate")